@@ -7,12 +7,12 @@ import mimetypes
 import platform
 import re
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
 
-import tiktoken
 from loguru import logger
 
 from kabot.agent.memory import MemoryStore
+from kabot.agent.prompt_cache import PromptSegmentCache, file_signature
 from kabot.agent.skills import (
     SkillsLoader,
     looks_like_skill_catalog_request,
@@ -20,9 +20,11 @@ from kabot.agent.skills import (
     looks_like_skill_install_request,
     normalize_skill_reference_name,
 )
+from kabot.agent.token_counter import get_token_counter
 from kabot.utils.workspace_templates import ensure_workspace_templates
 
 _SPACE_RE = re.compile(r"\s+")
+_PROMPT_PART_SEPARATOR = "\n\n---\n\n"
 _EXPLICIT_SKILL_TURN_RE = re.compile(
     r"(?i)\b(skill|skills)\b|スキル|技能|技術|สกิล"
 )
@@ -47,17 +49,10 @@ class TokenBudget:
         max_context: int = 128000,
         component_overrides: dict[str, float] | None = None,
     ):
-        # Use tiktoken for accurate token counting
-        self.encoder = None
-        try:
-            self.encoder = tiktoken.encoding_for_model(model.split("/")[-1])
-        except Exception as e:
-            logger.warning(f"Could not load tiktoken encoding for model {model}: {e}")
-            try:
-                # Fallback to cl100k_base for unknown models
-                self.encoder = tiktoken.get_encoding("cl100k_base")
-            except Exception as e2:
-                logger.error(f"Failed to load fallback cl100k_base encoding: {e2}. Token counting will be estimated.")
+        # Encoders and per-text counts are shared across turns by the token counter.
+        self.model = model
+        self._counter = get_token_counter()
+        self.encoder = self._counter.encoder_for(model)
 
         self.max_context = max_context
         # Reserve 20% for response + safety margin
@@ -103,16 +98,11 @@ class TokenBudget:
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
-        if not text:
-            return 0
-        if self.encoder:
-            try:
-                return len(self.encoder.encode(text, disallowed_special=()))
-            except Exception:
-                pass
+        return self._counter.count(text, self.model)
 
-        # Fallback to estimation: ~4 chars per token for English
-        return len(text) // 4 + 1
+    def count_tokens_many(self, texts: Iterable[str]) -> list[int]:
+        """Count tokens in several texts, encoding cache misses in one batch."""
+        return self._counter.count_many(texts, self.model)
 
     def get_budget(self, component: Literal["system", "memory", "skills", "history", "current"]) -> int:
         """Get token budget for a component."""
@@ -121,6 +111,8 @@ class TokenBudget:
     def truncate_to_budget(self, text: str, component: str) -> tuple[str, bool]:
         """Truncate text to fit budget. Returns (truncated_text, was_truncated)."""
         budget = self.get_budget(component) # type: ignore
+        if self.count_tokens(text) <= budget:
+            return text, False
 
         if self.encoder:
             try:
@@ -157,13 +149,11 @@ class TokenBudget:
         token_count = 0
         invalid_entries = 0
 
-        for msg in reversed(messages[1:]):  # Skip system message
-            if not isinstance(msg, dict):
-                invalid_entries += 1
-                continue
-            msg_text = str(msg.get("content", ""))
-            msg_tokens = self.count_tokens(msg_text)
+        candidates = [msg for msg in reversed(messages[1:]) if isinstance(msg, dict)]  # Skip system message
+        invalid_entries += len(messages) - 1 - len(candidates)
+        counts = self.count_tokens_many(str(msg.get("content", "")) for msg in candidates)
 
+        for msg, msg_tokens in zip(candidates, counts):
             if token_count + msg_tokens > budget:
                 break
 
@@ -301,6 +291,8 @@ Always check platform before writing scripts."""
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace, skills_config=skills_config)
         self._last_truncation_summary: dict[str, Any] | None = None
+        self._prompt_cache = PromptSegmentCache()
+        self._guardrail_store = None
         self._resolved_workspace_path = str(self.workspace.expanduser().resolve())
         system = platform.system()
         self._runtime_description = f"{'macOS' if system == 'Darwin' else system} {platform.machine()}, Python {platform.python_version()}"
@@ -344,8 +336,32 @@ Always check platform before writing scripts."""
         Returns:
             Complete system prompt.
         """
-        parts = []
+        prefix, suffix = self.build_system_prompt_segments(
+            skill_names,
+            profile,
+            tool_names=tool_names,
+            current_message=current_message,
+            budget_hints=budget_hints,
+        )
+        return _PROMPT_PART_SEPARATOR.join(part for part in (prefix, suffix) if part)
 
+    def build_system_prompt_segments(
+        self,
+        skill_names: list[str] | None = None,
+        profile: str = "GENERAL",
+        tool_names: list[str] | None = None,
+        current_message: str | None = None,
+        budget_hints: dict[str, Any] | None = None,
+    ) -> tuple[str, str]:
+        """
+        Build the system prompt as ``(stable_prefix, dynamic_suffix)``.
+
+        The prefix (identity, workspace persona, profile, tool guidance) only
+        changes when its inputs do, and is reused verbatim from the segment
+        cache so provider-side prompt caching sees an identical leading block
+        across turns. Per-turn content (time, skills, memory, guardrails) goes
+        in the suffix.
+        """
         compact_prompt = self._should_use_compact_system_prompt(profile, budget_hints)
         lean_probe_context = self._should_use_lean_probe_context(
             profile=profile,
@@ -354,17 +370,13 @@ Always check platform before writing scripts."""
             budget_hints=budget_hints,
         )
 
-        # Core identity
-        parts.append(self._get_identity(compact=compact_prompt))
-
-        workspace_persona = self._build_workspace_persona_prompt()
-        if workspace_persona:
-            parts.append(workspace_persona)
+        prefix = self._build_stable_prompt_prefix(
+            profile=profile,
+            compact=compact_prompt,
+            tool_names=tool_names,
+        )
 
-        # Profile instruction
-        profile_prompt = self._get_profile_prompt(profile, compact=compact_prompt)
-        if profile_prompt:
-            parts.append(profile_prompt)
+        parts = [self._build_current_time_prompt()]
 
         is_heartbeat_task = (
             isinstance(current_message, str)
@@ -464,24 +476,10 @@ Always check platform before writing scripts."""
         if skill_parts:
             parts.extend(skill_parts)
 
-        memory_prompt = self._build_memory_recall_prompt(tool_names=tool_names)
-        if memory_prompt:
-            parts.append(memory_prompt)
-
-        docs_prompt = self._build_docs_diagnostics_prompt(compact=compact_prompt)
-        if docs_prompt:
-            parts.append(docs_prompt)
-
-        # Supplemental bootstrap files
-        if not compact_prompt:
-            bootstrap = self._load_bootstrap_files(self.SUPPLEMENTAL_FILES)
-            if bootstrap:
-                parts.append(bootstrap)
-
         # Memory context
         memory = ""
         if not lean_probe_context:
-            memory = self.memory.get_memory_context()
+            memory = self._get_memory_context()
         if memory:
             parts.append(f"# Memory\n\n{memory}")
 
@@ -498,8 +496,70 @@ Always check platform before writing scripts."""
             if graph_context:
                 parts.append(f"# Graph Memory\n\n{graph_context}")
 
+        # Guardrails from past lessons (metacognition)
+        if not compact_prompt:
+            guardrails_prompt = self._build_guardrails_prompt()
+            if guardrails_prompt:
+                parts.append(guardrails_prompt)
+
+        return prefix, _PROMPT_PART_SEPARATOR.join(parts)
+
+    def _build_stable_prompt_prefix(
+        self,
+        *,
+        profile: str,
+        compact: bool,
+        tool_names: list[str] | None,
+    ) -> str:
+        """Identity, persona, profile and tool guidance; cached until an input changes."""
+        supplemental_files = [] if compact else self.SUPPLEMENTAL_FILES
+        key = (
+            str(profile or "").strip().upper(),
+            compact,
+            tuple(tool_names or ()),
+            tuple(file_signature(self.workspace / name) for name in (*self.PERSONA_FILES, *supplemental_files)),
+        )
+        return self._prompt_cache.get_or_build(
+            "stable_prefix",
+            key,
+            lambda: self._render_stable_prompt_prefix(profile=profile, compact=compact, tool_names=tool_names),
+        )
+
+    def _render_stable_prompt_prefix(
+        self,
+        *,
+        profile: str,
+        compact: bool,
+        tool_names: list[str] | None,
+    ) -> str:
+        # Core identity
+        parts = [self._get_identity(compact=compact)]
+
+        workspace_persona = self._build_workspace_persona_prompt()
+        if workspace_persona:
+            parts.append(workspace_persona)
+
+        # Profile instruction
+        profile_prompt = self._get_profile_prompt(profile, compact=compact)
+        if profile_prompt:
+            parts.append(profile_prompt)
+
+        memory_prompt = self._build_memory_recall_prompt(tool_names=tool_names)
+        if memory_prompt:
+            parts.append(memory_prompt)
+
+        docs_prompt = self._build_docs_diagnostics_prompt(compact=compact)
+        if docs_prompt:
+            parts.append(docs_prompt)
+
+        # Supplemental bootstrap files
+        if not compact:
+            bootstrap = self._load_bootstrap_files(self.SUPPLEMENTAL_FILES)
+            if bootstrap:
+                parts.append(bootstrap)
+
         # Tool roster (helps weaker models understand their capabilities)
-        if tool_names and not compact_prompt:
+        if tool_names and not compact:
             tools_str = ", ".join(tool_names)
             parts.append(f"""## Your Callable Tools
 You have these tools available: {tools_str}
@@ -512,24 +572,49 @@ For PC specs / hardware info questions, ALWAYS call get_system_info tool first.
 For cleanup / free space / optimize requests, ALWAYS call cleanup_system tool first.
 When user asks to build/create/automate something: use write_file to create scripts, exec to run them, and cron to schedule them. ALWAYS verify results with exec after running.""")
 
-        # Guardrails from past lessons (metacognition)
-        if not compact_prompt:
-            try:
+        return _PROMPT_PART_SEPARATOR.join(parts)
+
+    def _get_memory_context(self) -> str:
+        """MEMORY.md plus today's notes, re-read only when either file changes."""
+        key = (
+            file_signature(self.memory.memory_file),
+            file_signature(self.memory.get_today_file()),
+        )
+        return self._prompt_cache.get_or_build("memory", key, self.memory.get_memory_context)
+
+    def _build_guardrails_prompt(self) -> str:
+        """Learned guardrails, re-queried only when the metadata DB changes."""
+        db_path = self.workspace / "chroma" / "metadata.db"
+        key = (file_signature(db_path), file_signature(db_path.with_name("metadata.db-wal")))
+        return self._prompt_cache.get_or_build(
+            "guardrails",
+            key,
+            lambda: self._load_guardrails_prompt(db_path),
+        )
+
+    def _load_guardrails_prompt(self, db_path: Path) -> str:
+        try:
+            if not db_path.exists():
+                return ""
+            if self._guardrail_store is None:
                 from kabot.memory.sqlite_store import SQLiteMetadataStore
-                db_path = self.workspace / "chroma" / "metadata.db"
-                if db_path.exists():
-                    meta = SQLiteMetadataStore(db_path)
-                    guardrails = meta.get_guardrails(limit=5)
-                    if guardrails:
-                        guardrail_text = "\n".join(f"- {g}" for g in guardrails)
-                        parts.append(f"""## Learned Guardrails (from past mistakes)
+                self._guardrail_store = SQLiteMetadataStore(db_path)
+            guardrails = self._guardrail_store.get_guardrails(limit=5)
+        except Exception:
+            return ""  # Silently skip if lessons table doesn't exist yet
+        if not guardrails:
+            return ""
+        guardrail_text = "\n".join(f"- {g}" for g in guardrails)
+        return f"""## Learned Guardrails (from past mistakes)
 The following rules were learned from previous interactions where quality was low:
 {guardrail_text}
-Follow these guardrails to avoid repeating past mistakes.""")
-            except Exception:
-                pass  # Silently skip if lessons table doesn't exist yet
+Follow these guardrails to avoid repeating past mistakes."""
 
-        return "\n\n---\n\n".join(parts)
+    def close(self) -> None:
+        """Release the metadata store opened for learned guardrails."""
+        store, self._guardrail_store = self._guardrail_store, None
+        if store is not None:
+            store.close()
 
     def _normalize_skills_summary_root_tag(self, summary: str, *, root_tag: str) -> str:
         raw = str(summary or "").strip()
@@ -633,8 +718,8 @@ You are a direct, capable assistant.
 - For explicit skill-use turns, follow the loaded skill context first."""
         return self.PROFILES.get(normalized, "")
 
-    def _get_identity(self, *, compact: bool = False) -> str:
-        """Get the core identity section."""
+    def _build_current_time_prompt(self) -> str:
+        """Current local time; kept out of the cached identity since it changes every minute."""
         from datetime import datetime
         now_local = datetime.now().astimezone()
         now = now_local.strftime("%Y-%m-%d %H:%M (%A)")
@@ -644,6 +729,12 @@ You are a direct, capable assistant.
         sign = "+" if total_minutes >= 0 else "-"
         hours, minutes = divmod(abs(total_minutes), 60)
         tz_offset = f"UTC{sign}{hours:02d}:{minutes:02d}"
+        return f"""## Current Time
+{now}
+Timezone: {tz_name} ({tz_offset})"""
+
+    def _get_identity(self, *, compact: bool = False) -> str:
+        """Get the core identity section."""
         workspace_path = self._resolved_workspace_path
         runtime = self._runtime_description
 
@@ -652,10 +743,6 @@ You are a direct, capable assistant.
 
 You are kabot, a helpful AI assistant with tool access for files, shell, web, messaging, and subagents.
 
-## Current Time
-{now}
-Timezone: {tz_name} ({tz_offset})
-
 ## Runtime
 {runtime}
 
@@ -674,10 +761,6 @@ You are kabot, a helpful AI assistant. You have access to tools that allow you t
 - Send messages to users on chat channels
 - Spawn subagents for complex background tasks
 
-## Current Time
-{now}
-Timezone: {tz_name} ({tz_offset})
-
 ## Runtime
 {runtime}
 
@@ -859,7 +942,9 @@ If you are performing a multi-step task, start the first step NOW."""
                 "- Use it only as contextual hints for routing/audit."
             )
 
-        system_prompt = self.build_system_prompt(
+        # Stable prefix first, then per-turn content, so the leading block is
+        # byte-identical across turns for provider-side prompt caching.
+        prefix, suffix = self.build_system_prompt_segments(
             skill_names,
             profile,
             tool_names=tool_names,
@@ -867,13 +952,19 @@ If you are performing a multi-step task, start the first step NOW."""
             budget_hints=budget_hints,
         )
         if untrusted_safety_note:
-            system_prompt = f"{untrusted_safety_note}\n\n{system_prompt}"
+            # Kept at the head so budget truncation never cuts it; channel turns
+            # always carry it, so the leading block stays stable for them too.
+            prefix = f"{untrusted_safety_note}\n\n{prefix}"
         if channel and chat_id:
-            system_prompt += f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
+            suffix += f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
+        system_prompt = _PROMPT_PART_SEPARATOR.join(part for part in (prefix, suffix) if part)
 
-        system_prompt, was_truncated = budget.truncate_to_budget(system_prompt, "system")
-        if was_truncated:
-            logger.warning("System prompt truncated to fit token budget")
+        # The prefix count is memoized, so only the suffix is tokenized per turn.
+        system_tokens = budget.count_tokens(prefix) + budget.count_tokens(suffix)
+        if system_tokens > budget.get_budget("system"):
+            system_prompt, was_truncated = budget.truncate_to_budget(system_prompt, "system")
+            if was_truncated:
+                logger.warning("System prompt truncated to fit token budget")
 
         messages.append({"role": "system", "content": system_prompt})
 
@@ -937,7 +1028,9 @@ If you are performing a multi-step task, start the first step NOW."""
         messages.append({"role": "user", "content": user_content})
 
         # Final validation
-        total_tokens = sum(budget.count_tokens(str(m.get("content", ""))) for m in messages)
+        total_tokens = sum(
+            budget.count_tokens_many(str(m.get("content", "")) for m in messages)
+        )
         logger.info(f"Context: {total_tokens}/{budget.max_context} tokens ({total_tokens/budget.max_context*100:.1f}%)")
 
         if total_tokens > budget.available:
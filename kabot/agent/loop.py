@@ -1,6 +1,7 @@
 """Agent loop: the core processing engine."""
 
 import asyncio
+import inspect
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -9,10 +10,12 @@ from loguru import logger
 
 from kabot.agent.loop_parts.compat import lazy_compat_getattr as __getattr__  # noqa: F401
 from kabot.agent.loop_parts.delegates import AgentLoopDelegatesMixin
+from kabot.agent.loop_parts.turn_scheduler import SessionTurnScheduler
 from kabot.agent.tools.registry import ToolRegistry
 
 # Phase 12: Critical Features
 from kabot.agent.truncator import ToolResultTruncator
+from kabot.agent.turn_context import TurnLocal
 from kabot.bus.events import InboundMessage, OutboundMessage
 from kabot.bus.queue import MessageBus
 
@@ -53,8 +56,19 @@ class AgentLoop(AgentLoopDelegatesMixin):
     3. Calls the LLM
     4. Executes tool calls
     5. Sends responses back
+
+    Turns for different sessions run concurrently (see SessionTurnScheduler),
+    so per-turn state lives in TurnLocal attributes rather than on the instance.
     """
 
+    _active_turn_id = TurnLocal()
+    _active_message_metadata = TurnLocal()
+    last_usage = TurnLocal(default=None)
+    last_model_used = TurnLocal()
+    last_fallback_used = TurnLocal(default=False)
+    last_model_chain = TurnLocal()
+    _active_stream_sink = TurnLocal(default=None)
+
     def __init__(
         self,
         bus: MessageBus,
@@ -150,7 +164,15 @@ class AgentLoop(AgentLoopDelegatesMixin):
         self._context_builders: dict[str, "ContextBuilder"] = {
             str(workspace.expanduser().resolve()): self.context
         }
-        self.sessions = session_manager or SessionManager(workspace)
+        if session_manager is None:
+            session_cfg = getattr(getattr(self.config, "agents", None), "session", None)
+            session_manager = SessionManager(
+                workspace,
+                max_cached_sessions=getattr(session_cfg, "cache_max_sessions", 256),
+                max_cached_bytes=getattr(session_cfg, "cache_max_bytes", 64 * 1024 * 1024),
+                hydrate_tail_messages=getattr(session_cfg, "hydrate_tail_messages", 50),
+            )
+        self.sessions = session_manager
         from kabot.memory.memory_factory import MemoryFactory
 
         _cfg_obj = self.config
@@ -185,7 +207,7 @@ class AgentLoop(AgentLoopDelegatesMixin):
         else:
             self.auth_rotation = None
 
-        self.router = IntentRouter(provider, model=self.model)
+        self.router = IntentRouter(provider, model=self.model, route_cache=self._build_route_cache())
         # Phase 14: Pass bus for system event emission (will set run_id per message)
         self.tools = ToolRegistry(bus=bus, run_id=None)
         self.subagents = SubagentManager(
@@ -207,6 +229,7 @@ class AgentLoop(AgentLoopDelegatesMixin):
         self._load_plugins()
 
         self._running = False
+        self._turn_scheduler: SessionTurnScheduler | None = None
         self._register_default_tools()
 
         # Phase 8: System Internals â€” Command Router
@@ -841,6 +864,29 @@ class AgentLoop(AgentLoopDelegatesMixin):
         except Exception:
             return None
 
+    def _build_route_cache(self):
+        """Route-decision cache configured from runtime.performance (None when disabled)."""
+        from kabot.agent.route_cache import RouteCache
+
+        perf = self.runtime_performance
+        if not bool(getattr(perf, "route_cache_enabled", True)):
+            return None
+        embed = self._embed_route_text if bool(getattr(perf, "route_cache_semantic", False)) else None
+        return RouteCache(
+            ttl_seconds=float(getattr(perf, "route_cache_ttl_seconds", 900)),
+            max_entries=int(getattr(perf, "route_cache_max_entries", 512)),
+            embed=embed,
+            similarity_threshold=float(getattr(perf, "route_cache_similarity", 0.95)),
+        )
+
+    async def _embed_route_text(self, text: str) -> list[float] | None:
+        """Embed a routed message with the memory embedding model, if one is loaded."""
+        embeddings = getattr(self.memory, "embeddings", None)
+        embed = getattr(embeddings, "embed", None)
+        if not callable(embed):
+            return None
+        return await embed(text)
+
     async def _warmup_memory(self):
         """Background warmup of embedding model so first message is fast."""
         self._memory_warmup_attempted = True
@@ -913,35 +959,58 @@ class AgentLoop(AgentLoopDelegatesMixin):
         startup_ready_ms = int((self._startup_ready_at - self._boot_started_at) * 1000)
         logger.info(f"startup_ready_ms={startup_ready_ms}")
 
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
-                )
+        runtime_queue = getattr(getattr(self.config, "runtime", None), "queue", None)
+        scheduler = SessionTurnScheduler(
+            self._run_turn,
+            max_concurrent_turns=int(getattr(runtime_queue, "max_concurrent_turns", 4) or 1),
+            max_buffered_turns=int(getattr(runtime_queue, "max_buffered_turns", 0) or 0),
+        )
+        self._turn_scheduler = scheduler
+
+        try:
+            while self._running:
                 try:
-                    response = await self._process_message(msg)
-                    if response:
-                        await self.bus.publish_outbound(response)
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-
-                    # Phase 14: Emit error event
-                    seq = self.bus.get_next_seq(run_id)
-                    await self.bus.emit_system_event(
-                        SystemEvent.error(
-                            run_id, seq, "processing_error", str(e),
-                            session_key=msg.session_key
-                        )
+                    msg = await asyncio.wait_for(
+                        self.bus.consume_inbound(),
+                        timeout=1.0
                     )
+                except asyncio.TimeoutError:
+                    continue
+                await scheduler.submit(msg)
+        finally:
+            leftovers = await scheduler.shutdown()
+            for msg in leftovers:
+                # Hand unstarted turns back to the bus so a restarted loop picks them up.
+                self.bus.inbound.put_nowait(msg)
+            if leftovers:
+                logger.info(f"Returned {len(leftovers)} unstarted turn(s) to the inbound queue")
+
+    async def _run_turn(self, msg: InboundMessage) -> None:
+        """Process one inbound message and publish its response or error reply."""
+        from kabot.bus.events import SystemEvent
 
-                    await self.bus.publish_outbound(OutboundMessage(
-                        channel=msg.channel,
-                        chat_id=msg.chat_id,
-                        content=f"Sorry, I encountered an error: {str(e)}"
-                    ))
-            except asyncio.TimeoutError:
-                continue
+        try:
+            response = await self._process_message(msg)
+            if response:
+                await self.bus.publish_outbound(response)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+
+            # Phase 14: Emit error event
+            run_id = "agent-loop"
+            seq = self.bus.get_next_seq(run_id)
+            await self.bus.emit_system_event(
+                SystemEvent.error(
+                    run_id, seq, "processing_error", str(e),
+                    session_key=msg.session_key
+                )
+            )
+
+            await self.bus.publish_outbound(OutboundMessage(
+                channel=msg.channel,
+                chat_id=msg.chat_id,
+                content=f"Sorry, I encountered an error: {str(e)}"
+            ))
 
     def stop(self) -> None:
         self._running = False
@@ -952,6 +1021,16 @@ class AgentLoop(AgentLoopDelegatesMixin):
                 task.cancel()
         self._pending_memory_tasks.clear()
 
+        # Best-effort write of messages still queued by the memory write-behind.
+        flush_writes = getattr(self.memory, "flush_writes", None)
+        if callable(flush_writes):
+            flushed = flush_writes()
+            if inspect.iscoroutine(flushed):
+                try:
+                    asyncio.get_running_loop().create_task(flushed)
+                except RuntimeError:
+                    flushed.close()
+
         if self._mcp_session_runtimes:
             async def _close_all_mcp() -> None:
                 await self._close_mcp_runtimes()
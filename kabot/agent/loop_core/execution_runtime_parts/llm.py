@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterator
 
 from loguru import logger
 
@@ -15,6 +17,7 @@ from kabot.agent.loop_core.execution_runtime_parts.helpers import (
     _runtime_resilience_cfg,
     _sanitize_error,
 )
+from kabot.agent.loop_core.execution_runtime_parts.progress import StreamPreviewPublisher
 from kabot.bus.events import InboundMessage
 
 
@@ -41,6 +44,76 @@ def _active_llm_request_overrides(loop: Any) -> tuple[dict[str, Any], bool]:
     return overrides, disable_tools
 
 
+def _active_stream_sink(loop: Any) -> StreamPreviewPublisher | None:
+    """Preview publisher for this turn, unless the active call is an internal one."""
+    sink = getattr(loop, "_active_stream_sink", None)
+    if not isinstance(sink, StreamPreviewPublisher):
+        return None
+    if _active_message_metadata(loop).get("directive_no_stream"):
+        return None
+    return sink
+
+
+async def _consume_provider_stream(
+    loop: Any,
+    stream: AsyncIterator[Any],
+    sink: StreamPreviewPublisher,
+    *,
+    model: str,
+) -> Any:
+    """Forward streamed text to ``sink`` and return the stream's final response."""
+    turn_id = str(getattr(loop, "_active_turn_id", "turn-unknown"))
+    started = time.perf_counter()
+    first_token_ms: int | None = None
+    final_response = None
+    sink.reset()
+    async for chunk in stream:
+        if chunk.content:
+            if first_token_ms is None:
+                first_token_ms = int((time.perf_counter() - started) * 1000)
+                logger.info(f"turn_id={turn_id} model={model} first_token_ms={first_token_ms}")
+                _emit_runtime_event(
+                    loop,
+                    "llm_first_token",
+                    turn_id=turn_id,
+                    model=model,
+                    first_token_ms=first_token_ms,
+                )
+            await sink.push(chunk.content)
+        if chunk.response is not None:
+            final_response = chunk.response
+    if final_response is None:
+        raise RuntimeError("Provider stream ended without a final response")
+    return final_response
+
+
+@contextmanager
+def _provider_fallbacks_suspended(provider: Any) -> Iterator[None]:
+    """
+    Clear ``provider.fallbacks`` for the duration of one call.
+
+    Concurrent turns share the provider, so the original chain is saved by the
+    first entrant and restored by the last one; a naive save/restore per call
+    would let an overlapping turn persist the emptied list.
+    """
+    current_fallbacks = getattr(provider, "fallbacks", None)
+    if not isinstance(current_fallbacks, list):
+        yield
+        return
+    depth = int(getattr(provider, "_kabot_fallbacks_suspend_depth", 0) or 0)
+    if depth == 0:
+        provider._kabot_suspended_fallbacks = list(current_fallbacks)
+        provider.fallbacks = []
+    provider._kabot_fallbacks_suspend_depth = depth + 1
+    try:
+        yield
+    finally:
+        depth = int(getattr(provider, "_kabot_fallbacks_suspend_depth", 1) or 1) - 1
+        provider._kabot_fallbacks_suspend_depth = depth
+        if depth <= 0:
+            provider.fallbacks = list(getattr(provider, "_kabot_suspended_fallbacks", []) or [])
+
+
 async def run_simple_response(loop: Any, msg: InboundMessage, messages: list) -> str | None:
     """Direct single-shot response for simple queries (no loop, no tools)."""
     try:
@@ -113,12 +186,7 @@ async def call_llm_with_fallback(
         observability (e.g., primary logs "success" while fallback actually answered).
         """
         provider = loop.provider
-        restore_fallbacks: list[str] | None = None
-        current_fallbacks = getattr(provider, "fallbacks", None)
-        if isinstance(current_fallbacks, list):
-            restore_fallbacks = list(current_fallbacks)
-            provider.fallbacks = []
-        try:
+        with _provider_fallbacks_suspended(provider):
             request_overrides, disable_tools = _active_llm_request_overrides(loop)
             kwargs: dict[str, Any] = {
                 "messages": messages,
@@ -127,10 +195,12 @@ async def call_llm_with_fallback(
             kwargs.update(request_overrides)
             if include_tools and not disable_tools:
                 kwargs["tools"] = loop.tools.get_definitions()
+            sink = _active_stream_sink(loop)
+            if sink is not None and getattr(provider, "supports_streaming", False) is True:
+                return await _consume_provider_stream(
+                    loop, provider.stream_chat(**kwargs), sink, model=model_name
+                )
             return await provider.chat(**kwargs)
-        finally:
-            if restore_fallbacks is not None:
-                provider.fallbacks = restore_fallbacks
 
     for attempt_idx, current_model in enumerate(chain_snapshot[:max_attempts], start=1):
         state = "primary" if attempt_idx == 1 else "model_fallback"
@@ -11,6 +11,7 @@ from typing import Any
 
 from loguru import logger
 
+from kabot.agent.token_counter import get_token_counter
 from kabot.core.failover_error import resolve_failover_reason
 from kabot.utils.text_safety import ensure_utf8_text
 
@@ -137,12 +138,8 @@ def _emit_runtime_event(loop: Any, event_name: str, **fields: Any) -> None:
         logger.info(f"runtime_event={payload}")
 
 
-def _estimate_message_tokens(messages: list[dict[str, Any]]) -> int:
-    try:
-        serialized = json.dumps(messages, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        serialized = str(messages)
-    return max(1, len(serialized) // 4)
+def _estimate_message_tokens(messages: list[dict[str, Any]], model: str | None = None) -> int:
+    return max(1, get_token_counter().count_messages(messages, model))
 
 
 def _quota_bucket(loop: Any) -> dict[str, Any]:
@@ -181,7 +178,7 @@ def _check_quota_guard(
         mode = "warn"
     max_tokens_per_hour = int(getattr(quotas, "max_tokens_per_hour", 0) or 0)
     max_cost_per_day = float(getattr(quotas, "max_cost_per_day_usd", 0.0) or 0.0)
-    estimated_tokens = _estimate_message_tokens(messages)
+    estimated_tokens = _estimate_message_tokens(messages, model)
     usage = _quota_bucket(loop)
 
     if max_tokens_per_hour > 0:
@@ -71,19 +71,34 @@ async def _take_pending_interrupt_messages(
     *,
     limit: int = 3,
 ) -> list[InboundMessage]:
+    result: list[Any] = []
+    # Messages already admitted by the turn scheduler are older than anything
+    # still sitting on the bus, so drain the scheduler lane first.
+    scheduler = getattr(loop, "_turn_scheduler", None)
+    scheduler_taker = getattr(scheduler, "take_pending", None)
+    if callable(scheduler_taker):
+        try:
+            scheduled = scheduler_taker(msg.session_key, limit=limit)
+        except Exception as exc:
+            logger.debug(f"pending interrupt drain from scheduler skipped: {exc}")
+            scheduled = []
+        if isinstance(scheduled, list):
+            result.extend(scheduled)
+
     bus = getattr(loop, "bus", None)
     taker = getattr(bus, "take_pending_inbound_for_session", None)
-    if not callable(taker):
-        return []
-    try:
-        result = taker(msg.session_key, limit=limit)
-        if asyncio.iscoroutine(result):
-            result = await result
-    except Exception as exc:
-        logger.debug(f"pending interrupt drain skipped: {exc}")
-        return []
-    if not isinstance(result, list):
-        return []
+    remaining = max(0, int(limit or 3) - len(result))
+    if callable(taker) and remaining > 0:
+        try:
+            from_bus = taker(msg.session_key, limit=remaining)
+            if asyncio.iscoroutine(from_bus):
+                from_bus = await from_bus
+        except Exception as exc:
+            logger.debug(f"pending interrupt drain skipped: {exc}")
+            from_bus = []
+        if isinstance(from_bus, list):
+            result.extend(from_bus)
+
     pending: list[InboundMessage] = []
     for item in result:
         if isinstance(item, InboundMessage) and item.session_key == msg.session_key:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from typing import Any, Callable
 
 from loguru import logger
 
@@ -14,6 +15,81 @@ from kabot.agent.loop_core.execution_runtime_parts.helpers import (
 from kabot.bus.events import InboundMessage, OutboundMessage
 from kabot.utils.text_safety import ensure_utf8_text
 
+_STREAM_PREVIEW_MAX_CHARS = 3500
+
+
+class StreamPreviewPublisher:
+    """
+    Throttle streamed LLM text into ``draft_update`` edits on the partial lane.
+
+    Channels with a mutable preview (Telegram and friends) edit one message in
+    place, and the final reply later materializes over it, so only the latest
+    text matters. Edits are spaced ``min_interval_ms`` apart to stay inside
+    channel edit rate limits; long drafts show their tail.
+    """
+
+    def __init__(
+        self,
+        *,
+        loop: Any,
+        msg: InboundMessage,
+        min_interval_ms: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.loop = loop
+        self.msg = msg
+        self.min_interval_s = max(0, int(min_interval_ms)) / 1000.0
+        self._clock = clock
+        self._parts: list[str] = []
+        self._last_published_at: float | None = None
+        self._last_published_text = ""
+
+    def reset(self) -> None:
+        """Start a new draft for the next LLM call of the turn."""
+        self._parts = []
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    async def push(self, delta: str) -> None:
+        if not delta:
+            return
+        self._parts.append(delta)
+        now = self._clock()
+        if self._last_published_at is not None and now - self._last_published_at < self.min_interval_s:
+            return
+        await self.flush(now=now)
+
+    async def flush(self, *, now: float | None = None) -> None:
+        bus = getattr(self.loop, "bus", None)
+        publish = getattr(bus, "publish_outbound", None)
+        if not callable(publish):
+            return
+        normalized = ensure_utf8_text(self.text).strip()
+        if not normalized or normalized == self._last_published_text:
+            return
+        self._last_published_at = self._clock() if now is None else now
+        self._last_published_text = normalized
+        if len(normalized) > _STREAM_PREVIEW_MAX_CHARS:
+            normalized = "..." + normalized[-(_STREAM_PREVIEW_MAX_CHARS - 3):].lstrip()
+        try:
+            await publish(
+                OutboundMessage(
+                    channel=self.msg.channel,
+                    chat_id=self.msg.chat_id,
+                    content=normalized,
+                    metadata={
+                        "type": "draft_update",
+                        "phase": "streaming",
+                        "lane": "partial",
+                        "stream": True,
+                    },
+                )
+            )
+        except Exception:
+            return
+
 
 class TurnProgressRuntime:
     """Encapsulate status, draft, reasoning, and interrupt updates for one turn."""
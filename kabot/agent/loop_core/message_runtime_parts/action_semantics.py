@@ -8,7 +8,7 @@ from loguru import logger
 from kabot.agent.semantic_llm import call_semantic_llm_with_fallback
 
 _JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
-_ACTION_INTENTS = {
+ACTION_INTENT_LABELS = (
     "message",
     "list_dir",
     "read_file",
@@ -22,7 +22,26 @@ _ACTION_INTENTS = {
     "system_update",
     "speedtest",
     "none",
-}
+)
+_ACTION_INTENTS = set(ACTION_INTENT_LABELS)
+ACTION_INTENT_GUIDE = """- message: the user is asking to send/share/attach the active file or a file resolved from current directory context.
+- list_dir: the user is continuing folder navigation or asking about directory contents relative to the active directory context.
+- read_file: the user wants inspection/reading of a specific current file/artifact.
+- write_file: the user wants to create or update a file artifact.
+- find_files: the user wants to search for a file or folder before the next step.
+- cleanup_system: the user wants cleanup/free-space/cache/temp optimization work done now.
+- get_system_info: the user wants hardware, storage, disk-space, or system information.
+- get_process_memory: the user wants process/RAM/memory usage inspection.
+- server_monitor: the user wants runtime/server/uptime/resource health inspection.
+- check_update: the user wants to check whether the app/bot has updates.
+- system_update: the user wants to actually apply or install updates.
+- speedtest: the user wants a network speed test.
+- none: no grounded filesystem/delivery action is clear."""
+
+
+def stateful_action_eligible(text: str, **_: Any) -> bool:
+    raw = str(text or "").strip()
+    return bool(raw) and not raw.startswith("/")
 
 
 def _normalize_action_intent(value: Any) -> str:
@@ -52,12 +71,9 @@ def _parse_action_intent_response(raw_response: Any) -> str:
     return _normalize_action_intent(match.group(1) if match else "")
 
 
-async def classify_stateful_action_intent(
-    loop: Any,
-    text: str,
+def stateful_action_context(
+    loop: Any = None,
     *,
-    route_profile: str,
-    turn_category: str,
     working_directory: str = "",
     pending_followup_tool: str = "",
     pending_followup_source: str = "",
@@ -66,9 +82,35 @@ async def classify_stateful_action_intent(
     explicit_file_path: str = "",
     resolved_delivery_path: str = "",
     resolved_list_dir_path: str = "",
+    **_: Any,
+) -> str:
+    """Prompt lines describing the filesystem/delivery state of the turn."""
+    last_tool_name = str((last_tool_context or {}).get("tool") or "").strip()
+    last_tool_path = str((last_tool_context or {}).get("path") or "").strip()
+    tool_names = getattr(getattr(loop, "tools", None), "tool_names", []) or []
+    return f"""Working directory: {str(working_directory or '').strip() or 'none'}
+Pending follow-up tool: {str(pending_followup_tool or '').strip().lower() or 'none'}
+Pending follow-up source:
+\"\"\"{str(pending_followup_source or '')[:800]}\"\"\"
+Last tool name: {last_tool_name or 'none'}
+Last tool path: {last_tool_path or 'none'}
+Recent history file path: {str(recent_history_file_path or '').strip() or 'none'}
+Explicit file path candidate: {str(explicit_file_path or '').strip() or 'none'}
+Resolved delivery path candidate: {str(resolved_delivery_path or '').strip() or 'none'}
+Resolved directory path candidate: {str(resolved_list_dir_path or '').strip() or 'none'}
+Available tools: {", ".join(sorted(str(name) for name in tool_names)) or 'unknown'}"""
+
+
+async def classify_stateful_action_intent(
+    loop: Any,
+    text: str,
+    *,
+    route_profile: str,
+    turn_category: str,
+    **context: Any,
 ) -> str:
     raw = str(text or "").strip()
-    if not raw or raw.startswith("/"):
+    if not stateful_action_eligible(raw):
         return "none"
 
     provider = getattr(loop, "provider", None)
@@ -86,44 +128,19 @@ async def classify_stateful_action_intent(
         except Exception:
             model = ""
 
-    last_tool_name = str((last_tool_context or {}).get("tool") or "").strip()
-    last_tool_path = str((last_tool_context or {}).get("path") or "").strip()
-
     prompt = f"""Classify the user's primary filesystem or delivery action intent.
 
 Return ONLY one JSON object:
-{{"action_intent":"message|list_dir|read_file|write_file|find_files|cleanup_system|get_system_info|get_process_memory|server_monitor|check_update|system_update|speedtest|none"}}
+{{"action_intent":"{'|'.join(ACTION_INTENT_LABELS)}"}}
 
 Use semantics, not keyword spotting.
 
 Choose:
-- message: the user is asking to send/share/attach the active file or a file resolved from current directory context.
-- list_dir: the user is continuing folder navigation or asking about directory contents relative to the active directory context.
-- read_file: the user wants inspection/reading of a specific current file/artifact.
-- write_file: the user wants to create or update a file artifact.
-- find_files: the user wants to search for a file or folder before the next step.
-- cleanup_system: the user wants cleanup/free-space/cache/temp optimization work done now.
-- get_system_info: the user wants hardware, storage, disk-space, or system information.
-- get_process_memory: the user wants process/RAM/memory usage inspection.
-- server_monitor: the user wants runtime/server/uptime/resource health inspection.
-- check_update: the user wants to check whether the app/bot has updates.
-- system_update: the user wants to actually apply or install updates.
-- speedtest: the user wants a network speed test.
-- none: no grounded filesystem/delivery action is clear.
+{ACTION_INTENT_GUIDE}
 
 Route profile: {str(route_profile or '').strip().upper() or 'GENERAL'}
 Turn category: {str(turn_category or '').strip().lower() or 'chat'}
-Working directory: {str(working_directory or '').strip() or 'none'}
-Pending follow-up tool: {str(pending_followup_tool or '').strip().lower() or 'none'}
-Pending follow-up source:
-\"\"\"{str(pending_followup_source or '')[:800]}\"\"\"
-Last tool name: {last_tool_name or 'none'}
-Last tool path: {last_tool_path or 'none'}
-Recent history file path: {str(recent_history_file_path or '').strip() or 'none'}
-Explicit file path candidate: {str(explicit_file_path or '').strip() or 'none'}
-Resolved delivery path candidate: {str(resolved_delivery_path or '').strip() or 'none'}
-Resolved directory path candidate: {str(resolved_list_dir_path or '').strip() or 'none'}
-Available tools: {", ".join(sorted(str(name) for name in getattr(getattr(loop, "tools", None), "tool_names", []) or [])) or 'unknown'}
+{stateful_action_context(loop, **context)}
 User message:
 \"\"\"{raw[:1200]}\"\"\""""
 
@@ -142,4 +159,10 @@ User message:
     return _parse_action_intent_response(getattr(response, "content", ""))
 
 
-__all__ = ["classify_stateful_action_intent"]
+__all__ = [
+    "ACTION_INTENT_GUIDE",
+    "ACTION_INTENT_LABELS",
+    "classify_stateful_action_intent",
+    "stateful_action_context",
+    "stateful_action_eligible",
+]
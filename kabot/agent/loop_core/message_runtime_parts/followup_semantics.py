@@ -11,7 +11,7 @@ from kabot.agent.loop_core.message_runtime_parts.helpers import _is_low_informat
 
 _JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
 
-_FOLLOWUP_INTENTS = {
+FOLLOWUP_INTENT_LABELS = (
     "assistant_offer_accept",
     "assistant_committed_action_followup",
     "answer_reference",
@@ -22,7 +22,18 @@ _FOLLOWUP_INTENTS = {
     "weather_context",
     "contextual_followup",
     "none",
-}
+)
+_FOLLOWUP_INTENTS = set(FOLLOWUP_INTENT_LABELS)
+FOLLOWUP_INTENT_GUIDE = """- assistant_offer_accept: the user is accepting or continuing a pending assistant offer.
+- assistant_committed_action_followup: the user is asking you to proceed with a previously committed action or is giving a small missing detail for it.
+- answer_reference: the user is referring to the assistant's recent answer and wants that answer continued, clarified, simplified, expanded, or interpreted.
+- option_selection: the user is selecting or asking about one option from a recent assistant-provided option list.
+- file_context: the user is referring to the current file/page/artifact context and expects follow-up inspection or continuation on that same file.
+- directory_context: the user is continuing directory/folder navigation or asking about contents relative to the active directory context.
+- delivery_request: the user is asking to send/share/attach the active file/artifact context to the current destination.
+- weather_context: the user is asking a follow-up about the same weather/location context.
+- contextual_followup: the user is continuing the same active context, but none of the more specific labels fit.
+- none: this is mainly a fresh request or there is not enough evidence of continuation."""
 
 
 def _normalize_followup_intent(value: Any) -> str:
@@ -56,12 +67,9 @@ def _parse_followup_intent_response(raw_response: Any) -> str:
     return _normalize_followup_intent(match.group(1) if match else "")
 
 
-async def classify_stateful_followup_intent(
-    loop: Any,
+def stateful_followup_eligible(
     text: str,
     *,
-    route_profile: str,
-    turn_category: str,
     pending_followup_kind: str = "",
     pending_followup_text: str = "",
     pending_followup_request_text: str = "",
@@ -74,15 +82,13 @@ async def classify_stateful_followup_intent(
     current_workflow_kind: str = "",
     current_workflow_stage: str = "",
     current_workflow_request_text: str = "",
-) -> str:
+    **_: Any,
+) -> bool:
+    """Only short-ish turns with some live context can be follow-ups."""
     raw = str(text or "").strip()
     if not raw or raw.startswith("/"):
-        return "none"
+        return False
 
-    last_tool_name = str((last_tool_context or {}).get("tool") or "").strip()
-    last_tool_path = str((last_tool_context or {}).get("path") or "").strip()
-    last_execution_tool = str((last_tool_execution or {}).get("tool") or "").strip()
-    last_execution_source = str((last_tool_execution or {}).get("source") or "").strip()
     has_anchor = any(
         [
             str(pending_followup_kind or "").strip(),
@@ -90,10 +96,10 @@ async def classify_stateful_followup_intent(
             str(pending_followup_request_text or "").strip(),
             str(pending_followup_tool or "").strip(),
             str(pending_followup_source or "").strip(),
-            last_tool_name,
-            last_tool_path,
-            last_execution_tool,
-            last_execution_source,
+            str((last_tool_context or {}).get("tool") or "").strip(),
+            str((last_tool_context or {}).get("path") or "").strip(),
+            str((last_tool_execution or {}).get("tool") or "").strip(),
+            str((last_tool_execution or {}).get("source") or "").strip(),
             str(recent_assistant_answer or "").strip(),
             str(recent_history_file_path or "").strip(),
             str(current_workflow_kind or "").strip(),
@@ -102,11 +108,67 @@ async def classify_stateful_followup_intent(
         ]
     )
     if not has_anchor:
-        return "none"
+        return False
 
     if not _is_low_information_turn(raw, max_tokens=18, max_chars=220):
         if len(raw) > 420 or len([token for token in raw.split() if token]) > 32:
-            return "none"
+            return False
+    return True
+
+
+def stateful_followup_context(
+    *,
+    pending_followup_kind: str = "",
+    pending_followup_text: str = "",
+    pending_followup_request_text: str = "",
+    pending_followup_tool: str = "",
+    pending_followup_source: str = "",
+    last_tool_context: dict[str, Any] | None = None,
+    last_tool_execution: dict[str, Any] | None = None,
+    recent_assistant_answer: str = "",
+    recent_history_file_path: str = "",
+    current_workflow_kind: str = "",
+    current_workflow_stage: str = "",
+    current_workflow_request_text: str = "",
+    **_: Any,
+) -> str:
+    """Prompt lines describing the live context a follow-up could refer to."""
+    last_tool_name = str((last_tool_context or {}).get("tool") or "").strip()
+    last_tool_path = str((last_tool_context or {}).get("path") or "").strip()
+    last_execution_tool = str((last_tool_execution or {}).get("tool") or "").strip()
+    last_execution_source = str((last_tool_execution or {}).get("source") or "").strip()
+    return f"""Pending follow-up kind: {str(pending_followup_kind or '').strip().lower() or 'none'}
+Pending follow-up text:
+\"\"\"{str(pending_followup_text or '')[:900]}\"\"\"
+Pending follow-up request text:
+\"\"\"{str(pending_followup_request_text or '')[:900]}\"\"\"
+Pending follow-up tool: {str(pending_followup_tool or '').strip().lower() or 'none'}
+Pending follow-up source:
+\"\"\"{str(pending_followup_source or '')[:900]}\"\"\"
+Last tool name: {last_tool_name or 'none'}
+Last tool path: {last_tool_path or 'none'}
+Last execution tool: {last_execution_tool or 'none'}
+Last execution source: {last_execution_source or 'none'}
+Recent history file path: {str(recent_history_file_path or '').strip() or 'none'}
+Current workflow kind: {str(current_workflow_kind or '').strip().lower() or 'none'}
+Current workflow stage: {str(current_workflow_stage or '').strip().lower() or 'none'}
+Current workflow request:
+\"\"\"{str(current_workflow_request_text or '')[:900]}\"\"\"
+Recent assistant answer excerpt:
+\"\"\"{str(recent_assistant_answer or '')[:1200]}\"\"\""""
+
+
+async def classify_stateful_followup_intent(
+    loop: Any,
+    text: str,
+    *,
+    route_profile: str,
+    turn_category: str,
+    **context: Any,
+) -> str:
+    raw = str(text or "").strip()
+    if not stateful_followup_eligible(raw, **context):
+        return "none"
 
     provider = getattr(loop, "provider", None)
     chat = getattr(provider, "chat", None)
@@ -126,43 +188,16 @@ async def classify_stateful_followup_intent(
     prompt = f"""Classify whether the user's turn is continuing existing context.
 
 Return ONLY one JSON object:
-{{"followup_intent":"assistant_offer_accept|assistant_committed_action_followup|answer_reference|option_selection|file_context|directory_context|delivery_request|weather_context|contextual_followup|none"}}
+{{"followup_intent":"{'|'.join(FOLLOWUP_INTENT_LABELS)}"}}
 
 Use semantics, not keyword spotting.
 
 Labels:
-- assistant_offer_accept: the user is accepting or continuing a pending assistant offer.
-- assistant_committed_action_followup: the user is asking you to proceed with a previously committed action or is giving a small missing detail for it.
-- answer_reference: the user is referring to the assistant's recent answer and wants that answer continued, clarified, simplified, expanded, or interpreted.
-- option_selection: the user is selecting or asking about one option from a recent assistant-provided option list.
-- file_context: the user is referring to the current file/page/artifact context and expects follow-up inspection or continuation on that same file.
-- directory_context: the user is continuing directory/folder navigation or asking about contents relative to the active directory context.
-- delivery_request: the user is asking to send/share/attach the active file/artifact context to the current destination.
-- weather_context: the user is asking a follow-up about the same weather/location context.
-- contextual_followup: the user is continuing the same active context, but none of the more specific labels fit.
-- none: this is mainly a fresh request or there is not enough evidence of continuation.
+{FOLLOWUP_INTENT_GUIDE}
 
 Route profile: {str(route_profile or '').strip().upper() or 'GENERAL'}
 Turn category: {str(turn_category or '').strip().lower() or 'chat'}
-Pending follow-up kind: {str(pending_followup_kind or '').strip().lower() or 'none'}
-Pending follow-up text:
-\"\"\"{str(pending_followup_text or '')[:900]}\"\"\"
-Pending follow-up request text:
-\"\"\"{str(pending_followup_request_text or '')[:900]}\"\"\"
-Pending follow-up tool: {str(pending_followup_tool or '').strip().lower() or 'none'}
-Pending follow-up source:
-\"\"\"{str(pending_followup_source or '')[:900]}\"\"\"
-Last tool name: {last_tool_name or 'none'}
-Last tool path: {last_tool_path or 'none'}
-Last execution tool: {last_execution_tool or 'none'}
-Last execution source: {last_execution_source or 'none'}
-Recent history file path: {str(recent_history_file_path or '').strip() or 'none'}
-Current workflow kind: {str(current_workflow_kind or '').strip().lower() or 'none'}
-Current workflow stage: {str(current_workflow_stage or '').strip().lower() or 'none'}
-Current workflow request:
-\"\"\"{str(current_workflow_request_text or '')[:900]}\"\"\"
-Recent assistant answer excerpt:
-\"\"\"{str(recent_assistant_answer or '')[:1200]}\"\"\"
+{stateful_followup_context(**context)}
 User message:
 \"\"\"{raw[:1200]}\"\"\""""
 
@@ -181,4 +216,10 @@ User message:
     return _parse_followup_intent_response(getattr(response, "content", ""))
 
 
-__all__ = ["classify_stateful_followup_intent"]
+__all__ = [
+    "FOLLOWUP_INTENT_GUIDE",
+    "FOLLOWUP_INTENT_LABELS",
+    "classify_stateful_followup_intent",
+    "stateful_followup_context",
+    "stateful_followup_eligible",
+]
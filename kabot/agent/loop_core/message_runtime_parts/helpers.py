@@ -374,6 +374,18 @@ def _channel_uses_mutable_status_lane(loop: Any, channel_name: str) -> bool:
     return channel_base in _MUTABLE_STATUS_LANE_CHANNELS
 
 
+# The dashboard has no channel adapter; its SSE endpoint renders draft updates.
+_STREAM_PREVIEW_CHANNELS = {"dashboard"}
+
+
+def _channel_supports_stream_preview(loop: Any, channel_name: str) -> bool:
+    """Return whether streamed LLM text should be published as draft updates."""
+    if _channel_uses_mutable_status_lane(loop, channel_name):
+        return True
+    channel_base = str(channel_name or "").strip().lower().split(":", 1)[0]
+    return channel_base in _STREAM_PREVIEW_CHANNELS
+
+
 _PRIMARY_INTENT_TAIL_MARKERS = (
     "from this",
     "based on this",
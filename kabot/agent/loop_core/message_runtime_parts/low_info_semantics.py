@@ -12,9 +12,26 @@ from kabot.agent.semantic_llm import call_semantic_llm_with_fallback
 _JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
 
 
+TURN_INTENT_LABELS = ("closing_ack", "greeting_smalltalk", "meta_feedback", "none")
+TURN_INTENT_GUIDE = """- closing_ack: short gratitude, closure, or polite wrap-up with no new task.
+- greeting_smalltalk: short greeting/opening with no task.
+- meta_feedback: short reaction about the assistant's prior answer, but still not a new task.
+- none: anything else."""
+
+
+def low_information_turn_eligible(text: str, *, turn_category: str, **_: Any) -> bool:
+    """Cheap pre-check: only short chat/action turns are worth classifying."""
+    raw = str(text or "").strip()
+    if not raw or raw.startswith("/"):
+        return False
+    if not _is_low_information_turn(raw, max_tokens=10, max_chars=120):
+        return False
+    return str(turn_category or "").strip().lower() in {"chat", "contextual_action", "action"}
+
+
 def _normalize_turn_intent(value: Any) -> str:
     normalized = str(value or "").strip().lower()
-    if normalized in {"closing_ack", "greeting_smalltalk", "meta_feedback", "none"}:
+    if normalized in TURN_INTENT_LABELS:
         return normalized
     return "none"
 
@@ -43,11 +60,7 @@ async def classify_low_information_turn_intent(
     turn_category: str,
 ) -> str:
     raw = str(text or "").strip()
-    if not raw or raw.startswith("/"):
-        return "none"
-    if not _is_low_information_turn(raw, max_tokens=10, max_chars=120):
-        return "none"
-    if str(turn_category or "").strip().lower() not in {"chat", "contextual_action", "action"}:
+    if not low_information_turn_eligible(raw, turn_category=turn_category):
         return "none"
 
     provider = getattr(loop, "provider", None)
@@ -68,14 +81,11 @@ async def classify_low_information_turn_intent(
     prompt = f"""Classify this short user turn.
 
 Return ONLY one JSON object:
-{{"turn_intent":"closing_ack|greeting_smalltalk|meta_feedback|none"}}
+{{"turn_intent":"{'|'.join(TURN_INTENT_LABELS)}"}}
 
 Use semantics, not keyword spotting.
 
-- closing_ack: short gratitude, closure, or polite wrap-up with no new task.
-- greeting_smalltalk: short greeting/opening with no task.
-- meta_feedback: short reaction about the assistant's prior answer, but still not a new task.
-- none: anything else.
+{TURN_INTENT_GUIDE}
 
 Understand the user's actual language.
 
@@ -99,4 +109,9 @@ User message:
     return _parse_turn_intent_response(getattr(response, "content", ""))
 
 
-__all__ = ["classify_low_information_turn_intent"]
+__all__ = [
+    "TURN_INTENT_GUIDE",
+    "TURN_INTENT_LABELS",
+    "classify_low_information_turn_intent",
+    "low_information_turn_eligible",
+]
@@ -11,9 +11,20 @@ from kabot.agent.semantic_llm import call_semantic_llm_with_fallback
 _JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
 
 
+MEMORY_INTENT_LABELS = ("memory_recall", "memory_commit", "none")
+MEMORY_INTENT_GUIDE = """Choose memory_recall when the user is asking you to recall something previously stored, remembered, decided, agreed, or learned about the user, project, or conversation.
+Choose memory_commit when the user is asking you to store or remember current information for future use.
+Choose none otherwise."""
+
+
+def semantic_memory_eligible(text: str, **_: Any) -> bool:
+    raw = str(text or "").strip()
+    return bool(raw) and not raw.startswith("/")
+
+
 def _normalize_memory_intent(value: Any) -> str:
     normalized = str(value or "").strip().lower()
-    if normalized in {"memory_recall", "memory_commit", "none"}:
+    if normalized in MEMORY_INTENT_LABELS:
         return normalized
     return "none"
 
@@ -49,6 +60,28 @@ def _format_recent_history_excerpt(conversation_history: list[dict[str, Any]] |
     return "\n".join(excerpt_lines).strip()
 
 
+def semantic_memory_context(
+    *,
+    conversation_history: list[dict[str, Any]] | None = None,
+    user_profile: dict[str, Any] | None = None,
+    **_: Any,
+) -> str:
+    """Prompt lines describing what the memory classifier conditions on."""
+    profile_summary = ""
+    if isinstance(user_profile, dict) and user_profile:
+        summary_parts = [
+            f"{key}={value}"
+            for key, value in list(user_profile.items())[:6]
+            if str(value or "").strip()
+        ]
+        profile_summary = ", ".join(summary_parts)
+
+    history_excerpt = _format_recent_history_excerpt(conversation_history)
+    return f"""Known user profile summary: {profile_summary or 'none'}
+Recent conversation excerpt:
+\"\"\"{history_excerpt[:1600]}\"\"\""""
+
+
 async def classify_semantic_memory_intent(
     loop: Any,
     text: str,
@@ -59,7 +92,7 @@ async def classify_semantic_memory_intent(
     user_profile: dict[str, Any] | None = None,
 ) -> str:
     raw = str(text or "").strip()
-    if not raw or raw.startswith("/"):
+    if not semantic_memory_eligible(raw):
         return "none"
 
     provider = getattr(loop, "provider", None)
@@ -77,32 +110,18 @@ async def classify_semantic_memory_intent(
         except Exception:
             model = ""
 
-    profile_summary = ""
-    if isinstance(user_profile, dict) and user_profile:
-        summary_parts = [
-            f"{key}={value}"
-            for key, value in list(user_profile.items())[:6]
-            if str(value or "").strip()
-        ]
-        profile_summary = ", ".join(summary_parts)
-
-    history_excerpt = _format_recent_history_excerpt(conversation_history)
     prompt = f"""Classify the user's memory intent.
 
 Return ONLY one JSON object:
-{{"memory_intent":"memory_recall|memory_commit|none"}}
+{{"memory_intent":"{'|'.join(MEMORY_INTENT_LABELS)}"}}
 
 Use semantics, not keyword spotting.
 
-Choose memory_recall when the user is asking you to recall something previously stored, remembered, decided, agreed, or learned about the user, project, or conversation.
-Choose memory_commit when the user is asking you to store or remember current information for future use.
-Choose none otherwise.
+{MEMORY_INTENT_GUIDE}
 
 Route profile: {str(route_profile or '').strip().upper() or 'GENERAL'}
 Turn category: {str(turn_category or '').strip().lower() or 'chat'}
-Known user profile summary: {profile_summary or 'none'}
-Recent conversation excerpt:
-\"\"\"{history_excerpt[:1600]}\"\"\"
+{semantic_memory_context(conversation_history=conversation_history, user_profile=user_profile)}
 
 User message:
 \"\"\"{raw[:2400]}\"\"\""""
@@ -121,4 +140,10 @@ User message:
     return _parse_memory_intent_response(getattr(response, "content", ""))
 
 
-__all__ = ["classify_semantic_memory_intent"]
+__all__ = [
+    "MEMORY_INTENT_GUIDE",
+    "MEMORY_INTENT_LABELS",
+    "classify_semantic_memory_intent",
+    "semantic_memory_context",
+    "semantic_memory_eligible",
+]
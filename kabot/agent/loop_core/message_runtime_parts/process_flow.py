@@ -143,6 +143,10 @@ from kabot.agent.loop_core.message_runtime_parts.workflow_semantics import (
 from kabot.agent.loop_core.message_runtime_parts.low_info_semantics import (
     classify_low_information_turn_intent,
 )
+from kabot.agent.loop_core.message_runtime_parts.semantic_classification import (
+    SemanticTask,
+    classify_turn_semantics,
+)
 from kabot.agent.loop_core.execution_runtime_parts.intent import (
     _build_source_constrained_web_search_query,
     _extract_direct_fetch_url_candidate,
@@ -511,10 +515,12 @@ async def process_message(loop: Any, msg: InboundMessage) -> OutboundMessage | N
                         pass
 
     # Router triase: SIMPLE vs COMPLEX
+    route_started = time.perf_counter()
     if fast_direct_context and required_tool in route_bypass_direct_tools:
         decision = SimpleNamespace(profile="GENERAL", is_complex=True)
     else:
         decision = await loop.router.route(effective_content)
+    route_ms = int((time.perf_counter() - route_started) * 1000)
     route_workflow_intent = str(getattr(decision, "workflow_intent", "") or "").strip().lower() or "none"
     semantic_workflow_intent = route_workflow_intent
     if (
@@ -788,16 +794,168 @@ async def process_message(loop: Any, msg: InboundMessage) -> OutboundMessage | N
         looks_like_meta_skill_or_workflow_prompt(effective_content)
         and not explicit_skill_use_request
     )
+    user_profile_snapshot = (
+        (getattr(session, "metadata", {}) or {}).get("user_profile")
+        if isinstance(getattr(session, "metadata", None), dict)
+        else None
+    )
+    followup_semantic_kwargs = {
+        "pending_followup_kind": pending_followup_intent_kind,
+        "pending_followup_text": pending_followup_intent_text,
+        "pending_followup_request_text": pending_followup_intent_request_text,
+        "pending_followup_tool": str(pending_followup_tool or ""),
+        "pending_followup_source": pending_followup_source,
+        "last_tool_context": last_tool_context if isinstance(last_tool_context, dict) else None,
+        "last_tool_execution": last_tool_execution if isinstance(last_tool_execution, dict) else None,
+        "recent_assistant_answer": recent_assistant_answer,
+        "recent_history_file_path": recent_history_file_path,
+        "current_workflow_kind": current_skill_flow_kind,
+        "current_workflow_stage": str((current_skill_flow or {}).get("stage") or ""),
+        "current_workflow_request_text": str((current_skill_flow or {}).get("request_text") or ""),
+    }
+    action_semantic_kwargs = {
+        "working_directory": str(
+            (
+                getattr(session, "metadata", {}).get("working_directory")
+                if isinstance(getattr(session, "metadata", None), dict)
+                else ""
+            )
+            or ""
+        ).strip(),
+        "pending_followup_tool": str(pending_followup_tool or ""),
+        "pending_followup_source": pending_followup_source,
+        "last_tool_context": action_context_last_tool,
+        "recent_history_file_path": recent_history_file_path,
+        "explicit_file_path": explicit_file_path_candidate,
+        "resolved_delivery_path": resolved_delivery_path_candidate,
+        "resolved_list_dir_path": resolved_list_dir_path_candidate,
+    }
+    semantic_skills_loader = None
+    if semantic_workflow_intent == "none" and not required_tool and not meta_skill_reference_turn:
+        semantic_context_builder = None
+        resolve_context_builder = getattr(loop, "_resolve_context_for_message", None)
+        if callable(resolve_context_builder):
+            try:
+                semantic_context_builder = resolve_context_builder(msg)
+            except Exception as exc:
+                logger.debug(f"Semantic workflow context resolution failed: {exc}")
+        if semantic_context_builder is None:
+            semantic_context_builder = getattr(loop, "context", None)
+        semantic_skills_loader = getattr(semantic_context_builder, "skills", None)
+    # Ask every classifier this turn may need in one LLM call. The router stays
+    # a separate call: its turn category decides which classifiers apply.
+    # If the fused call fails, memory and action only run once the independent
+    # labels show the call site would still ask for them.
+    looks_like_meta_feedback = _looks_like_non_action_meta_feedback(effective_content)
+
+    def _memory_gate(results: dict[str, str]) -> bool:
+        return not looks_like_meta_feedback and results.get("low_info") not in {
+            "closing_ack",
+            "greeting_smalltalk",
+            "meta_feedback",
+        }
+
+    def _action_gate(results: dict[str, str]) -> bool:
+        return _memory_gate(results) and results.get("followup") not in {
+            "directory_context",
+            "delivery_request",
+        }
+
+    semantic_tasks: list[SemanticTask] = []
+    if not required_tool and not meta_skill_reference_turn:
+        semantic_tasks.append(SemanticTask("low_info", classify_low_information_turn_intent))
+        semantic_tasks.append(
+            SemanticTask(
+                "memory",
+                classify_semantic_memory_intent,
+                {
+                    "conversation_history": conversation_history,
+                    "user_profile": user_profile_snapshot,
+                },
+                gate=_memory_gate,
+            )
+        )
+        if (
+            pending_followup_tool
+            or pending_followup_intent
+            or recent_assistant_answer
+            or recent_history_file_path
+            or isinstance(last_tool_context, dict)
+            or isinstance(last_tool_execution, dict)
+            or current_skill_flow
+        ):
+            semantic_tasks.append(
+                SemanticTask("followup", classify_stateful_followup_intent, followup_semantic_kwargs)
+            )
+        if semantic_workflow_intent == "none":
+            semantic_tasks.append(
+                SemanticTask(
+                    "workflow",
+                    classify_skill_workflow_intent,
+                    {
+                        "skills_loader": semantic_skills_loader,
+                        "conversation_history": conversation_history,
+                        "current_workflow_request_text": str(
+                            (current_skill_flow or {}).get("request_text") or ""
+                        ),
+                        "current_workflow_stage": str((current_skill_flow or {}).get("stage") or ""),
+                        "current_workflow_kind": current_skill_flow_kind,
+                    },
+                    turn_category=str(getattr(decision, "turn_category", "") or ""),
+                )
+            )
+    if not required_tool and route_turn_category in {"action", "contextual_action", "command"}:
+        semantic_tasks.append(
+            SemanticTask(
+                "action",
+                classify_stateful_action_intent,
+                action_semantic_kwargs,
+                turn_category=route_turn_category or "action",
+                gate=_action_gate,
+            )
+        )
+    semantic_turn = await classify_turn_semantics(
+        loop,
+        effective_content,
+        route_profile=str(getattr(decision, "profile", "") or ""),
+        turn_category=route_turn_category,
+        tasks=semantic_tasks,
+    )
+    logger.info(
+        f"turn_id={turn_id} route_ms={route_ms} "
+        f"semantic_classify_ms={semantic_turn.elapsed_ms} semantic_mode={semantic_turn.mode}"
+    )
+    _emit_runtime_event(
+        loop,
+        "semantic_classified",
+        turn_id=turn_id,
+        route_ms=route_ms,
+        classify_ms=semantic_turn.elapsed_ms,
+        mode=semantic_turn.mode,
+        llm_calls=semantic_turn.llm_calls,
+        tasks=sorted(semantic_turn.results),
+    )
+    try:
+        msg.metadata["semantic_timing"] = {
+            "route_ms": route_ms,
+            "classify_ms": semantic_turn.elapsed_ms,
+            "mode": semantic_turn.mode,
+            "llm_calls": semantic_turn.llm_calls,
+        }
+    except Exception:
+        pass
     if (
         not required_tool
         and not meta_skill_reference_turn
     ):
-        semantic_low_info_intent = await classify_low_information_turn_intent(
-            loop,
-            effective_content,
-            route_profile=str(getattr(decision, "profile", "") or ""),
-            turn_category=route_turn_category,
-        )
+        semantic_low_info_intent = semantic_turn.get("low_info")
+        if semantic_low_info_intent is None:
+            semantic_low_info_intent = await classify_low_information_turn_intent(
+                loop,
+                effective_content,
+                route_profile=str(getattr(decision, "profile", "") or ""),
+                turn_category=route_turn_category,
+            )
         if semantic_low_info_intent == "closing_ack":
             is_closing_ack = True
         elif semantic_low_info_intent == "greeting_smalltalk":
@@ -832,18 +990,16 @@ async def process_message(loop: Any, msg: InboundMessage) -> OutboundMessage | N
         and not is_non_action_feedback
         and not meta_skill_reference_turn
     ):
-        semantic_memory_intent = await classify_semantic_memory_intent(
-            loop,
-            effective_content,
-            route_profile=str(getattr(decision, "profile", "") or ""),
-            turn_category=route_turn_category,
-            conversation_history=conversation_history,
-            user_profile=(
-                (getattr(session, "metadata", {}) or {}).get("user_profile")
-                if isinstance(getattr(session, "metadata", None), dict)
-                else None
-            ),
-        )
+        semantic_memory_intent = semantic_turn.get("memory")
+        if semantic_memory_intent is None:
+            semantic_memory_intent = await classify_semantic_memory_intent(
+                loop,
+                effective_content,
+                route_profile=str(getattr(decision, "profile", "") or ""),
+                turn_category=route_turn_category,
+                conversation_history=conversation_history,
+                user_profile=user_profile_snapshot,
+            )
     semantic_followup_intent = "none"
     if (
         not required_tool
@@ -861,24 +1017,15 @@ async def process_message(loop: Any, msg: InboundMessage) -> OutboundMessage | N
             or current_skill_flow
         )
     ):
-        semantic_followup_intent = await classify_stateful_followup_intent(
-            loop,
-            effective_content,
-            route_profile=str(getattr(decision, "profile", "") or ""),
-            turn_category=route_turn_category,
-            pending_followup_kind=pending_followup_intent_kind,
-            pending_followup_text=pending_followup_intent_text,
-            pending_followup_request_text=pending_followup_intent_request_text,
-            pending_followup_tool=str(pending_followup_tool or ""),
-            pending_followup_source=pending_followup_source,
-            last_tool_context=last_tool_context if isinstance(last_tool_context, dict) else None,
-            last_tool_execution=last_tool_execution if isinstance(last_tool_execution, dict) else None,
-            recent_assistant_answer=recent_assistant_answer,
-            recent_history_file_path=recent_history_file_path,
-            current_workflow_kind=current_skill_flow_kind,
-            current_workflow_stage=str((current_skill_flow or {}).get("stage") or ""),
-            current_workflow_request_text=str((current_skill_flow or {}).get("request_text") or ""),
-        )
+        semantic_followup_intent = semantic_turn.get("followup")
+        if semantic_followup_intent is None:
+            semantic_followup_intent = await classify_stateful_followup_intent(
+                loop,
+                effective_content,
+                route_profile=str(getattr(decision, "profile", "") or ""),
+                turn_category=route_turn_category,
+                **followup_semantic_kwargs,
+            )
     if semantic_followup_intent == "none" and structural_option_dialog_followup:
         semantic_followup_intent = "option_selection"
     if semantic_followup_intent == "answer_reference":
@@ -996,27 +1143,19 @@ async def process_message(loop: Any, msg: InboundMessage) -> OutboundMessage | N
         and not is_non_action_feedback
         and not meta_skill_reference_turn
     ):
-        semantic_context_builder = None
-        resolve_context_builder = getattr(loop, "_resolve_context_for_message", None)
-        if callable(resolve_context_builder):
-            try:
-                semantic_context_builder = resolve_context_builder(msg)
-            except Exception as exc:
-                logger.debug(f"Semantic workflow context resolution failed: {exc}")
-        if semantic_context_builder is None:
-            semantic_context_builder = getattr(loop, "context", None)
-        semantic_skills_loader = getattr(semantic_context_builder, "skills", None)
-        semantic_workflow_intent = await classify_skill_workflow_intent(
-            loop,
-            effective_content,
-            route_profile=str(getattr(decision, "profile", "") or ""),
-            turn_category=str(getattr(decision, "turn_category", "") or ""),
-            skills_loader=semantic_skills_loader,
-            conversation_history=conversation_history,
-            current_workflow_request_text=str((current_skill_flow or {}).get("request_text") or ""),
-            current_workflow_stage=str((current_skill_flow or {}).get("stage") or ""),
-            current_workflow_kind=current_skill_flow_kind,
-        )
+        semantic_workflow_intent = semantic_turn.get("workflow")
+        if semantic_workflow_intent is None:
+            semantic_workflow_intent = await classify_skill_workflow_intent(
+                loop,
+                effective_content,
+                route_profile=str(getattr(decision, "profile", "") or ""),
+                turn_category=str(getattr(decision, "turn_category", "") or ""),
+                skills_loader=semantic_skills_loader,
+                conversation_history=conversation_history,
+                current_workflow_request_text=str((current_skill_flow or {}).get("request_text") or ""),
+                current_workflow_stage=str((current_skill_flow or {}).get("stage") or ""),
+                current_workflow_kind=current_skill_flow_kind,
+            )
     if semantic_hint.kind in {
         "advice_turn",
         "meta_feedback",
@@ -1105,27 +1244,15 @@ async def process_message(loop: Any, msg: InboundMessage) -> OutboundMessage | N
         and not is_non_action_feedback
         and route_turn_category in {"action", "contextual_action", "command"}
     ):
-        semantic_action_tool = await classify_stateful_action_intent(
-            loop,
-            effective_content,
-            route_profile=str(getattr(decision, "profile", "") or ""),
-            turn_category=route_turn_category or "action",
-            working_directory=str(
-                (
-                    getattr(session, "metadata", {}).get("working_directory")
-                    if isinstance(getattr(session, "metadata", None), dict)
-                    else ""
-                )
-                or ""
-            ).strip(),
-            pending_followup_tool=str(pending_followup_tool or ""),
-            pending_followup_source=pending_followup_source,
-            last_tool_context=action_context_last_tool,
-            recent_history_file_path=recent_history_file_path,
-            explicit_file_path=explicit_file_path_candidate,
-            resolved_delivery_path=resolved_delivery_path_candidate,
-            resolved_list_dir_path=resolved_list_dir_path_candidate,
-        )
+        semantic_action_tool = semantic_turn.get("action")
+        if semantic_action_tool is None:
+            semantic_action_tool = await classify_stateful_action_intent(
+                loop,
+                effective_content,
+                route_profile=str(getattr(decision, "profile", "") or ""),
+                turn_category=route_turn_category or "action",
+                **action_semantic_kwargs,
+            )
         if (
             semantic_action_tool != "none"
             and _tool_registry_has(loop, semantic_action_tool)
@@ -10,12 +10,17 @@ from typing import Any
 from loguru import logger
 
 from kabot.agent.fallback_i18n import t
+from kabot.agent.loop_core.execution_runtime_parts.progress import StreamPreviewPublisher
+from kabot.agent.loop_core.message_runtime_parts.bootstrap_onboarding import (
+    update_bootstrap_onboarding_state,
+)
 from kabot.agent.loop_core.message_runtime_parts.helpers import (
     _KEEPALIVE_INITIAL_DELAY_SECONDS,
     _KEEPALIVE_INTERVAL_SECONDS,
     _build_budget_hints,
     _build_untrusted_context_payload,
     _channel_supports_keepalive_passthrough,
+    _channel_supports_stream_preview,
     _channel_uses_mutable_status_lane,
     _classify_assistant_followup_intent_kind,
     _emit_runtime_event,
@@ -29,9 +34,6 @@ from kabot.agent.loop_core.message_runtime_parts.helpers import (
     _set_pending_followup_intent,
     _update_skill_creation_flow_after_response,
 )
-from kabot.agent.loop_core.message_runtime_parts.bootstrap_onboarding import (
-    update_bootstrap_onboarding_state,
-)
 from kabot.agent.loop_core.message_runtime_parts.language_semantics import (
     classify_language_followup_intent,
 )
@@ -388,6 +390,18 @@ async def _run_turn_response(state: Any) -> OutboundMessage | None:
                     f"turn_id={turn_id} context_build_ms={context_build_ms} exceeded budget={max_context_build_ms}"
                 )
 
+            if (
+                not is_background_task
+                and perf_cfg
+                and bool(getattr(perf_cfg, "stream_responses", True))
+                and _channel_supports_stream_preview(loop, msg.channel)
+            ):
+                loop._active_stream_sink = StreamPreviewPublisher(
+                    loop=loop,
+                    msg=msg,
+                    min_interval_ms=int(getattr(perf_cfg, "stream_preview_interval_ms", 1000)),
+                )
+
             if decision.is_complex or required_tool:
                 if required_tool and not decision.is_complex:
                     logger.info(f"Route override: simple -> complex (required_tool={required_tool})")
@@ -405,6 +419,7 @@ async def _run_turn_response(state: Any) -> OutboundMessage | None:
             response_error = exc
 
         finally:
+            loop._active_stream_sink = None
             keepalive_stop.set()
             if keepalive_task is not None:
                 keepalive_task.cancel()
@@ -0,0 +1,311 @@
+"""Fused per-turn semantic classification.
+
+A turn can need up to five small classifier prompts (low-info, memory,
+follow-up, workflow, action). When two or more of them are eligible they are
+asked in one structured LLM call; if that answer is missing any field or uses
+an unknown label, the independent classifiers run concurrently instead, and
+tasks with a ``gate`` run afterwards only if the gate passes on those results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+from kabot.agent.loop_core.message_runtime_parts.action_semantics import (
+    ACTION_INTENT_GUIDE,
+    ACTION_INTENT_LABELS,
+    stateful_action_context,
+    stateful_action_eligible,
+)
+from kabot.agent.loop_core.message_runtime_parts.followup_semantics import (
+    FOLLOWUP_INTENT_GUIDE,
+    FOLLOWUP_INTENT_LABELS,
+    stateful_followup_context,
+    stateful_followup_eligible,
+)
+from kabot.agent.loop_core.message_runtime_parts.low_info_semantics import (
+    TURN_INTENT_GUIDE,
+    TURN_INTENT_LABELS,
+    low_information_turn_eligible,
+)
+from kabot.agent.loop_core.message_runtime_parts.memory_semantics import (
+    MEMORY_INTENT_GUIDE,
+    MEMORY_INTENT_LABELS,
+    semantic_memory_context,
+    semantic_memory_eligible,
+)
+from kabot.agent.loop_core.message_runtime_parts.workflow_semantics import (
+    WORKFLOW_INTENT_GUIDE,
+    WORKFLOW_INTENT_LABELS,
+    filter_workflow_intent,
+    skill_workflow_context,
+    skill_workflow_eligible,
+)
+from kabot.agent.semantic_llm import call_semantic_llm_with_fallback
+
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
+class _AxisSpec:
+    field: str
+    labels: tuple[str, ...]
+    guide: str
+    eligible: Callable[..., bool]
+    context: Callable[..., str] | None = None
+
+
+_AXES: dict[str, _AxisSpec] = {
+    "low_info": _AxisSpec(
+        "turn_intent", TURN_INTENT_LABELS, TURN_INTENT_GUIDE, low_information_turn_eligible
+    ),
+    "memory": _AxisSpec(
+        "memory_intent",
+        MEMORY_INTENT_LABELS,
+        MEMORY_INTENT_GUIDE,
+        semantic_memory_eligible,
+        semantic_memory_context,
+    ),
+    "followup": _AxisSpec(
+        "followup_intent",
+        FOLLOWUP_INTENT_LABELS,
+        FOLLOWUP_INTENT_GUIDE,
+        stateful_followup_eligible,
+        stateful_followup_context,
+    ),
+    "workflow": _AxisSpec(
+        "workflow_intent",
+        WORKFLOW_INTENT_LABELS,
+        WORKFLOW_INTENT_GUIDE,
+        skill_workflow_eligible,
+        skill_workflow_context,
+    ),
+    "action": _AxisSpec(
+        "action_intent",
+        ACTION_INTENT_LABELS,
+        ACTION_INTENT_GUIDE,
+        stateful_action_eligible,
+        stateful_action_context,
+    ),
+}
+
+
+@dataclass(slots=True)
+class SemanticTask:
+    """One classifier the caller would otherwise await on its own."""
+
+    name: str
+    classifier: Callable[..., Awaitable[str]]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    turn_category: str | None = None
+    # Fallback only: decides from the independent tasks' labels whether this
+    # task is still needed, mirroring the call site's own gate.
+    gate: Callable[[dict[str, str]], bool] | None = None
+
+
+@dataclass(slots=True)
+class SemanticTurnClassification:
+    results: dict[str, str] = field(default_factory=dict)
+    mode: str = "skipped"
+    elapsed_ms: int = 0
+    llm_calls: int = 0
+
+    def get(self, name: str) -> str | None:
+        """Precomputed label for ``name``, or None when the caller should classify itself."""
+        return self.results.get(name)
+
+
+def _build_fused_prompt(
+    loop: Any,
+    text: str,
+    *,
+    route_profile: str,
+    turn_category: str,
+    tasks: list[SemanticTask],
+) -> str:
+    schema = ",".join(
+        f'"{_AXES[task.name].field}":"{"|".join(_AXES[task.name].labels)}"' for task in tasks
+    )
+    guides = "\n\n".join(
+        f"{_AXES[task.name].field}:\n{_AXES[task.name].guide}" for task in tasks
+    )
+    context_blocks: list[str] = []
+    for task in tasks:
+        build_context = _AXES[task.name].context
+        if build_context is None:
+            continue
+        block = build_context(loop=loop, **task.kwargs).strip()
+        if block and block not in context_blocks:
+            context_blocks.append(block)
+    context = "\n".join(context_blocks)
+    return f"""Classify the user's turn on several independent axes.
+
+Return ONLY one JSON object:
+{{{schema}}}
+
+Use semantics, not keyword spotting. Decide each field on its own.
+
+{guides}
+
+Understand the user's actual language.
+
+Route profile: {str(route_profile or '').strip().upper() or 'GENERAL'}
+Turn category: {str(turn_category or '').strip().lower() or 'chat'}
+{context}
+User message:
+\"\"\"{text[:2400]}\"\"\""""
+
+
+def _parse_fused_response(raw_response: Any, tasks: list[SemanticTask]) -> dict[str, str] | None:
+    """All requested labels, or None if any field is missing or invalid."""
+    raw = _JSON_FENCE_RE.sub("", str(raw_response or "").strip()).strip()
+    try:
+        parsed = json.loads(raw)
+    except Exception:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    results: dict[str, str] = {}
+    for task in tasks:
+        spec = _AXES[task.name]
+        value = str(parsed.get(spec.field) or "").strip().lower()
+        if value not in spec.labels:
+            return None
+        results[task.name] = value
+    return results
+
+
+async def _classify_individually(
+    loop: Any,
+    text: str,
+    tasks: list[SemanticTask],
+    results: dict[str, str],
+    *,
+    route_profile: str,
+    turn_category: str,
+) -> int:
+    """Run ``tasks`` concurrently, store their labels in ``results``, return the call count."""
+    labels = await asyncio.gather(
+        *(
+            task.classifier(
+                loop,
+                text,
+                route_profile=route_profile,
+                turn_category=task.turn_category or turn_category,
+                **task.kwargs,
+            )
+            for task in tasks
+        ),
+        return_exceptions=True,
+    )
+    for task, label in zip(tasks, labels):
+        if isinstance(label, BaseException):
+            logger.debug(f"Semantic {task.name} classification failed: {label}")
+            continue
+        results[task.name] = str(label or "none")
+    return len(tasks)
+
+
+async def classify_turn_semantics(
+    loop: Any,
+    text: str,
+    *,
+    route_profile: str,
+    turn_category: str,
+    tasks: list[SemanticTask],
+) -> SemanticTurnClassification:
+    """
+    Classify every eligible task for this turn up front.
+
+    Tasks that fail their cheap eligibility gate are left out of the result,
+    as is a lone eligible task, so the call site runs its classifier exactly
+    as before. Two or more eligible tasks share one LLM call.
+    """
+    started = time.perf_counter()
+    outcome = SemanticTurnClassification()
+    raw = str(text or "").strip()
+    provider = getattr(loop, "provider", None)
+    if not raw or not callable(getattr(provider, "chat", None)):
+        return outcome
+
+    eligible = [
+        task
+        for task in tasks
+        if task.name in _AXES
+        and _AXES[task.name].eligible(
+            raw,
+            turn_category=task.turn_category or turn_category,
+            **task.kwargs,
+        )
+    ]
+    if len(eligible) < 2:
+        return outcome
+
+    model = (
+        str(getattr(getattr(loop, "router", None), "model", "") or "").strip()
+        or str(getattr(loop, "model", "") or "").strip()
+    )
+    if not model and hasattr(provider, "get_default_model"):
+        try:
+            model = str(provider.get_default_model() or "").strip()
+        except Exception:
+            model = ""
+
+    prompt = _build_fused_prompt(
+        loop,
+        raw,
+        route_profile=route_profile,
+        turn_category=turn_category,
+        tasks=eligible,
+    )
+    response = await call_semantic_llm_with_fallback(
+        loop=loop,
+        provider=provider,
+        messages=[{"role": "user", "content": prompt}],
+        primary_model=model,
+        max_tokens=40 + 40 * len(eligible),
+        temperature=0.0,
+    )
+    outcome.llm_calls = 1
+    results = (
+        _parse_fused_response(getattr(response, "content", ""), eligible)
+        if response is not None
+        else None
+    )
+    if results is not None:
+        outcome.mode = "fused"
+    else:
+        logger.debug("Fused semantic classification unusable; classifying tasks individually")
+        results = {}
+        independent = [task for task in eligible if task.gate is None]
+        outcome.llm_calls += await _classify_individually(
+            loop, raw, independent, results, route_profile=route_profile, turn_category=turn_category
+        )
+        gated = [task for task in eligible if task.gate is not None and task.gate(dict(results))]
+        outcome.llm_calls += await _classify_individually(
+            loop, raw, gated, results, route_profile=route_profile, turn_category=turn_category
+        )
+        outcome.mode = "fallback"
+
+    if "workflow" in results:
+        workflow_task = next(task for task in eligible if task.name == "workflow")
+        results["workflow"] = filter_workflow_intent(
+            results["workflow"], workflow_task.kwargs.get("skills_loader")
+        )
+    outcome.results = results
+    outcome.elapsed_ms = int((time.perf_counter() - started) * 1000)
+    return outcome
+
+
+__all__ = [
+    "SemanticTask",
+    "SemanticTurnClassification",
+    "classify_turn_semantics",
+]
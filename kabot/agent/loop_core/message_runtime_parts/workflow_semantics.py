@@ -10,9 +10,15 @@ from kabot.agent.semantic_llm import call_semantic_llm_with_fallback
 _JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
 
 
+WORKFLOW_INTENT_LABELS = ("skill_creator", "skill_installer", "none")
+WORKFLOW_INTENT_GUIDE = """Choose skill_creator when the user is mainly asking to create or update a reusable skill/capability/workflow, especially if they provide API docs, endpoints, JSON examples, schemas, or trigger/output requirements.
+Choose skill_installer when the user is mainly asking to install, list, update, or sync external skills.
+Choose none otherwise."""
+
+
 def _normalize_workflow_intent(value: Any) -> str:
     normalized = str(value or "").strip().lower()
-    if normalized in {"skill_creator", "skill_installer", "none"}:
+    if normalized in WORKFLOW_INTENT_LABELS:
         return normalized
     return "none"
 
@@ -72,6 +78,42 @@ def _format_recent_history_excerpt(conversation_history: list[dict[str, Any]] |
     return "\n".join(excerpt_lines).strip()
 
 
+def skill_workflow_eligible(text: str, *, skills_loader: Any = None, **_: Any) -> bool:
+    """Only worth asking when a workflow skill can actually be invoked."""
+    raw = str(text or "").strip()
+    if not raw or raw.startswith("/"):
+        return False
+    return bool(_workflow_skills_available(skills_loader))
+
+
+def skill_workflow_context(
+    *,
+    conversation_history: list[dict[str, Any]] | None = None,
+    current_workflow_request_text: str = "",
+    current_workflow_stage: str = "",
+    current_workflow_kind: str = "",
+    **_: Any,
+) -> str:
+    """Prompt lines describing the active workflow and recent conversation."""
+    history_excerpt = _format_recent_history_excerpt(conversation_history)
+    return f"""Current active workflow kind: {str(current_workflow_kind or '').strip().lower() or 'none'}
+Current active workflow stage: {str(current_workflow_stage or '').strip().lower() or 'none'}
+Current active workflow request:
+\"\"\"{str(current_workflow_request_text or '')[:900]}\"\"\"
+Recent conversation excerpt:
+\"\"\"{history_excerpt[:1600]}\"\"\""""
+
+
+def filter_workflow_intent(intent: str, skills_loader: Any = None) -> str:
+    """Drop a workflow label whose skill is not available to this turn."""
+    available_workflow_skills = _workflow_skills_available(skills_loader)
+    if intent == "skill_creator" and "skill-creator" not in available_workflow_skills:
+        return "none"
+    if intent == "skill_installer" and "skill-installer" not in available_workflow_skills:
+        return "none"
+    return intent
+
+
 async def classify_skill_workflow_intent(
     loop: Any,
     text: str,
@@ -85,11 +127,7 @@ async def classify_skill_workflow_intent(
     current_workflow_kind: str = "",
 ) -> str:
     raw = str(text or "").strip()
-    if not raw or raw.startswith("/"):
-        return "none"
-
-    available_workflow_skills = _workflow_skills_available(skills_loader)
-    if not available_workflow_skills:
+    if not skill_workflow_eligible(raw, skills_loader=skills_loader):
         return "none"
 
     provider = getattr(loop, "provider", None)
@@ -106,25 +144,23 @@ async def classify_skill_workflow_intent(
             model = str(provider.get_default_model() or "").strip()
         except Exception:
             model = ""
-    history_excerpt = _format_recent_history_excerpt(conversation_history)
 
+    context = skill_workflow_context(
+        conversation_history=conversation_history,
+        current_workflow_request_text=current_workflow_request_text,
+        current_workflow_stage=current_workflow_stage,
+        current_workflow_kind=current_workflow_kind,
+    )
     prompt = f"""Classify the user's primary workflow intent.
 
 Return ONLY one JSON object:
-{{"workflow_intent":"skill_creator|skill_installer|none"}}
+{{"workflow_intent":"{'|'.join(WORKFLOW_INTENT_LABELS)}"}}
 
 Use semantics, not keyword spotting.
 
-Choose skill_creator when the user is mainly asking to create or update a reusable skill/capability/workflow, especially if they provide API docs, endpoints, JSON examples, schemas, or trigger/output requirements.
-Choose skill_installer when the user is mainly asking to install, list, update, or sync external skills.
-Choose none otherwise.
+{WORKFLOW_INTENT_GUIDE}
 
-Current active workflow kind: {str(current_workflow_kind or '').strip().lower() or 'none'}
-Current active workflow stage: {str(current_workflow_stage or '').strip().lower() or 'none'}
-Current active workflow request:
-\"\"\"{str(current_workflow_request_text or '')[:900]}\"\"\"
-Recent conversation excerpt:
-\"\"\"{history_excerpt[:1600]}\"\"\"
+{context}
 
 User message:
 \"\"\"{raw[:2400]}\"\"\""""
@@ -142,13 +178,14 @@ User message:
         return "none"
 
     intent = _parse_workflow_intent_response(getattr(response, "content", ""))
-    if intent == "skill_creator" and "skill-creator" not in available_workflow_skills:
-        return "none"
-    if intent == "skill_installer" and "skill-installer" not in available_workflow_skills:
-        return "none"
-    return intent
+    return filter_workflow_intent(intent, skills_loader)
 
 
 __all__ = [
+    "WORKFLOW_INTENT_GUIDE",
+    "WORKFLOW_INTENT_LABELS",
     "classify_skill_workflow_intent",
+    "filter_workflow_intent",
+    "skill_workflow_context",
+    "skill_workflow_eligible",
 ]
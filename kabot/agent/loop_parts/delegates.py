@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import Any
 
 from kabot.agent.cron_fallback_nlp import REMINDER_KEYWORDS, WEATHER_KEYWORDS
@@ -254,8 +255,22 @@ class AgentLoopDelegatesMixin:
         drain_pending = getattr(self, "_drain_pending_memory_writes", None)
         if callable(drain_pending):
             await drain_pending(max_wait_ms=1500)
+        flush_writes = getattr(getattr(self, "memory", None), "flush_writes", None)
+        if callable(flush_writes):
+            flushed = flush_writes()
+            if inspect.isawaitable(flushed):
+                await flushed
+        close_memory = getattr(getattr(self, "memory", None), "close", None)
+        if callable(close_memory):
+            closed = close_memory()
+            if inspect.isawaitable(closed):
+                await closed
         if getattr(self, "_mcp_session_runtimes", None):
             await self._close_mcp_runtimes()
+        for context in list(getattr(self, "_context_builders", {}).values()):
+            close_context = getattr(context, "close", None)
+            if callable(close_context):
+                close_context()
 
     async def process_isolated(
         self,
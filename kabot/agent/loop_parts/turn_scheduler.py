@@ -0,0 +1,138 @@
+"""Session-sharded turn scheduler used by AgentLoop.run."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+from kabot.bus.events import InboundMessage
+
+
+class SessionTurnScheduler:
+    """
+    Run inbound turns concurrently across sessions, strictly ordered within one.
+
+    Each session key owns a FIFO lane drained by a single worker task, so two
+    turns of the same chat never overlap. A semaphore caps how many turns run
+    at once across all sessions. ``submit`` blocks once ``max_buffered_turns``
+    messages are admitted but not finished; the caller then stops consuming and
+    further messages stay in ``MessageBus.inbound``, where the debounce/cap
+    policy still applies to them.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[InboundMessage], Awaitable[None]],
+        *,
+        max_concurrent_turns: int = 4,
+        max_buffered_turns: int = 0,
+    ):
+        self._handler = handler
+        self.max_concurrent_turns = max(1, int(max_concurrent_turns or 1))
+        buffered = int(max_buffered_turns or 0)
+        if buffered <= 0:
+            buffered = self.max_concurrent_turns * 4
+        self.max_buffered_turns = max(self.max_concurrent_turns, buffered)
+
+        self._slots = asyncio.Semaphore(self.max_concurrent_turns)
+        self._lanes: dict[str, deque[InboundMessage]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._admitted = 0
+        self._capacity_available = asyncio.Event()
+        self._capacity_available.set()
+        self._running_turns = 0
+        self._completed_turns = 0
+        self._accepting = True
+
+    async def submit(self, msg: InboundMessage) -> None:
+        """Admit one message, waiting while the scheduler is at capacity."""
+        while self._admitted >= self.max_buffered_turns:
+            self._capacity_available.clear()
+            await self._capacity_available.wait()
+        if not self._accepting:
+            raise RuntimeError("turn scheduler is shut down")
+
+        self._admitted += 1
+        session_key = msg.session_key
+        self._lanes.setdefault(session_key, deque()).append(msg)
+        if session_key not in self._workers:
+            self._workers[session_key] = asyncio.create_task(
+                self._drain_lane(session_key),
+                name=f"kabot-turn:{session_key}",
+            )
+
+    def take_pending(self, session_key: str, *, limit: int = 3) -> list[InboundMessage]:
+        """Remove up to ``limit`` not-yet-started messages queued for one session."""
+        lane = self._lanes.get(session_key)
+        if not lane or limit <= 0:
+            return []
+        taken: list[InboundMessage] = []
+        while lane and len(taken) < limit:
+            taken.append(lane.popleft())
+        self._release(len(taken))
+        return taken
+
+    def _release(self, count: int) -> None:
+        if count <= 0:
+            return
+        self._admitted = max(0, self._admitted - count)
+        self._capacity_available.set()
+
+    async def _drain_lane(self, session_key: str) -> None:
+        try:
+            while self._accepting:
+                lane = self._lanes.get(session_key)
+                if not lane:
+                    break
+                async with self._slots:
+                    # The lane may have been drained by take_pending() or
+                    # shutdown() while this worker waited for a slot.
+                    if not lane or not self._accepting:
+                        break
+                    msg = lane.popleft()
+                    self._running_turns += 1
+                    try:
+                        await self._handler(msg)
+                    except Exception as exc:
+                        logger.error(f"Unhandled turn error for {session_key}: {exc}")
+                    finally:
+                        self._running_turns -= 1
+                        self._completed_turns += 1
+                        self._release(1)
+        finally:
+            self._workers.pop(session_key, None)
+            if not self._lanes.get(session_key):
+                self._lanes.pop(session_key, None)
+
+    async def join(self) -> None:
+        """Wait until every admitted turn has finished."""
+        while self._workers:
+            await asyncio.gather(*list(self._workers.values()), return_exceptions=True)
+
+    async def shutdown(self) -> list[InboundMessage]:
+        """Stop starting new turns, wait for in-flight ones, and return unstarted messages."""
+        self._accepting = False
+        leftovers: list[InboundMessage] = []
+        for lane in self._lanes.values():
+            leftovers.extend(lane)
+            lane.clear()
+        self._release(len(leftovers))
+        workers = list(self._workers.values())
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._lanes.clear()
+        return leftovers
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of scheduler load for status reporting."""
+        return {
+            "max_concurrent_turns": self.max_concurrent_turns,
+            "max_buffered_turns": self.max_buffered_turns,
+            "running_turns": self._running_turns,
+            "queued_turns": sum(len(lane) for lane in self._lanes.values()),
+            "active_sessions": len(self._workers),
+            "completed_turns": self._completed_turns,
+        }
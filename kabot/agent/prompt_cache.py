@@ -0,0 +1,59 @@
+"""
+Segment cache for system-prompt assembly.
+
+Each segment is stored under its name plus the key it was built from (file
+signatures, profile, tool roster, ...), so every variant of a segment has its
+own entry: a lookup with a key seen before returns the stored text verbatim,
+a new key builds a new entry, and the least recently used entries are evicted.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+FileSignature = tuple[str, int, int] | tuple[str, None, None]
+
+DEFAULT_MAX_SEGMENTS = 128
+
+
+def file_signature(path: Path) -> FileSignature:
+    """``(path, mtime_ns, size)`` of ``path``; mtime/size are None when it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+class PromptSegmentCache:
+    """LRU of prompt segments keyed by ``(name, key)``."""
+
+    def __init__(self, max_segments: int = DEFAULT_MAX_SEGMENTS):
+        self.max_segments = max(1, int(max_segments))
+        self._segments: OrderedDict[tuple[str, Hashable], Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, name: str, key: Hashable, build: Callable[[], Any]) -> Any:
+        slot = (name, key)
+        if slot in self._segments:
+            self._segments.move_to_end(slot)
+            self.hits += 1
+            return self._segments[slot]
+        self.misses += 1
+        value = build()
+        self._segments[slot] = value
+        while len(self._segments) > self.max_segments:
+            self._segments.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._segments.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {"segments": len(self._segments), "hits": self.hits, "misses": self.misses}
+
+
+__all__ = ["PromptSegmentCache", "file_signature"]
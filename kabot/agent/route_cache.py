@@ -0,0 +1,198 @@
+"""
+Route-decision cache for IntentRouter.
+
+Two tiers:
+1. Exact: normalized message text -> RouteDecision.
+2. Semantic (optional): nearest cached query embedding above a cosine
+   similarity threshold.
+
+Both tiers expire entries after ``ttl_seconds`` and evict least-recently-used
+entries beyond ``max_entries``. Hits and misses are counted per profile so the
+hit rate of repetitive traffic (greetings, routine commands) is visible.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+try:
+    import numpy as np
+except ImportError:  # optional (requirements-memory.txt); similarity falls back to pure Python
+    np = None
+
+if TYPE_CHECKING:
+    from kabot.agent.router import RouteDecision
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 900
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+_SPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s.!~]+$")
+
+EmbedFn = Callable[[str], Awaitable[list[float] | None]]
+
+
+def normalize_route_text(content: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing ``.``/``!``/``~``."""
+    normalized = _SPACE_RE.sub(" ", str(content or "").casefold()).strip()
+    return _TRAILING_PUNCT_RE.sub("", normalized)
+
+
+def _unit(vector: list[float]) -> list[float] | None:
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return None
+    return [v / norm for v in vector]
+
+
+class RouteCache:
+    """TTL/LRU cache of route decisions with an optional embedding tier."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        embed: EmbedFn | None = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(0, int(max_entries))
+        self.embed = embed
+        self.similarity_threshold = float(similarity_threshold)
+        self._clock = clock
+        self._exact: OrderedDict[str, tuple[RouteDecision, float]] = OrderedDict()
+        # key -> (unit vector, decision, stored_at); same LRU/TTL policy as the exact tier.
+        self._semantic: OrderedDict[str, tuple[list[float], RouteDecision, float]] = OrderedDict()
+        self._hits: dict[str, dict[str, int]] = {}
+        self._misses: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def _count_hit(self, decision: RouteDecision, tier: str) -> None:
+        by_tier = self._hits.setdefault(decision.profile, {"exact": 0, "semantic": 0})
+        by_tier[tier] += 1
+
+    def _fresh(self, stored_at: float) -> bool:
+        return self._clock() - stored_at < self.ttl_seconds
+
+    async def _embed(self, key: str) -> list[float] | None:
+        if self.embed is None:
+            return None
+        try:
+            vector = await self.embed(key)
+        except Exception as e:
+            logger.debug(f"Route cache embedding failed: {e}")
+            return None
+        return _unit([float(v) for v in vector]) if vector else None
+
+    def _nearest(self, query: list[float]) -> tuple[str, float] | None:
+        now = self._clock()
+        for key in [k for k, (_, _, at) in self._semantic.items() if now - at >= self.ttl_seconds]:
+            del self._semantic[key]
+        entries = [
+            (key, vector) for key, (vector, _, _) in self._semantic.items() if len(vector) == len(query)
+        ]
+        if not entries:
+            return None
+        if np is not None:
+            matrix = np.asarray([vector for _, vector in entries], dtype=float)
+            scores = matrix @ np.asarray(query, dtype=float)
+            best = int(np.argmax(scores))
+            return entries[best][0], float(scores[best])
+        best_key, best_score = None, -1.0
+        for key, vector in entries:
+            score = sum(a * b for a, b in zip(vector, query))
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key, best_score
+
+    async def lookup(self, content: str) -> tuple[RouteDecision | None, list[float] | None]:
+        """
+        Return ``(decision, query_vector)``.
+
+        ``decision`` is a copy of the cached RouteDecision or None on a miss.
+        ``query_vector`` is the embedding computed for the semantic tier (if
+        any), to be handed back to :meth:`store` so a miss is embedded once.
+        """
+        if not self.enabled:
+            return None, None
+        key = normalize_route_text(content)
+        if not key:
+            return None, None
+        entry = self._exact.get(key)
+        if entry is not None:
+            decision, stored_at = entry
+            if self._fresh(stored_at):
+                self._exact.move_to_end(key)
+                self._count_hit(decision, "exact")
+                return replace(decision), None
+            del self._exact[key]
+
+        query = await self._embed(key)
+        if query is not None:
+            nearest = self._nearest(query)
+            if nearest is not None and nearest[1] >= self.similarity_threshold:
+                match_key = nearest[0]
+                self._semantic.move_to_end(match_key)
+                decision = self._semantic[match_key][1]
+                self._count_hit(decision, "semantic")
+                return replace(decision), query
+        return None, query
+
+    def store(self, content: str, decision: RouteDecision, query_vector: list[float] | None = None) -> None:
+        """Remember a freshly classified decision (counted as a miss for its profile)."""
+        if not self.enabled:
+            return
+        key = normalize_route_text(content)
+        if not key:
+            return
+        self._misses[decision.profile] = self._misses.get(decision.profile, 0) + 1
+        now = self._clock()
+        self._exact[key] = (replace(decision), now)
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+        if query_vector is not None:
+            self._semantic[key] = (query_vector, replace(decision), now)
+            self._semantic.move_to_end(key)
+            while len(self._semantic) > self.max_entries:
+                self._semantic.popitem(last=False)
+
+    def clear(self) -> None:
+        self._exact.clear()
+        self._semantic.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        profiles: dict[str, dict[str, Any]] = {}
+        for profile in sorted(set(self._hits) | set(self._misses)):
+            hits = self._hits.get(profile, {"exact": 0, "semantic": 0})
+            misses = self._misses.get(profile, 0)
+            total = hits["exact"] + hits["semantic"] + misses
+            profiles[profile] = {
+                "exact_hits": hits["exact"],
+                "semantic_hits": hits["semantic"],
+                "misses": misses,
+                "hit_rate": round((hits["exact"] + hits["semantic"]) / total, 4) if total else 0.0,
+            }
+        return {
+            "exact_entries": len(self._exact),
+            "semantic_entries": len(self._semantic),
+            "semantic_enabled": self.embed is not None,
+            "profiles": profiles,
+        }
+
+
+__all__ = ["RouteCache", "normalize_route_text"]
@@ -12,8 +12,9 @@ import re
 from dataclasses import dataclass
 from typing import Literal
 
-from kabot.providers.base import LLMProvider
+from kabot.agent.route_cache import RouteCache
 from kabot.agent.semantic_llm import call_semantic_llm_with_fallback
+from kabot.providers.base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
@@ -44,11 +45,20 @@ class IntentRouter:
 
     Simple requests -> direct response, skip agent loop.
     Complex requests -> full reasoning loop.
+
+    With a ``route_cache``, structured decisions are reused for repeated (or,
+    with the embedding tier, near-identical) messages without a model call.
     """
 
-    def __init__(self, provider: LLMProvider, model: str | None = None):
+    def __init__(
+        self,
+        provider: LLMProvider,
+        model: str | None = None,
+        route_cache: RouteCache | None = None,
+    ):
         self.provider = provider
         self.model = model or provider.get_default_model()
+        self.route_cache = route_cache
 
     @staticmethod
     def _normalize_profile(value: str | None) -> IntentType | None:
@@ -214,8 +224,16 @@ class IntentRouter:
         if content_stripped.startswith("/"):
             return RouteDecision(profile="GENERAL", is_complex=True, turn_category="command")
 
+        query_vector = None
+        if self.route_cache is not None:
+            cached_decision, query_vector = await self.route_cache.lookup(content_stripped)
+            if cached_decision is not None:
+                return cached_decision
+
         structured_decision = await self.classify_route(content)
         if structured_decision:
+            if self.route_cache is not None:
+                self.route_cache.store(content_stripped, structured_decision, query_vector)
             return structured_decision
 
         profile = await self.classify(content)
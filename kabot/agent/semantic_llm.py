@@ -105,6 +105,7 @@ async def call_semantic_llm_with_fallback(
                     "directive_max_tokens": max(1, int(max_tokens or 120)),
                     "directive_temperature": float(temperature),
                     "directive_no_tools": True,
+                    "directive_no_stream": True,
                 },
             )
             response, error = await call_with_fallback(
@@ -10,7 +10,6 @@ import time
 from pathlib import Path
 from typing import Any
 
-from kabot.agent.tools.stock_matching import extract_crypto_ids, extract_stock_symbols
 from kabot.agent.skills_matching import (
     BUILTIN_SKILLS_DIR,
     WORKFLOW_CHAINS,
@@ -22,6 +21,7 @@ from kabot.agent.skills_matching import (
     looks_like_skill_install_request,
     normalize_skill_reference_name,
 )
+from kabot.agent.skills_parts.match_index import SkillMatchIndex
 from kabot.agent.skills_parts.runtime import (
     get_always_skills as runtime_get_always_skills,
 )
@@ -43,6 +43,7 @@ from kabot.agent.skills_parts.runtime import (
 from kabot.agent.skills_parts.runtime import (
     parse_frontmatter_metadata as runtime_parse_frontmatter_metadata,
 )
+from kabot.agent.tools.stock_matching import extract_crypto_ids, extract_stock_symbols
 from kabot.config.skills_settings import (
     get_skills_entries,
     normalize_skills_settings,
@@ -209,8 +210,10 @@ def _classify_finance_skill(skill_name: str, description: str) -> str | None:
 
 
 def _finance_skill_matches_request(skill_name: str, description: str, text: str) -> bool:
-    request_kind = _classify_finance_request(text)
-    skill_kind = _classify_finance_skill(skill_name, description)
+    return _finance_kinds_match(_classify_finance_request(text), _classify_finance_skill(skill_name, description))
+
+
+def _finance_kinds_match(request_kind: str | None, skill_kind: str | None) -> bool:
     if not request_kind or not skill_kind:
         return False
     if request_kind == "mixed" or skill_kind == "mixed":
@@ -220,8 +223,7 @@ def _finance_skill_matches_request(skill_name: str, description: str, text: str)
     return request_kind == skill_kind
 
 
-def _finance_skill_name_is_grounded(skill_name: str, text: str) -> bool:
-    request_kind = _classify_finance_request(text)
+def _finance_name_grounded_for_kind(skill_name: str, request_kind: str | None) -> bool:
     normalized_name = str(skill_name or "").strip().lower().replace("-", " ").replace("_", " ")
     if not request_kind or not normalized_name:
         return False
@@ -289,7 +291,12 @@ class SkillsLoader:
         self._skill_entries = get_skills_entries(self._skills_config)
         self._skill_index: dict[str, set[str]] | None = None  # lazy cache
         self._body_index: dict[str, set[str]] | None = None   # lazy cache
+        self._match_index: SkillMatchIndex | None = None      # lazy cache
         self._index_snapshot: tuple[tuple[str, int, int], ...] | None = None
+        # Skill roots are re-scanned at most once per interval (0 = on every lookup).
+        self._refresh_interval_seconds = max(0.0, float(load_settings.get("refresh_interval_seconds", 0.0) or 0.0))
+        self._sweep_cache: dict[str, tuple[float, Any]] = {}
+        self._name_automaton_cache: tuple[tuple[str, ...], Any, dict[str, list[str]]] | None = None
         self._list_cache_ttl_seconds = 60.0
         self._list_skills_cache: dict[bool, tuple[float, tuple[tuple[str, int, int, int], ...], list[dict[str, Any]]]] = {}
         self._summary_cache: tuple[float, tuple[tuple[str, int, int, int], ...], str] | None = None
@@ -303,10 +310,12 @@ class SkillsLoader:
 
         index: dict[str, set[str]] = {}
         body_index: dict[str, set[str]] = {}
+        finance_kinds: dict[str, str | None] = {}
         for skill in self.list_skills(filter_unavailable=False):
             if bool(skill.get("disable_model_invocation")):
                 continue
             desc = self._get_skill_description(skill["name"])
+            finance_kinds[skill["name"]] = _classify_finance_skill(skill["name"], desc)
             # Primary keywords: from description + skill name (high signal)
             keywords = _extract_keywords(desc)
             keywords.update(_extract_keywords(skill["name"].replace("-", " ").replace("_", " ")))
@@ -322,6 +331,7 @@ class SkillsLoader:
 
         self._skill_index = index
         self._body_index = body_index
+        self._match_index = SkillMatchIndex.build(index, body_index, finance_kinds)
         self._index_snapshot = current_snapshot
         return index
 
@@ -346,32 +356,55 @@ class SkillsLoader:
         return runtime_iter_unique_skill_candidates(self)
 
     def _iter_skill_files(self) -> list[Path]:
-        files: list[Path] = []
+        return [skill_file for skill_file, _stat in self._iter_skill_file_stats()]
+
+    def _iter_skill_file_stats(self) -> list[tuple[Path, os.stat_result]]:
+        # scandir + one stat per SKILL.md instead of is_dir/exists/stat per skill.
+        files: list[tuple[Path, os.stat_result]] = []
         for root in self._iter_skill_roots():
-            if not root.exists():
+            try:
+                entries = list(os.scandir(root))
+            except OSError:
                 continue
-            for skill_dir in root.iterdir():
-                if not skill_dir.is_dir():
+            for entry in entries:
+                try:
+                    if not entry.is_dir():
+                        continue
+                    skill_file = Path(entry.path) / "SKILL.md"
+                    files.append((skill_file, skill_file.stat()))
+                except OSError:
                     continue
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    files.append(skill_file)
         return files
 
+    def _throttled_sweep(self, name: str, compute):
+        """Reuse the result of a filesystem sweep for ``_refresh_interval_seconds``."""
+        if self._refresh_interval_seconds <= 0:
+            return compute()
+        now = time.monotonic()
+        cached = self._sweep_cache.get(name)
+        if cached is not None and (now - cached[0]) < self._refresh_interval_seconds:
+            return cached[1]
+        value = compute()
+        self._sweep_cache[name] = (now, value)
+        return value
+
     def _compute_skill_snapshot(self) -> tuple[tuple[str, int, int], ...]:
         """Return deterministic snapshot of skill files for cache invalidation."""
-        snapshot: list[tuple[str, int, int]] = []
-        for skill_file in self._iter_skill_files():
-            try:
-                stat = skill_file.stat()
-            except OSError:
-                continue
-            snapshot.append((str(skill_file), int(stat.st_mtime_ns), int(stat.st_size)))
+        return self._throttled_sweep("skill_files", self._scan_skill_snapshot)
+
+    def _scan_skill_snapshot(self) -> tuple[tuple[str, int, int], ...]:
+        snapshot = [
+            (str(skill_file), int(stat.st_mtime_ns), int(stat.st_size))
+            for skill_file, stat in self._iter_skill_file_stats()
+        ]
         snapshot.sort(key=lambda item: item[0])
         return tuple(snapshot)
 
     def _compute_roots_snapshot(self) -> tuple[tuple[str, int, int, int], ...]:
         """Cheap snapshot for list/summary cache invalidation based on root directories."""
+        return self._throttled_sweep("roots", self._scan_roots_snapshot)
+
+    def _scan_roots_snapshot(self) -> tuple[tuple[str, int, int, int], ...]:
         snapshot: list[tuple[str, int, int, int]] = []
         for root in self._iter_skill_roots():
             exists = root.exists()
@@ -404,8 +437,9 @@ class SkillsLoader:
         """
         Auto-select relevant skills based on user message content.
 
-        Scores each skill by keyword overlap between the message and the
-        skill's description. Applies workflow chain expansion for related skills.
+        Scores skills by keyword overlap between the message and the skill's
+        description; only candidates found through the prebuilt match index
+        are scored. Applies workflow chain expansion for related skills.
 
         Args:
             message: User message text.
@@ -435,12 +469,25 @@ class SkillsLoader:
             if not finance_request:
                 return []
 
-        # Score each skill
-        body_idx = self._body_index or {}
+        match_index = self._match_index
+        if match_index is None or match_index.keywords is not index:
+            # _build_skill_index was bypassed (e.g. patched); index what it returned.
+            match_index = SkillMatchIndex.build(index, self._body_index or {}, {})
+        # Also check stemmed name words (e.g., "debugging" -> "debug")
+        stemmed_msg = {_naive_stem(w) for w in msg_keywords}
+        finance_kind = _classify_finance_request(message)
+        candidates = match_index.candidates(
+            msg_keywords,
+            stemmed_msg,
+            message_lower,
+            finance_request=finance_kind is not None,
+        )
+
+        # Score candidate skills
+        body_idx = match_index.body_keywords
         scored: list[tuple[str, bool, float]] = []
-        for skill_name, skill_keywords in index.items():
-            if not skill_keywords:
-                continue
+        for skill_name in candidates.names:
+            skill_keywords = index[skill_name]
 
             # Primary overlap: description + name keywords (high signal)
             overlap = msg_keywords & skill_keywords
@@ -450,29 +497,16 @@ class SkillsLoader:
 
             # Extra multilingual signal: allow non-ASCII keyword containment
             # (helps languages where user text may omit spaces, e.g. Thai).
-            contain_overlap = {
-                kw for kw in skill_keywords
-                if len(kw) >= 2 and any(ord(ch) > 127 for ch in kw) and kw in message_lower
-            }
-            contain_body_overlap = {
-                kw for kw in body_keywords
-                if len(kw) >= 2 and any(ord(ch) > 127 for ch in kw) and kw in message_lower
-            }
+            contain_overlap = match_index.fragments[skill_name] & candidates.fragment_hits
+            contain_body_overlap = match_index.body_fragments[skill_name] & candidates.fragment_hits
             alias_bonus = _intent_alias_bonus(skill_name, message_lower)
-            name_words = set(skill_name.replace("-", " ").split())
-            # Also check stemmed name words (e.g., "debugging" -> "debug")
-            stemmed_name = {_naive_stem(w) for w in name_words}
-            stemmed_msg = {_naive_stem(w) for w in msg_keywords}
-            name_overlap = (name_words & msg_keywords) | (stemmed_name & stemmed_msg)
-            explicit_full_name_match = bool(
-                re.search(rf"(?<![\w-]){re.escape(skill_name.lower())}(?![\w-])", message_lower)
-            )
-            finance_skill_match = _finance_skill_matches_request(
-                skill_name,
-                self._get_skill_description(skill_name),
-                message,
+            name_overlap = (
+                (match_index.name_words[skill_name] & msg_keywords)
+                | (match_index.stemmed_name_words[skill_name] & stemmed_msg)
             )
-            finance_name_grounded = _finance_skill_name_is_grounded(skill_name, message)
+            explicit_full_name_match = skill_name in candidates.full_name_matches
+            finance_skill_match = _finance_kinds_match(finance_kind, match_index.finance_kinds.get(skill_name))
+            finance_name_grounded = finance_skill_match and _finance_name_grounded_for_kind(skill_name, finance_kind)
 
             if (
                 not overlap
@@ -191,6 +191,10 @@ def _extract_keywords(text: str) -> set[str]:
     return stemmed | originals
 
 
+# Skills that ``_intent_alias_bonus`` can boost without any keyword overlap.
+_INTENT_ALIAS_SKILLS = frozenset({"skill-installer", "skill-creator", "writing-skills"})
+
+
 def _intent_alias_bonus(skill_name: str, message_lower: str) -> float:
     """Provide intent-level boost for well-known workflow skills."""
     normalized_skill = (skill_name or "").strip().lower()
@@ -0,0 +1,195 @@
+"""
+Prebuilt lookup structures for ``SkillsLoader.match_skills``.
+
+The index is built once per skill snapshot. Message keywords are mapped to
+candidate skills through inverted indexes, and an Aho-Corasick automaton
+finds full skill names and non-ASCII keyword fragments (languages written
+without spaces) in one pass over the message, so only candidates are scored.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from kabot.agent.skills_matching import _INTENT_ALIAS_SKILLS, _naive_stem
+
+_NAME_BOUNDARY_RE = re.compile(r"[\w-]")
+
+
+def _is_non_ascii_fragment(keyword: str) -> bool:
+    return len(keyword) >= 2 and any(ord(ch) > 127 for ch in keyword)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting every (start, pattern) occurrence in a text."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for pattern in set(patterns):
+            if pattern:
+                self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[node][ch] = nxt
+            node = nxt
+        self._out[node] = self._out[node] + (pattern,)
+
+    def _link(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> list[tuple[int, str]]:
+        matches: list[tuple[int, str]] = []
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pattern in out[node]:
+                matches.append((index - len(pattern) + 1, pattern))
+        return matches
+
+
+def find_full_name_mentions(
+    matches: list[tuple[int, str]],
+    names_by_pattern: dict[str, list[str]],
+    message_lower: str,
+) -> set[str]:
+    """Names among ``matches`` mentioned as whole tokens, i.e. ``(?<![\\w-])name(?![\\w-])``."""
+    found: set[str] = set()
+    for start, pattern in matches:
+        names = names_by_pattern.get(pattern)
+        if not names:
+            continue
+        end = start + len(pattern)
+        if start > 0 and _NAME_BOUNDARY_RE.match(message_lower[start - 1]):
+            continue
+        if end < len(message_lower) and _NAME_BOUNDARY_RE.match(message_lower[end]):
+            continue
+        found.update(names)
+    return found
+
+
+@dataclass
+class SkillMatchCandidates:
+    names: list[str]
+    full_name_matches: set[str]
+    fragment_hits: set[str]
+
+
+@dataclass
+class SkillMatchIndex:
+    """Inverted indexes over one snapshot of skill keywords."""
+
+    keywords: dict[str, set[str]]
+    body_keywords: dict[str, set[str]]
+    finance_kinds: dict[str, str | None]
+    order: dict[str, int] = field(default_factory=dict)
+    name_words: dict[str, set[str]] = field(default_factory=dict)
+    stemmed_name_words: dict[str, set[str]] = field(default_factory=dict)
+    fragments: dict[str, set[str]] = field(default_factory=dict)
+    body_fragments: dict[str, set[str]] = field(default_factory=dict)
+    _keyword_postings: dict[str, set[str]] = field(default_factory=dict)
+    _name_postings: dict[str, set[str]] = field(default_factory=dict)
+    _stemmed_name_postings: dict[str, set[str]] = field(default_factory=dict)
+    _names_by_pattern: dict[str, list[str]] = field(default_factory=dict)
+    _alias_skills: set[str] = field(default_factory=set)
+    _finance_skills: set[str] = field(default_factory=set)
+    _automaton: KeywordAutomaton | None = None
+
+    @classmethod
+    def build(
+        cls,
+        keywords: dict[str, set[str]],
+        body_keywords: dict[str, set[str]],
+        finance_kinds: dict[str, str | None],
+    ) -> SkillMatchIndex:
+        index = cls(keywords=keywords, body_keywords=body_keywords, finance_kinds=finance_kinds)
+        patterns: set[str] = set()
+        for position, (skill_name, skill_keywords) in enumerate(keywords.items()):
+            if not skill_keywords:
+                continue
+            index.order[skill_name] = position
+            body = body_keywords.get(skill_name, set())
+            for keyword in skill_keywords | body:
+                index._keyword_postings.setdefault(keyword, set()).add(skill_name)
+
+            name_words = set(skill_name.replace("-", " ").split())
+            stemmed = {_naive_stem(word) for word in name_words}
+            index.name_words[skill_name] = name_words
+            index.stemmed_name_words[skill_name] = stemmed
+            for word in name_words:
+                index._name_postings.setdefault(word, set()).add(skill_name)
+            for word in stemmed:
+                index._stemmed_name_postings.setdefault(word, set()).add(skill_name)
+
+            full_name = skill_name.lower()
+            index._names_by_pattern.setdefault(full_name, []).append(skill_name)
+            patterns.add(full_name)
+            index.fragments[skill_name] = {kw for kw in skill_keywords if _is_non_ascii_fragment(kw)}
+            index.body_fragments[skill_name] = {kw for kw in body if _is_non_ascii_fragment(kw)}
+            patterns.update(index.fragments[skill_name])
+            patterns.update(index.body_fragments[skill_name])
+
+            if full_name.strip() in _INTENT_ALIAS_SKILLS:
+                index._alias_skills.add(skill_name)
+            if finance_kinds.get(skill_name):
+                index._finance_skills.add(skill_name)
+        index._automaton = KeywordAutomaton(patterns)
+        return index
+
+    def candidates(
+        self,
+        msg_keywords: set[str],
+        stemmed_msg: set[str],
+        message_lower: str,
+        *,
+        finance_request: bool,
+    ) -> SkillMatchCandidates:
+        """Skills that can pass any scoring gate, in index order."""
+        names: set[str] = set(self._alias_skills)
+        if finance_request:
+            names |= self._finance_skills
+        for keyword in msg_keywords:
+            names |= self._keyword_postings.get(keyword, set())
+            names |= self._name_postings.get(keyword, set())
+        for stem in stemmed_msg:
+            names |= self._stemmed_name_postings.get(stem, set())
+
+        full_name_matches: set[str] = set()
+        fragment_hits: set[str] = set()
+        if self._automaton is not None:
+            matches = self._automaton.find_all(message_lower)
+            full_name_matches = find_full_name_mentions(matches, self._names_by_pattern, message_lower)
+            fragment_hits = {pattern for _, pattern in matches if _is_non_ascii_fragment(pattern)}
+            for pattern in fragment_hits:
+                names |= self._keyword_postings.get(pattern, set())
+        names |= full_name_matches
+        ordered = sorted((name for name in names if name in self.order), key=self.order.__getitem__)
+        return SkillMatchCandidates(ordered, full_name_matches, fragment_hits)
+
+
+__all__ = ["KeywordAutomaton", "SkillMatchCandidates", "SkillMatchIndex", "find_full_name_mentions"]
@@ -10,6 +10,7 @@ from kabot.agent.skills_matching import (
     _extract_keywords,
     normalize_skill_reference_name,
 )
+from kabot.agent.skills_parts.match_index import KeywordAutomaton, find_full_name_mentions
 
 _EXPLICIT_SKILL_FAST_PATH_FILLERS = {"request", "task", "please", "that", "this"}
 
@@ -174,12 +175,25 @@ def get_always_skills(loader: Any) -> list[str]:
     return result
 
 
+def _skill_name_automaton(loader: Any, names: tuple[str, ...]) -> tuple[KeywordAutomaton, dict[str, list[str]]]:
+    cached = loader._name_automaton_cache
+    if cached is not None and cached[0] == names:
+        return cached[1], cached[2]
+    names_by_pattern: dict[str, list[str]] = {}
+    for name in names:
+        names_by_pattern.setdefault(name.lower(), []).append(name)
+    automaton = KeywordAutomaton(names_by_pattern)
+    loader._name_automaton_cache = (names, automaton, names_by_pattern)
+    return automaton, names_by_pattern
+
+
 def match_explicit_skill_fast_path(loader: Any, *, message: str, message_lower: str, max_results: int) -> list[str] | None:
-    matched_name = ""
-    for skill_name, _skill_file, _source in iter_unique_skill_candidates(loader):
-        if re.search(rf"(?<![\w-]){re.escape(skill_name.lower())}(?![\w-])", message_lower):
-            matched_name = skill_name
-            break
+    candidates = loader._throttled_sweep("skill_candidates", lambda: list(iter_unique_skill_candidates(loader)))
+    names = tuple(name for name, _skill_file, _source in candidates)
+    automaton, names_by_pattern = _skill_name_automaton(loader, names)
+    mentioned = find_full_name_mentions(automaton.find_all(message_lower), names_by_pattern, message_lower)
+    # First mention in root precedence order, as the per-skill scan did.
+    matched_name = next((name for name in names if name in mentioned), "")
     if not matched_name:
         return None
 
@@ -0,0 +1,219 @@
+"""
+Shared token accounting.
+
+``TokenBudget``, ``ContextGuard``, ``ToolResultTruncator`` and the quota
+estimator all count tokens for the same history messages on every turn and
+tool iteration. This module does it once:
+
+1. Encoders are resolved per model and cached (unknown models fall back to
+   ``cl100k_base`` once, not on every call).
+2. Counts are memoized per (encoding, BLAKE2b digest of the content), so an
+   unchanged history message is only hashed on later turns; only new content
+   is tokenized. Keys stay small without keeping counted strings alive.
+3. ``count_many`` tokenizes all cache misses in one batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from loguru import logger
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is a core dependency
+    tiktoken = None
+
+DEFAULT_MAX_ENTRIES = 20_000
+CHARS_PER_TOKEN = 4
+# Role, separators and message framing per chat message.
+MESSAGE_OVERHEAD_TOKENS = 4
+_FALLBACK_ENCODING = "cl100k_base"
+# Short strings are cheaper to encode than to cache.
+_MEMO_MIN_CHARS = 32
+_BATCH_MIN_TEXTS = 8
+
+
+def estimate_tokens(text: str) -> int:
+    """Character-based estimate used when no encoder is available."""
+    return len(text) // CHARS_PER_TOKEN + 1 if text else 0
+
+
+class TokenCounter:
+    """Per-model encoder cache plus an LRU of token counts keyed by content digest."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(0, int(max_entries))
+        self._encoders: dict[str, Any] = {}
+        self._counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def encoder_for(self, model: str | None = None) -> Any:
+        """Cached tiktoken encoding for ``model`` (provider prefix ignored), or None."""
+        key = str(model or "gpt-4").split("/")[-1]
+        if key in self._encoders:
+            return self._encoders[key]
+        encoder = None
+        if tiktoken is not None:
+            try:
+                encoder = tiktoken.encoding_for_model(key)
+            except Exception:
+                try:
+                    encoder = tiktoken.get_encoding(_FALLBACK_ENCODING)
+                except Exception as e:
+                    logger.error(f"Failed to load {_FALLBACK_ENCODING} encoding: {e}. Token counts will be estimated.")
+        self._encoders[key] = encoder
+        return encoder
+
+    def _memo_key(self, encoder: Any, text: str) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return (getattr(encoder, "name", "estimate"), digest)
+
+    def _remember(self, key: tuple[str, bytes], count: int) -> None:
+        if not self.max_entries:
+            return
+        self._counts[key] = count
+        if len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+
+    def _lookup(self, key: tuple[str, bytes]) -> int | None:
+        count = self._counts.get(key)
+        if count is not None:
+            try:
+                self._counts.move_to_end(key)
+            except KeyError:  # evicted concurrently
+                pass
+            self.hits += 1
+        return count
+
+    @staticmethod
+    def _encode_len(encoder: Any, text: str) -> int:
+        if encoder is None:
+            return estimate_tokens(text)
+        try:
+            # Special-token text in user content counts as ordinary text.
+            return len(encoder.encode_ordinary(text))
+        except Exception:
+            return estimate_tokens(text)
+
+    def count(self, text: str, model: str | None = None) -> int:
+        """Token count of one string."""
+        if not text:
+            return 0
+        encoder = self.encoder_for(model)
+        if len(text) < _MEMO_MIN_CHARS:
+            return self._encode_len(encoder, text)
+        key = self._memo_key(encoder, text)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        self.misses += 1
+        count = self._encode_len(encoder, text)
+        self._remember(key, count)
+        return count
+
+    def count_many(self, texts: Iterable[str], model: str | None = None) -> list[int]:
+        """Token counts for several strings; cache misses are encoded in one batch."""
+        texts = [str(text or "") for text in texts]
+        encoder = self.encoder_for(model)
+        counts: list[int | None] = [None] * len(texts)
+        pending: dict[tuple[str, bytes], list[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                counts[index] = 0
+                continue
+            key = self._memo_key(encoder, text)
+            cached = self._lookup(key)
+            if cached is not None:
+                counts[index] = cached
+            else:
+                pending.setdefault(key, []).append(index)
+        if pending:
+            self.misses += len(pending)
+            keys = list(pending)
+            miss_texts = [texts[pending[key][0]] for key in keys]
+            if encoder is not None and len(miss_texts) >= _BATCH_MIN_TEXTS:
+                try:
+                    lengths = [len(tokens) for tokens in encoder.encode_ordinary_batch(miss_texts)]
+                except Exception:
+                    lengths = [self._encode_len(encoder, text) for text in miss_texts]
+            else:
+                lengths = [self._encode_len(encoder, text) for text in miss_texts]
+            for key, length in zip(keys, lengths):
+                self._remember(key, length)
+                for index in pending[key]:
+                    counts[index] = length
+        return [int(count or 0) for count in counts]
+
+    def _content_texts(self, content: Any, out: list[str]) -> None:
+        if content is None:
+            return
+        if isinstance(content, str):
+            out.append(content)
+        elif isinstance(content, list):
+            for item in content:
+                self._content_texts(item, out)
+        elif isinstance(content, dict):
+            for value in content.values():
+                self._content_texts(value, out)
+        else:
+            out.append(str(content))
+
+    def _message_texts(self, message: dict[str, Any]) -> list[str]:
+        texts: list[str] = []
+        self._content_texts(message.get("content"), texts)
+        for tool_call in message.get("tool_calls") or []:
+            if not isinstance(tool_call, dict):
+                continue
+            function = tool_call.get("function", {})
+            if isinstance(function, dict):
+                texts.append(str(function.get("name", "")))
+                texts.append(str(function.get("arguments", "")))
+        return texts
+
+    def count_messages(self, messages: Iterable[Any], model: str | None = None) -> int:
+        """
+        Tokens for a chat message list: content (text parts of multimodal
+        content included), tool-call names and arguments, plus per-message
+        framing overhead.
+        """
+        texts: list[str] = []
+        message_count = 0
+        for message in messages:
+            if not isinstance(message, dict):
+                continue
+            message_count += 1
+            texts.extend(self._message_texts(message))
+        return sum(self.count_many(texts, model)) + MESSAGE_OVERHEAD_TOKENS * message_count
+
+    def clear(self) -> None:
+        self._counts.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._counts),
+            "encoders": sorted(key for key, encoder in self._encoders.items() if encoder is not None),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_default_counter = TokenCounter()
+
+
+def get_token_counter() -> TokenCounter:
+    """Process-wide counter shared by context building, guards and truncation."""
+    return _default_counter
+
+
+__all__ = [
+    "MESSAGE_OVERHEAD_TOKENS",
+    "TokenCounter",
+    "estimate_tokens",
+    "get_token_counter",
+]
@@ -3,6 +3,7 @@
 from typing import Any, Optional
 
 from kabot.agent.tools.base import Tool
+from kabot.agent.turn_context import TurnLocal
 
 
 class ToolRegistry:
@@ -13,6 +14,9 @@ class ToolRegistry:
     Phase 14: Added system event emission for tool execution monitoring.
     """
 
+    # Set per turn by the agent loop; concurrent turns each keep their own value.
+    _run_id = TurnLocal(default=None)
+
     def __init__(self, bus: Optional[Any] = None, run_id: Optional[str] = None):
         self._tools: dict[str, Tool] = {}
         self._bus = bus  # MessageBus for emitting system events
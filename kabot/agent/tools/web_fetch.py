@@ -15,6 +15,7 @@ from kabot.agent.fallback_i18n import t as i18n_t
 from kabot.agent.tools.base import Tool
 from kabot.agent.tools.web_cache import TTLCache
 from kabot.utils.external_content import wrap_external_content
+from kabot.utils.http_pool import get_http_client
 
 MAX_CHARS_DEFAULT = 8000
 MAX_CHARS_CAP = 50000
@@ -76,17 +77,16 @@ class WebFetchTool(Tool):
         if not self.firecrawl_api_key:
             return None
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.post(
-                    f"{self.firecrawl_base_url}/v1/scrape",
-                    json={"url": url, "formats": ["markdown"], "onlyMainContent": True},
-                    headers={
-                        "Authorization": f"Bearer {self.firecrawl_api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                r.raise_for_status()
+            r = await get_http_client("web").post(
+                f"{self.firecrawl_base_url}/v1/scrape",
+                json={"url": url, "formats": ["markdown"], "onlyMainContent": True},
+                headers={
+                    "Authorization": f"Bearer {self.firecrawl_api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+            )
+            r.raise_for_status()
             data = r.json()
             md = data.get("data", {}).get("markdown", "")
             if md and len(md) > max_chars:
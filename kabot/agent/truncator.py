@@ -2,6 +2,8 @@
 
 from loguru import logger
 
+from kabot.agent.token_counter import get_token_counter
+
 
 class ToolResultTruncator:
     """Truncates tool results to prevent context overflow."""
@@ -20,11 +22,11 @@ class ToolResultTruncator:
         self.max_share = max_share
         self.threshold = int(max_tokens * max_share)
 
-        # Cache tiktoken encoding
+        # Encoding and per-result counts come from the shared token counter.
         try:
-            import tiktoken
-            self.encoding = tiktoken.encoding_for_model("gpt-4")
-            self.has_tiktoken = True
+            import tiktoken  # noqa: F401
+            self.encoding = get_token_counter().encoder_for("gpt-4")
+            self.has_tiktoken = self.encoding is not None
         except ImportError:
             self.encoding = None
             self.has_tiktoken = False
@@ -71,7 +73,7 @@ class ToolResultTruncator:
             Number of tokens (or estimated tokens if tiktoken unavailable)
         """
         if self.has_tiktoken:
-            return len(self.encoding.encode(text))
+            return get_token_counter().count(text, "gpt-4")
         else:
             return len(text) // self.CHARS_PER_TOKEN
 
@@ -0,0 +1,63 @@
+"""Per-turn state bound to the current async context.
+
+The agent loop runs turns for different sessions concurrently on one shared
+``AgentLoop`` object. Attributes that describe "the turn being processed right
+now" (turn id, active message metadata, last usage and model, tool run id) must
+not leak between those turns, so they are stored in a ``ContextVar`` instead of
+on the instance. Each turn runs in its own ``asyncio.Task`` and therefore sees its own
+copy of the values.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Any
+
+_MISSING = object()
+
+_TURN_VALUES: ContextVar[dict[tuple[int, str], Any] | None] = ContextVar(
+    "kabot_turn_values",
+    default=None,
+)
+
+
+class TurnLocal:
+    """Descriptor for instance attributes whose value is isolated per async context.
+
+    Reads fall back to ``default`` (or raise ``AttributeError`` when no default
+    is given, so ``getattr(obj, name, fallback)`` keeps working). Writes never
+    mutate the mapping in place; a new mapping is bound to the current context
+    so sibling tasks that copied the context earlier are unaffected.
+    """
+
+    def __init__(self, default: Any = _MISSING):
+        self._default = default
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def _key(self, instance: Any) -> tuple[int, str]:
+        return (id(instance), self._name)
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        values = _TURN_VALUES.get() or {}
+        key = self._key(instance)
+        if key in values:
+            return values[key]
+        if self._default is not _MISSING:
+            return self._default
+        raise AttributeError(self._name)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        values = dict(_TURN_VALUES.get() or {})
+        values[self._key(instance)] = value
+        _TURN_VALUES.set(values)
+
+    def __delete__(self, instance: Any) -> None:
+        values = dict(_TURN_VALUES.get() or {})
+        if values.pop(self._key(instance), _MISSING) is _MISSING:
+            raise AttributeError(self._name)
+        _TURN_VALUES.set(values)
@@ -0,0 +1,146 @@
+"""Per-chat outbound send lanes with bounded parallelism."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+from kabot.bus.events import OutboundMessage
+
+OutboundSender = Callable[[OutboundMessage], Awaitable[Any]]
+
+
+@dataclass
+class _OutboundLane:
+    """FIFO of pending sends for one (channel, chat) pair plus latency counters."""
+
+    channel: str
+    chat_id: str
+    pending: deque[tuple[OutboundMessage, OutboundSender]] = field(default_factory=deque)
+    worker: asyncio.Task | None = None
+    sent: int = 0
+    failed: int = 0
+    total_latency_ms: float = 0.0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_activity: float = field(default_factory=time.monotonic)
+
+    def snapshot(self) -> dict[str, Any]:
+        delivered = self.sent + self.failed
+        return {
+            "channel": self.channel,
+            "chat_id": self.chat_id,
+            "queue_depth": len(self.pending),
+            "sending": bool(self.worker is not None and not self.worker.done()),
+            "sent": self.sent,
+            "failed": self.failed,
+            "avg_latency_ms": round(self.total_latency_ms / delivered, 1) if delivered else 0.0,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        }
+
+
+class OutboundScheduler:
+    """
+    Deliver outbound messages on independent per-chat lanes.
+
+    Messages for the same channel instance and chat are sent strictly in
+    FIFO order by one worker, so a chunked Telegram reply or a Discord
+    rate-limit wait only delays that chat. Different chats send in parallel,
+    bounded by ``max_inflight`` concurrent ``send`` calls overall.
+    """
+
+    def __init__(self, *, max_inflight: int = 8, max_tracked_lanes: int = 256):
+        self.max_inflight = max(1, int(max_inflight or 1))
+        self.max_tracked_lanes = max(1, int(max_tracked_lanes or 1))
+        self._slots = asyncio.Semaphore(self.max_inflight)
+        self._lanes: OrderedDict[tuple[str, str], _OutboundLane] = OrderedDict()
+        self._inflight = 0
+
+    def submit(self, channel: str, msg: OutboundMessage, send: OutboundSender) -> None:
+        """Queue ``msg`` on its chat lane; ``send`` performs the actual delivery."""
+        key = (str(channel), str(msg.chat_id))
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = _OutboundLane(channel=key[0], chat_id=key[1])
+            self._lanes[key] = lane
+        self._lanes.move_to_end(key)
+        lane.pending.append((msg, send))
+        lane.last_activity = time.monotonic()
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.create_task(
+                self._drain_lane(lane),
+                name=f"kabot-outbound:{key[0]}:{key[1]}",
+            )
+        self._prune_idle_lanes()
+
+    async def _drain_lane(self, lane: _OutboundLane) -> None:
+        while lane.pending:
+            async with self._slots:
+                msg, send = lane.pending.popleft()
+                self._inflight += 1
+                started = time.perf_counter()
+                try:
+                    await send(msg)
+                    lane.sent += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    lane.failed += 1
+                    logger.error(f"Error sending to {lane.channel}: {exc}")
+                finally:
+                    self._inflight -= 1
+                    elapsed_ms = (time.perf_counter() - started) * 1000.0
+                    lane.total_latency_ms += elapsed_ms
+                    lane.last_latency_ms = elapsed_ms
+                    lane.max_latency_ms = max(lane.max_latency_ms, elapsed_ms)
+                    lane.last_activity = time.monotonic()
+
+    def _prune_idle_lanes(self) -> None:
+        if len(self._lanes) <= self.max_tracked_lanes:
+            return
+        for key in list(self._lanes.keys()):
+            if len(self._lanes) <= self.max_tracked_lanes:
+                break
+            lane = self._lanes[key]
+            if lane.pending or (lane.worker is not None and not lane.worker.done()):
+                continue
+            self._lanes.pop(key, None)
+
+    async def join(self) -> None:
+        """Wait until every queued message has been attempted."""
+        while True:
+            workers = [
+                lane.worker
+                for lane in self._lanes.values()
+                if lane.worker is not None and not lane.worker.done()
+            ]
+            if not workers:
+                return
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Give queued sends ``timeout`` seconds to finish, then cancel the rest."""
+        try:
+            await asyncio.wait_for(self.join(), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            logger.warning("Outbound lanes did not drain before shutdown; cancelling pending sends")
+        for lane in self._lanes.values():
+            lane.pending.clear()
+            if lane.worker is not None and not lane.worker.done():
+                lane.worker.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """Scheduler load plus per-lane queue depth and send latency."""
+        lanes = [lane.snapshot() for lane in self._lanes.values()]
+        return {
+            "max_inflight": self.max_inflight,
+            "inflight": self._inflight,
+            "queued": sum(item["queue_depth"] for item in lanes),
+            "lanes": lanes,
+        }
@@ -9,6 +9,7 @@ from typing import Any, Awaitable, Callable
 from loguru import logger
 
 from kabot.bus.events import InboundMessage, OutboundMessage, SystemEvent
+from kabot.bus.outbound import OutboundScheduler
 
 
 @dataclass
@@ -34,6 +35,7 @@ class MessageBus:
         self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
         self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
         self._outbound_subscribers: dict[str, list[Callable[[OutboundMessage], Awaitable[None]]]] = {}
+        self._outbound_lanes = OutboundScheduler()
 
         # Runtime inbound queue controls (debounce/cap/drop).
         self._queue_enabled = False
@@ -320,15 +322,30 @@ class MessageBus:
         while self._running:
             try:
                 msg = await asyncio.wait_for(self.outbound.get(), timeout=1.0)
-                subscribers = self._outbound_subscribers.get(msg.channel, [])
-                for callback in subscribers:
-                    try:
-                        await callback(msg)
-                    except Exception as e:
-                        logger.error(f"Error dispatching to {msg.channel}: {e}")
+                if not self._outbound_subscribers.get(msg.channel):
+                    continue
+                # Per-chat lanes keep FIFO order within a chat while a slow
+                # subscriber for one chat no longer blocks every other chat.
+                self._outbound_lanes.submit(msg.channel, msg, self.deliver_to_subscribers)
             except asyncio.TimeoutError:
                 continue
 
+    def has_outbound_subscribers(self, channel: str) -> bool:
+        """Return whether any callback is subscribed to ``channel``."""
+        return bool(self._outbound_subscribers.get(channel))
+
+    async def deliver_to_subscribers(self, msg: OutboundMessage) -> None:
+        """Run the subscriber callbacks for ``msg.channel``."""
+        for callback in list(self._outbound_subscribers.get(msg.channel, [])):
+            try:
+                await callback(msg)
+            except Exception as e:
+                logger.error(f"Error dispatching to {msg.channel}: {e}")
+
+    def outbound_lane_stats(self) -> dict[str, Any]:
+        """Per-chat outbound lane depth and send latency for subscriber dispatch."""
+        return self._outbound_lanes.stats()
+
     # Phase 14: System event methods
     def get_next_seq(self, run_id: str) -> int:
         """Get next monotonic sequence number for a run."""
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from kabot.bus.outbound import OutboundScheduler
 from kabot.bus.queue import MessageBus
 from kabot.channels.adapters import AdapterRegistry
 from kabot.channels.base import BaseChannel
@@ -44,6 +45,10 @@ class ChannelManager:
         self.channels: dict[str, BaseChannel] = {}
         self._instance_keys_by_type: dict[str, list[str]] = {}
         self._dispatch_task: asyncio.Task | None = None
+        runtime_queue = getattr(getattr(self.config, "runtime", None), "queue", None)
+        self._outbound = OutboundScheduler(
+            max_inflight=int(getattr(runtime_queue, "max_concurrent_sends", 8) or 8),
+        )
 
         self._init_channels()
 
@@ -137,6 +142,7 @@ class ChannelManager:
                 await self._dispatch_task
             except asyncio.CancelledError:
                 pass
+        await self._outbound.close()
 
         # Stop all channels
         for name, channel in self.channels.items():
@@ -157,21 +163,25 @@ class ChannelManager:
                     timeout=1.0
                 )
 
+                channel_key = msg.channel
                 channel = self.channels.get(msg.channel)
                 if not channel and ":" not in msg.channel:
                     candidates = self._instance_keys_by_type.get(msg.channel, [])
                     if len(candidates) == 1:
-                        channel = self.channels.get(candidates[0])
+                        channel_key = candidates[0]
+                        channel = self.channels.get(channel_key)
                     elif len(candidates) > 1:
                         logger.warning(
                             f"Ambiguous channel '{msg.channel}' with {len(candidates)} instances; "
                             "send using explicit key '<type>:<id>'."
                         )
                 if channel:
-                    try:
-                        await channel.send(msg)
-                    except Exception as e:
-                        logger.error(f"Error sending to {msg.channel}: {e}")
+                    # One lane per channel instance + chat: FIFO within a chat,
+                    # parallel across chats, bounded in-flight sends overall.
+                    self._outbound.submit(channel_key, msg, channel.send)
+                elif self.bus.has_outbound_subscribers(msg.channel):
+                    # Adapter-less surfaces (the dashboard) consume their updates via bus subscriptions.
+                    self._outbound.submit(msg.channel, msg, self.bus.deliver_to_subscribers)
                 else:
                     if msg.channel in {"cli", "system"}:
                         logger.debug(f"Dropping outbound for non-network channel: {msg.channel}")
@@ -218,6 +228,10 @@ class ChannelManager:
             for name, channel in self.channels.items()
         }
 
+    def get_outbound_stats(self) -> dict[str, Any]:
+        """Get outbound lane queue depth and send latency."""
+        return self._outbound.stats()
+
     @property
     def enabled_channels(self) -> list[str]:
         """Get list of enabled channel names."""
@@ -871,7 +871,7 @@ class TelegramChannel(BaseChannel):
             return
 
         session = self.session_manager.get_or_create(session_key)
-        msg_count = len(session.messages)
+        msg_count = session.message_count
         session.clear()
         self.session_manager.save(session)
 
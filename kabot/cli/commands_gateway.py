@@ -607,6 +607,9 @@ def _gateway_dashboard_chat_history_provider(
     except Exception:
         return []
 
+    ensure_history = getattr(session, "ensure_history", None)
+    if callable(ensure_history):
+        ensure_history(limit_int)
     raw_messages = getattr(session, "messages", [])
     if not isinstance(raw_messages, list):
         return []
@@ -626,6 +629,36 @@ def _gateway_dashboard_chat_history_provider(
         items.append(payload_item)
     return items
 
+async def _shutdown_gateway_runtime(
+    *,
+    heartbeat: Any,
+    cron: Any,
+    agent: Any,
+    channels: Any,
+    webhook_runner: Any | None = None,
+    drain_timeout_s: float = 10.0,
+) -> None:
+    """Stop gateway services, draining queued memory writes before the loop goes away."""
+    heartbeat.stop()
+    cron.stop()
+    close_resources = getattr(agent, "close_runtime_resources", None)
+    if callable(close_resources):
+        try:
+            await asyncio.wait_for(close_resources(), timeout=drain_timeout_s)
+        except asyncio.TimeoutError:
+            console.print(
+                f"[yellow]Memory writes did not drain within {drain_timeout_s:g}s; "
+                "some queued messages may be lost.[/yellow]"
+            )
+        except Exception as exc:
+            console.print(f"[yellow]Failed to drain memory writes: {exc}[/yellow]")
+    agent.stop()
+    await channels.stop_all()
+    if webhook_runner is not None:
+        await webhook_runner.cleanup()
+    from kabot.utils.http_pool import aclose_http_pool
+    await aclose_http_pool()
+
 def gateway(
     port: int | None = typer.Option(None, "--port", "-p", help="Gateway port (default: config.gateway.port)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
@@ -695,11 +728,23 @@ def gateway(
 
     bus = MessageBus()
     provider = _resolve_commands_override("_make_provider", _make_provider)(config)
-    session_manager = SessionManager(config.workspace_path)
+    session_cfg = config.agents.session
+    session_manager = SessionManager(
+        config.workspace_path,
+        max_cached_sessions=session_cfg.cache_max_sessions,
+        max_cached_bytes=session_cfg.cache_max_bytes,
+        hydrate_tail_messages=session_cfg.hydrate_tail_messages,
+    )
 
     # Create cron service first (callback set after agent creation)
     cron_store_path = get_data_dir() / "cron" / "jobs.json"
-    cron = CronService(cron_store_path)
+    perf_cfg = config.runtime.performance
+    cron = CronService(
+        cron_store_path,
+        max_concurrent_jobs=perf_cfg.cron_max_concurrent_jobs,
+        misfire_policy=perf_cfg.cron_misfire_policy,
+        misfire_grace_ms=perf_cfg.cron_misfire_grace_seconds * 1000,
+    )
 
     runtime_model, model_fallbacks = _resolve_model_runtime(config)
     p = config.get_provider(runtime_model)
@@ -817,7 +862,7 @@ def gateway(
         # Lazy import keeps startup-critical module import path shorter.
         from kabot.gateway.webhook_server import WebhookServer
 
-        return WebhookServer(
+        server = WebhookServer(
             bus,
             auth_token=config.gateway.auth_token or None,
             meta_verify_token=getattr(getattr(config.integrations, "meta", None), "verify_token", None),
@@ -837,6 +882,11 @@ def gateway(
             control_handler=_gateway_control_handler,
             tailscale_only=bool(getattr(config.gateway, "tailscale", False)),
         )
+        # Session saves drive the dashboard chat stream instead of per-client polling.
+        add_save_listener = getattr(session_manager, "add_save_listener", None)
+        if callable(add_save_listener):
+            add_save_listener(server.notify_chat_session_saved)
+        return server
 
     # Check for restart recovery
     from kabot.utils.restart import RestartManager
@@ -891,12 +941,13 @@ def gateway(
             await asyncio.gather(*tasks)
         except KeyboardInterrupt:
             console.print("\nShutting down...")
-            heartbeat.stop()
-            cron.stop()
-            agent.stop()
-            await channels.stop_all()
-            if webhook_runner is not None:
-                await webhook_runner.cleanup()
+            await _shutdown_gateway_runtime(
+                heartbeat=heartbeat,
+                cron=cron,
+                agent=agent,
+                channels=channels,
+                webhook_runner=webhook_runner,
+            )
 
     try:
         asyncio.run(run())
@@ -43,6 +43,11 @@ def _resolve_api_key_with_refresh(config, model: str) -> str | None:
 def _make_provider(config):
     """Create LLMProvider from config. Exits if no API key found."""
     from kabot.providers.litellm_provider import LiteLLMProvider
+    from kabot.utils.http_pool import configure_http_pool, http_pool_settings_from_config
+
+    performance_cfg = getattr(getattr(config, "runtime", None), "performance", None)
+    if performance_cfg is not None:
+        configure_http_pool(http_pool_settings_from_config(performance_cfg))
 
     model, model_fallbacks = _resolve_model_runtime(config)
     p = config.get_provider(model)
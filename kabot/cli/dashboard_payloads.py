@@ -454,6 +454,29 @@ def _build_dashboard_memory_snapshot(agent: Any) -> dict[str, Any]:
     return snapshot
 
 
+def _build_dashboard_outbound_snapshot(channels: Any) -> dict[str, Any]:
+    """Return outbound lane queue depth and send latency for the dashboard."""
+    get_outbound_stats = getattr(channels, "get_outbound_stats", None)
+    if not callable(get_outbound_stats):
+        return {}
+    try:
+        raw_stats = get_outbound_stats()
+    except Exception:
+        return {}
+    if not isinstance(raw_stats, dict):
+        return {}
+    lanes = raw_stats.get("lanes")
+    lane_rows = [dict(item) for item in lanes if isinstance(item, dict)] if isinstance(lanes, list) else []
+    # Busiest lanes first so a stuck chat is visible without scrolling.
+    lane_rows.sort(key=lambda item: (-int(item.get("queue_depth", 0) or 0), str(item.get("channel", ""))))
+    return {
+        "max_inflight": int(raw_stats.get("max_inflight", 0) or 0),
+        "inflight": int(raw_stats.get("inflight", 0) or 0),
+        "queued": int(raw_stats.get("queued", 0) or 0),
+        "lanes": lane_rows[:50],
+    }
+
+
 def _build_dashboard_cost_payload(
     session_manager: Any,
     *,
@@ -879,6 +902,7 @@ def _build_dashboard_status_payload(
     subagent_activity = _build_dashboard_subagent_activity(agent)
     git_log = _build_dashboard_git_log(config.workspace_path)
     memory = _build_dashboard_memory_snapshot(agent)
+    outbound = _build_dashboard_outbound_snapshot(channels)
 
     return {
         "status": "running",
@@ -897,6 +921,7 @@ def _build_dashboard_status_payload(
         "sessions": sessions,
         "recent_turn": recent_turn,
         "nodes": _build_dashboard_nodes(channels),
+        "outbound": outbound,
         "config": _build_dashboard_config_summary(config),
         "system": {"pid": os.getpid(), "memory_mb": 0},
         "memory": memory,
@@ -917,6 +942,7 @@ __all__ = [
     "_build_dashboard_git_log",
     "_build_dashboard_memory_snapshot",
     "_build_dashboard_nodes",
+    "_build_dashboard_outbound_snapshot",
     "_build_dashboard_skills_snapshot",
     "_build_dashboard_status_payload",
     "_build_dashboard_subagent_activity",
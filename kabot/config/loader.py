@@ -255,6 +255,23 @@ def _migrate_config(data: dict) -> dict:
         "maxContextBuildMs": 500,
         "maxFirstResponseMsSoft": 4000,
         "tokenMode": "boros",
+        "routeCacheEnabled": True,
+        "routeCacheTtlSeconds": 900,
+        "routeCacheMaxEntries": 512,
+        "routeCacheSemantic": False,
+        "routeCacheSimilarity": 0.95,
+        "streamResponses": True,
+        "streamPreviewIntervalMs": 1000,
+        "httpMaxConnections": 100,
+        "httpMaxKeepaliveConnections": 20,
+        "httpMaxConnectionsPerHost": 16,
+        "httpKeepaliveExpirySeconds": 30.0,
+        "httpConnectTimeoutSeconds": 15.0,
+        "httpReadTimeoutSeconds": 120.0,
+        "http2": True,
+        "cronMaxConcurrentJobs": 4,
+        "cronMisfirePolicy": "run_once",
+        "cronMisfireGraceSeconds": 3600,
     }
     autopilot_defaults = {
         "enabled": True,
@@ -284,6 +301,9 @@ def _migrate_config(data: dict) -> dict:
         "maxPendingPerSession": 4,
         "dropPolicy": "drop_oldest",
         "summarizeDropped": True,
+        "maxConcurrentTurns": 4,
+        "maxBufferedTurns": 16,
+        "maxConcurrentSends": 8,
     }
 
     resilience_cfg = runtime_cfg.get("resilience")
@@ -291,6 +291,9 @@ class SessionConfig(BaseModel):
     """Session management configuration."""
     dm_scope: str = "main"  # "main", "per-peer", "per-channel-peer", "per-account-channel-peer"
     identity_links: dict[str, list[str]] = Field(default_factory=dict)
+    cache_max_sessions: int = 256
+    cache_max_bytes: int = 64 * 1024 * 1024
+    hydrate_tail_messages: int = 50
 
 
 class AgentsConfig(BaseModel):
@@ -450,7 +453,16 @@ class MemoryConfig(BaseModel):
     enable_hybrid_search: bool = True
     enable_graph_memory: bool = True
     graph_injection_limit: int = 8
+    graph_expand_depth: int = 2  # hops walked from an entity for graph context (hybrid)
+    graph_expand_fanout: int = 16  # strongest edges followed per entity on each hop
     auto_unload_timeout: int = 300
+    lexical_engine: str = "auto"  # "auto" | "bm25" | "fts5" | "like" (sqlite_only)
+    embedding_cache_mb: int = 256  # persistent embedding cache budget; 0 disables
+    io_workers: int = 4  # worker threads for blocking Chroma/SQLite work (hybrid)
+    io_queue_limit: int = 64  # memory calls admitted to the I/O executor at once
+    io_timeout_seconds: float = 30.0  # per-call limit for memory I/O; 0 disables
+    write_behind_batch: int = 32  # messages written per batch (hybrid); 0 writes each inline
+    write_behind_delay_ms: int = 500  # longest a queued message waits for its batch
 
 
 class McpServerConfig(BaseModel):
@@ -505,6 +517,23 @@ class RuntimePerformanceConfig(BaseModel):
     max_context_build_ms: int = 500
     max_first_response_ms_soft: int = 4000
     token_mode: str = "boros"  # "boros" | "hemat"
+    route_cache_enabled: bool = True
+    route_cache_ttl_seconds: int = 900
+    route_cache_max_entries: int = 512
+    route_cache_semantic: bool = False  # nearest-neighbour tier over memory embeddings
+    route_cache_similarity: float = 0.95
+    stream_responses: bool = True  # stream LLM text into mutable preview lanes
+    stream_preview_interval_ms: int = 1000
+    http_max_connections: int = 100  # shared async HTTP pool (LLM providers, web tools)
+    http_max_keepalive_connections: int = 20
+    http_max_connections_per_host: int = 16
+    http_keepalive_expiry_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 15.0
+    http_read_timeout_seconds: float = 120.0
+    http2: bool = True  # used when the optional h2 package is installed
+    cron_max_concurrent_jobs: int = 4  # jobs for the same destination still run one at a time
+    cron_misfire_policy: str = "run_once"  # "run_once" | "skip" for runs missed while stopped
+    cron_misfire_grace_seconds: int = 3600
 
 
 class RuntimeAutopilotConfig(BaseModel):
@@ -538,7 +567,7 @@ class RuntimeQuotaConfig(BaseModel):
 
 
 class RuntimeQueueConfig(BaseModel):
-    """Inbound message queue policy for burst handling and responsiveness."""
+    """Inbound/outbound message queue policy for burst handling and responsiveness."""
 
     enabled: bool = True
     mode: str = "debounce"  # "off" | "debounce"
@@ -546,6 +575,9 @@ class RuntimeQueueConfig(BaseModel):
     max_pending_per_session: int = 4
     drop_policy: str = "drop_oldest"  # "drop_oldest" | "drop_newest"
     summarize_dropped: bool = True
+    max_concurrent_turns: int = 4  # Turns from different sessions processed in parallel
+    max_buffered_turns: int = 16  # Admitted-but-unfinished turns before inbound backpressure
+    max_concurrent_sends: int = 8  # In-flight outbound sends across all channel/chat lanes
 
 
 class RuntimeConfig(BaseModel):
@@ -586,6 +618,8 @@ class SkillsLoadConfig(BaseModel):
 
     managed_dir: str = "~/.kabot/skills"
     extra_dirs: list[str] = Field(default_factory=list)
+    # Skill roots are re-scanned for added/edited skills at most this often.
+    refresh_interval_seconds: float = 2.0
 
 
 class SkillsInstallConfig(BaseModel):
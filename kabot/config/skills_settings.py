@@ -160,7 +160,7 @@ def normalize_skills_settings(raw_skills: Any) -> dict[str, Any]:
     Canonical keys (snake_case in runtime):
     - entries: dict[str, dict]
     - allow_bundled: list[str] (optional)
-    - load: { managed_dir?: str, extra_dirs?: list[str] } (optional)
+    - load: { managed_dir?: str, extra_dirs?: list[str], refresh_interval_seconds?: float } (optional)
     - install / limits (optional passthrough dict)
     """
     raw_map = _as_plain_dict(raw_skills)
@@ -222,6 +222,9 @@ def normalize_skills_settings(raw_skills: Any) -> dict[str, Any]:
             cleaned_extra = [str(v).strip() for v in extra_dirs if str(v).strip()]
             if cleaned_extra:
                 load["extra_dirs"] = cleaned_extra
+        refresh_interval = _coalesce(load_cfg, "refresh_interval_seconds", "refreshIntervalSeconds")
+        if isinstance(refresh_interval, (int, float)) and not isinstance(refresh_interval, bool) and refresh_interval >= 0:
+            load["refresh_interval_seconds"] = float(refresh_interval)
         if load:
             result["load"] = load
 
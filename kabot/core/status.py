@@ -103,6 +103,34 @@ class StatusService:
                 f"  Chain: {' -> '.join(chain)}",
             ])
 
+            scheduler = getattr(self._agent_loop, "_turn_scheduler", None)
+            scheduler_stats = getattr(scheduler, "stats", None)
+            stats = scheduler_stats() if callable(scheduler_stats) else None
+            if isinstance(stats, dict):
+                lines.extend([
+                    "",
+                    "🧵 *Turn Scheduler*",
+                    f"  Running: {stats.get('running_turns', 0)}/{stats.get('max_concurrent_turns', 0)}",
+                    f"  Queued: {stats.get('queued_turns', 0)}",
+                    f"  Active sessions: {stats.get('active_sessions', 0)}",
+                ])
+
+            sessions = getattr(self._agent_loop, "sessions", None)
+            cache_stats = getattr(sessions, "cache_stats", None)
+            cache = cache_stats() if callable(cache_stats) else None
+            if isinstance(cache, dict):
+                lookups = cache.get("hits", 0) + cache.get("misses", 0)
+                hit_rate = (cache.get("hits", 0) / lookups * 100) if lookups else 0
+                lines.extend([
+                    "",
+                    "🗂 *Session Cache*",
+                    f"  Cached: {cache.get('cached_sessions', 0)}/{cache.get('max_cached_sessions', 0)}"
+                    f" ({cache.get('cached_bytes', 0) / 1024 / 1024:.1f} MB)",
+                    f"  Hits: {cache.get('hits', 0)} ({hit_rate:.1f}%)",
+                    f"  Misses: {cache.get('misses', 0)}",
+                    f"  Evictions: {cache.get('evictions', 0)}",
+                ])
+
         return "\n".join(lines)
 
 
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from loguru import logger
 
-from kabot.cron.core.scheduling import compute_next_run, now_ms
+from kabot.cron.core.scheduling import compute_next_run, now_ms, schedule_job
 from kabot.cron.types import CronJob
 
 
@@ -52,3 +53,51 @@ async def execute_job(service: Any, job: CronJob, *, max_run_history: int) -> No
             job.state.next_run_at_ms = None
     else:
         job.state.next_run_at_ms = compute_next_run(job.schedule, now_ms())
+        schedule_job(service, job)
+
+
+def destination_key(job: CronJob) -> tuple[str, ...]:
+    """Jobs delivering to the same chat share a key; other jobs get their own."""
+    if job.payload.channel and job.payload.to:
+        return ("destination", job.payload.channel, job.payload.to)
+    return ("job", job.id)
+
+
+def destination_lock(service: Any, job: CronJob) -> asyncio.Lock:
+    key = destination_key(job)
+    lock = service._destination_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        service._destination_locks[key] = lock
+    return lock
+
+
+async def run_serialized(service: Any, job: CronJob) -> None:
+    """
+    Run ``job`` one at a time per destination and within the service-wide
+    concurrency limit. The destination lock is taken first so queued jobs do
+    not hold a global slot while they wait.
+    """
+    async with destination_lock(service, job):
+        async with service._job_slots:
+            await service._execute_job(job)
+
+
+def dispatch_job(service: Any, job: CronJob) -> None:
+    """Start ``job`` in the background; the service persists and re-arms when it finishes."""
+
+    async def _run() -> None:
+        try:
+            await run_serialized(service, job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Cron: job '{job.name}' crashed: {e}")
+        finally:
+            # Nothing awaits between execute_job() re-registering the job and
+            # clearing the running mark, so the wake heap keeps its new entry.
+            service._running_jobs.pop(job.id, None)
+        service._request_save()
+        service._arm_timer()
+
+    service._running_jobs[job.id] = asyncio.create_task(_run())
@@ -95,7 +95,7 @@ def load_store(service: Any, *, max_run_history: int) -> CronStore:
 
 
 def save_store(service: Any, *, max_run_history: int) -> None:
-    """Persist service._store to disk atomically."""
+    """Persist service._store to disk atomically; skipped when nothing changed."""
     if not service._store:
         return
 
@@ -152,6 +152,8 @@ def save_store(service: Any, *, max_run_history: int) -> None:
     }
 
     payload = json.dumps(data, indent=2)
+    if payload == getattr(service, "_last_saved_payload", None) and service.store_path.exists():
+        return  # nothing changed since the last write
     temp_path = service.store_path.with_suffix(service.store_path.suffix + ".tmp")
 
     with PIDLock(service.store_path):
@@ -164,3 +166,4 @@ def save_store(service: Any, *, max_run_history: int) -> None:
                 if attempt == 4:
                     raise
                 time.sleep(0.05 * (attempt + 1))
+    service._last_saved_payload = payload
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import time
 from typing import Any
 
@@ -53,34 +54,110 @@ def compute_next_run(schedule: CronSchedule, now_ms_value: int) -> int | None:
     return None
 
 
+MISFIRE_POLICIES = ("run_once", "skip")
+
+
 def recompute_next_runs(service: Any) -> None:
-    """Recompute next run times for all enabled jobs."""
+    """
+    Recompute next run times for all enabled jobs.
+
+    Jobs whose stored run time already passed (the gateway was down) follow
+    ``service.misfire_policy``: ``run_once`` keeps the missed time so the job
+    fires once on the first tick, if it is no older than
+    ``service.misfire_grace_ms``; otherwise the missed runs are skipped.
+    """
     if not service._store:
         return
     now_value = now_ms()
+    policy = getattr(service, "misfire_policy", "skip")
+    grace_ms = int(getattr(service, "misfire_grace_ms", 0) or 0)
     for job in service._store.jobs:
-        if job.enabled:
-            job.state.next_run_at_ms = compute_next_run(job.schedule, now_value)
+        if not job.enabled:
+            continue
+        missed_at = job.state.next_run_at_ms
+        if missed_at and missed_at <= now_value:
+            if policy == "run_once" and now_value - missed_at <= grace_ms:
+                logger.info(f"Cron: job '{job.name}' ({job.id}) missed its run at {missed_at}, catching up once")
+                continue
+            logger.info(f"Cron: job '{job.name}' ({job.id}) missed its run at {missed_at}, skipping")
+            job.state.last_status = "skipped"
+        job.state.next_run_at_ms = compute_next_run(job.schedule, now_value)
+    index_jobs(service)
+
+
+def index_jobs(service: Any) -> None:
+    """Rebuild the id index and the wake heap from the in-memory store."""
+    jobs = service._store.jobs if service._store else []
+    service._jobs_by_id = {job.id: job for job in jobs}
+    service._indexed_jobs = jobs
+    service._wake_heap = [
+        (job.state.next_run_at_ms, index, job.id)
+        for index, job in enumerate(jobs)
+        if job.enabled and job.state.next_run_at_ms
+    ]
+    heapq.heapify(service._wake_heap)
+    service._wake_seq = len(jobs)
+
+
+def _ensure_index(service: Any) -> None:
+    # Replacing the store or its job list (load, remove, delete-after-run)
+    # invalidates the index; in-place edits go through schedule_job().
+    jobs = service._store.jobs if service._store else []
+    if getattr(service, "_indexed_jobs", None) is not jobs:
+        index_jobs(service)
+
+
+def schedule_job(service: Any, job: Any) -> None:
+    """Register ``job``'s current next run time with the wake heap."""
+    _ensure_index(service)
+    service._jobs_by_id[job.id] = job
+    if job.enabled and job.state.next_run_at_ms:
+        service._wake_seq += 1
+        heapq.heappush(service._wake_heap, (job.state.next_run_at_ms, service._wake_seq, job.id))
+
+
+def _is_current(service: Any, entry: tuple[int, int, str]) -> bool:
+    """Heap entries are invalidated lazily: only the job's current run time counts."""
+    when, _, job_id = entry
+    if job_id in getattr(service, "_running_jobs", ()):
+        return False  # re-registered by execute_job() when the run finishes
+    job = service._jobs_by_id.get(job_id)
+    return bool(job is not None and job.enabled and job.state.next_run_at_ms == when)
 
 
 def get_next_wake_ms(service: Any) -> int | None:
     """Get the earliest next run time across all jobs."""
     if not service._store:
         return None
-    times = [j.state.next_run_at_ms for j in service._store.jobs if j.enabled and j.state.next_run_at_ms]
-    logger.debug(f"Next wake candidates: {times}")
-    return min(times) if times else None
+    _ensure_index(service)
+    heap = service._wake_heap
+    while heap and not _is_current(service, heap[0]):
+        heapq.heappop(heap)
+    return heap[0][0] if heap else None
 
 
-def get_due_jobs(service: Any, now_ms_value: int | None = None):
-    """Return currently due jobs from in-memory store."""
+def pop_due_jobs(service: Any, now_ms_value: int | None = None) -> list[Any]:
+    """
+    Remove and return due jobs, earliest first.
+
+    A popped job is re-registered by execute_job() once its next run time is
+    known, and running jobs are skipped, so a job is never dispatched twice.
+    """
     if not service._store:
         return []
+    _ensure_index(service)
     now_value = now_ms_value if now_ms_value is not None else now_ms()
-    return [
-        j for j in service._store.jobs
-        if j.enabled and j.state.next_run_at_ms and now_value >= j.state.next_run_at_ms
-    ]
+    heap = service._wake_heap
+    due: list[Any] = []
+    seen: set[str] = set()
+    while heap and heap[0][0] <= now_value:
+        entry = heapq.heappop(heap)
+        job_id = entry[2]
+        if job_id in seen or not _is_current(service, entry):
+            continue
+        seen.add(job_id)
+        due.append(service._jobs_by_id[job_id])
+    return due
 
 
 def arm_timer(service: Any) -> None:
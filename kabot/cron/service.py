@@ -25,6 +25,10 @@ from kabot.cron.types import (
 )
 
 MAX_RUN_HISTORY = 20
+DEFAULT_MAX_CONCURRENT_JOBS = 4
+DEFAULT_MISFIRE_GRACE_MS = 60 * 60 * 1000
+# Job completions within this window are persisted with one write.
+SAVE_DEBOUNCE_SECONDS = 0.5
 
 
 def _now_ms() -> int:
@@ -64,14 +68,30 @@ class CronService:
         *,
         max_jobs_per_destination: int = core_policies.DEFAULT_MAX_JOBS_PER_DESTINATION,
         dedup_enabled: bool = True,
+        max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+        misfire_policy: str = "run_once",
+        misfire_grace_ms: int = DEFAULT_MISFIRE_GRACE_MS,
     ):
         self.store_path = store_path
         self.on_job = on_job  # Callback to execute job, returns response text
         self.max_jobs_per_destination = max(0, int(max_jobs_per_destination))
         self.dedup_enabled = bool(dedup_enabled)
+        self.max_concurrent_jobs = max(1, int(max_concurrent_jobs))
+        self.misfire_policy = misfire_policy if misfire_policy in core_scheduling.MISFIRE_POLICIES else "run_once"
+        self.misfire_grace_ms = max(0, int(misfire_grace_ms))
         self._store: CronStore | None = None
         self._timer_task: asyncio.Task | None = None
         self._running = False
+        # Wake heap of (next_run_at_ms, seq, job_id); see core.scheduling.
+        self._wake_heap: list[tuple[int, int, str]] = []
+        self._wake_seq = 0
+        self._jobs_by_id: dict[str, CronJob] = {}
+        self._indexed_jobs: list[CronJob] | None = None
+        self._running_jobs: dict[str, asyncio.Task] = {}
+        self._job_slots = asyncio.Semaphore(self.max_concurrent_jobs)
+        self._destination_locks: dict[tuple[str, ...], asyncio.Lock] = {}
+        self._last_saved_payload: str | None = None
+        self._save_handle: asyncio.TimerHandle | None = None
 
     def _load_store(self) -> CronStore:
         return core_persistence.load_store(self, max_run_history=MAX_RUN_HISTORY)
@@ -79,6 +99,24 @@ class CronService:
     def _save_store(self) -> None:
         core_persistence.save_store(self, max_run_history=MAX_RUN_HISTORY)
 
+    def _request_save(self) -> None:
+        """Coalesce saves from background job completions into one write."""
+        if self._save_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_store()
+            return
+        self._save_handle = loop.call_later(SAVE_DEBOUNCE_SECONDS, self._flush_pending_save)
+
+    def _flush_pending_save(self) -> None:
+        self._save_handle = None
+        try:
+            self._save_store()
+        except Exception as e:
+            logger.error(f"Cron: failed to save store: {e}")
+
     async def start(self) -> None:
         """Start the cron service."""
         self._running = True
@@ -94,6 +132,12 @@ class CronService:
         if self._timer_task:
             self._timer_task.cancel()
             self._timer_task = None
+        for task in list(self._running_jobs.values()):
+            task.cancel()
+        self._running_jobs.clear()
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._flush_pending_save()
 
     def _recompute_next_runs(self) -> None:
         core_scheduling.recompute_next_runs(self)
@@ -105,22 +149,23 @@ class CronService:
         core_scheduling.arm_timer(self)
 
     async def _on_timer(self) -> None:
-        """Handle timer tick - run due jobs."""
+        """Handle timer tick - dispatch due jobs without waiting for them."""
         if not self._store:
             return
 
         now = _now_ms()
         logger.debug(f"Cron tick: now={now}")
 
-        due_jobs = core_scheduling.get_due_jobs(self, now_ms_value=now)
+        due_jobs = core_scheduling.pop_due_jobs(self, now_ms_value=now)
 
         if due_jobs:
             logger.info(f"Cron: found {len(due_jobs)} due jobs")
 
+        # Jobs for the same destination run one at a time, others in parallel
+        # (up to max_concurrent_jobs); each one persists and re-arms when done.
         for job in due_jobs:
-            await self._execute_job(job)
+            core_execution.dispatch_job(self, job)
 
-        self._save_store()
         self._arm_timer()
 
     async def _execute_job(self, job: CronJob) -> None:
@@ -193,6 +238,7 @@ class CronService:
         )
 
         store.jobs.append(job)
+        core_scheduling.schedule_job(self, job)
         self._save_store()
         self._arm_timer()
 
@@ -224,6 +270,7 @@ class CronService:
                     job.state.next_run_at_ms = _compute_next_run(job.schedule, _now_ms())
                 else:
                     job.state.next_run_at_ms = None
+                core_scheduling.schedule_job(self, job)
                 self._save_store()
                 self._arm_timer()
                 return job
@@ -236,7 +283,7 @@ class CronService:
             if job.id == job_id:
                 if not force and not job.enabled:
                     return False
-                await self._execute_job(job)
+                await core_execution.run_serialized(self, job)
                 self._save_store()
                 self._arm_timer()
                 return True
@@ -265,6 +312,7 @@ class CronService:
                 if "group_title" in kwargs:
                     job.payload.group_title = kwargs["group_title"]
                 job.updated_at_ms = _now_ms()
+                core_scheduling.schedule_job(self, job)
                 self._save_store()
                 self._arm_timer()
                 return job
@@ -293,5 +341,6 @@ class CronService:
         return {
             "enabled": self._running,
             "jobs": len(store.jobs),
+            "running_jobs": len(self._running_jobs),
             "next_wake_at_ms": self._get_next_wake_ms(),
         }
@@ -0,0 +1,251 @@
+"""
+Publish/subscribe fan-out for the dashboard chat SSE stream.
+
+Each (session_key, limit) pair with at least one connected client has a
+feed. A change notification (session save, outbound bus message) schedules
+one coalesced history read per feed; the result is diffed against the
+previous read and fanned out to every client as incremental ``message``
+events, so many open tabs share one read and idle dashboards do no reads.
+
+Event ids are monotonic across the hub (seeded from the wall clock, so ids
+keep increasing across restarts). Each feed keeps a short replay buffer for
+``Last-Event-ID`` resume; clients that resume from outside it get a fresh
+``snapshot``. Every client has a bounded queue: a client that falls behind
+is marked for resync and receives a snapshot instead of an unbounded backlog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+ReadHistory = Callable[[str, int], Awaitable[list[dict[str, Any]]]]
+
+REPLAY_BUFFER_EVENTS = 256
+CLIENT_QUEUE_EVENTS = 64
+
+
+@dataclass(frozen=True)
+class ChatStreamEvent:
+    event: str
+    data: str
+    id: int | None = None
+
+    def encode(self) -> bytes:
+        lines = [f"event: {self.event}"]
+        if self.id is not None:
+            lines.append(f"id: {self.id}")
+        lines.append(f"data: {self.data}")
+        return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+@dataclass(eq=False)
+class ChatStreamClient:
+    """One connected SSE client; ``needs_snapshot`` is set when its queue overflowed."""
+
+    feed_key: tuple[str, int]
+    chat_id: str
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=CLIENT_QUEUE_EVENTS))
+    needs_snapshot: bool = False
+
+    def offer(self, event: ChatStreamEvent) -> None:
+        if self.needs_snapshot:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow reader: drop the backlog and resync with one snapshot.
+            self.needs_snapshot = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(ChatStreamEvent("resync", "{}"))
+
+
+def _message_identity(item: dict[str, Any]) -> tuple[str, str, str]:
+    return (str(item.get("role", "")), str(item.get("timestamp", "")), str(item.get("content", "")))
+
+
+def appended_messages(
+    previous: list[dict[str, Any]],
+    current: list[dict[str, Any]],
+) -> list[dict[str, Any]] | None:
+    """
+    Messages added at the end of a sliding history window, or None when the
+    window changed in some other way (cleared, rewritten, or more new
+    messages than the window holds) and a snapshot is needed.
+    """
+    old = [_message_identity(item) for item in previous]
+    new = [_message_identity(item) for item in current]
+    if old == new:
+        return []
+    if not old:
+        return list(current)
+    for start in range(len(old)):
+        overlap = old[start:]
+        if new[: len(overlap)] == overlap:
+            return list(current[len(overlap):])
+    return None
+
+
+class _Feed:
+    def __init__(self, session_key: str, limit: int):
+        self.session_key = session_key
+        self.limit = limit
+        self.items: list[dict[str, Any]] | None = None
+        self.last_id = 0
+        # ``replay`` holds every event of this feed with an id above ``replay_floor``.
+        self.replay: deque[ChatStreamEvent] = deque(maxlen=REPLAY_BUFFER_EVENTS)
+        self.replay_floor = 0
+        self.clients: set[ChatStreamClient] = set()
+        self.dirty = False
+        self.refresh_task: asyncio.Task | None = None
+
+
+class ChatStreamHub:
+    """Shared chat feeds for the dashboard SSE endpoint."""
+
+    def __init__(self, read_history: ReadHistory):
+        self._read_history = read_history
+        self._feeds: dict[tuple[str, int], _Feed] = {}
+        self._next_id = int(time.time() * 1000)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.history_reads = 0
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    @property
+    def client_count(self) -> int:
+        return sum(len(feed.clients) for feed in self._feeds.values())
+
+    async def subscribe(
+        self,
+        session_key: str,
+        limit: int,
+        *,
+        chat_id: str,
+        last_event_id: int | None = None,
+    ) -> tuple[ChatStreamClient, list[ChatStreamEvent]]:
+        """Register a client and return the events it should receive first."""
+        self._loop = asyncio.get_running_loop()
+        key = (session_key, limit)
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = _Feed(session_key, limit)
+            self._feeds[key] = feed
+        client = ChatStreamClient(feed_key=key, chat_id=chat_id)
+        feed.clients.add(client)
+        try:
+            if feed.items is None:
+                await self._refresh(feed)
+        except BaseException:
+            # The caller never gets the client, so it could not unsubscribe it.
+            self.unsubscribe(client)
+            raise
+
+        if last_event_id is not None and (
+            last_event_id == feed.replay_floor
+            or any(event.id == last_event_id for event in feed.replay)
+        ):
+            return client, [event for event in feed.replay if event.id > last_event_id]
+        return client, [self.snapshot_event(client)]
+
+    def unsubscribe(self, client: ChatStreamClient) -> None:
+        feed = self._feeds.get(client.feed_key)
+        if feed is None:
+            return
+        feed.clients.discard(client)
+        if not feed.clients:
+            if feed.refresh_task is not None:
+                feed.refresh_task.cancel()
+            self._feeds.pop(client.feed_key, None)
+
+    def snapshot_event(self, client: ChatStreamClient) -> ChatStreamEvent:
+        """Full window for ``client`` from the feed's cached read (no history read)."""
+        client.needs_snapshot = False
+        feed = self._feeds.get(client.feed_key)
+        items = (feed.items if feed else None) or []
+        payload = json.dumps({"session_key": client.feed_key[0], "messages": items}, ensure_ascii=False)
+        return ChatStreamEvent("snapshot", payload, feed.last_id if feed else None)
+
+    def notify(self, session_key: str | None = None) -> None:
+        """
+        Mark feeds for ``session_key`` (or all feeds) as changed. Safe to call
+        from any thread; a no-op when nobody is connected.
+        """
+        if not self._feeds:
+            return
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and running is loop:
+            self._mark_dirty(session_key)
+        elif loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._mark_dirty, session_key)
+
+    def _mark_dirty(self, session_key: str | None) -> None:
+        for feed in list(self._feeds.values()):
+            if session_key is not None and feed.session_key != session_key:
+                continue
+            feed.dirty = True
+            if feed.refresh_task is None or feed.refresh_task.done():
+                feed.refresh_task = asyncio.create_task(self._drain(feed))
+
+    async def _drain(self, feed: _Feed) -> None:
+        # Changes that arrive during a read trigger exactly one more read.
+        while feed.dirty and feed.clients:
+            feed.dirty = False
+            try:
+                await self._refresh(feed)
+            except Exception as e:
+                logger.debug(f"Dashboard chat feed refresh failed for {feed.session_key}: {e}")
+
+    async def _refresh(self, feed: _Feed) -> None:
+        self.history_reads += 1
+        items = await self._read_history(feed.session_key, feed.limit)
+        previous = feed.items
+        feed.items = items
+        added = None if previous is None else appended_messages(previous, items)
+        if added is None:
+            # First read or a non-append change: start a new replay window.
+            feed.last_id = feed.replay_floor = self._new_id()
+            feed.replay.clear()
+            if previous is not None:
+                for client in list(feed.clients):
+                    client.offer(ChatStreamEvent("resync", "{}"))
+            return
+        for item in added:
+            event = ChatStreamEvent(
+                "message",
+                json.dumps({"session_key": feed.session_key, "message": item}, ensure_ascii=False),
+                self._new_id(),
+            )
+            feed.last_id = event.id
+            if len(feed.replay) == feed.replay.maxlen:
+                feed.replay_floor = feed.replay[0].id
+            feed.replay.append(event)
+            for client in list(feed.clients):
+                client.offer(event)
+
+    def publish_draft(self, chat_id: str, content: str) -> None:
+        """Ephemeral draft text for clients watching ``chat_id`` (not replayed)."""
+        event = ChatStreamEvent(
+            "draft",
+            json.dumps({"chat_id": chat_id, "content": content}, ensure_ascii=False),
+        )
+        for feed in self._feeds.values():
+            for client in list(feed.clients):
+                if client.chat_id == chat_id:
+                    client.offer(event)
+
+
+__all__ = ["ChatStreamClient", "ChatStreamEvent", "ChatStreamHub", "appended_messages"]
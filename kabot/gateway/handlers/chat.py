@@ -8,8 +8,36 @@ import json
 
 from aiohttp import web
 
+from kabot.bus.events import OutboundMessage
+
+# Seconds between SSE keepalive comments on an idle chat stream.
+CHAT_STREAM_KEEPALIVE_SECONDS = 15.0
+
 
 class ChatMixin:
+    async def _on_dashboard_outbound(self, msg: OutboundMessage) -> None:
+        """Push streamed drafts and final replies of dashboard chats to SSE clients."""
+        metadata = msg.metadata if isinstance(msg.metadata, dict) else {}
+        update_type = str(metadata.get("type") or "").strip().lower()
+        chat_id = str(msg.chat_id or "dashboard")
+        if update_type == "draft_update":
+            draft = str(msg.content or "")
+            self._dashboard_drafts[chat_id] = draft
+            self._chat_stream.publish_draft(chat_id, draft)
+            return
+        if update_type in {"status_update", "reasoning_update"}:
+            return
+        self._clear_dashboard_draft(chat_id)
+        self._chat_stream.notify()
+
+    def _clear_dashboard_draft(self, chat_id: str) -> None:
+        if self._dashboard_drafts.pop(chat_id, None) is not None:
+            self._chat_stream.publish_draft(chat_id, "")
+
+    def notify_chat_session_saved(self, session_key: str) -> None:
+        """Session-save hook: refresh chat feeds of ``session_key`` (thread-safe)."""
+        self._chat_stream.notify(session_key)
+
     async def handle_dashboard_chat(self, request: web.Request) -> web.Response:
         unauthorized = self._authorize_route(request)
         if unauthorized is not None:
@@ -455,45 +483,74 @@ class ChatMixin:
             f"  window.__kabotChatSSE=window.__kabotChatSSE||{{}};"
             f"  var key={json.dumps(session_key)};"
             f"  if(window.__kabotChatSSE[key]){{try{{window.__kabotChatSSE[key].close();}}catch(_e){{}}}}"
-            f"  var url={json.dumps(self._dashboard_url_with_token('/dashboard/api/chat/stream', request, query={'session_key': session_key}))};"
+            f"  var url={json.dumps(self._dashboard_url_with_token('/dashboard/api/chat/stream', request, query={'session_key': session_key, 'chat_id': chat_id}))};"
             f"  var es=new EventSource(url); window.__kabotChatSSE[key]=es;"
             f"  function esc(s){{return String(s||'').replace(/[&<>\"']/g,function(c){{return {{'&':'&amp;','<':'&lt;','>':'&gt;','\"':'&quot;',\"'\":'&#39;'}}[c];}});}}"
+            f"  function renderRow(m){{"
+            f"    var role=esc(m.role||'assistant').toLowerCase(); var ts=esc(m.timestamp||''); var content=esc(m.content||'');"
+            f"    var metadata=(m&&typeof m.metadata==='object'&&m.metadata)?m.metadata:{{}};"
+            f"    var updateType=String(metadata.type||'').toLowerCase().trim();"
+            f"    var phase=esc(String(metadata.phase||'').toLowerCase().trim());"
+            f"    var isStatusLike=['status_update','draft_update','reasoning_update'].indexOf(updateType)!==-1;"
+            f"    var isUser=role==='user';"
+            f"    var align=isUser?'flex-end':'flex-start';"
+            f"    var avatarLabel=isUser?'U':'K';"
+            f"    var avatarClass=isUser?'user':'agent';"
+            f"    var bubbleClass=isUser?'kb-bubble user':(isStatusLike?'kb-bubble status':'kb-bubble agent');"
+            f"    var nameLabel=isUser?'You':(isStatusLike?'Status':'Kabot');"
+            f"    var row='<div class=\"kb-msg-row\" style=\"display:flex;flex-direction:column;align-items:'+align+';gap:4px;\">';"
+            f"    var avatarRow='<div style=\"display:flex;align-items:center;gap:6px;'+( isUser?'flex-direction:row-reverse;':'')+'\">';"
+            f"    avatarRow+='<div class=\"kb-avatar '+avatarClass+'\">'+avatarLabel+'</div>';"
+            f"    avatarRow+='<span style=\"font-size:11px;font-weight:600;color:var(--muted);\">'+nameLabel+'</span>';"
+            f"    if(phase)avatarRow+='<span class=\"kb-phase-badge\">'+phase+'</span>';"
+            f"    if(ts)avatarRow+='<span class=\"kb-ts\">'+ts+'</span>';"
+            f"    avatarRow+='</div>';"
+            f"    row+=avatarRow;"
+            f"    row+='<div class=\"'+bubbleClass+'\">'+content+'</div>';"
+            f"    row+='</div>';"
+            f"    return row;"
+            f"  }}"
             f"  es.addEventListener('snapshot',function(ev){{"
             f"    try{{"
             f"      var p=JSON.parse(ev.data||'{{}}'); var msgs=Array.isArray(p.messages)?p.messages:[];"
             f"      if(!msgs.length){{el.innerHTML='<div class=\"kb-empty\"><div class=\"kb-empty-icon\">ðŸ’¬</div>"
             f"<div class=\"kb-empty-copy\"><div style=\"font-size:14px;font-weight:600;margin-bottom:4px;color:var(--text);\">No messages yet</div>"
             f"<div style=\"font-size:12px;\">Send a prompt to start chatting</div></div></div>'; if(window.kabotScrollChatToLatest)window.kabotScrollChatToLatest(true); return;}}"
-            f"      var rows=[];"
-            f"      msgs.slice(-50).forEach(function(m){{"
-            f"        var role=esc(m.role||'assistant').toLowerCase(); var ts=esc(m.timestamp||''); var content=esc(m.content||'');"
-            f"        var metadata=(m&&typeof m.metadata==='object'&&m.metadata)?m.metadata:{{}};"
-            f"        var updateType=String(metadata.type||'').toLowerCase().trim();"
-            f"        var phase=esc(String(metadata.phase||'').toLowerCase().trim());"
-            f"        var isStatusLike=['status_update','draft_update','reasoning_update'].indexOf(updateType)!==-1;"
-            f"        var isUser=role==='user';"
-            f"        var align=isUser?'flex-end':'flex-start';"
-            f"        var avatarLabel=isUser?'U':'K';"
-            f"        var avatarClass=isUser?'user':'agent';"
-            f"        var bubbleClass=isUser?'kb-bubble user':(isStatusLike?'kb-bubble status':'kb-bubble agent');"
-            f"        var nameLabel=isUser?'You':(isStatusLike?'Status':'Kabot');"
-            f"        var row='<div class=\"kb-msg-row\" style=\"display:flex;flex-direction:column;align-items:'+align+';gap:4px;\">';"
-            f"        var avatarRow='<div style=\"display:flex;align-items:center;gap:6px;'+( isUser?'flex-direction:row-reverse;':'')+'\">';"
-            f"        avatarRow+='<div class=\"kb-avatar '+avatarClass+'\">'+avatarLabel+'</div>';"
-            f"        avatarRow+='<span style=\"font-size:11px;font-weight:600;color:var(--muted);\">'+nameLabel+'</span>';"
-            f"        if(phase)avatarRow+='<span class=\"kb-phase-badge\">'+phase+'</span>';"
-            f"        if(ts)avatarRow+='<span class=\"kb-ts\">'+ts+'</span>';"
-            f"        avatarRow+='</div>';"
-            f"        row+=avatarRow;"
-            f"        row+='<div class=\"'+bubbleClass+'\">'+content+'</div>';"
-            f"        row+='</div>';"
-            f"        rows.push(row);"
-            f"      }});"
             f"      chatState.pendingStick=chatState.stickToLatest||chatDistanceFromBottom()<=40;"
-            f"      el.innerHTML=rows.join('');"
+            f"      el.innerHTML=msgs.slice(-50).map(renderRow).join('');"
             f"      if(chatState.pendingStick!==false&&window.kabotScrollChatToLatest)window.kabotScrollChatToLatest(true);"
             f"    }}catch(_err){{}}"
             f"  }});"
+            f"  es.addEventListener('message',function(ev){{"
+            f"    try{{"
+            f"      var p=JSON.parse(ev.data||'{{}}'); if(!p.message||typeof p.message!=='object')return;"
+            f"      var stick=chatState.stickToLatest||chatDistanceFromBottom()<=40;"
+            f"      var empty=el.querySelector('.kb-empty'); if(empty&&empty.parentNode)empty.parentNode.removeChild(empty);"
+            f"      var holder=document.createElement('div'); holder.innerHTML=renderRow(p.message);"
+            f"      var draft=document.getElementById('kb-stream-draft');"
+            f"      if(draft&&draft.parentNode===el)el.insertBefore(holder.firstChild,draft); else el.appendChild(holder.firstChild);"
+            f"      var rows=el.querySelectorAll('.kb-msg-row:not(#kb-stream-draft)');"
+            f"      for(var i=0;i<rows.length-50;i++){{el.removeChild(rows[i]);}}"
+            f"      if(stick&&window.kabotScrollChatToLatest)window.kabotScrollChatToLatest(true);"
+            f"    }}catch(_err){{}}"
+            f"  }});"
+            f"  es.addEventListener('draft',function(ev){{"
+            f"    try{{"
+            f"      var p=JSON.parse(ev.data||'{{}}'); var text=String(p.content||'');"
+            f"      var node=document.getElementById('kb-stream-draft');"
+            f"      if(!text){{if(node&&node.parentNode)node.parentNode.removeChild(node);return;}}"
+            f"      if(!node){{"
+            f"        node=document.createElement('div'); node.id='kb-stream-draft'; node.className='kb-msg-row';"
+            f"        node.setAttribute('style','display:flex;flex-direction:column;align-items:flex-start;gap:4px;');"
+            f"        node.innerHTML='<div style=\"display:flex;align-items:center;gap:6px;\"><div class=\"kb-avatar agent\">K</div>"
+            f"<span style=\"font-size:11px;font-weight:600;color:var(--muted);\">Kabot</span><span class=\"kb-phase-badge\">streaming</span></div>"
+            f"<div class=\"kb-bubble agent\"></div>';"
+            f"        el.appendChild(node);"
+            f"      }}"
+            f"      node.lastChild.textContent=text;"
+            f"      if(chatState.stickToLatest!==false&&window.kabotScrollChatToLatest)window.kabotScrollChatToLatest(true);"
+            f"    }}catch(_err){{}}"
+            f"  }});"
             f"}}"
             f"}})();</script>"
         )
@@ -514,9 +571,15 @@ class ChatMixin:
             return unauthorized
 
         session_key = self._resolve_session_key(request.query.get("session_key"))
+        chat_id = str(request.query.get("chat_id") or "dashboard").strip() or "dashboard"
         limit = self._resolve_history_limit(request.query.get("limit"), default=30)
         once_raw = str(request.query.get("once", "") or "").strip().lower()
         once = once_raw in {"1", "true", "yes", "on"}
+        last_event_raw = request.headers.get("Last-Event-ID") or request.query.get("last_event_id")
+        try:
+            last_event_id = int(str(last_event_raw).strip()) if last_event_raw else None
+        except ValueError:
+            last_event_id = None
 
         response = web.StreamResponse(
             status=200,
@@ -529,27 +592,40 @@ class ChatMixin:
         )
         await response.prepare(request)
 
-        last_payload = ""
+        hub = self._chat_stream
+        client = None
         try:
+            client, initial = await hub.subscribe(
+                session_key,
+                limit,
+                chat_id=chat_id,
+                last_event_id=None if once else last_event_id,
+            )
+            for event in initial:
+                await response.write(event.encode())
+            draft = self._dashboard_drafts.get(chat_id, "")
+            if draft:
+                draft_payload = json.dumps({"chat_id": chat_id, "content": draft}, ensure_ascii=False)
+                await response.write(f"event: draft\ndata: {draft_payload}\n\n".encode("utf-8"))
+            if once:
+                return response
             while True:
-                items = await self._read_chat_history(session_key, limit=limit)
-                payload = json.dumps(
-                    {"session_key": session_key, "messages": items},
-                    ensure_ascii=False,
-                )
-                if payload != last_payload or once:
-                    event_block = f"event: snapshot\ndata: {payload}\n\n"
-                    await response.write(event_block.encode("utf-8"))
-                    last_payload = payload
-                else:
-                    await response.write(b"event: ping\ndata: {}\n\n")
-
-                if once:
-                    break
-                await asyncio.sleep(2.0)
+                try:
+                    event = await asyncio.wait_for(
+                        client.queue.get(),
+                        timeout=CHAT_STREAM_KEEPALIVE_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    await response.write(b": keepalive\n\n")
+                    continue
+                if event.event == "resync":
+                    event = hub.snapshot_event(client)
+                await response.write(event.encode())
         except (ConnectionResetError, asyncio.CancelledError):
             pass
         finally:
+            if client is not None:
+                hub.unsubscribe(client)
             try:
                 await response.write_eof()
             except Exception:
@@ -632,6 +708,7 @@ class ChatMixin:
                 "chat_id": chat_id,
             },
         )
+        self._clear_dashboard_draft(chat_id)
         return web.json_response(result, status=status_code)
 
     async def handle_dashboard_chat_action(self, request: web.Request) -> web.Response:
@@ -658,7 +735,7 @@ class ChatMixin:
                 content_type="text/html",
                 status=501,
             )
-        self._dispatch_control_action_background(
+        task = self._dispatch_control_action_background(
             action="chat.send",
             args={
                 "prompt": prompt,
@@ -670,6 +747,7 @@ class ChatMixin:
                 "chat_id": chat_id,
             },
         )
+        task.add_done_callback(lambda _task: self._clear_dashboard_draft(chat_id))
         return web.Response(
             text="<span class='kb-chat-result--ok'>Queued: sending to runtime...</span>",
             content_type="text/html",
@@ -8,6 +8,7 @@ from typing import Any, Callable
 from aiohttp import web
 
 from kabot.bus.queue import MessageBus
+from kabot.gateway.chat_stream import ChatStreamHub
 from kabot.gateway.handlers._base import BaseMixin
 from kabot.gateway.handlers.chat import ChatMixin
 from kabot.gateway.handlers.config import ConfigMixin
@@ -87,6 +88,13 @@ class WebhookServer(
         self._dashboard_status_cache_payload = None
         self._dashboard_status_cache_at = 0.0
         self._dashboard_background_tasks = set()
+        # Latest streamed draft per dashboard chat_id, sent to newly connected chat SSE clients.
+        self._dashboard_drafts: dict[str, str] = {}
+        # Shared chat feeds: one history read per change, fanned out to every SSE client.
+        self._chat_stream = ChatStreamHub(self._read_chat_history)
+        subscribe_outbound = getattr(bus, "subscribe_outbound", None)
+        if callable(subscribe_outbound):
+            subscribe_outbound("dashboard", self._on_dashboard_outbound)
 
         @web.middleware
         async def security_headers_middleware(
@@ -17,6 +17,7 @@ _MODULE_LOCKS = {
     "GraphMemory": ".graph_memory",
     "SentenceEmbeddingProvider": ".sentence_embeddings",
     "OllamaEmbeddingProvider": ".ollama_embeddings",
+    "EmbeddingCache": ".embedding_cache",
     "SQLiteMetadataStore": ".sqlite_store",
 }
 
@@ -3,79 +3,181 @@
 This file is invoked as a separate Python process:
     python -m kabot.memory._embedding_worker <model_name>
 
-Communication protocol (stdin/stdout, JSON lines):
-    Request:  {"id": "req_1", "type": "embed", "data": "hello world"}
-    Response: {"id": "req_1", "status": "ok", "result": [0.1, 0.2, ...]}
+Communication protocol (stdin/stdout):
+    Request (JSON line):
+        {"id": 7, "type": "embed", "data": "hello world"}
+        {"id": 8, "type": "embed_batch", "data": ["hello", "world"]}
+    Response (JSON header line, followed by ``nbytes`` of little-endian float32):
+        {"id": 7, "status": "ok", "shape": [1, 384], "nbytes": 1536}\\n<1536 bytes>
+    Control replies and errors have no payload:
+        {"id": 9, "status": "ok", "result": true}
+        {"id": 10, "status": "error", "result": "..."}
+
+Requests are read on a separate thread, so the parent may keep several in
+flight and match responses by id. Embed requests arriving within
+``COALESCE_WINDOW_S`` of each other are encoded in a single ``model.encode``
+call and then answered one by one.
 """
 
 import json
+import os
+import queue
 import sys
+import threading
+import time
 
+# How long to wait for more requests before encoding, and the batch cap.
+COALESCE_WINDOW_S = 0.002
+MAX_BATCH_TEXTS = 64
 
-def main():
-    model_name = sys.argv[1] if len(sys.argv) > 1 else "all-MiniLM-L6-v2"
+_EMBED_TYPES = ("embed", "embed_batch")
 
-    # Import and load model
-    from sentence_transformers import SentenceTransformer
 
-    model = SentenceTransformer(model_name)
+def _write_frame(out, header: dict, payload: bytes = b"") -> None:
+    if payload:
+        header["nbytes"] = len(payload)
+    out.write(json.dumps(header).encode("utf-8") + b"\n" + payload)
+    out.flush()
 
-    # Signal ready
-    sys.stdout.write(json.dumps({"id": "init", "status": "ok", "result": True}) + "\n")
-    sys.stdout.flush()
 
-    # Process requests from stdin
-    # Use readline() in while loop instead of 'for line in sys.stdin'
-    # because the latter has buffering issues with subprocess pipes on Windows
+def _read_requests(stream, requests: queue.Queue) -> None:
+    """Feed parsed request lines into ``requests``; ``None`` marks EOF."""
+    # readline() instead of iterating the stream: iteration has buffering
+    # issues with subprocess pipes on Windows.
     while True:
         try:
-            line = sys.stdin.readline()
-            if not line:  # EOF
-                break
-
-            line = line.strip()
-            if not line:
-                continue
-
+            line = stream.readline()
+        except (OSError, ValueError):
+            break
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        try:
             request = json.loads(line)
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             continue
-        except EOFError:
+        if isinstance(request, dict):
+            requests.put(request)
+    requests.put(None)
+
+
+def _text_count(request: dict | None) -> int:
+    if not request or request.get("type") not in _EMBED_TYPES:
+        return 0
+    data = request.get("data")
+    return 1 if request.get("type") == "embed" else len(data or [])
+
+
+def _collect_batch(
+    requests: queue.Queue,
+    window: float = COALESCE_WINDOW_S,
+    max_texts: int = MAX_BATCH_TEXTS,
+) -> list[dict | None]:
+    """Block for one request, then take whatever else arrives within ``window``."""
+    batch = [requests.get()]
+    texts = _text_count(batch[0])
+    deadline = time.monotonic() + window
+    while texts < max_texts and batch[-1] is not None and batch[-1].get("type") != "shutdown":
+        remaining = deadline - time.monotonic()
+        try:
+            request = requests.get(timeout=remaining) if remaining > 0 else requests.get_nowait()
+        except queue.Empty:
             break
+        batch.append(request)
+        texts += _text_count(request)
+    return batch
+
+
+def _encode(model, texts: list[str]):
+    import numpy as np
+
+    if not texts:
+        return np.zeros((0, 0), dtype="<f4")
+    vectors = model.encode(texts, convert_to_numpy=True)
+    return np.asarray(vectors, dtype="<f4").reshape(len(texts), -1)
 
+
+def _serve_batch(model, out, batch: list[dict | None]) -> bool:
+    """Answer one coalesced batch; returns False once the worker should exit."""
+    keep_running = True
+    shutdown_id = None
+    spans: list[tuple[dict, int, int]] = []
+    texts: list[str] = []
+    for request in batch:
+        if request is None:
+            keep_running = False
+            continue
         req_id = request.get("id", "unknown")
         req_type = request.get("type", "")
-        data = request.get("data")
-
+        if req_type in _EMBED_TYPES:
+            data = request.get("data")
+            items = [data] if req_type == "embed" else list(data or [])
+            spans.append((request, len(texts), len(items)))
+            texts.extend(str(item) for item in items)
+        elif req_type == "ping":
+            _write_frame(out, {"id": req_id, "status": "ok", "result": True})
+        elif req_type == "shutdown":
+            keep_running = False
+            shutdown_id = req_id
+        else:
+            _write_frame(out, {"id": req_id, "status": "error", "result": f"Unknown type: {req_type}"})
+
+    if spans:
         try:
-            if req_type == "embed":
-                embedding = model.encode(data)
-                if hasattr(embedding, "tolist"):
-                    embedding = embedding.tolist()
-                response = {"id": req_id, "status": "ok", "result": embedding}
-
-            elif req_type == "embed_batch":
-                embeddings = model.encode(data)
-                if hasattr(embeddings, "tolist"):
-                    embeddings = embeddings.tolist()
-                response = {"id": req_id, "status": "ok", "result": embeddings}
-
-            elif req_type == "ping":
-                response = {"id": req_id, "status": "ok", "result": True}
-
-            elif req_type == "shutdown":
-                sys.stdout.write(json.dumps({"id": req_id, "status": "ok", "result": "bye"}) + "\n")
-                sys.stdout.flush()
-                break
-
+            vectors = _encode(model, texts)
+            encoded = [(request, vectors[start:start + count]) for request, start, count in spans]
+        except Exception:
+            # Re-encode per request so one bad input only fails its own caller.
+            encoded = []
+            for request, start, count in spans:
+                try:
+                    encoded.append((request, _encode(model, texts[start:start + count])))
+                except Exception as e:
+                    encoded.append((request, e))
+        for request, rows in encoded:
+            req_id = request.get("id", "unknown")
+            if isinstance(rows, Exception):
+                _write_frame(out, {"id": req_id, "status": "error", "result": str(rows)})
             else:
-                response = {"id": req_id, "status": "error", "result": f"Unknown type: {req_type}"}
+                _write_frame(
+                    out,
+                    {"id": req_id, "status": "ok", "shape": [int(rows.shape[0]), int(rows.shape[1])]},
+                    rows.tobytes(),
+                )
 
-        except Exception as e:
-            response = {"id": req_id, "status": "error", "result": str(e)}
+    if shutdown_id is not None:
+        _write_frame(out, {"id": shutdown_id, "status": "ok", "result": "bye"})
+    return keep_running
+
+
+def main():
+    model_name = sys.argv[1] if len(sys.argv) > 1 else "all-MiniLM-L6-v2"
 
-        sys.stdout.write(json.dumps(response) + "\n")
-        sys.stdout.flush()
+    # Frames go to a private copy of stdout; anything a dependency prints
+    # lands on stderr and cannot corrupt the binary payloads.
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    # Import and load model
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+
+    # Signal ready
+    _write_frame(out, {"id": "init", "status": "ok", "result": True})
+
+    requests: queue.Queue = queue.Queue()
+    threading.Thread(
+        target=_read_requests,
+        args=(sys.stdin.buffer, requests),
+        name="embedding-worker-stdin",
+        daemon=True,
+    ).start()
+
+    while _serve_batch(model, out, _collect_batch(requests)):
+        pass
 
 
 if __name__ == "__main__":
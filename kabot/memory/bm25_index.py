@@ -0,0 +1,256 @@
+"""Incremental BM25 inverted index persisted in the memory metadata database."""
+
+from __future__ import annotations
+
+import math
+import re
+import sqlite3
+from collections import Counter
+from pathlib import Path
+
+from loguru import logger
+
+from kabot.memory.sqlite_pool import execute_script, get_sqlite_pool
+
+_TOKEN_RE = re.compile(r"\w+")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS bm25_docs (
+        doc_rowid INTEGER PRIMARY KEY,
+        doc_type TEXT NOT NULL,
+        doc_id TEXT NOT NULL,
+        session_id TEXT,
+        length INTEGER NOT NULL,
+        UNIQUE (doc_type, doc_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS bm25_postings (
+        term TEXT NOT NULL,
+        doc_rowid INTEGER NOT NULL,
+        tf INTEGER NOT NULL,
+        PRIMARY KEY (term, doc_rowid)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_bm25_postings_doc
+    ON bm25_postings(doc_rowid);
+
+    CREATE TABLE IF NOT EXISTS bm25_stats (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        doc_count INTEGER NOT NULL,
+        total_length INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO bm25_stats (id, doc_count, total_length) VALUES (1, 0, 0);
+
+    CREATE TRIGGER IF NOT EXISTS bm25_docs_ai AFTER INSERT ON bm25_docs BEGIN
+        UPDATE bm25_stats
+        SET doc_count = doc_count + 1, total_length = total_length + NEW.length
+        WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS bm25_docs_ad AFTER DELETE ON bm25_docs BEGIN
+        DELETE FROM bm25_postings WHERE doc_rowid = OLD.doc_rowid;
+        UPDATE bm25_stats
+        SET doc_count = doc_count - 1, total_length = total_length - OLD.length
+        WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS bm25_messages_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM bm25_docs WHERE doc_type = 'message' AND doc_id = OLD.message_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS bm25_facts_ad AFTER DELETE ON facts BEGIN
+        DELETE FROM bm25_docs WHERE doc_type = 'fact' AND doc_id = OLD.fact_id;
+    END;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Simple tokenizer for BM25."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def fact_document(category: str | None, value: str | None) -> str:
+    """Text indexed for a fact row (category prefix improves keyword matching)."""
+    return f"[{category}] {value}"
+
+
+class BM25Index:
+    """
+    BM25 posting lists kept next to the ``messages``/``facts`` tables.
+
+    Each write tokenizes only the new document and inserts its postings, so a
+    lexical search after a write touches just the postings of the query terms
+    instead of re-reading and re-tokenizing the whole corpus. Document count
+    and total length are maintained by triggers, and deleting a message or
+    fact row (for example by ``MemoryPruner``) drops its postings as well.
+
+    Scoring is Okapi BM25 with the non-negative ``log(1 + ...)`` IDF, which
+    stays correct under incremental updates without corpus-wide IDF floors.
+    """
+
+    def __init__(self, db_path: Path | str, *, k1: float = 1.5, b: float = 0.75):
+        self.db_path = Path(db_path)
+        self.k1 = float(k1)
+        self.b = float(b)
+        self._synced = False
+        self._closed = False
+        self._pool = get_sqlite_pool(self.db_path)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        self._pool.write(lambda conn: execute_script(conn, _SCHEMA), "bm25_init")
+
+    def close(self) -> None:
+        """Release this index's share of the pool; the last owner closes its connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pool.release()
+
+    @staticmethod
+    def _insert(
+        conn: sqlite3.Connection,
+        doc_type: str,
+        doc_id: str,
+        content: str,
+        session_id: str | None,
+    ) -> None:
+        # Replacing a document (facts use INSERT OR REPLACE) drops old postings first.
+        conn.execute("DELETE FROM bm25_docs WHERE doc_type = ? AND doc_id = ?", (doc_type, doc_id))
+        terms = tokenize(content)
+        cursor = conn.execute(
+            "INSERT INTO bm25_docs (doc_type, doc_id, session_id, length) VALUES (?, ?, ?, ?)",
+            (doc_type, doc_id, session_id, len(terms)),
+        )
+        doc_rowid = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO bm25_postings (term, doc_rowid, tf) VALUES (?, ?, ?)",
+            [(term, doc_rowid, tf) for term, tf in Counter(terms).items()],
+        )
+
+    def add_document(
+        self,
+        doc_type: str,
+        doc_id: str,
+        content: str,
+        session_id: str | None = None,
+    ) -> None:
+        """Index (or re-index) one message or fact."""
+        self._pool.write(
+            lambda conn: self._insert(conn, doc_type, doc_id, content, session_id),
+            "bm25_add",
+        )
+
+    def remove_document(self, doc_type: str, doc_id: str) -> None:
+        """Drop one document and its postings."""
+        self._pool.write(
+            lambda conn: conn.execute(
+                "DELETE FROM bm25_docs WHERE doc_type = ? AND doc_id = ?", (doc_type, doc_id)
+            ),
+            "bm25_remove",
+        )
+
+    def ensure_synced(self) -> int:
+        """
+        Catch the index up with rows written before it existed or by other writers.
+
+        Runs once per instance; afterwards writes go through ``add_document``.
+        Returns the number of documents indexed.
+        """
+        if self._synced:
+            return 0
+        indexed = self._pool.write(self._catch_up, "bm25_sync")
+        self._synced = True
+        if indexed:
+            logger.info(f"BM25 index caught up with {indexed} documents")
+        return indexed
+
+    def _catch_up(self, conn: sqlite3.Connection) -> int:
+        """Drop orphaned documents and index unindexed rows (runs on the pool writer)."""
+        indexed = 0
+        conn.execute(
+            "DELETE FROM bm25_docs WHERE doc_type = 'message' "
+            "AND doc_id NOT IN (SELECT message_id FROM messages)"
+        )
+        conn.execute(
+            "DELETE FROM bm25_docs WHERE doc_type = 'fact' "
+            "AND doc_id NOT IN (SELECT fact_id FROM facts)"
+        )
+        missing_messages = conn.execute(
+            """SELECT message_id, session_id, content FROM messages m
+               WHERE NOT EXISTS (
+                   SELECT 1 FROM bm25_docs d
+                   WHERE d.doc_type = 'message' AND d.doc_id = m.message_id
+               )"""
+        ).fetchall()
+        for message_id, session_id, content in missing_messages:
+            self._insert(conn, "message", message_id, content or "", session_id)
+            indexed += 1
+        missing_facts = conn.execute(
+            """SELECT fact_id, session_id, category, value FROM facts f
+               WHERE NOT EXISTS (
+                   SELECT 1 FROM bm25_docs d
+                   WHERE d.doc_type = 'fact' AND d.doc_id = f.fact_id
+               )"""
+        ).fetchall()
+        for fact_id, session_id, category, value in missing_facts:
+            self._insert(conn, "fact", fact_id, fact_document(category, value), session_id)
+            indexed += 1
+        return indexed
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 5,
+        session_id: str | None = None,
+    ) -> list[tuple[str, str, float]]:
+        """Return ``(doc_type, doc_id, score)`` for the best-scoring documents."""
+        terms = Counter(tokenize(query))
+        if not terms or limit <= 0:
+            return []
+
+        with self._pool.reader("bm25_search") as conn:
+            doc_count, total_length = conn.execute(
+                "SELECT doc_count, total_length FROM bm25_stats WHERE id = 1"
+            ).fetchone()
+            if doc_count <= 0:
+                return []
+            avg_length = (total_length / doc_count) or 1.0
+
+            scores: dict[int, float] = {}
+            docs: dict[int, tuple[str, str]] = {}
+            for term, query_tf in terms.items():
+                rows = conn.execute(
+                    """SELECT p.doc_rowid, p.tf, d.length, d.doc_type, d.doc_id, d.session_id
+                       FROM bm25_postings p JOIN bm25_docs d ON d.doc_rowid = p.doc_rowid
+                       WHERE p.term = ?""",
+                    (term,),
+                ).fetchall()
+                if not rows:
+                    continue
+                # Document frequency is corpus-wide even when results are session-filtered.
+                df = len(rows)
+                idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+                for doc_rowid, tf, length, doc_type, doc_id, doc_session in rows:
+                    if session_id and doc_session != session_id:
+                        continue
+                    norm = tf + self.k1 * (1.0 - self.b + self.b * length / avg_length)
+                    scores[doc_rowid] = scores.get(doc_rowid, 0.0) + (
+                        query_tf * idf * tf * (self.k1 + 1.0) / norm
+                    )
+                    docs[doc_rowid] = (doc_type, doc_id)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(*docs[doc_rowid], score) for doc_rowid, score in ranked if score > 0]
+
+    def get_stats(self) -> dict:
+        """Document count and average length of the indexed corpus."""
+        with self._pool.reader("bm25_stats") as conn:
+            doc_count, total_length = conn.execute(
+                "SELECT doc_count, total_length FROM bm25_stats WHERE id = 1"
+            ).fetchone()
+        return {
+            "documents": doc_count,
+            "avg_length": round(total_length / doc_count, 1) if doc_count else 0.0,
+        }
@@ -1,22 +1,34 @@
 ﻿"""ChromaDB-based memory manager with Ollama embeddings and SQLite metadata."""
 
+import asyncio
 import hashlib
 import math
-import re
-import sqlite3
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
 from loguru import logger
 
+try:
+    import numpy as np
+except ImportError:  # optional (requirements-memory.txt); ranking falls back to pure Python
+    np = None
+
+from kabot.memory.bm25_index import fact_document, tokenize
+from kabot.memory.lexical_index import LexicalIndex, create_lexical_index, resolve_lexical_engine
 from kabot.memory.memory_backend import MemoryBackend
 
+from .embedding_cache import EmbeddingCache
+from .memory_executor import MemoryExecutor
 from .ollama_embeddings import OllamaEmbeddingProvider
 from .reranker import Reranker
 from .sentence_embeddings import SentenceEmbeddingProvider
 from .smart_router import SmartRouter
 from .sqlite_store import SQLiteMetadataStore
+from .write_behind import PendingMessage, WriteBehindQueue
+
+_DECAY_HALF_LIFE_HOURS = 24.0 * 7.0
+_DECAY_FLOOR = 0.65
 
 
 class HybridMemoryManager(MemoryBackend):
@@ -37,7 +49,16 @@ class HybridMemoryManager(MemoryBackend):
                  embedding_model: str | None = None, enable_hybrid_memory: bool = True,
                  enable_graph_memory: bool = True,
                  graph_injection_limit: int = 8,
-                 auto_unload_seconds: int = 300):
+                 graph_expand_depth: int = 2,
+                 graph_expand_fanout: int = 16,
+                 auto_unload_seconds: int = 300,
+                 lexical_engine: str = "auto",
+                 embedding_cache_mb: int = 256,
+                 io_workers: int = 4,
+                 io_queue_limit: int = 64,
+                 io_timeout_seconds: float = 30.0,
+                 write_behind_batch: int = 32,
+                 write_behind_delay_ms: int = 500):
         self.workspace = Path(workspace)
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.enable_hybrid_memory = enable_hybrid_memory
@@ -47,20 +68,40 @@ class HybridMemoryManager(MemoryBackend):
 
         self.router = SmartRouter()
         self.reranker = Reranker(threshold=0.6, top_k=3, max_tokens=500)
+        # Chroma, SQLite and MMR work runs here so the event loop never blocks on it.
+        self._io = MemoryExecutor(
+            max_workers=io_workers,
+            max_pending=io_queue_limit,
+            timeout_seconds=io_timeout_seconds,
+            name="kabot-memory-io",
+        )
+        # add_message queues here and returns; 0 writes every message inline.
+        self._write_behind: WriteBehindQueue | None = None
+        if int(write_behind_batch or 0) > 0:
+            self._write_behind = WriteBehindQueue(
+                self._flush_pending_messages,
+                max_batch=write_behind_batch,
+                max_delay_seconds=max(0, int(write_behind_delay_ms)) / 1000.0,
+            )
 
         # Initialize embedding provider (sentence-transformers or ollama)
         if embedding_provider == "sentence":
             model = embedding_model or "all-MiniLM-L6-v2"
             self._embedding_model_name = model
+            self.embedding_cache = self._open_embedding_cache(embedding_provider, model, embedding_cache_mb)
             self.embeddings = SentenceEmbeddingProvider(
                 model,
-                auto_unload_seconds=auto_unload_seconds
+                auto_unload_seconds=auto_unload_seconds,
+                cache=self.embedding_cache,
             )
             logger.info(f"Using Sentence-Transformers with model: {model}")
         elif embedding_provider == "ollama":
             model = embedding_model or "nomic-embed-text"
             self._embedding_model_name = model
-            self.embeddings = OllamaEmbeddingProvider("http://localhost:11434", model)
+            self.embedding_cache = self._open_embedding_cache(embedding_provider, model, embedding_cache_mb)
+            self.embeddings = OllamaEmbeddingProvider(
+                "http://localhost:11434", model, cache=self.embedding_cache
+            )
             logger.info(f"Using Ollama with model: {model}")
         else:
             raise ValueError(f"Unknown embedding provider: {embedding_provider}")
@@ -72,21 +113,29 @@ class HybridMemoryManager(MemoryBackend):
         if self.enable_graph_memory:
             try:
                 from kabot.memory.graph_memory import GraphMemory
-                self.graph = GraphMemory(self.workspace / "graph_memory.db", enabled=True)
+                self.graph = GraphMemory(
+                    self.workspace / "graph_memory.db",
+                    enabled=True,
+                    expand_depth=graph_expand_depth,
+                    expand_fanout=graph_expand_fanout,
+                )
             except Exception as e:
                 logger.warning(f"Graph memory disabled due init error: {e}")
                 self.graph = None
 
-        # Initialize BM25 index components lazily
-        self.bm25 = None
-        self.bm25_documents = []
-        self.bm25_ids = []  # List of (type, id) tuples
-        self._bm25_built = False
-
+        # Keyword index (incremental BM25 postings or FTS5) lives in metadata.db
+        # next to the rows it indexes.
+        self.lexical_engine = resolve_lexical_engine(
+            lexical_engine, default="bm25", allowed={"bm25", "fts5"}
+        )
+        self.lexical_index: LexicalIndex | None = None
         if not self.enable_hybrid_memory:
             logger.info("Hybrid memory (BM25) disabled via config")
         else:
-            logger.debug("BM25 index will be built lazily on first search")
+            try:
+                self.lexical_index = create_lexical_index(self.lexical_engine, db_path)
+            except Exception as e:
+                logger.warning(f"Keyword index unavailable, using semantic search only: {e}")
 
         # ChromaDB will be initialized lazily
         self._chroma_client = None
@@ -94,12 +143,29 @@ class HybridMemoryManager(MemoryBackend):
         import threading
         self._lock = threading.Lock()
 
+    def _open_embedding_cache(self, provider: str, model: str, cache_mb: int) -> EmbeddingCache | None:
+        """Persistent vectors survive restarts and auto-unload; 0 MB disables it."""
+        if int(cache_mb or 0) <= 0:
+            return None
+        try:
+            return EmbeddingCache(
+                self.workspace / "embedding_cache.db",
+                provider=provider,
+                model=model,
+                max_bytes=int(cache_mb) * 1024 * 1024,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable: {e}")
+            return None
+
     async def warmup(self):
         """Pre-load embedding model and ChromaDB in background (non-blocking)."""
         try:
+            if self.embedding_cache is not None:
+                await self._io.run(self.embedding_cache.warm, op="warm_embedding_cache", timeout=None)
             if isinstance(self.embeddings, SentenceEmbeddingProvider):
                 await self.embeddings.warmup()
-            self._init_chroma()
+            await self._io.run(self._init_chroma, op="init_chroma", timeout=None)
             logger.info("Memory warmup completed")
         except Exception as e:
             logger.warning(f"Memory warmup failed (will lazy-load later): {e}")
@@ -149,51 +215,21 @@ class HybridMemoryManager(MemoryBackend):
 
     def _tokenize(self, text: str) -> list[str]:
         """Simple tokenizer for BM25."""
-        return re.findall(r'\w+', text.lower())
+        return tokenize(text)
 
-    def _build_bm25_index(self):
-        """Build BM25 index from all messages and facts in SQLite."""
-        try:
-            documents = []
-            doc_ids = []
-
-            # Connect directly to SQLite to fetch all text
-            with sqlite3.connect(self.metadata.db_path) as conn:
-                # 1. Fetch messages
-                cursor = conn.execute("SELECT message_id, content FROM messages")
-                for row in cursor:
-                    message_id, content = row
-                    documents.append(content)
-                    doc_ids.append(('message', message_id))
-
-                # 2. Fetch facts
-                cursor = conn.execute("SELECT fact_id, value, category FROM facts")
-                for row in cursor:
-                    fact_id, value, category = row
-                    # Add category to content for better matching
-                    content = f"[{category}] {value}"
-                    documents.append(content)
-                    doc_ids.append(('fact', fact_id))
-
-            if not documents:
-                self.bm25 = None
-                self.bm25_documents = []
-                self.bm25_ids = []
-                self._bm25_built = True # Mark as built, even if empty
-                return
-
-            # Tokenize and build index
-            tokenized_corpus = [self._tokenize(doc) for doc in documents]
-            from rank_bm25 import BM25Okapi
-            self.bm25 = BM25Okapi(tokenized_corpus)
-            self.bm25_documents = documents
-            self.bm25_ids = doc_ids
-            self._bm25_built = True
-
-            logger.info(f"Built BM25 index with {len(documents)} documents")
+    def _index_lexical_documents(self, documents: list[tuple[str, str, str, str | None]]) -> None:
+        for doc_type, doc_id, content, session_id in documents:
+            self._index_lexical_document(doc_type, doc_id, content, session_id)
 
+    def _index_lexical_document(self, doc_type: str, doc_id: str, content: str,
+                                session_id: str | None) -> None:
+        """Add one document to the keyword index (no corpus rebuild)."""
+        if not self.lexical_index:
+            return
+        try:
+            self.lexical_index.add_document(doc_type, doc_id, content, session_id=session_id)
         except Exception as e:
-            logger.error(f"Error building BM25 index: {e}")
+            logger.error(f"Error updating keyword index: {e}")
 
     async def add_message(self, session_id: str, role: str, content: str,
                          parent_id: str | None = None,
@@ -208,34 +244,41 @@ class HybridMemoryManager(MemoryBackend):
         try:
             message_id = str(uuid.uuid4())
 
-            # 1. Store in SQLite with parent relationship
-            success = self.metadata.add_message(
-                message_id=message_id,
-                session_id=session_id,
-                role=role,
-                content=content,
-                parent_id=parent_id,
-                tool_calls=tool_calls,
-                tool_results=tool_results,
-                metadata=metadata
+            if self._write_behind is not None:
+                # Written with the next batch; search_memory and
+                # get_conversation_context overlay it until then.
+                self._write_behind.submit(PendingMessage(
+                    message_id=message_id,
+                    session_id=session_id,
+                    role=role,
+                    content=content,
+                    created_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+                    parent_id=parent_id,
+                    tool_calls=tool_calls,
+                    tool_results=tool_results,
+                    metadata=metadata,
+                ))
+                return True
+
+            # 1. Store in SQLite with parent relationship (+ graph relations)
+            success = await self._io.run(
+                self._store_message,
+                message_id, session_id, role, content, parent_id,
+                tool_calls, tool_results, metadata,
+                op="add_message",
             )
 
             if not success:
                 return False
 
-            if self.graph:
-                self.graph.ingest_text(
-                    session_id=session_id,
-                    role=role,
-                    content=content,
-                )
-
             # 2. Generate embedding and store in ChromaDB
             await self._index_message(session_id, message_id, content, metadata)
 
-            # 3. Invalidate BM25 index to force rebuild on next search
-            if self.enable_hybrid_memory:
-                self._bm25_built = False
+            # 3. Add the message's postings to the BM25 index
+            await self._io.run(
+                self._index_lexical_document, "message", message_id, content, session_id,
+                op="index_lexical",
+            )
 
             return True
 
@@ -243,6 +286,28 @@ class HybridMemoryManager(MemoryBackend):
             logger.error(f"Error adding message: {e}")
             return False
 
+    def _store_message(self, message_id: str, session_id: str, role: str, content: str,
+                       parent_id: str | None, tool_calls: list | None,
+                       tool_results: list | None, metadata: dict | None) -> bool:
+        """SQLite row and graph relations for a new message (runs on the I/O executor)."""
+        success = self.metadata.add_message(
+            message_id=message_id,
+            session_id=session_id,
+            role=role,
+            content=content,
+            parent_id=parent_id,
+            tool_calls=tool_calls,
+            tool_results=tool_results,
+            metadata=metadata
+        )
+        if success and self.graph:
+            self.graph.ingest_text(
+                session_id=session_id,
+                role=role,
+                content=content,
+            )
+        return success
+
     async def _index_message(self, session_id: str, message_id: str,
                             content: str, metadata: dict | None = None):
         """Index message in ChromaDB for semantic search."""
@@ -251,59 +316,141 @@ class HybridMemoryManager(MemoryBackend):
             embedding = await self.embeddings.embed(content)
 
             if embedding:
-                self._init_chroma()
-
-                content_hash = hashlib.md5(content.encode()).hexdigest()
-                chroma_id = f"{session_id}_{message_id}"
-
-                # Store in ChromaDB
-                self._collection.add(
-                    ids=[chroma_id],
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[{
-                        "session_id": session_id,
-                        "message_id": message_id,
-                        "content_hash": content_hash,
-                        "timestamp": datetime.now().isoformat()
-                    }]
-                )
-
-                # Save index reference in SQLite
-                self.metadata.save_memory_index(
-                    session_id, message_id, chroma_id, content_hash
+                await self._io.run(
+                    self._store_vector, session_id, message_id, content, embedding,
+                    op="index_vector",
                 )
 
         except Exception as e:
             logger.error(f"Error indexing message: {e}")
 
+    def _store_vector(self, session_id: str, message_id: str, content: str,
+                      embedding: list[float]) -> None:
+        """Add one embedding to ChromaDB and record it in SQLite (runs on the I/O executor)."""
+        self._store_vectors([(session_id, message_id, content, embedding)])
+
+    def _store_vectors(self, entries: list[tuple[str, str, str, list[float]]]) -> None:
+        """One ChromaDB add and one SQLite transaction for (session_id, message_id, content, embedding) entries."""
+        self._init_chroma()
+
+        timestamp = datetime.now().isoformat()
+        ids, embeddings, documents, metadatas, index_rows = [], [], [], [], []
+        for session_id, message_id, content, embedding in entries:
+            content_hash = hashlib.md5(content.encode()).hexdigest()
+            chroma_id = f"{session_id}_{message_id}"
+            ids.append(chroma_id)
+            embeddings.append(embedding)
+            documents.append(content)
+            metadatas.append({
+                "session_id": session_id,
+                "message_id": message_id,
+                "content_hash": content_hash,
+                "timestamp": timestamp
+            })
+            index_rows.append((session_id, message_id, chroma_id, content_hash))
+
+        # Store in ChromaDB
+        self._collection.add(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+
+        # Save index references in SQLite
+        self.metadata.save_memory_indexes(index_rows)
+
+    async def _flush_pending_messages(self, batch: list[PendingMessage]) -> None:
+        """
+        Write one write-behind batch: SQLite + graph, embeddings, ChromaDB, keyword index.
+
+        Raises only when the SQLite insert fails, so the queue can retry it.
+        """
+        stored = await self._io.run(self._store_messages, [item.as_row() for item in batch], op="add_messages")
+        if not stored:
+            raise RuntimeError("SQLite batch insert failed")
+
+        try:
+            vectors = await self.embeddings.embed_batch([item.content for item in batch])
+            entries = [
+                (item.session_id, item.message_id, item.content, vector)
+                for item, vector in zip(batch, vectors)
+                if vector
+            ]
+            if entries:
+                await self._io.run(self._store_vectors, entries, op="index_vectors")
+        except Exception as e:
+            logger.error(f"Error indexing messages: {e}")
+
+        # The rows are committed; raising now would make the queue retry them.
+        try:
+            await self._io.run(
+                self._index_lexical_documents,
+                [("message", item.message_id, item.content, item.session_id) for item in batch],
+                op="index_lexical",
+            )
+        except Exception as e:
+            logger.error(f"Error updating keyword index: {e}")
+
+    def _store_messages(self, rows: list[dict]) -> bool:
+        """SQLite rows and graph relations for a batch of messages (runs on the I/O executor)."""
+        success = self.metadata.add_messages(rows)
+        if success and self.graph:
+            self.graph.ingest_many([
+                {"session_id": row["session_id"], "role": row["role"], "content": row["content"]}
+                for row in rows
+            ])
+        return success
+
+    async def flush_writes(self) -> None:
+        """Write every message still queued by ``add_message``."""
+        if self._write_behind is not None:
+            await self._write_behind.flush()
+
+    async def close(self) -> None:
+        """Write queued messages, then release the SQLite pools and the embedding cache."""
+        await self.flush_writes()
+        await asyncio.to_thread(self._io.shutdown, True)
+        if self.lexical_index is not None:
+            self.lexical_index.close()
+        if self.graph is not None:
+            self.graph.close()
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+        self.metadata.close()
+
+    def _pending_messages(self, session_id: str | None = None) -> list[PendingMessage]:
+        return self._write_behind.pending(session_id) if self._write_behind is not None else []
+
+    def _match_pending(self, query: str, session_id: str | None, limit: int) -> list[dict]:
+        """Queued messages sharing terms with ``query``, best first (read-your-writes overlay)."""
+        pending = self._pending_messages(session_id)
+        terms = set(tokenize(query))
+        if not pending or not terms:
+            return []
+        scored = []
+        for position, item in enumerate(pending):
+            overlap = len(terms & set(tokenize(item.content)))
+            if overlap:
+                scored.append((overlap, position, item))
+        scored.sort(key=lambda entry: (entry[0], entry[1]), reverse=True)
+        return [{**item.as_row(), "pending_score": overlap} for overlap, _, item in scored[:limit]]
+
 
     def _perform_bm25_search(self, query: str, limit: int = 5) -> list[dict]:
         """Perform keyword search using BM25."""
-        if not self.bm25:
+        if not self.lexical_index:
             return []
 
         try:
-            tokenized_query = self._tokenize(query)
-            scores = self.bm25.get_scores(tokenized_query)
-
-            # Get top N indices
-            top_n = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:limit]
+            self.lexical_index.ensure_synced()
+            hits = self.lexical_index.search(query, limit=limit)
 
+            messages, facts = self._hydrate_candidates(
+                [doc_id for doc_type, doc_id, _ in hits if doc_type == 'message'],
+                [doc_id for doc_type, doc_id, _ in hits if doc_type != 'message'],
+            )
             results = []
-            for i in top_n:
-                if scores[i] <= 0:
-                    continue
-
-                doc_type, doc_id = self.bm25_ids[i]
-
-                if doc_type == 'message':
-                    item = self._get_message_by_id(doc_id)
-                else:
-                    item = self._get_fact_by_id(doc_id)
+            for doc_type, doc_id, score in hits:
+                item = messages.get(doc_id) if doc_type == 'message' else facts.get(doc_id)
 
                 if item:
-                    item['bm25_score'] = scores[i]
+                    item['bm25_score'] = score
                     results.append(item)
 
             return results
@@ -311,11 +458,72 @@ class HybridMemoryManager(MemoryBackend):
             logger.error(f"Error in BM25 search: {e}")
             return []
 
+    def _vector_search(
+        self,
+        query_embedding: list[float],
+        session_id: str | None,
+        limit: int,
+    ) -> tuple[list[dict], dict[str, list[float]]]:
+        """Chroma query plus SQLite hydration (runs on the I/O executor)."""
+        vector_results: list[dict] = []
+        stored_embeddings: dict[str, list[float]] = {}
+
+        self._init_chroma()
+        # Prepare filter
+        where_filter = {"session_id": session_id} if session_id else None
+
+        # Search ChromaDB
+        results = self._collection.query(
+            query_embeddings=[query_embedding],
+            n_results=limit,
+            where=where_filter,
+            include=["documents", "metadatas", "distances", "embeddings"]
+        )
+        # Stored vectors let MMR skip re-embedding the vector hits.
+        result_embeddings = results.get("embeddings")
+        result_embeddings = result_embeddings[0] if result_embeddings is not None else None
+
+        # Format results
+        if results["ids"] and len(results["ids"][0]) > 0:
+            # Resolve every hit from SQLite up front: messages first,
+            # then the facts table for ids that are not messages.
+            hit_ids = [metadata.get("message_id") for metadata in results["metadatas"][0]]
+            hit_messages, hit_facts = self._hydrate_candidates(hit_ids, hit_ids)
+            for i, chroma_id in enumerate(results["ids"][0]):
+                metadata = results["metadatas"][0][i]
+                document = results["documents"][0][i]
+                distance = results["distances"][0][i]
+
+                message_id = metadata.get("message_id")
+                item = None
+                if message_id in hit_messages:
+                    item = hit_messages[message_id]
+                else:
+                    fact_data = hit_facts.get(message_id)
+                    if fact_data:
+                        item = fact_data
+                    elif document:
+                        # Fallback: use ChromaDB document directly
+                        item = {
+                            "content": document,
+                            "metadata": metadata,
+                            "message_id": message_id # Ensure ID exists
+                        }
+
+                if item:
+                    item["similarity_score"] = 1.0 - distance
+                    vector_results.append(item)
+                    if message_id and result_embeddings is not None:
+                        vector = self._as_float_list(result_embeddings[i])
+                        if vector:
+                            stored_embeddings[message_id] = vector
+        return vector_results, stored_embeddings
+
     @staticmethod
     def _temporal_decay_multiplier(
         age_hours: float,
-        half_life_hours: float = 24.0 * 7.0,
-        floor: float = 0.65,
+        half_life_hours: float = _DECAY_HALF_LIFE_HOURS,
+        floor: float = _DECAY_FLOOR,
     ) -> float:
         """Compute a bounded temporal decay factor.
 
@@ -327,17 +535,26 @@ class HybridMemoryManager(MemoryBackend):
         decay = math.exp(-math.log(2.0) * (age_hours / max(1.0, half_life_hours)))
         return floor + ((1.0 - floor) * decay)
 
+    @classmethod
+    def _temporal_decay_multipliers(cls, ages_hours: list[float]) -> list[float]:
+        """Batch form of `_temporal_decay_multiplier` for a whole candidate pool."""
+        if np is None:
+            return [cls._temporal_decay_multiplier(age) for age in ages_hours]
+        ages = np.maximum(np.asarray(ages_hours, dtype=np.float64), 0.0)
+        decay = np.exp(-math.log(2.0) * (ages / _DECAY_HALF_LIFE_HOURS))
+        return (_DECAY_FLOOR + (1.0 - _DECAY_FLOOR) * decay).tolist()
+
     @staticmethod
-    def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if not vec_a or not vec_b or len(vec_a) != len(vec_b):
-            return 0.0
-        dot = sum(a * b for a, b in zip(vec_a, vec_b))
-        norm_a = math.sqrt(sum(a * a for a in vec_a))
-        norm_b = math.sqrt(sum(b * b for b in vec_b))
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+    def _unit_vectors(vectors: list, dims: int) -> list[list[float] | None]:
+        """Pre-normalize embeddings once; unusable ones become None."""
+        unit: list[list[float] | None] = []
+        for vec in vectors:
+            if not isinstance(vec, list) or len(vec) != dims or not dims:
+                unit.append(None)
+                continue
+            norm = math.sqrt(sum(v * v for v in vec))
+            unit.append([v / norm for v in vec] if norm else None)
+        return unit
 
     @staticmethod
     def _normalize_scores(values: list[float]) -> list[float]:
@@ -391,15 +608,19 @@ class HybridMemoryManager(MemoryBackend):
     def _apply_temporal_decay_to_candidates(self, candidates: list[dict]) -> list[dict]:
         """Apply temporal decay to fused candidates and resort by adjusted score."""
         now = datetime.now(timezone.utc).replace(tzinfo=None)
-        adjusted: list[dict] = []
+        ages_hours: list[float] = []
         for candidate in candidates:
             item = candidate.get("item", {})
-            base_score = float(candidate.get("score", 0.0))
             item_dt = self._extract_item_datetime(item) if isinstance(item, dict) else None
             age_hours = 0.0
             if item_dt:
                 age_hours = max(0.0, (now - item_dt).total_seconds() / 3600.0)
-            temporal_mult = self._temporal_decay_multiplier(age_hours)
+            ages_hours.append(age_hours)
+
+        multipliers = self._temporal_decay_multipliers(ages_hours)
+        adjusted: list[dict] = []
+        for candidate, temporal_mult in zip(candidates, multipliers):
+            base_score = float(candidate.get("score", 0.0))
             adjusted.append({
                 **candidate,
                 "score": base_score * temporal_mult,
@@ -408,25 +629,54 @@ class HybridMemoryManager(MemoryBackend):
         adjusted.sort(key=lambda x: x.get("score", 0.0), reverse=True)
         return adjusted
 
-    async def _prepare_mmr_candidates(self, candidates: list[dict]) -> list[dict]:
-        """Attach embeddings for MMR reranking with lightweight content cache."""
-        cache: dict[str, list[float] | None] = {}
-        prepared: list[dict] = []
-        for candidate in candidates:
+    async def _prepare_mmr_candidates(
+        self,
+        candidates: list[dict],
+        stored_embeddings: dict[str, list[float]] | None = None,
+    ) -> list[dict]:
+        """Attach embeddings for MMR reranking.
+
+        Vectors already returned by the Chroma query are reused; the remaining
+        candidates (e.g. BM25-only hits) are embedded in one ``embed_batch`` call.
+        """
+        stored_embeddings = stored_embeddings or {}
+        embeddings: list[list[float] | None] = []
+        missing: dict[str, list[int]] = {}
+        for idx, candidate in enumerate(candidates):
             item = candidate.get("item", {})
-            content = item.get("content", "") if isinstance(item, dict) else ""
-            embedding: list[float] | None = None
-            if isinstance(content, str) and content.strip():
-                if content in cache:
-                    embedding = cache[content]
-                else:
-                    try:
-                        embedding = await self.embeddings.embed(content)
-                    except Exception:
-                        embedding = None
-                    cache[content] = embedding
-            prepared.append({**candidate, "embedding": embedding})
-        return prepared
+            if not isinstance(item, dict):
+                item = {}
+            item_id = item.get("message_id") or item.get("fact_id")
+            embedding = stored_embeddings.get(item_id) if item_id else None
+            content = item.get("content", "")
+            if embedding is None and isinstance(content, str) and content.strip():
+                missing.setdefault(content, []).append(idx)
+            embeddings.append(embedding)
+
+        if missing:
+            texts = list(missing)
+            try:
+                batch = await self.embeddings.embed_batch(texts)
+            except Exception as e:
+                logger.warning(f"Batch embedding for MMR failed: {e}")
+                batch = [None] * len(texts)
+            for content, embedding in zip(texts, batch):
+                for idx in missing[content]:
+                    embeddings[idx] = embedding
+
+        return [
+            {**candidate, "embedding": embedding}
+            for candidate, embedding in zip(candidates, embeddings)
+        ]
+
+    @staticmethod
+    def _as_float_list(vector) -> list[float] | None:
+        """Chroma returns stored vectors as numpy arrays or lists."""
+        if vector is None:
+            return None
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
+        return [float(v) for v in vector] if len(vector) else None
 
     def _mmr_select_candidates(
         self,
@@ -435,7 +685,12 @@ class HybridMemoryManager(MemoryBackend):
         limit: int,
         lambda_mult: float = 0.75,
     ) -> list[dict]:
-        """Select diverse-yet-relevant candidates using MMR."""
+        """Select diverse-yet-relevant candidates using MMR.
+
+        Embeddings are normalized once, so every similarity is a dot product;
+        each round only folds the newest pick into a running max-similarity
+        vector instead of re-comparing against every selected item.
+        """
         if limit <= 0 or not candidates:
             return []
         if len(candidates) <= 1:
@@ -443,42 +698,83 @@ class HybridMemoryManager(MemoryBackend):
 
         score_values = [float(c.get("score", 0.0)) for c in candidates]
         norm_scores = self._normalize_scores(score_values)
+        embeddings = [c.get("embedding") for c in candidates]
 
-        query_sims: list[float] = []
-        for candidate in candidates:
-            emb = candidate.get("embedding")
-            if isinstance(emb, list) and emb:
-                query_sims.append(self._cosine_similarity(query_embedding, emb))
+        if np is not None:
+            order = self._mmr_order_numpy(norm_scores, embeddings, query_embedding, candidates,
+                                          limit, lambda_mult)
+        else:
+            order = self._mmr_order_python(norm_scores, embeddings, query_embedding, candidates,
+                                           limit, lambda_mult)
+        return [candidates[idx] for idx in order]
+
+    def _mmr_order_numpy(self, norm_scores, embeddings, query_embedding, candidates,
+                         limit, lambda_mult) -> list[int]:
+        dims = len(query_embedding or [])
+        matrix = np.zeros((len(candidates), dims), dtype=np.float64)
+        for idx, emb in enumerate(embeddings):
+            if isinstance(emb, list) and dims and len(emb) == dims:
+                matrix[idx] = emb
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        query = np.asarray(query_embedding or [], dtype=np.float64)
+        query_norm = float(np.linalg.norm(query)) if dims else 0.0
+        query_sims = matrix @ (query / query_norm) if query_norm else np.zeros(len(candidates))
+        norm_query = self._normalize_scores(query_sims.tolist())
+
+        relevance = 0.5 * np.asarray(norm_scores) + 0.5 * np.asarray(norm_query)
+        for idx, candidate in enumerate(candidates):
+            candidate["_mmr_relevance"] = float(relevance[idx])
+
+        similarity = matrix @ matrix.T
+        max_sim = np.zeros(len(candidates))
+        available = np.ones(len(candidates), dtype=bool)
+        order: list[int] = []
+        while len(order) < min(limit, len(candidates)):
+            if order:
+                mmr = (lambda_mult * relevance) - ((1.0 - lambda_mult) * max_sim)
             else:
-                query_sims.append(0.0)
-        norm_query = self._normalize_scores(query_sims)
-
+                mmr = relevance.copy()
+            mmr[~available] = -np.inf
+            pick = int(np.argmax(mmr))
+            order.append(pick)
+            available[pick] = False
+            np.maximum(max_sim, similarity[:, pick], out=max_sim)
+        return order
+
+    def _mmr_order_python(self, norm_scores, embeddings, query_embedding, candidates,
+                          limit, lambda_mult) -> list[int]:
+        dims = len(query_embedding or [])
+        unit = self._unit_vectors(embeddings, dims)
+        query_unit = self._unit_vectors([list(query_embedding or [])], dims)[0]
+
+        def _dot(vec_a: list[float] | None, vec_b: list[float] | None) -> float:
+            if vec_a is None or vec_b is None:
+                return 0.0
+            return sum(a * b for a, b in zip(vec_a, vec_b))
+
+        norm_query = self._normalize_scores([_dot(vec, query_unit) for vec in unit])
+        relevance = [(0.5 * norm_scores[i]) + (0.5 * norm_query[i]) for i in range(len(candidates))]
         for idx, candidate in enumerate(candidates):
-            candidate["_mmr_relevance"] = (0.5 * norm_scores[idx]) + (0.5 * norm_query[idx])
+            candidate["_mmr_relevance"] = relevance[idx]
 
-        selected: list[dict] = []
+        max_sim = [0.0] * len(candidates)
         remaining = list(range(len(candidates)))
-        while remaining and len(selected) < limit:
-            if not selected:
-                pick_idx = max(remaining, key=lambda i: candidates[i]["_mmr_relevance"])
+        order: list[int] = []
+        while remaining and len(order) < limit:
+            if order:
+                pick = max(
+                    remaining,
+                    key=lambda i: (lambda_mult * relevance[i]) - ((1.0 - lambda_mult) * max_sim[i]),
+                )
             else:
-                def _mmr_value(i: int) -> float:
-                    relevance = candidates[i]["_mmr_relevance"]
-                    emb_i = candidates[i].get("embedding")
-                    max_sim = 0.0
-                    if isinstance(emb_i, list) and emb_i:
-                        for chosen in selected:
-                            emb_j = chosen.get("embedding")
-                            if isinstance(emb_j, list) and emb_j:
-                                max_sim = max(max_sim, self._cosine_similarity(emb_i, emb_j))
-                    return (lambda_mult * relevance) - ((1.0 - lambda_mult) * max_sim)
-
-                pick_idx = max(remaining, key=_mmr_value)
-
-            selected.append(candidates[pick_idx])
-            remaining.remove(pick_idx)
-
-        return selected[:limit]
+                pick = max(remaining, key=lambda i: relevance[i])
+            order.append(pick)
+            remaining.remove(pick)
+            for i in remaining:
+                max_sim[i] = max(max_sim[i], _dot(unit[i], unit[pick]))
+        return order
 
     def _prepare_reranker_items(self, candidates: list[dict]) -> list[dict]:
         """Copy candidate items and attach normalized scores for reranking."""
@@ -520,70 +816,32 @@ class HybridMemoryManager(MemoryBackend):
             logger.debug(f"Search memory route: {route} for query '{query}'")
 
             # 1. Run Vector Search
-            vector_results = []
-            # Generate query embedding
             query_embedding = await self.embeddings.embed(query)
-
+            lanes = []
             if query_embedding:
-                self._init_chroma()
-                # Prepare filter
-                where_filter = {"session_id": session_id} if session_id else None
-
-                # Search ChromaDB
-                results = self._collection.query(
-                    query_embeddings=[query_embedding],
-                    n_results=limit,
-                    where=where_filter,
-                    include=["documents", "metadatas", "distances"]
-                )
+                lanes.append(self._io.run(
+                    self._vector_search, query_embedding, session_id, limit, op="vector_search",
+                ))
 
-                # Format results
-                if results["ids"] and len(results["ids"][0]) > 0:
-                    for i, chroma_id in enumerate(results["ids"][0]):
-                        metadata = results["metadatas"][0][i]
-                        document = results["documents"][0][i]
-                        distance = results["distances"][0][i]
-
-                        # Get full message from SQLite
-                        message_id = metadata.get("message_id")
-                        msg_data = self._get_message_by_id(message_id)
-
-                        item = None
-                        if msg_data:
-                            item = msg_data
-                        else:
-                            # If not found in messages table, check facts table
-                            fact_data = self._get_fact_by_id(message_id)
-                            if fact_data:
-                                item = fact_data
-                            elif document:
-                                # Fallback: use ChromaDB document directly
-                                item = {
-                                    "content": document,
-                                    "metadata": metadata,
-                                    "message_id": message_id # Ensure ID exists
-                                }
-
-                        if item:
-                            item["similarity_score"] = 1.0 - distance
-                            vector_results.append(item)
-
-            # 2. Run BM25 Search
-            bm25_results = []
+            # 2. Run BM25 Search (concurrently with the vector lane)
             if self.enable_hybrid_memory:
                 logger.debug("Executing full hybrid retrieval (semantic + BM25)")
+                lanes.append(self._io.run(self._perform_bm25_search, query, limit=limit, op="bm25_search"))
 
-                if not self._bm25_built:
-                    self._build_bm25_index()
-
-                if self.bm25 and self.bm25_documents:
-                    bm25_results = self._perform_bm25_search(query, limit=limit)
-
+            lane_results = await asyncio.gather(*lanes)
+            vector_results: list[dict] = []
+            stored_embeddings: dict[str, list[float]] = {}
+            if query_embedding:
+                vector_results, stored_embeddings = lane_results[0]
+            bm25_results = lane_results[-1] if self.enable_hybrid_memory else []
 
             # Filter BM25 results by session_id if needed
             if session_id:
                 bm25_results = [r for r in bm25_results if r.get('session_id') == session_id]
 
+            # Messages queued by add_message but not written yet
+            pending_results = self._match_pending(query, session_id, limit)
+
             # 3. Apply Reciprocal Rank Fusion (RRF)
             k = 60
             fused_scores = {}
@@ -624,6 +882,14 @@ class HybridMemoryManager(MemoryBackend):
                     if 'bm25_score' in item:
                         fused_scores[item_id]['item']['bm25_score'] = item['bm25_score']
 
+            # Process queued (not yet written) messages
+            for rank, item in enumerate(pending_results):
+                item_id = item['message_id']
+                if item_id not in fused_scores:
+                    fused_scores[item_id] = {'item': item, 'score': 0.0}
+                fused_scores[item_id]['score'] += 1.0 / (k + rank + 1)
+                fused_scores[item_id]['item']['pending_rank'] = rank + 1
+
             # Sort by fused score, then apply temporal decay weighting.
             final_results = sorted(fused_scores.values(), key=lambda x: x['score'], reverse=True)
             ranked = self._apply_temporal_decay_to_candidates(final_results)
@@ -632,11 +898,13 @@ class HybridMemoryManager(MemoryBackend):
             if query_embedding and len(ranked) > 1 and limit > 1:
                 candidate_pool_size = max(limit * 4, limit)
                 candidate_pool = ranked[:candidate_pool_size]
-                mmr_candidates = await self._prepare_mmr_candidates(candidate_pool)
-                selected = self._mmr_select_candidates(
+                mmr_candidates = await self._prepare_mmr_candidates(candidate_pool, stored_embeddings)
+                selected = await self._io.run(
+                    self._mmr_select_candidates,
                     candidates=mmr_candidates,
                     query_embedding=query_embedding,
                     limit=limit,
+                    op="mmr",
                 )
                 return self.reranker.rank(query, self._prepare_reranker_items(selected))
 
@@ -667,16 +935,10 @@ class HybridMemoryManager(MemoryBackend):
             except Exception as e:
                 logger.error(f"Error unloading ChromaDB: {e}")
 
-            # Unload BM25 index (if exists)
-            try:
-                if hasattr(self, 'bm25') and self.bm25 is not None:
-                    self.bm25 = None
-                    self.bm25_documents = []
-                    self.bm25_ids = []
-                    self._bm25_built = False
-                    logger.info("BM25 index unloaded")
-            except Exception as e:
-                logger.error(f"Error unloading BM25: {e}")
+            # BM25 postings live in SQLite, so there is nothing to unload;
+            # the embedding cache only needs its pending LRU timestamps written.
+            if self.embedding_cache is not None:
+                self.embedding_cache.flush()
 
     def get_memory_stats(self) -> dict:
         """Get memory system statistics."""
@@ -692,28 +954,26 @@ class HybridMemoryManager(MemoryBackend):
 
             return stats
 
-    def _get_message_by_id(self, message_id: str) -> dict | None:
-        """Get message data from SQLite by ID."""
-        try:
-            messages = self.metadata.get_message_tree(message_id)
-            if messages:
-                return messages[-1]
-            return None
-        except Exception:
-            return None
+    def _hydrate_candidates(
+        self,
+        message_ids: list[str],
+        fact_ids: list[str],
+    ) -> tuple[dict[str, dict], dict[str, dict]]:
+        """
+        Resolve search candidates from SQLite with one query per table.
 
-    def _get_fact_by_id(self, fact_id: str) -> dict | None:
-        """Get fact data from SQLite by ID."""
-        try:
-            fact = self.metadata.get_fact(fact_id)
-            if fact:
-                # Add role='system' to make it look like a message
-                fact["role"] = "system"
-                fact["content"] = f"[{fact['category']}] {fact['value']}"
-                return fact
-            return None
-        except Exception:
-            return None
+        Returns (messages, facts) keyed by id; ``fact_ids`` that resolved as
+        messages are not looked up again. Facts are shaped like messages
+        (role='system') so both lanes feed RRF fusion the same row shape.
+        """
+        messages = self.metadata.get_messages_by_ids(message_ids)
+        facts = self.metadata.get_facts_by_ids(
+            [fact_id for fact_id in fact_ids if fact_id and fact_id not in messages]
+        )
+        for fact in facts.values():
+            fact["role"] = "system"
+            fact["content"] = f"[{fact['category']}] {fact['value']}"
+        return messages, facts
 
     def get_conversation_context(self, session_id: str,
                                  max_messages: int = 20) -> list[dict]:
@@ -729,6 +989,11 @@ class HybridMemoryManager(MemoryBackend):
             messages = self.metadata.get_message_chain(
                 session_id, limit=max_messages
             )
+            pending = self._pending_messages(session_id)
+            if pending:
+                written = {msg.get("message_id") for msg in messages}
+                messages = messages + [item.as_row() for item in pending if item.message_id not in written]
+                messages = messages[-max_messages:]
 
             # Format for LLM consumption
             context = []
@@ -779,24 +1044,13 @@ class HybridMemoryManager(MemoryBackend):
         try:
             fact_id = str(uuid.uuid4())
 
-            # Store in SQLite
-            success = self.metadata.add_fact(
-                fact_id=fact_id,
-                category=category,
-                key=fact[:50],  # First 50 chars as key
-                value=fact,
-                session_id=session_id,
-                confidence=confidence
+            # Store in SQLite (+ graph relations)
+            success = await self._io.run(
+                self._store_fact, fact_id, fact, category, session_id, confidence,
+                op="remember_fact",
             )
 
             if success:
-                if self.graph:
-                    self.graph.ingest_text(
-                        session_id=session_id or "global",
-                        role="fact",
-                        content=fact,
-                        category=category,
-                    )
                 # Also index in ChromaDB for semantic search
                 await self._index_message(
                     session_id or "global",
@@ -806,8 +1060,10 @@ class HybridMemoryManager(MemoryBackend):
                 )
 
                 # Update BM25 index
-                if self.enable_hybrid_memory:
-                    self._build_bm25_index()
+                await self._io.run(
+                    self._index_lexical_document, "fact", fact_id, fact_document(category, fact), session_id,
+                    op="index_lexical",
+                )
 
             return success
 
@@ -815,6 +1071,26 @@ class HybridMemoryManager(MemoryBackend):
             logger.error(f"Error remembering fact: {e}")
             return False
 
+    def _store_fact(self, fact_id: str, fact: str, category: str,
+                    session_id: str | None, confidence: float) -> bool:
+        """SQLite row and graph relations for a new fact (runs on the I/O executor)."""
+        success = self.metadata.add_fact(
+            fact_id=fact_id,
+            category=category,
+            key=fact[:50],  # First 50 chars as key
+            value=fact,
+            session_id=session_id,
+            confidence=confidence
+        )
+        if success and self.graph:
+            self.graph.ingest_text(
+                session_id=session_id or "global",
+                role="fact",
+                content=fact,
+                category=category,
+            )
+        return success
+
     def get_relevant_facts(self, category: str | None = None,
                           session_id: str | None = None) -> list[str]:
         """Get relevant facts from long-term memory."""
@@ -860,7 +1136,10 @@ class HybridMemoryManager(MemoryBackend):
         3. Maintains tool result references
         """
         try:
-            messages = self.metadata.get_message_chain(session_id, limit=1000)
+            await self.flush_writes()
+            messages = await self._io.run(
+                self.metadata.get_message_chain, session_id, limit=1000, op="compact_read",
+            )
 
             if len(messages) <= 50:
                 return True  # No need to compact
@@ -897,9 +1176,23 @@ class HybridMemoryManager(MemoryBackend):
         stats = self.metadata.get_stats()
         stats["backend"] = "hybrid"
         stats["retrieval_mode"] = "full_hybrid" if self.enable_hybrid_memory else "semantic_only"
+        stats["lexical_engine"] = self.lexical_engine
         stats["embedding_provider"] = self._embedding_provider_name
         stats["embedding_model"] = self._embedding_model_name
 
+        if self.lexical_index:
+            try:
+                stats["lexical_index"] = self.lexical_index.get_stats()
+            except Exception:
+                pass
+
+        if self.embedding_cache is not None:
+            stats["embedding_cache"] = self.embedding_cache.get_stats()
+
+        stats["io_executor"] = self._io.get_stats()
+        if self._write_behind is not None:
+            stats["write_behind"] = self._write_behind.get_stats()
+
         if self._chroma_client:
             try:
                 chroma_count = self._collection.count()
@@ -944,7 +1237,9 @@ class HybridMemoryManager(MemoryBackend):
         """Save a metacognition lesson to SQLite."""
         import uuid
         lesson_id = str(uuid.uuid4())[:12]
-        return self.metadata.add_lesson(
+        return await self._io.run(
+            self.metadata.add_lesson,
+            op="save_lesson",
             lesson_id=lesson_id,
             trigger=trigger,
             mistake=mistake,
@@ -0,0 +1,327 @@
+"""Persistent embedding cache shared by the embedding providers."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+from loguru import logger
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMORY_BYTES = 16 * 1024 * 1024
+# Hit timestamps are written back in batches rather than on every lookup.
+_TOUCH_FLUSH_THRESHOLD = 256
+
+
+def _pack(vector: list[float]) -> bytes:
+    values = array("f", vector)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """
+    Embeddings keyed by ``(provider, model, sha256(text))`` in a SQLite file.
+
+    Vectors are stored as little-endian float32 BLOBs. The file is shared by
+    every provider/model pair and trimmed least-recently-used first once it
+    grows past ``max_bytes``; a small in-process tier bounded by
+    ``memory_bytes`` answers repeated lookups without touching SQLite, and
+    :meth:`warm` preloads it with the most recently used vectors at startup.
+
+    One SQLite connection is kept per cache. Async callers use :meth:`aget`,
+    :meth:`aget_many`, :meth:`aput` and :meth:`aput_many`, which answer
+    in-process hits inline and run SQLite work in a worker thread.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        provider: str,
+        model: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+    ):
+        self.db_path = Path(db_path)
+        self.provider = str(provider)
+        self.model = str(model)
+        self.max_bytes = max(0, int(max_bytes))
+        self.memory_bytes = max(0, int(memory_bytes))
+        self._memory: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._memory_used = 0
+        self._touched: set[bytes] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _get_connection(self):
+        """The cache's connection, held exclusively for the ``with`` block."""
+        with self._db_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            try:
+                yield self._conn
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Write pending hit timestamps and close the connection."""
+        self.flush()
+        with self._db_lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    text_hash BLOB NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (provider, model, text_hash)
+                ) WITHOUT ROWID;
+
+                CREATE INDEX IF NOT EXISTS idx_embedding_cache_lru
+                ON embedding_cache(last_used);
+            """)
+            conn.commit()
+            self._disk_bytes = conn.execute(
+                "SELECT COALESCE(SUM(length(vector)), 0) FROM embedding_cache"
+            ).fetchone()[0]
+
+    @staticmethod
+    def text_hash(text: str) -> bytes:
+        return hashlib.sha256((text or "").encode("utf-8")).digest()
+
+    def _remember(self, key: bytes, vector: list[float]) -> None:
+        """Insert into the in-process tier; caller holds ``_lock``."""
+        size = len(vector) * 4
+        if size > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_used -= len(previous) * 4
+        self._memory[key] = vector
+        self._memory_used += size
+        while self._memory_used > self.memory_bytes and self._memory:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_used -= len(dropped) * 4
+
+    def get(self, text: str) -> list[float] | None:
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: list[str]) -> list[list[float] | None]:
+        """Cached vectors for ``texts`` (None where not cached)."""
+        keys = [self.text_hash(text) for text in texts]
+        found: dict[bytes, list[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing:
+            try:
+                with self._get_connection() as conn:
+                    for start in range(0, len(missing), 500):
+                        chunk = missing[start:start + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = conn.execute(
+                            f"""SELECT text_hash, vector FROM embedding_cache
+                                WHERE provider = ? AND model = ? AND text_hash IN ({placeholders})""",
+                            [self.provider, self.model, *chunk],
+                        ).fetchall()
+                        for key, blob in rows:
+                            found[bytes(key)] = _unpack(blob)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+            with self._lock:
+                for key in missing:
+                    if key in found:
+                        self._remember(key, found[key])
+
+        results = [found.get(key) for key in keys]
+        with self._lock:
+            hits = sum(1 for vector in results if vector is not None)
+            self._hits += hits
+            self._misses += len(results) - hits
+            self._touched.update(key for key in keys if key in found)
+            flush = len(self._touched) >= _TOUCH_FLUSH_THRESHOLD
+        if flush:
+            self.flush()
+        return results
+
+    async def aget(self, text: str) -> list[float] | None:
+        return (await self.aget_many([text]))[0]
+
+    async def aget_many(self, texts: list[str]) -> list[list[float] | None]:
+        """:meth:`get_many` for the event loop: SQLite reads run in a worker thread."""
+        keys = [self.text_hash(text) for text in texts]
+        with self._lock:
+            inline = (
+                all(key in self._memory for key in keys)
+                and len(self._touched) + len(keys) < _TOUCH_FLUSH_THRESHOLD
+            )
+        if inline:
+            return self.get_many(texts)
+        return await asyncio.to_thread(self.get_many, texts)
+
+    async def aput(self, text: str, vector: list[float] | None) -> None:
+        await self.aput_many([(text, vector)])
+
+    async def aput_many(self, items: list[tuple[str, list[float] | None]]) -> None:
+        """:meth:`put_many` for the event loop: the write (and any eviction) runs in a worker thread."""
+        if any(vector for _text, vector in items):
+            await asyncio.to_thread(self.put_many, items)
+
+    def put(self, text: str, vector: list[float] | None) -> None:
+        self.put_many([(text, vector)])
+
+    def put_many(self, items: list[tuple[str, list[float] | None]]) -> None:
+        """Store freshly computed vectors, then trim the file to its byte budget."""
+        rows = []
+        with self._lock:
+            for text, vector in items:
+                if not vector:
+                    continue
+                key = self.text_hash(text)
+                vector = [float(v) for v in vector]
+                self._remember(key, vector)
+                self._touched.discard(key)
+                rows.append((self.provider, self.model, key, _pack(vector), time.time()))
+        if not rows:
+            return
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    """INSERT OR REPLACE INTO embedding_cache
+                       (provider, model, text_hash, vector, last_used) VALUES (?, ?, ?, ?, ?)""",
+                    rows,
+                )
+                conn.commit()
+                self._disk_bytes += sum(len(row[3]) for row in rows)
+                if self._disk_bytes > self.max_bytes:
+                    self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used rows until the file is 90% of ``max_bytes``."""
+        # The running total is an estimate (replaced rows, other writers); re-measure first.
+        self._disk_bytes = conn.execute(
+            "SELECT COALESCE(SUM(length(vector)), 0) FROM embedding_cache"
+        ).fetchone()[0]
+        excess = self._disk_bytes - int(self.max_bytes * 0.9)
+        if self._disk_bytes <= self.max_bytes or excess <= 0:
+            return
+        victims = []
+        freed = 0
+        for provider, model, key, size in conn.execute(
+            """SELECT provider, model, text_hash, length(vector) FROM embedding_cache
+               ORDER BY last_used"""
+        ):
+            victims.append((provider, model, key))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany(
+            "DELETE FROM embedding_cache WHERE provider = ? AND model = ? AND text_hash = ?",
+            victims,
+        )
+        conn.commit()
+        self._disk_bytes -= freed
+        self._evicted += len(victims)
+
+    def flush(self) -> None:
+        """Write pending hit timestamps so LRU eviction sees recent use."""
+        with self._lock:
+            touched, self._touched = self._touched, set()
+        if not touched:
+            return
+        now = time.time()
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    """UPDATE embedding_cache SET last_used = ?
+                       WHERE provider = ? AND model = ? AND text_hash = ?""",
+                    [(now, self.provider, self.model, key) for key in touched],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache touch failed: {e}")
+
+    def warm(self, limit_bytes: int | None = None) -> int:
+        """Preload the most recently used vectors of this provider/model into memory."""
+        budget = self.memory_bytes if limit_bytes is None else min(int(limit_bytes), self.memory_bytes)
+        loaded = 0
+        used = 0
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    """SELECT text_hash, vector FROM embedding_cache
+                       WHERE provider = ? AND model = ? ORDER BY last_used DESC""",
+                    (self.provider, self.model),
+                )
+                warmed = []
+                for key, blob in rows:
+                    if used + len(blob) > budget:
+                        break
+                    warmed.append((bytes(key), _unpack(blob)))
+                    used += len(blob)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache warm start failed: {e}")
+            return 0
+        with self._lock:
+            # Oldest first, so the most recent end up at the LRU's hot end.
+            for key, vector in reversed(warmed):
+                if key not in self._memory:
+                    self._remember(key, vector)
+                    loaded += 1
+        if loaded:
+            logger.info(f"Embedding cache warmed with {loaded} vectors ({self.provider}/{self.model})")
+        return loaded
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "provider": self.provider,
+                "model": self.model,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_used,
+                "disk_bytes": self._disk_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evicted": self._evicted,
+            }
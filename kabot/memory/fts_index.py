@@ -0,0 +1,190 @@
+"""SQLite FTS5 lexical index over memory messages and facts."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from pathlib import Path
+
+from loguru import logger
+
+from kabot.memory.sqlite_pool import execute_script, get_sqlite_pool
+
+_QUERY_TERM_RE = re.compile(r"(\w+)(\*?)")
+
+_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+        content,
+        doc_type UNINDEXED,
+        doc_id UNINDEXED,
+        session_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS memory_fts_messages_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO memory_fts (rowid, content, doc_type, doc_id, session_id)
+        VALUES (NEW.rowid * 2, NEW.content, 'message', NEW.message_id, NEW.session_id);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memory_fts_messages_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM memory_fts WHERE rowid = OLD.rowid * 2;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memory_fts_messages_au
+    AFTER UPDATE OF content, session_id ON messages BEGIN
+        DELETE FROM memory_fts WHERE rowid = OLD.rowid * 2;
+        INSERT INTO memory_fts (rowid, content, doc_type, doc_id, session_id)
+        VALUES (NEW.rowid * 2, NEW.content, 'message', NEW.message_id, NEW.session_id);
+    END;
+
+    -- add_fact uses INSERT OR REPLACE, whose implicit delete does not
+    -- fire delete triggers, so drop the replaced row up front.
+    CREATE TRIGGER IF NOT EXISTS memory_fts_facts_bi BEFORE INSERT ON facts BEGIN
+        DELETE FROM memory_fts
+        WHERE rowid = (SELECT rowid * 2 + 1 FROM facts WHERE fact_id = NEW.fact_id);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memory_fts_facts_ai AFTER INSERT ON facts BEGIN
+        INSERT INTO memory_fts (rowid, content, doc_type, doc_id, session_id)
+        VALUES (
+            NEW.rowid * 2 + 1, '[' || NEW.category || '] ' || NEW.value,
+            'fact', NEW.fact_id, NEW.session_id
+        );
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memory_fts_facts_ad AFTER DELETE ON facts BEGIN
+        DELETE FROM memory_fts WHERE rowid = OLD.rowid * 2 + 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memory_fts_facts_au
+    AFTER UPDATE OF category, value, session_id ON facts BEGIN
+        DELETE FROM memory_fts WHERE rowid = OLD.rowid * 2 + 1;
+        INSERT INTO memory_fts (rowid, content, doc_type, doc_id, session_id)
+        VALUES (
+            NEW.rowid * 2 + 1, '[' || NEW.category || '] ' || NEW.value,
+            'fact', NEW.fact_id, NEW.session_id
+        );
+    END;
+"""
+
+
+def fts5_available() -> bool:
+    """Return True when the linked SQLite library was built with FTS5."""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE _probe USING fts5(x)")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def build_match_query(query: str, *, prefix_last_term: bool = True) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every term is quoted (so punctuation and FTS5 operators in user text are
+    inert) and terms are OR-ed so bm25() ranks partial matches instead of
+    requiring all of them. ``term*`` in the input, and the last term when
+    ``prefix_last_term`` is set, become prefix queries.
+    """
+    parts: list[str] = []
+    matches = _QUERY_TERM_RE.findall((query or "").lower())
+    for position, (term, star) in enumerate(matches):
+        is_last = position == len(matches) - 1
+        suffix = "*" if star or (prefix_last_term and is_last) else ""
+        parts.append(f'"{term}"{suffix}')
+    return " OR ".join(parts)
+
+
+class FTS5Index:
+    """
+    FTS5 virtual table kept in sync with ``messages`` and ``facts`` by triggers.
+
+    Rows are keyed by the source table's rowid (even rowids for messages, odd
+    for facts), so trigger-driven deletes are point lookups. Because every
+    writer of ``metadata.db`` goes through the triggers, the index needs no
+    Python-side bookkeeping; :meth:`add_document` and :meth:`ensure_synced`
+    exist only to share the interface of :class:`~kabot.memory.bm25_index.BM25Index`.
+    """
+
+    def __init__(self, db_path: Path | str, *, prefix_last_term: bool = True):
+        self.db_path = Path(db_path)
+        self.prefix_last_term = bool(prefix_last_term)
+        self._closed = False
+        self._pool = get_sqlite_pool(self.db_path)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        indexed = self._pool.write(self._create_schema, "fts_init")
+        if indexed:
+            logger.info(f"FTS5 memory index built with {indexed} documents")
+
+    def close(self) -> None:
+        """Release this index's share of the pool; the last owner closes its connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pool.release()
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> int:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_fts'"
+        ).fetchone()
+        execute_script(conn, _SCHEMA)
+        if exists:
+            return 0
+        # First run on an existing database: index rows written before the triggers.
+        conn.execute(
+            """INSERT INTO memory_fts (rowid, content, doc_type, doc_id, session_id)
+               SELECT rowid * 2, content, 'message', message_id, session_id FROM messages"""
+        )
+        conn.execute(
+            """INSERT INTO memory_fts (rowid, content, doc_type, doc_id, session_id)
+               SELECT rowid * 2 + 1, '[' || category || '] ' || value, 'fact', fact_id, session_id
+               FROM facts"""
+        )
+        return conn.execute("SELECT COUNT(*) FROM memory_fts").fetchone()[0]
+
+    def add_document(self, doc_type: str, doc_id: str, content: str,
+                     session_id: str | None = None) -> None:
+        """No-op: triggers index rows as they are written."""
+
+    def ensure_synced(self) -> int:
+        """No-op: triggers keep the index in sync."""
+        return 0
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 5,
+        session_id: str | None = None,
+    ) -> list[tuple[str, str, float]]:
+        """Return ``(doc_type, doc_id, score)`` ranked by bm25(); higher is better."""
+        match = build_match_query(query, prefix_last_term=self.prefix_last_term)
+        if not match or limit <= 0:
+            return []
+        sql = (
+            "SELECT doc_type, doc_id, -bm25(memory_fts) AS score FROM memory_fts "
+            "WHERE memory_fts MATCH ?"
+        )
+        params: list = [match]
+        if session_id:
+            sql += " AND session_id = ?"
+            params.append(session_id)
+        sql += " ORDER BY bm25(memory_fts) LIMIT ?"
+        params.append(int(limit))
+        with self._pool.reader("fts_search") as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [(doc_type, doc_id, float(score)) for doc_type, doc_id, score in rows]
+
+    def get_stats(self) -> dict:
+        """Number of indexed documents."""
+        with self._pool.reader("fts_stats") as conn:
+            documents = conn.execute("SELECT COUNT(*) FROM memory_fts").fetchone()[0]
+        return {"documents": documents}
@@ -10,6 +10,75 @@ from typing import Any
 
 from loguru import logger
 
+from kabot.memory.fts_index import fts5_available
+from kabot.memory.sqlite_pool import get_sqlite_pool
+
+DEFAULT_EXPAND_DEPTH = 2
+DEFAULT_EXPAND_FANOUT = 16
+
+_RELATION_KEY = "src_entity_id, dst_entity_id, relation, COALESCE(session_id, '')"
+
+
+def _strongest_edges(entity: str, limit: str) -> str:
+    """Subquery for the rowids of ``entity``'s ``limit`` strongest edges, either direction."""
+    return f"""
+        SELECT rid FROM (
+            SELECT * FROM (
+                SELECT rowid AS rid, mentions, last_seen FROM relations
+                WHERE src_entity_id = {entity}
+                ORDER BY mentions DESC, last_seen DESC LIMIT {limit}
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT rowid AS rid, mentions, last_seen FROM relations
+                WHERE dst_entity_id = {entity}
+                ORDER BY mentions DESC, last_seen DESC LIMIT {limit}
+            )
+        )
+        ORDER BY mentions DESC, last_seen DESC
+        LIMIT {limit}
+    """
+
+
+# Relations within :depth hops of :root, each hop following an entity's strongest edges.
+_NEIGHBOURHOOD_SQL = f"""
+    WITH RECURSIVE walk(entity_id, depth, rel_rowid) AS (
+        SELECT
+            CASE WHEN r.src_entity_id = :root THEN r.dst_entity_id ELSE r.src_entity_id END,
+            1,
+            r.rowid
+        FROM relations r
+        WHERE r.rowid IN ({_strongest_edges(":root", ":root_fanout")})
+        UNION
+        SELECT
+            CASE WHEN r.src_entity_id = w.entity_id THEN r.dst_entity_id ELSE r.src_entity_id END,
+            w.depth + 1,
+            r.rowid
+        FROM walk w
+        JOIN relations r ON r.rowid IN ({_strongest_edges("w.entity_id", ":fanout")})
+        WHERE w.depth < :depth
+    ),
+    reached AS (
+        SELECT rel_rowid, MIN(depth) AS depth FROM walk GROUP BY rel_rowid
+    )
+    SELECT
+        r.relation,
+        s.name AS src_name,
+        d.name AS dst_name,
+        r.session_id,
+        r.role,
+        r.confidence,
+        r.mentions,
+        r.last_seen,
+        reached.depth
+    FROM reached
+    JOIN relations r ON r.rowid = reached.rel_rowid
+    JOIN entities s ON s.entity_id = r.src_entity_id
+    JOIN entities d ON d.entity_id = r.dst_entity_id
+    ORDER BY reached.depth, r.mentions DESC, r.last_seen DESC
+    LIMIT :limit
+"""
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -25,147 +94,163 @@ class GraphMemory:
         (re.compile(r"\b(?:i|aku|saya)\s+(?:prefer|like|suka|lebih suka)\s+(?P<dst>[^.,;]{2,80})", re.IGNORECASE), "prefers", 0.8),
     ]
 
-    def __init__(self, db_path: Path, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        enabled: bool = True,
+        *,
+        name_index: str = "auto",
+        expand_depth: int = DEFAULT_EXPAND_DEPTH,
+        expand_fanout: int = DEFAULT_EXPAND_FANOUT,
+    ) -> None:
         self.db_path = Path(db_path)
         self.enabled = bool(enabled)
+        # Relations reached from a queried entity: hops, and edges followed per entity.
+        self.expand_depth = max(1, int(expand_depth))
+        self.expand_fanout = max(1, int(expand_fanout))
+        self.name_index = "like"
+        self._closed = False
         if not self.enabled:
             return
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_sqlite_pool(self.db_path)
         self._init_db()
-
-    def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        if str(name_index or "auto").strip().lower() in {"auto", "fts5"}:
+            self.name_index = "fts5" if self._create_name_index() else "like"
 
     def _init_db(self) -> None:
-        with self._conn() as conn:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS entities (
-                    entity_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    name_key TEXT NOT NULL UNIQUE,
-                    entity_type TEXT DEFAULT 'unknown',
-                    first_seen TEXT NOT NULL,
-                    last_seen TEXT NOT NULL,
-                    mentions INTEGER NOT NULL DEFAULT 1
-                );
-
-                CREATE TABLE IF NOT EXISTS relations (
-                    relation_id TEXT PRIMARY KEY,
-                    src_entity_id TEXT NOT NULL,
-                    dst_entity_id TEXT NOT NULL,
-                    relation TEXT NOT NULL,
-                    session_id TEXT,
-                    role TEXT,
-                    evidence TEXT,
-                    confidence REAL NOT NULL DEFAULT 0.7,
-                    first_seen TEXT NOT NULL,
-                    last_seen TEXT NOT NULL,
-                    mentions INTEGER NOT NULL DEFAULT 1
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_rel_src ON relations(src_entity_id);
-                CREATE INDEX IF NOT EXISTS idx_rel_dst ON relations(dst_entity_id);
-                CREATE INDEX IF NOT EXISTS idx_rel_session ON relations(session_id);
-                """
-            )
+        self._pool.write(self._create_schema, "init_schema")
 
-    @staticmethod
-    def _normalize_entity(raw: str) -> str:
-        cleaned = re.sub(r"\s+", " ", str(raw or "").strip())
-        cleaned = cleaned.strip("`'\".,;:()[]{}")
-        return cleaned
+    def close(self) -> None:
+        """Release this graph's share of the pool; the last owner closes its connections."""
+        if not self.enabled or self._closed:
+            return
+        self._closed = True
+        self._pool.release()
 
-    @staticmethod
-    def _entity_key(name: str) -> str:
-        return re.sub(r"\s+", " ", name.lower().strip())
+    def _create_name_index(self) -> bool:
+        """Trigram FTS5 index over entity names for substring lookups; False when unavailable."""
+        if not fts5_available():
+            return False
+        try:
+            self._pool.write(self._create_name_fts, "init_name_index")
+            return True
+        except sqlite3.Error as exc:
+            logger.warning(f"GraphMemory name index unavailable, using LIKE lookups: {exc}")
+            return False
 
-    def _ensure_entity(self, conn: sqlite3.Connection, name: str, entity_type: str = "unknown") -> str:
-        normalized = self._normalize_entity(name)
-        if not normalized:
-            return ""
-        key = self._entity_key(normalized)
-        now = _now_iso()
-        row = conn.execute(
-            "SELECT entity_id, mentions FROM entities WHERE name_key = ?",
-            (key,),
+    @staticmethod
+    def _create_name_fts(conn: sqlite3.Connection) -> None:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entities_fts'"
         ).fetchone()
-        if row:
-            conn.execute(
-                "UPDATE entities SET last_seen = ?, mentions = ? WHERE entity_id = ?",
-                (now, int(row["mentions"]) + 1, row["entity_id"]),
-            )
-            return str(row["entity_id"])
-
-        entity_id = str(uuid.uuid4())
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts USING fts5(name_key, tokenize = 'trigram')")
         conn.execute(
             """
-            INSERT INTO entities (entity_id, name, name_key, entity_type, first_seen, last_seen, mentions)
-            VALUES (?, ?, ?, ?, ?, ?, 1)
-            """,
-            (entity_id, normalized, key, entity_type, now, now),
+            CREATE TRIGGER IF NOT EXISTS entities_fts_ai AFTER INSERT ON entities BEGIN
+                INSERT INTO entities_fts (rowid, name_key) VALUES (NEW.rowid, NEW.name_key);
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS entities_fts_ad AFTER DELETE ON entities BEGIN
+                DELETE FROM entities_fts WHERE rowid = OLD.rowid;
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS entities_fts_au AFTER UPDATE OF name_key ON entities BEGIN
+                DELETE FROM entities_fts WHERE rowid = OLD.rowid;
+                INSERT INTO entities_fts (rowid, name_key) VALUES (NEW.rowid, NEW.name_key);
+            END
+            """
         )
-        return entity_id
+        if not exists:
+            conn.execute("INSERT INTO entities_fts (rowid, name_key) SELECT rowid, name_key FROM entities")
 
-    def _upsert_relation(
-        self,
-        conn: sqlite3.Connection,
-        src_entity_id: str,
-        dst_entity_id: str,
-        relation: str,
-        session_id: str | None,
-        role: str | None,
-        evidence: str,
-        confidence: float,
-    ) -> None:
-        now = _now_iso()
-        row = conn.execute(
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        # Individual statements: executescript() would commit the writer's batch.
+        conn.execute(
             """
-            SELECT relation_id, mentions, confidence
-            FROM relations
-            WHERE src_entity_id = ? AND dst_entity_id = ? AND relation = ?
-              AND COALESCE(session_id, '') = COALESCE(?, '')
-            """,
-            (src_entity_id, dst_entity_id, relation, session_id),
-        ).fetchone()
-        if row:
-            conn.execute(
-                """
-                UPDATE relations
-                SET last_seen = ?, mentions = ?, confidence = ?, evidence = ?
-                WHERE relation_id = ?
-                """,
-                (
-                    now,
-                    int(row["mentions"]) + 1,
-                    max(float(row["confidence"]), float(confidence)),
-                    evidence[:400],
-                    row["relation_id"],
-                ),
+            CREATE TABLE IF NOT EXISTS entities (
+                entity_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                name_key TEXT NOT NULL UNIQUE,
+                entity_type TEXT DEFAULT 'unknown',
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                mentions INTEGER NOT NULL DEFAULT 1
             )
-            return
-
+            """
+        )
         conn.execute(
             """
-            INSERT INTO relations
-            (relation_id, src_entity_id, dst_entity_id, relation, session_id, role, evidence, confidence, first_seen, last_seen, mentions)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-            """,
-            (
-                str(uuid.uuid4()),
-                src_entity_id,
-                dst_entity_id,
-                relation,
-                session_id,
-                role,
-                evidence[:400],
-                float(confidence),
-                now,
-                now,
-            ),
+            CREATE TABLE IF NOT EXISTS relations (
+                relation_id TEXT PRIMARY KEY,
+                src_entity_id TEXT NOT NULL,
+                dst_entity_id TEXT NOT NULL,
+                relation TEXT NOT NULL,
+                session_id TEXT,
+                role TEXT,
+                evidence TEXT,
+                confidence REAL NOT NULL DEFAULT 0.7,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                mentions INTEGER NOT NULL DEFAULT 1
+            )
+            """
         )
+        # Neighbourhood expansion reads each entity's strongest edges straight off these.
+        conn.execute("DROP INDEX IF EXISTS idx_rel_src")
+        conn.execute("DROP INDEX IF EXISTS idx_rel_dst")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rel_src_rank ON relations(src_entity_id, mentions DESC, last_seen DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rel_dst_rank ON relations(dst_entity_id, mentions DESC, last_seen DESC)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_rel_session ON relations(session_id)")
+        try:
+            conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_rel_unique ON relations({_RELATION_KEY})")
+        except sqlite3.IntegrityError:
+            # Older databases may hold duplicate edges: fold them into the oldest row first.
+            conn.execute(
+                f"""
+                UPDATE relations
+                SET mentions = (
+                        SELECT SUM(d.mentions) FROM relations d
+                        WHERE d.src_entity_id = relations.src_entity_id
+                          AND d.dst_entity_id = relations.dst_entity_id
+                          AND d.relation = relations.relation
+                          AND COALESCE(d.session_id, '') = COALESCE(relations.session_id, '')
+                    ),
+                    confidence = (
+                        SELECT MAX(d.confidence) FROM relations d
+                        WHERE d.src_entity_id = relations.src_entity_id
+                          AND d.dst_entity_id = relations.dst_entity_id
+                          AND d.relation = relations.relation
+                          AND COALESCE(d.session_id, '') = COALESCE(relations.session_id, '')
+                    )
+                WHERE rowid IN (SELECT MIN(rowid) FROM relations GROUP BY {_RELATION_KEY} HAVING COUNT(*) > 1)
+                """
+            )
+            conn.execute(
+                f"DELETE FROM relations WHERE rowid NOT IN (SELECT MIN(rowid) FROM relations GROUP BY {_RELATION_KEY})"
+            )
+            conn.execute(f"CREATE UNIQUE INDEX idx_rel_unique ON relations({_RELATION_KEY})")
+
+    @staticmethod
+    def _normalize_entity(raw: str) -> str:
+        cleaned = re.sub(r"\s+", " ", str(raw or "").strip())
+        cleaned = cleaned.strip("`'\".,;:()[]{}")
+        return cleaned
+
+    @staticmethod
+    def _entity_key(name: str) -> str:
+        return re.sub(r"\s+", " ", name.lower().strip())
 
     def _extract_relations(self, content: str) -> list[tuple[str, str, str, float]]:
         text = str(content or "").strip()
@@ -196,6 +281,87 @@ class GraphMemory:
                     relations.append((a, b, "related_to", 0.55))
         return relations
 
+    def _extract_for_ingest(self, content: str, category: str | None) -> list[tuple[str, str, str, float]]:
+        extracted = self._extract_relations(content)
+        if category and category.lower() in {"preference", "fact"}:
+            candidate = self._normalize_entity(content)
+            if candidate and len(candidate) <= 80:
+                extracted.append(("user", candidate, "states", 0.6))
+        return extracted
+
+    def _ingest_extracted(
+        self,
+        conn: sqlite3.Connection,
+        extracted: list[tuple[str, str, str, float]],
+        *,
+        session_id: str | None,
+        role: str | None,
+        content: str,
+    ) -> dict[str, int]:
+        """Upsert one text's entities and relations with one statement per table."""
+        # name_key -> [display name, mentions]
+        entities: dict[str, list[Any]] = {}
+        pairs: list[tuple[str, str, str, float]] = []
+        for src, dst, relation, confidence in extracted:
+            src_name = self._normalize_entity(src)
+            dst_name = self._normalize_entity(dst)
+            for name in (src_name, dst_name):
+                if name:
+                    entities.setdefault(self._entity_key(name), [name, 0])[1] += 1
+            if src_name and dst_name:
+                pairs.append((self._entity_key(src_name), self._entity_key(dst_name), relation, confidence))
+        if not entities:
+            return {"entities": 0, "relations": 0}
+
+        now = _now_iso()
+        conn.executemany(
+            """
+            INSERT INTO entities (entity_id, name, name_key, entity_type, first_seen, last_seen, mentions)
+            VALUES (?, ?, ?, 'unknown', ?, ?, ?)
+            ON CONFLICT(name_key) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                mentions = entities.mentions + excluded.mentions
+            """,
+            [(str(uuid.uuid4()), name, key, now, now, count) for key, (name, count) in entities.items()],
+        )
+        keys = list(entities)
+        entity_ids = {
+            row["name_key"]: str(row["entity_id"])
+            for row in conn.execute(
+                f"SELECT entity_id, name_key FROM entities WHERE name_key IN ({','.join('?' * len(keys))})",
+                keys,
+            )
+        }
+
+        # (src, dst, relation) -> [mentions, confidence]
+        relations: dict[tuple[str, str, str], list[Any]] = {}
+        for src_key, dst_key, relation, confidence in pairs:
+            entry = relations.setdefault((entity_ids[src_key], entity_ids[dst_key], relation), [0, confidence])
+            entry[0] += 1
+            entry[1] = max(entry[1], confidence)
+        evidence = content[:400]
+        conn.executemany(
+            f"""
+            INSERT INTO relations
+            (relation_id, src_entity_id, dst_entity_id, relation, session_id, role, evidence, confidence, first_seen, last_seen, mentions)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT({_RELATION_KEY}) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                mentions = relations.mentions + excluded.mentions,
+                confidence = MAX(relations.confidence, excluded.confidence),
+                evidence = excluded.evidence
+            """,
+            [
+                (str(uuid.uuid4()), src_id, dst_id, relation, session_id, role, evidence,
+                 float(confidence), now, now, mentions)
+                for (src_id, dst_id, relation), (mentions, confidence) in relations.items()
+            ],
+        )
+        return {
+            "entities": len({entity_ids[key] for pair in pairs for key in pair[:2]}),
+            "relations": len(pairs),
+        }
+
     def ingest_text(
         self,
         *,
@@ -208,90 +374,126 @@ class GraphMemory:
         if not self.enabled:
             return {"entities": 0, "relations": 0}
 
-        extracted = self._extract_relations(content)
-        if category and category.lower() in {"preference", "fact"}:
-            candidate = self._normalize_entity(content)
-            if candidate and len(candidate) <= 80:
-                extracted.append(("user", candidate, "states", 0.6))
-
+        extracted = self._extract_for_ingest(content, category)
         if not extracted:
             return {"entities": 0, "relations": 0}
 
-        entity_ids: set[str] = set()
-        relation_count = 0
         try:
-            with self._conn() as conn:
-                for src, dst, relation, confidence in extracted:
-                    src_id = self._ensure_entity(conn, src)
-                    dst_id = self._ensure_entity(conn, dst)
-                    if not src_id or not dst_id:
-                        continue
-                    entity_ids.add(src_id)
-                    entity_ids.add(dst_id)
-                    self._upsert_relation(
-                        conn,
-                        src_entity_id=src_id,
-                        dst_entity_id=dst_id,
-                        relation=relation,
-                        session_id=session_id,
-                        role=role,
-                        evidence=content,
-                        confidence=confidence,
-                    )
-                    relation_count += 1
-            return {"entities": len(entity_ids), "relations": relation_count}
+            return self._pool.write(
+                lambda conn: self._ingest_extracted(
+                    conn, extracted, session_id=session_id, role=role, content=content,
+                ),
+                "graph_ingest",
+            )
         except Exception as exc:
             logger.warning(f"GraphMemory ingest failed: {exc}")
             return {"entities": 0, "relations": 0}
 
-    def query_related(self, entity: str, limit: int = 10) -> list[dict[str, Any]]:
-        """Query outgoing/incoming relations for a named entity."""
+    def ingest_many(self, items: list[dict[str, Any]]) -> dict[str, int]:
+        """
+        Like ``ingest_text`` for several texts in one transaction; each item
+        has the ``ingest_text`` keyword arguments.
+        """
+        if not self.enabled:
+            return {"entities": 0, "relations": 0}
+        work = []
+        for item in items:
+            content = str(item.get("content") or "")
+            extracted = self._extract_for_ingest(content, item.get("category"))
+            if extracted:
+                work.append((item, content, extracted))
+        if not work:
+            return {"entities": 0, "relations": 0}
+
+        def ingest(conn: sqlite3.Connection) -> dict[str, int]:
+            totals = {"entities": 0, "relations": 0}
+            for item, content, extracted in work:
+                counts = self._ingest_extracted(
+                    conn,
+                    extracted,
+                    session_id=item.get("session_id"),
+                    role=item.get("role"),
+                    content=content,
+                )
+                totals["entities"] += counts["entities"]
+                totals["relations"] += counts["relations"]
+            return totals
+
+        try:
+            return self._pool.write(ingest, "graph_ingest_many")
+        except Exception as exc:
+            logger.warning(f"GraphMemory batch ingest failed: {exc}")
+            return {"entities": 0, "relations": 0}
+
+    def _find_entity(self, conn: sqlite3.Connection, key: str) -> sqlite3.Row | None:
+        row = conn.execute(
+            "SELECT entity_id, name FROM entities WHERE name_key = ?",
+            (key,),
+        ).fetchone()
+        if row:
+            return row
+        # Soft contains match fallback (trigram index when available; it needs 3+ characters)
+        if self.name_index == "fts5" and len(key) >= 3:
+            return conn.execute(
+                """
+                SELECT e.entity_id, e.name
+                FROM entities_fts f
+                JOIN entities e ON e.rowid = f.rowid
+                WHERE entities_fts MATCH ?
+                ORDER BY e.mentions DESC, e.last_seen DESC
+                LIMIT 1
+                """,
+                ('"' + key.replace('"', '""') + '"',),
+            ).fetchone()
+        return conn.execute(
+            """
+            SELECT entity_id, name
+            FROM entities
+            WHERE name_key LIKE ?
+            ORDER BY mentions DESC, last_seen DESC
+            LIMIT 1
+            """,
+            (f"%{key}%",),
+        ).fetchone()
+
+    def query_related(
+        self,
+        entity: str,
+        limit: int = 10,
+        *,
+        depth: int | None = None,
+        fanout: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Query relations around a named entity, nearest first.
+
+        Walks up to ``depth`` hops (default ``expand_depth``), following at most
+        ``fanout`` of each entity's strongest edges (default ``expand_fanout``,
+        never fewer than ``limit`` for the entity itself).
+        """
         if not self.enabled:
             return []
         key = self._entity_key(entity)
         if not key:
             return []
+        limit = max(1, int(limit))
+        max_depth = max(1, int(depth or self.expand_depth))
+        max_fanout = max(1, int(fanout or self.expand_fanout))
         try:
-            with self._conn() as conn:
-                row = conn.execute(
-                    "SELECT entity_id, name FROM entities WHERE name_key = ?",
-                    (key,),
-                ).fetchone()
-                if not row:
-                    # Soft contains match fallback
-                    row = conn.execute(
-                        """
-                        SELECT entity_id, name
-                        FROM entities
-                        WHERE name_key LIKE ?
-                        ORDER BY mentions DESC, last_seen DESC
-                        LIMIT 1
-                        """,
-                        (f"%{key}%",),
-                    ).fetchone()
+            with self._pool.reader("graph_query") as conn:
+                row = self._find_entity(conn, key)
                 if not row:
                     return []
 
-                entity_id = str(row["entity_id"])
                 rows = conn.execute(
-                    """
-                    SELECT
-                        r.relation,
-                        s.name AS src_name,
-                        d.name AS dst_name,
-                        r.session_id,
-                        r.role,
-                        r.confidence,
-                        r.mentions,
-                        r.last_seen
-                    FROM relations r
-                    JOIN entities s ON s.entity_id = r.src_entity_id
-                    JOIN entities d ON d.entity_id = r.dst_entity_id
-                    WHERE r.src_entity_id = ? OR r.dst_entity_id = ?
-                    ORDER BY r.mentions DESC, r.last_seen DESC
-                    LIMIT ?
-                    """,
-                    (entity_id, entity_id, max(1, int(limit))),
+                    _NEIGHBOURHOOD_SQL,
+                    {
+                        "root": str(row["entity_id"]),
+                        "root_fanout": max(max_fanout, limit),
+                        "fanout": max_fanout,
+                        "depth": max_depth,
+                        "limit": limit,
+                    },
                 ).fetchall()
                 return [dict(item) for item in rows]
         except Exception as exc:
@@ -307,7 +509,7 @@ class GraphMemory:
             if not self.enabled:
                 return ""
             try:
-                with self._conn() as conn:
+                with self._pool.reader("graph_summarize") as conn:
                     fetched = conn.execute(
                         """
                         SELECT
@@ -350,10 +552,15 @@ class GraphMemory:
         if not self.enabled:
             return {"enabled": False, "entities": 0, "relations": 0}
         try:
-            with self._conn() as conn:
+            with self._pool.reader("graph_stats") as conn:
                 entities = conn.execute("SELECT COUNT(*) AS c FROM entities").fetchone()["c"]
                 relations = conn.execute("SELECT COUNT(*) AS c FROM relations").fetchone()["c"]
-            return {"enabled": True, "entities": int(entities), "relations": int(relations)}
+            return {
+                "enabled": True,
+                "entities": int(entities),
+                "relations": int(relations),
+                "storage": self._pool.get_stats(),
+            }
         except Exception as exc:
             logger.warning(f"GraphMemory stats failed: {exc}")
             return {"enabled": True, "entities": 0, "relations": 0, "error": str(exc)}
@@ -363,7 +570,7 @@ class GraphMemory:
         if not self.enabled:
             return {"status": "disabled"}
         try:
-            with self._conn() as conn:
+            with self._pool.reader("graph_health") as conn:
                 conn.execute("SELECT 1").fetchone()
             return {"status": "ok"}
         except Exception as exc:
@@ -27,6 +27,9 @@ class LazyProbeMemory(MemoryBackend):
         self._sqlite = SQLiteMemory(
             workspace=self._memory_workspace,
             enable_graph_memory=enable_graph,
+            # Only share the FTS5 table when the hybrid stack uses it too, so
+            # probe runs never add trigger overhead to a BM25 metadata.db.
+            lexical_engine="fts5" if self._memory_config.get("lexical_engine") == "fts5" else "like",
         )
         self._hybrid = None
         self._pending_index_rows: list[tuple[str, str, str, dict[str, Any] | None]] = []
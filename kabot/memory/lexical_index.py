@@ -0,0 +1,42 @@
+"""Selection of the keyword (lexical) search engine used by memory backends."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from loguru import logger
+
+from kabot.memory.bm25_index import BM25Index
+from kabot.memory.fts_index import FTS5Index, fts5_available
+
+# "like" is the unranked substring scan kept for the SQLite-only backend.
+LEXICAL_ENGINES = {"auto", "bm25", "fts5", "like"}
+
+LexicalIndex = BM25Index | FTS5Index
+
+
+def resolve_lexical_engine(requested: str | None, *, default: str, allowed: set[str]) -> str:
+    """Map a configured engine name to one this backend can actually run."""
+    engine = str(requested or "auto").strip().lower()
+    if engine not in LEXICAL_ENGINES:
+        logger.warning(f"Unknown lexical_engine='{requested}', using '{default}'")
+        engine = "auto"
+    if engine == "auto":
+        engine = default
+    if engine not in allowed:
+        logger.warning(f"lexical_engine='{engine}' is not supported by this backend, using '{default}'")
+        engine = default
+    if engine == "fts5" and not fts5_available():
+        fallback = "like" if "like" in allowed else "bm25"
+        logger.warning(f"SQLite was built without FTS5, using '{fallback}' for keyword search")
+        engine = fallback
+    return engine
+
+
+def create_lexical_index(engine: str, db_path: Path | str) -> LexicalIndex | None:
+    """Open the index for ``engine`` over ``db_path`` (None for ``like``)."""
+    if engine == "fts5":
+        return FTS5Index(db_path)
+    if engine == "bm25":
+        return BM25Index(db_path)
+    return None
@@ -0,0 +1,204 @@
+"""
+Bounded executor for the blocking work behind the async memory API.
+
+Chroma queries and writes, SQLite access, graph ingestion and MMR ranking
+are synchronous. ``HybridMemoryManager`` runs them here instead of on the
+event loop, so a slow recall no longer stalls every channel.
+
+Workers are a fixed thread pool (SQLite, Chroma and numpy release the GIL
+while they work). At most ``max_pending`` calls per event loop are admitted
+at a time; later callers wait for a slot instead of growing an unbounded
+backlog. Cancelling the awaiting task, or hitting its timeout, drops a call
+that has not started yet. A call that is already running finishes in its
+worker and its result is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 64
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+_USE_DEFAULT: Any = object()
+
+
+class MemoryExecutor:
+    """Fixed worker pool with admission control, timeouts and queue-depth metrics."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        timeout_seconds: float | None = DEFAULT_TIMEOUT_SECONDS,
+        name: str = "kabot-memory",
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending = max(self.max_workers, int(max_pending))
+        self.timeout_seconds = float(timeout_seconds) if timeout_seconds and timeout_seconds > 0 else None
+        self._name = name
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._waiting = 0
+        self._queued = 0
+        self._running = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._timed_out = 0
+        self._queue_wait_s = 0.0
+        self._queue_wait_max_s = 0.0
+        # op -> [count, total seconds, max seconds]
+        self._ops: dict[str, list[float]] = {}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self._name)
+            return self._pool
+
+    def _slots_for_running_loop(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_pending)
+            self._slots[loop] = slots
+        return slots
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            # Dropped before a worker picked it up.
+            with self._lock:
+                self._queued -= 1
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        op: str = "memory",
+        timeout: float | None = _USE_DEFAULT,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` on a worker and return its result.
+
+        ``timeout`` (seconds, ``None`` for no limit) defaults to the
+        executor's ``timeout_seconds`` and covers waiting for a slot as well
+        as the call itself; it raises ``TimeoutError``.
+        """
+        limit = self.timeout_seconds if timeout is _USE_DEFAULT else timeout
+        deadline = asyncio.get_running_loop().time() + limit if limit else None
+        slots = self._slots_for_running_loop()
+        with self._lock:
+            self._waiting += 1
+        try:
+            async with asyncio.timeout_at(deadline):
+                await slots.acquire()
+        except TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            raise
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        try:
+            enqueued_at = time.perf_counter()
+
+            def call() -> T:
+                started = time.perf_counter()
+                with self._lock:
+                    self._queued -= 1
+                    self._running += 1
+                    wait = started - enqueued_at
+                    self._queue_wait_s += wait
+                    self._queue_wait_max_s = max(self._queue_wait_max_s, wait)
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    with self._lock:
+                        self._running -= 1
+                        entry = self._ops.get(op)
+                        if entry is None:
+                            self._ops[op] = [1, elapsed, elapsed]
+                        else:
+                            entry[0] += 1
+                            entry[1] += elapsed
+                            entry[2] = max(entry[2], elapsed)
+
+            with self._lock:
+                self._queued += 1
+                self._max_queue_depth = max(self._max_queue_depth, self._queued)
+            future = self._executor().submit(call)
+            future.add_done_callback(self._on_done)
+            try:
+                async with asyncio.timeout_at(deadline):
+                    result = await asyncio.wrap_future(future)
+            except TimeoutError:
+                future.cancel()
+                with self._lock:
+                    self._timed_out += 1
+                raise
+            except asyncio.CancelledError:
+                future.cancel()
+                with self._lock:
+                    self._cancelled += 1
+                raise
+            except Exception:
+                with self._lock:
+                    self._failed += 1
+                raise
+            with self._lock:
+                self._completed += 1
+            return result
+        finally:
+            slots.release()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the workers; queued calls are cancelled, running ones finish."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "waiting": self._waiting,
+                "queued": self._queued,
+                "running": self._running,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "timed_out": self._timed_out,
+                "queue_wait_ms_total": round(self._queue_wait_s * 1000, 3),
+                "queue_wait_ms_max": round(self._queue_wait_max_s * 1000, 3),
+                "operations": {
+                    name: {
+                        "count": int(count),
+                        "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+                        "max_ms": round(peak * 1000, 3),
+                    }
+                    for name, (count, total, peak) in sorted(self._ops.items())
+                },
+            }
+
+
+__all__ = ["MemoryExecutor"]
@@ -11,6 +11,12 @@ from kabot.memory.memory_backend import MemoryBackend
 # Supported backends — add new entries here to register new engines.
 SUPPORTED_BACKENDS = {"hybrid", "sqlite_only", "disabled"}
 DEFAULT_AUTO_UNLOAD_SECONDS = 300
+DEFAULT_EMBEDDING_CACHE_MB = 256
+DEFAULT_IO_WORKERS = 4
+DEFAULT_IO_QUEUE_LIMIT = 64
+DEFAULT_IO_TIMEOUT_SECONDS = 30.0
+DEFAULT_WRITE_BEHIND_BATCH = 32
+DEFAULT_WRITE_BEHIND_DELAY_MS = 500
 
 
 class MemoryFactory:
@@ -22,7 +28,16 @@ class MemoryFactory:
         "backend": "hybrid",           // "hybrid" | "sqlite_only" | "disabled"
         "embedding_provider": "sentence", // "sentence" | "ollama"
         "embedding_model": "all-MiniLM-L6-v2",
-        "enable_hybrid_search": true
+        "enable_hybrid_search": true,
+        "graph_expand_depth": 2,        // hops walked from an entity for graph context
+        "graph_expand_fanout": 16,      // strongest edges followed per entity on each hop
+        "lexical_engine": "auto",       // "auto" | "bm25" | "fts5" | "like" (sqlite_only)
+        "embedding_cache_mb": 256,      // persistent embedding cache budget, 0 disables
+        "io_workers": 4,                // threads for blocking Chroma/SQLite work
+        "io_queue_limit": 64,           // memory calls admitted to those threads at once
+        "io_timeout_seconds": 30,       // per-call limit for memory I/O, 0 disables
+        "write_behind_batch": 32,       // messages written per batch, 0 writes each inline
+        "write_behind_delay_ms": 500    // longest a queued message waits for its batch
       }
     }
     """
@@ -63,6 +78,7 @@ class MemoryFactory:
             return SQLiteMemory(
                 workspace=workspace / "memory_db",
                 enable_graph_memory=bool(memory_config.get("enable_graph_memory", True)),
+                lexical_engine=str(memory_config.get("lexical_engine") or "auto"),
             )
 
         if lazy_probe:
@@ -86,6 +102,8 @@ class MemoryFactory:
         enable_hybrid = memory_config.get("enable_hybrid_search", True)
         enable_graph = bool(memory_config.get("enable_graph_memory", True))
         graph_injection_limit = int(memory_config.get("graph_injection_limit", 8) or 8)
+        graph_expand_depth = int(memory_config.get("graph_expand_depth", 2) or 2)
+        graph_expand_fanout = int(memory_config.get("graph_expand_fanout", 16) or 16)
 
         # Get auto-unload timeout with validation
         auto_unload_seconds = memory_config.get("auto_unload_timeout", DEFAULT_AUTO_UNLOAD_SECONDS)
@@ -100,6 +118,41 @@ class MemoryFactory:
             )
             auto_unload_seconds = DEFAULT_AUTO_UNLOAD_SECONDS
 
+        embedding_cache_mb = memory_config.get("embedding_cache_mb", DEFAULT_EMBEDDING_CACHE_MB)
+        if not isinstance(embedding_cache_mb, int) or embedding_cache_mb < 0:
+            logger.warning(
+                f"Invalid embedding_cache_mb={embedding_cache_mb!r}, using default {DEFAULT_EMBEDDING_CACHE_MB}"
+            )
+            embedding_cache_mb = DEFAULT_EMBEDDING_CACHE_MB
+
+        io_workers = memory_config.get("io_workers", DEFAULT_IO_WORKERS)
+        if not isinstance(io_workers, int) or io_workers < 1:
+            logger.warning(f"Invalid io_workers={io_workers!r}, using default {DEFAULT_IO_WORKERS}")
+            io_workers = DEFAULT_IO_WORKERS
+        io_queue_limit = memory_config.get("io_queue_limit", DEFAULT_IO_QUEUE_LIMIT)
+        if not isinstance(io_queue_limit, int) or io_queue_limit < 1:
+            logger.warning(f"Invalid io_queue_limit={io_queue_limit!r}, using default {DEFAULT_IO_QUEUE_LIMIT}")
+            io_queue_limit = DEFAULT_IO_QUEUE_LIMIT
+        io_timeout_seconds = memory_config.get("io_timeout_seconds", DEFAULT_IO_TIMEOUT_SECONDS)
+        if isinstance(io_timeout_seconds, bool) or not isinstance(io_timeout_seconds, (int, float)) or io_timeout_seconds < 0:
+            logger.warning(
+                f"Invalid io_timeout_seconds={io_timeout_seconds!r}, using default {DEFAULT_IO_TIMEOUT_SECONDS}s"
+            )
+            io_timeout_seconds = DEFAULT_IO_TIMEOUT_SECONDS
+        write_behind_batch = memory_config.get("write_behind_batch", DEFAULT_WRITE_BEHIND_BATCH)
+        if isinstance(write_behind_batch, bool) or not isinstance(write_behind_batch, int) or write_behind_batch < 0:
+            logger.warning(
+                f"Invalid write_behind_batch={write_behind_batch!r}, using default {DEFAULT_WRITE_BEHIND_BATCH}"
+            )
+            write_behind_batch = DEFAULT_WRITE_BEHIND_BATCH
+        write_behind_delay_ms = memory_config.get("write_behind_delay_ms", DEFAULT_WRITE_BEHIND_DELAY_MS)
+        if isinstance(write_behind_delay_ms, bool) or not isinstance(write_behind_delay_ms, int) or write_behind_delay_ms < 0:
+            logger.warning(
+                f"Invalid write_behind_delay_ms={write_behind_delay_ms!r}, "
+                f"using default {DEFAULT_WRITE_BEHIND_DELAY_MS}ms"
+            )
+            write_behind_delay_ms = DEFAULT_WRITE_BEHIND_DELAY_MS
+
         logger.info(
             f"Memory backend: hybrid "
             f"(embeddings={embedding_provider}, model={embedding_model})"
@@ -111,5 +164,14 @@ class MemoryFactory:
             enable_hybrid_memory=enable_hybrid,
             enable_graph_memory=enable_graph,
             graph_injection_limit=max(1, graph_injection_limit),
+            graph_expand_depth=max(1, graph_expand_depth),
+            graph_expand_fanout=max(1, graph_expand_fanout),
             auto_unload_seconds=auto_unload_seconds,
+            lexical_engine=str(memory_config.get("lexical_engine") or "auto"),
+            embedding_cache_mb=embedding_cache_mb,
+            io_workers=io_workers,
+            io_queue_limit=io_queue_limit,
+            io_timeout_seconds=float(io_timeout_seconds),
+            write_behind_batch=write_behind_batch,
+            write_behind_delay_ms=write_behind_delay_ms,
         )
@@ -24,16 +24,16 @@ class MemoryPruner:
             Number of deleted facts.
         """
         try:
-            with store._get_connection() as conn:
-                cursor = conn.execute(
+            deleted = store._pool.write(
+                lambda conn: conn.execute(
                     "DELETE FROM facts WHERE created_at < datetime('now', ?)",
                     (f"-{self.max_age_days} days",),
-                )
-                deleted = cursor.rowcount
-                conn.commit()
-                if deleted > 0:
-                    logger.info(f"Pruned {deleted} stale facts (>{self.max_age_days} days)")
-                return deleted
+                ).rowcount,
+                "prune_facts",
+            )
+            if deleted > 0:
+                logger.info(f"Pruned {deleted} stale facts (>{self.max_age_days} days)")
+            return deleted
         except Exception as e:
             logger.error(f"Error pruning facts: {e}")
             return 0
@@ -45,16 +45,16 @@ class MemoryPruner:
             Number of deleted messages.
         """
         try:
-            with store._get_connection() as conn:
-                cursor = conn.execute(
+            deleted = store._pool.write(
+                lambda conn: conn.execute(
                     "DELETE FROM messages WHERE created_at < datetime('now', ?)",
                     (f"-{self.max_age_days} days",),
-                )
-                deleted = cursor.rowcount
-                conn.commit()
-                if deleted > 0:
-                    logger.info(f"Pruned {deleted} stale messages (>{self.max_age_days} days)")
-                return deleted
+                ).rowcount,
+                "prune_messages",
+            )
+            if deleted > 0:
+                logger.info(f"Pruned {deleted} stale messages (>{self.max_age_days} days)")
+            return deleted
         except Exception as e:
             logger.error(f"Error pruning messages: {e}")
             return 0
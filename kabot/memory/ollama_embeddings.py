@@ -5,6 +5,8 @@ import hashlib
 import httpx
 from loguru import logger
 
+from kabot.memory.embedding_cache import EmbeddingCache
+
 
 class OllamaEmbeddingProvider:
     """
@@ -16,11 +18,13 @@ class OllamaEmbeddingProvider:
     - all-minilm
     """
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "nomic-embed-text"):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "nomic-embed-text",
+                 cache: EmbeddingCache | None = None):
         self.base_url = base_url
         self.model = model
         self._cache = {}  # Simple LRU cache
         self._cache_size = 1000
+        self.persistent_cache = cache  # Optional on-disk cache shared across restarts
 
     async def embed(self, text: str) -> list[float] | None:
         """
@@ -37,6 +41,13 @@ class OllamaEmbeddingProvider:
             cache_key = hashlib.md5(text.encode()).hexdigest()
             if cache_key in self._cache:
                 return self._cache[cache_key]
+            if self.persistent_cache is not None:
+                embedding = await self.persistent_cache.aget(text)
+                if embedding:
+                    if len(self._cache) >= self._cache_size:
+                        self._cache.pop(next(iter(self._cache)))
+                    self._cache[cache_key] = embedding
+                    return embedding
 
             url = f"{self.base_url}/api/embeddings"
             payload = {
@@ -60,6 +71,8 @@ class OllamaEmbeddingProvider:
                         # Remove oldest entry (simple FIFO)
                         self._cache.pop(next(iter(self._cache)))
                     self._cache[cache_key] = embedding
+                    if self.persistent_cache is not None:
+                        await self.persistent_cache.aput(text, embedding)
 
                 return embedding
 
@@ -5,11 +5,17 @@ when it's terminated, the OS reclaims ALL memory immediately — solving CPython
 arena-allocator retention issue where ~350 MB stays resident after `del`.
 
 Architecture:
-  Main process (91 MB) ──JSON line──▶ Worker process (loads model, +359 MB)
-                        ◀──JSON line──  │
-                                        └─ process.kill() → OS reclaims all 359 MB → main stays at 91 MB
+  Main process (91 MB) ──JSON line requests──▶ Worker process (loads model, +359 MB)
+                        ◀──header + float32──   │
+                                                └─ process.kill() → OS reclaims all 359 MB → main stays at 91 MB
+
+Requests are multiplexed: each carries an id, a reader thread routes the
+response frames back to per-request futures, and the worker coalesces
+requests that arrive together into one ``model.encode`` batch. See
+``kabot.memory._embedding_worker`` for the wire format.
 """
 
+import asyncio
 import hashlib
 import json
 import os
@@ -17,9 +23,78 @@ import subprocess
 import sys
 import threading
 import time
+from array import array
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 from loguru import logger
 
+from kabot.memory.embedding_cache import EmbeddingCache
+
+REQUEST_TIMEOUT_S = 30.0
+
+
+def _decode_vectors(payload: bytes, shape) -> list[list[float]]:
+    """Unpack a little-endian float32 response payload into rows."""
+    rows, dims = (int(n) for n in shape)
+    values = array("f")
+    values.frombytes(payload)
+    if sys.byteorder != "little":
+        values.byteswap()
+    flat = values.tolist()
+    return [flat[row * dims:(row + 1) * dims] for row in range(rows)]
+
+
+def _read_exact(stream, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _resolve(future: Future, result=None, error: Exception | None = None) -> None:
+    # A caller that timed out has already cancelled its future.
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _WorkerChannel:
+    """Requests in flight on one worker process, keyed by request id."""
+
+    def __init__(self, process):
+        self.process = process
+        self.pending: dict[int, Future] = {}
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def register(self, req_id: int, future: Future) -> bool:
+        with self._lock:
+            if self.closed:
+                return False
+            self.pending[req_id] = future
+        future.add_done_callback(lambda _f: self.pop(req_id))
+        return True
+
+    def pop(self, req_id) -> Future | None:
+        with self._lock:
+            return self.pending.pop(req_id, None)
+
+    def close(self, error: Exception) -> None:
+        with self._lock:
+            self.closed = True
+            pending, self.pending = self.pending, {}
+        for future in pending.values():
+            _resolve(future, error=error)
+
 
 class SentenceEmbeddingProvider:
     """Local embedding provider using Sentence-Transformers in a subprocess.
@@ -34,7 +109,12 @@ class SentenceEmbeddingProvider:
     - paraphrase-multilingual-MiniLM-L12-v2 (multilingual support)
     """
 
-    def __init__(self, model: str = "all-MiniLM-L6-v2", auto_unload_seconds: int = 300):
+    def __init__(
+        self,
+        model: str = "all-MiniLM-L6-v2",
+        auto_unload_seconds: int = 300,
+        cache: EmbeddingCache | None = None,
+    ):
         if auto_unload_seconds < 0:
             raise ValueError("auto_unload_seconds must be >= 0")
         self.model_name = model
@@ -47,15 +127,18 @@ class SentenceEmbeddingProvider:
         # Embedding cache (lives in main process, lightweight)
         self._cache: dict[str, list[float]] = {}
         self._cache_size = 1000
+        # Optional on-disk cache; hits there never start the worker process.
+        self.persistent_cache = cache
 
         # Timing and thread safety
         self._last_used: float | None = None
         self._unload_timer: threading.Timer | None = None
         self._lock = threading.RLock()
-        # Serialize stdin/stdout request-response exchange; concurrent callers can
-        # otherwise interleave reads and cause malformed JSON framing on Windows.
+        # Serializes writes of request lines only; responses are matched by id
+        # on the reader thread, so many requests can be in flight at once.
         self._io_lock = threading.Lock()
         self._req_counter = 0
+        self._channel: _WorkerChannel | None = None
 
     def _is_subprocess_alive(self) -> bool:
         """Check if the embedding subprocess is running."""
@@ -93,8 +176,6 @@ class SentenceEmbeddingProvider:
                 # (64KB on Windows), the subprocess blocks and never sends init to stdout.
                 # DEVNULL keeps startup quiet without risking deadlocks from unread stderr.
                 stderr=subprocess.DEVNULL,
-                text=True,
-                bufsize=1,
                 env=env,
             )
 
@@ -111,9 +192,9 @@ class SentenceEmbeddingProvider:
                         continue
                     try:
                         candidate = json.loads(ready_line)
-                    except json.JSONDecodeError:
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         # Worker/process dependencies may emit non-JSON noise.
-                        logger.debug(f"Ignoring non-JSON embedding init output: {ready_line[:200]}")
+                        logger.debug(f"Ignoring non-JSON embedding init output: {ready_line[:200]!r}")
                         continue
                     if isinstance(candidate, dict) and candidate.get("id") == "init":
                         ready = candidate
@@ -125,12 +206,63 @@ class SentenceEmbeddingProvider:
                     raise RuntimeError(f"Subprocess init failed: {ready}")
 
                 logger.info(f"Embedding subprocess ready (PID={self._process.pid})")
+                self._start_reader()
 
             except Exception as e:
                 logger.error(f"Embedding subprocess startup failed: {e}")
                 self._kill_subprocess()
                 raise
 
+    def _start_reader(self) -> None:
+        """Start routing response frames of the current process to their futures."""
+        channel = _WorkerChannel(self._process)
+        self._channel = channel
+        threading.Thread(
+            target=self._read_responses,
+            args=(channel,),
+            name="embedding-worker-reader",
+            daemon=True,
+        ).start()
+
+    def _read_responses(self, channel: _WorkerChannel) -> None:
+        stdout = channel.process.stdout
+        error = RuntimeError("Subprocess closed stdout unexpectedly")
+        try:
+            while True:
+                line = stdout.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    header = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Ignore external progress/warning output if any appears on stdout.
+                    logger.debug(f"Ignoring non-JSON embedding worker output: {line[:200]!r}")
+                    continue
+                if not isinstance(header, dict):
+                    continue
+
+                nbytes = int(header.get("nbytes") or 0)
+                payload = _read_exact(stdout, nbytes) if nbytes else b""
+                if len(payload) < nbytes:
+                    break
+
+                future = channel.pop(header.get("id"))
+                if future is None:
+                    # Out-of-band event or a request that already timed out.
+                    continue
+                if header.get("status") == "error":
+                    _resolve(future, error=RuntimeError(f"Embedding error: {header.get('result')}"))
+                elif "shape" in header:
+                    _resolve(future, _decode_vectors(payload, header["shape"]))
+                else:
+                    _resolve(future, header.get("result"))
+        except (OSError, ValueError) as e:
+            error = RuntimeError(f"Subprocess pipe broken: {e}")
+        channel.close(error)
+
     def _kill_subprocess(self, graceful_timeout: float = 1.0):
         """Terminate the subprocess; OS reclaims ALL its memory."""
         if self._process is not None:
@@ -139,7 +271,9 @@ class SentenceEmbeddingProvider:
                 # Try graceful shutdown first
                 if self._process.poll() is None:
                     try:
-                        self._process.stdin.write(json.dumps({"id": "shutdown", "type": "shutdown"}) + "\n")
+                        self._process.stdin.write(
+                            (json.dumps({"id": "shutdown", "type": "shutdown"}) + "\n").encode("utf-8")
+                        )
                         self._process.stdin.flush()
                         # Keep graceful shutdown brief so auto-unload is timely.
                         self._process.wait(timeout=max(0.0, graceful_timeout))
@@ -162,61 +296,65 @@ class SentenceEmbeddingProvider:
                     except Exception:
                         pass
                 self._process = None
+                if self._channel is not None:
+                    self._channel.close(RuntimeError("Embedding subprocess stopped"))
+                    self._channel = None
                 logger.info(f"Embedding subprocess terminated (PID={pid}) — memory returned to OS")
 
-    def _send_request(self, req_type: str, data) -> any:
-        """Send a request to the subprocess and wait for JSON response."""
+    def _submit(self, req_type: str, data) -> Future:
+        """Write one request line; the reader thread resolves the returned future."""
+        self._start_subprocess()
+        future: Future = Future()
         with self._io_lock:
-            self._start_subprocess()
+            channel = self._channel
+            if channel is None or channel.process is not self._process:
+                raise RuntimeError("Embedding subprocess is not running")
             self._req_counter += 1
-            req_id = f"req_{self._req_counter}"
-
-            request = json.dumps({"id": req_id, "type": req_type, "data": data})
+            req_id = self._req_counter
+            if not channel.register(req_id, future):
+                raise RuntimeError("Embedding subprocess stopped")
 
+            request = json.dumps({"id": req_id, "type": req_type, "data": data}) + "\n"
             try:
-                self._process.stdin.write(request + "\n")
-                self._process.stdin.flush()
-
-                deadline = time.time() + 30
-                while time.time() < deadline:
-                    response_line = self._process.stdout.readline()
-                    if not response_line:
-                        raise RuntimeError("Subprocess closed stdout unexpectedly")
-                    response_line = response_line.strip()
-                    if not response_line:
-                        continue
-
-                    try:
-                        response = json.loads(response_line)
-                    except json.JSONDecodeError:
-                        # Ignore external progress/warning output if any appears on stdout.
-                        logger.debug(f"Ignoring non-JSON embedding worker output: {response_line[:200]}")
-                        continue
-
-                    if not isinstance(response, dict):
-                        continue
-
-                    response_id = response.get("id")
-                    if response_id and response_id != req_id:
-                        # Ignore out-of-band events / stale lines from previous requests.
-                        continue
-
-                    if response.get("status") == "error":
-                        raise RuntimeError(f"Embedding error: {response.get('result')}")
-
-                    return response.get("result")
-
-                raise RuntimeError("Embedding worker request timeout")
-
-            except (BrokenPipeError, OSError) as e:
+                channel.process.stdin.write(request.encode("utf-8"))
+                channel.process.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError) as e:
                 logger.error(f"Subprocess pipe broken: {e}")
                 self._kill_subprocess()
                 raise RuntimeError("Embedding subprocess crashed") from e
+        return future
+
+    def _send_request(self, req_type: str, data) -> any:
+        """Send a request to the subprocess and block until its response arrives."""
+        try:
+            return self._submit(req_type, data).result(timeout=REQUEST_TIMEOUT_S)
+        except FutureTimeoutError:
+            raise RuntimeError("Embedding worker request timeout") from None
+
+    async def _request(self, req_type: str, data) -> any:
+        """Awaitable request; no executor thread is held while waiting."""
+        if not self._is_subprocess_alive():
+            # Model load blocks for seconds, keep it off the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self._start_subprocess)
+        future = self._submit(req_type, data)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=REQUEST_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Embedding worker request timeout") from None
+
+    def _touch(self) -> None:
+        self._last_used = time.time()
+        if self._auto_unload_enabled:
+            self._reset_unload_timer()
+
+    def _cache_put(self, cache_key: str, embedding: list[float]) -> None:
+        if len(self._cache) >= self._cache_size:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[cache_key] = embedding
 
     async def warmup(self):
         """Pre-load the embedding model subprocess in background (non-blocking)."""
-        import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._start_subprocess)
 
     async def embed(self, text: str) -> list[float] | None:
@@ -232,28 +370,23 @@ class SentenceEmbeddingProvider:
             # Check cache (cache is in main process — zero overhead)
             cache_key = hashlib.md5(text.encode()).hexdigest()
             if cache_key in self._cache:
-                self._last_used = time.time()
-                if self._auto_unload_enabled:
-                    self._reset_unload_timer()
+                self._touch()
                 return self._cache[cache_key]
 
-            # Run blocking subprocess I/O in thread executor
-            # Note: no lock here — subprocess pipe is inherently serialized
-            import asyncio
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None, self._send_request, "embed", text
-            )
-            self._last_used = time.time()
+            if self.persistent_cache is not None:
+                embedding = await self.persistent_cache.aget(text)
+                if embedding:
+                    self._cache_put(cache_key, embedding)
+                    self._touch()
+                    return embedding
 
+            rows = await self._request("embed", text)
+            embedding = rows[0] if rows else None
             if embedding:
-                if len(self._cache) >= self._cache_size:
-                    self._cache.pop(next(iter(self._cache)))
-                self._cache[cache_key] = embedding
-
-            if self._auto_unload_enabled:
-                self._reset_unload_timer()
-
+                self._cache_put(cache_key, embedding)
+                if self.persistent_cache is not None:
+                    await self.persistent_cache.aput(text, embedding)
+            self._touch()
             return embedding
 
         except Exception as e:
@@ -263,6 +396,9 @@ class SentenceEmbeddingProvider:
     async def embed_batch(self, texts: list[str]) -> list[list[float] | None]:
         """Generate embeddings for multiple texts.
 
+        Cached texts (in process, then on disk) are served locally; the rest
+        go to the worker in one request.
+
         Args:
             texts: List of texts to embed
 
@@ -270,26 +406,29 @@ class SentenceEmbeddingProvider:
             List of embeddings
         """
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                None, self._send_request, "embed_batch", texts
-            )
-            self._last_used = time.time()
-
-            # Cache results
-            results = []
-            for text, embedding in zip(texts, embeddings):
-                cache_key = hashlib.md5(text.encode()).hexdigest()
-                if len(self._cache) >= self._cache_size:
-                    self._cache.pop(next(iter(self._cache)))
-                self._cache[cache_key] = embedding
-                results.append(embedding)
-
-            if self._auto_unload_enabled:
-                self._reset_unload_timer()
-
-            return results
+            keys = [hashlib.md5(text.encode()).hexdigest() for text in texts]
+            misses = list(dict.fromkeys(
+                text for text, key in zip(texts, keys) if key not in self._cache
+            ))
+            fresh: dict[str, list[float]] = {}
+            if misses and self.persistent_cache is not None:
+                stored = await self.persistent_cache.aget_many(misses)
+                fresh = {text: embedding for text, embedding in zip(misses, stored) if embedding}
+                misses = [text for text in misses if text not in fresh]
+            if misses:
+                rows = await self._request("embed_batch", misses)
+                computed = dict(zip(misses, rows))
+                if self.persistent_cache is not None:
+                    await self.persistent_cache.aput_many(list(computed.items()))
+                fresh.update(computed)
+            for text, embedding in fresh.items():
+                if embedding:
+                    self._cache_put(hashlib.md5(text.encode()).hexdigest(), embedding)
+            self._touch()
+            return [
+                fresh[text] if text in fresh else self._cache.get(key)
+                for text, key in zip(texts, keys)
+            ]
 
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
@@ -344,6 +483,7 @@ class SentenceEmbeddingProvider:
             "auto_unload_seconds": self._auto_unload_seconds,
             "auto_unload_enabled": self._auto_unload_enabled,
             "cache_size": len(self._cache),
+            "in_flight": len(self._channel.pending) if self._channel else 0,
         }
 
     def __del__(self):
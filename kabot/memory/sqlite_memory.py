@@ -6,6 +6,8 @@ from pathlib import Path
 
 from loguru import logger
 
+from kabot.memory.bm25_index import fact_document
+from kabot.memory.lexical_index import create_lexical_index, resolve_lexical_engine
 from kabot.memory.memory_backend import MemoryBackend
 from kabot.memory.sqlite_store import SQLiteMetadataStore
 
@@ -14,13 +16,24 @@ class SQLiteMemory(MemoryBackend):
     """Lightweight memory using only SQLite. No ChromaDB, no embeddings.
 
     Best for: Termux, Raspberry Pi, low-resource environments.
-    Search uses SQL LIKE (keyword match), not semantic similarity.
+    Search is keyword-based, not semantic: ranked FTS5 matching by default,
+    or the incremental BM25 index / plain SQL LIKE via ``lexical_engine``.
     """
 
-    def __init__(self, workspace: Path, enable_graph_memory: bool = True):
+    def __init__(self, workspace: Path, enable_graph_memory: bool = True,
+                 lexical_engine: str = "auto"):
         self.workspace = Path(workspace)
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.metadata = SQLiteMetadataStore(self.workspace / "metadata.db")
+        self.lexical_engine = resolve_lexical_engine(
+            lexical_engine, default="fts5", allowed={"fts5", "bm25", "like"}
+        )
+        self.lexical_index = None
+        try:
+            self.lexical_index = create_lexical_index(self.lexical_engine, self.metadata.db_path)
+        except Exception as e:
+            logger.warning(f"SQLiteMemory keyword index unavailable, using LIKE search: {e}")
+            self.lexical_engine = "like"
         self.graph = None
         if enable_graph_memory:
             try:
@@ -41,42 +54,62 @@ class SQLiteMemory(MemoryBackend):
             tool_results=tool_results,
             metadata=metadata,
         )
+        if self.lexical_index:
+            self.lexical_index.add_document("message", msg_id, content, session_id=session_id)
         if self.graph:
             self.graph.ingest_text(session_id=session_id, role=role, content=content)
         return msg_id
 
     def search_memory(self, query, session_id=None, limit=5):
-        """Keyword-based search using SQL LIKE."""
-        try:
-            with self.metadata._get_connection() as conn:
-                if session_id:
-                    rows = conn.execute(
-                        "SELECT message_id, content, role, created_at FROM messages "
-                        "WHERE session_id = ? AND content LIKE ? "
-                        "ORDER BY created_at DESC LIMIT ?",
-                        (session_id, f"%{query}%", limit),
-                    ).fetchall()
-                else:
-                    rows = conn.execute(
-                        "SELECT message_id, content, role, created_at FROM messages "
-                        "WHERE content LIKE ? "
-                        "ORDER BY created_at DESC LIMIT ?",
-                        (f"%{query}%", limit),
-                    ).fetchall()
-            return [
-                {"id": r[0], "content": r[1], "role": r[2],
-                 "created_at": r[3], "score": 1.0}
-                for r in rows
-            ]
-        except Exception as e:
-            logger.error(f"SQLiteMemory search error: {e}")
+        """Keyword-based search (ranked index, or SQL LIKE as the fallback)."""
+        if self.lexical_index:
+            try:
+                return self._search_index(query, session_id=session_id, limit=limit)
+            except Exception as e:
+                logger.warning(f"SQLiteMemory {self.lexical_engine} search failed, using LIKE: {e}")
+        rows = self.metadata.search_messages(query, session_id=session_id, limit=limit)
+        return [
+            {"id": r["message_id"], "content": r["content"], "role": r["role"],
+             "created_at": r["created_at"], "score": 1.0}
+            for r in rows
+        ]
+
+    def _search_index(self, query, session_id=None, limit=5):
+        self.lexical_index.ensure_synced()
+        hits = self.lexical_index.search(query, limit=limit, session_id=session_id)
+        if not hits:
             return []
+        message_ids = [doc_id for doc_type, doc_id, _ in hits if doc_type == "message"]
+        fact_ids = [doc_id for doc_type, doc_id, _ in hits if doc_type == "fact"]
+        rows: dict[tuple[str, str], dict] = {}
+        if message_ids:
+            for message_id, r in self.metadata.get_messages_by_ids(message_ids).items():
+                rows[("message", message_id)] = {
+                    "id": message_id, "content": r["content"], "role": r["role"],
+                    "created_at": r["created_at"],
+                }
+        if fact_ids:
+            for fact_id, r in self.metadata.get_facts_by_ids(fact_ids).items():
+                rows[("fact", fact_id)] = {
+                    "id": fact_id, "content": fact_document(r["category"], r["value"]),
+                    "role": "system", "created_at": r["created_at"],
+                }
+        results = []
+        for doc_type, doc_id, score in hits:
+            item = rows.get((doc_type, doc_id))
+            if item:
+                results.append({**item, "score": score})
+        return results
 
     def remember_fact(self, fact, category="general", session_id=None,
                       confidence=1.0):
         fact_id = str(uuid.uuid4())
         self.metadata.add_fact(fact_id, category, category, fact,
                                session_id=session_id, confidence=confidence)
+        if self.lexical_index:
+            self.lexical_index.add_document(
+                "fact", fact_id, fact_document(category, fact), session_id=session_id
+            )
         if self.graph:
             self.graph.ingest_text(
                 session_id=session_id or "global",
@@ -113,6 +146,7 @@ class SQLiteMemory(MemoryBackend):
     def get_stats(self):
         base = self.metadata.get_stats()
         base["backend"] = "sqlite_only"
+        base["lexical_engine"] = self.lexical_engine
         if self.graph:
             base["graph"] = self.graph.get_stats()
         return base
@@ -127,6 +161,14 @@ class SQLiteMemory(MemoryBackend):
         except Exception as e:
             return {"status": "error", "backend": "sqlite_only", "error": str(e)}
 
+    def close(self) -> None:
+        """Release the SQLite pools held by the store and its indexes."""
+        if self.lexical_index:
+            self.lexical_index.close()
+        if self.graph:
+            self.graph.close()
+        self.metadata.close()
+
     def search_graph(self, entity: str, limit: int = 10) -> list[dict]:
         if not self.graph:
             return []
@@ -0,0 +1,304 @@
+"""
+Shared SQLite access layer for the memory stores.
+
+There is one :class:`SQLitePool` per database file (see :func:`get_sqlite_pool`),
+shared by every store on that file; each owner calls :meth:`SQLitePool.release`
+when done and the last release closes the connections:
+
+- reads run on a long-lived connection per thread, configured once, whose
+  statement cache keeps prepared statements across calls;
+- writes are callables queued to a single writer thread that runs whatever
+  is waiting as one group-committed transaction, each write inside its own
+  savepoint so a failing write does not roll back the rest of the batch.
+  Callers block until their batch commits, so a write is durable and visible
+  to readers when it returns.
+
+Per-operation latency and time spent waiting for the writer/database lock
+are reported by :meth:`SQLitePool.get_stats`.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+STATEMENT_CACHE_SIZE = 256
+MAX_WRITE_BATCH = 64
+# The writer thread exits after this long without work and restarts on demand.
+WRITER_IDLE_SECONDS = 5.0
+BUSY_TIMEOUT_MS = 5000
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=30000000;",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS};",
+)
+
+
+class SQLitePool:
+    """Per-thread reader connections plus one group-committing writer for a database file."""
+
+    def __init__(self, db_path: Path | str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._readers: list[sqlite3.Connection] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._writer_thread: threading.Thread | None = None
+        self._writer_conn: sqlite3.Connection | None = None
+        self._closed = False
+        self._refs = 0
+        # op -> [count, total seconds, max seconds]
+        self._ops: dict[str, list[float]] = {}
+        self._batches = 0
+        self._writes = 0
+        self._max_batch = 0
+        self._queue_wait_s = 0.0
+        self._lock_wait_s = 0.0
+        self._lock_wait_max_s = 0.0
+        # journal_mode is persistent and cannot change inside a transaction: set it once up front.
+        conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_MS / 1000)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL;")
+        finally:
+            conn.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _open(self, *, isolation_level: str | None = "") -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            isolation_level=isolation_level,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _record(self, op: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._ops.get(op)
+            if entry is None:
+                self._ops[op] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    # ── Reads ───────────────────────────────────────────────────
+
+    def _reader_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._closed:
+                raise sqlite3.ProgrammingError(f"SQLite pool for {self.db_path} is closed")
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def reader(self, op: str = "read") -> Iterator[sqlite3.Connection]:
+        """This thread's connection; anything left uncommitted is rolled back on exit."""
+        conn = self._reader_connection()
+        started = time.perf_counter()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._record(op, time.perf_counter() - started)
+
+    # ── Writes ──────────────────────────────────────────────────
+
+    def write(self, fn: Callable[[sqlite3.Connection], T], op: str = "write") -> T:
+        """
+        Run ``fn(conn)`` on the writer connection and return its result once
+        the transaction containing it has committed. ``fn`` must not commit.
+        """
+        if threading.current_thread() is self._writer_thread and self._writer_conn is not None:
+            # A write issued from inside another write joins the current transaction.
+            return fn(self._writer_conn)
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"SQLite pool for {self.db_path} is closed")
+        future: Future = Future()
+        self._queue.put((fn, op, time.perf_counter(), future))
+        self._ensure_writer()
+        return future.result()
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop,
+                    name=f"sqlite-writer:{self.db_path.name}",
+                    daemon=True,
+                )
+                self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        conn = self._open(isolation_level=None)
+        self._writer_conn = conn
+        try:
+            while True:
+                try:
+                    first = self._queue.get(timeout=WRITER_IDLE_SECONDS)
+                except queue.Empty:
+                    with self._lock:
+                        if self._queue.empty():
+                            self._writer_thread = None
+                            self._writer_conn = None
+                            return
+                    continue
+                batch = [first]
+                while len(batch) < MAX_WRITE_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                self._run_batch(conn, batch)
+        finally:
+            conn.close()
+
+    def _run_batch(self, conn: sqlite3.Connection, batch: list[tuple[Any, str, float, Future]]) -> None:
+        started = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as exc:
+            for _fn, _op, _queued_at, future in batch:
+                future.set_exception(exc)
+            return
+        lock_wait = time.perf_counter() - started
+
+        outcomes: list[tuple[Future, Any, BaseException | None]] = []
+        for fn, op, _queued_at, future in batch:
+            op_started = time.perf_counter()
+            conn.execute("SAVEPOINT pooled_write")
+            try:
+                value = fn(conn)
+            except Exception as exc:
+                conn.execute("ROLLBACK TO pooled_write")
+                conn.execute("RELEASE pooled_write")
+                outcomes.append((future, None, exc))
+            else:
+                conn.execute("RELEASE pooled_write")
+                outcomes.append((future, value, None))
+            self._record(op, time.perf_counter() - op_started)
+
+        try:
+            conn.execute("COMMIT")
+        except sqlite3.Error as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            outcomes = [(future, None, exc) for future, _value, _error in outcomes]
+
+        with self._lock:
+            self._batches += 1
+            self._writes += len(batch)
+            self._max_batch = max(self._max_batch, len(batch))
+            self._queue_wait_s += sum(started - queued_at for _fn, _op, queued_at, _future in batch)
+            self._lock_wait_s += lock_wait
+            self._lock_wait_max_s = max(self._lock_wait_max_s, lock_wait)
+        for future, value, error in outcomes:
+            if error is None:
+                future.set_result(value)
+            else:
+                future.set_exception(error)
+
+    # ── Lifecycle / stats ───────────────────────────────────────
+
+    def release(self) -> None:
+        """Drop one owner's reference (see :func:`get_sqlite_pool`); the last one closes the pool."""
+        with _pools_lock:
+            with self._lock:
+                self._refs = max(0, self._refs - 1)
+                last = self._refs == 0
+            if last:
+                self.close()
+
+    def close(self) -> None:
+        """Close every reader connection; the writer exits once its queue is drained."""
+        with self._lock:
+            self._closed = True
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            operations = {
+                op: {
+                    "count": int(count),
+                    "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+                    "max_ms": round(peak * 1000, 3),
+                }
+                for op, (count, total, peak) in sorted(self._ops.items())
+            }
+            return {
+                "reader_connections": len(self._readers),
+                "writer_running": self._writer_thread is not None,
+                "write_batches": self._batches,
+                "writes": self._writes,
+                "max_batch": self._max_batch,
+                "queue_wait_ms_total": round(self._queue_wait_s * 1000, 3),
+                "lock_wait_ms_total": round(self._lock_wait_s * 1000, 3),
+                "lock_wait_ms_max": round(self._lock_wait_max_s * 1000, 3),
+                "operations": operations,
+            }
+
+
+def execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Run ``script`` one statement at a time; ``executescript()`` would commit the writer's batch."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+    if statement.strip():
+        conn.execute(statement)
+
+
+_pools: weakref.WeakValueDictionary[str, SQLitePool] = weakref.WeakValueDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(db_path: Path | str) -> SQLitePool:
+    """
+    The shared pool for ``db_path`` (one per resolved file path).
+
+    Every call takes a reference; owners that shut down call
+    :meth:`SQLitePool.release` instead of :meth:`SQLitePool.close`.
+    """
+    key = str(Path(db_path).expanduser().resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = SQLitePool(key)
+            _pools[key] = pool
+        with pool._lock:
+            pool._refs += 1
+        return pool
+
+
+__all__ = ["SQLitePool", "execute_script", "get_sqlite_pool"]
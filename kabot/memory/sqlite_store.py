@@ -1,179 +1,186 @@
 """SQLite metadata store for conversation relationships and metadata."""
 
 import json
-import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
 
 from loguru import logger
 
+from kabot.memory.sqlite_pool import get_sqlite_pool
 from kabot.memory.tool_transcript_guard import (
     normalize_persisted_message,
     repair_tool_result_pairs,
 )
 
+# Ids per ``IN (...)`` query, below SQLite's default bound-parameter limit (999).
+_MAX_IN_PARAMS = 500
+
 
 class SQLiteMetadataStore:
     """
     SQLite database for storing conversation metadata and parent-child relationships.
 
     Prevents amnesia by maintaining proper message chains and session history.
+    Reads use pooled per-thread connections and writes go through the shared
+    writer of :mod:`kabot.memory.sqlite_pool`.
     """
 
     def __init__(self, db_path: Path | str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_sqlite_pool(self.db_path)
+        self._closed = False
         self._init_db()
 
     def _init_db(self):
-        """Initialize database tables and performance PRAGMAs."""
-        with self._get_connection() as conn:
-            # Performance Tuning: WAL Mode & Memory optimizations
-            conn.execute("PRAGMA journal_mode=WAL;")
-            conn.execute("PRAGMA synchronous=NORMAL;")
-            conn.execute("PRAGMA mmap_size=30000000;") # 30MB
-            conn.execute("PRAGMA temp_store=MEMORY;")
-
-            # Sessions table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    session_id TEXT PRIMARY KEY,
-                    channel TEXT NOT NULL,
-                    chat_id TEXT NOT NULL,
-                    user_id TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    metadata TEXT
-                )
-            """)
-
-            # Messages table with parent-child relationships
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    message_id TEXT PRIMARY KEY,
-                    session_id TEXT NOT NULL,
-                    parent_id TEXT,
-                    role TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    message_type TEXT DEFAULT 'chat',
-                    tool_calls TEXT,
-                    tool_results TEXT,
-                    metadata TEXT,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id),
-                    FOREIGN KEY (parent_id) REFERENCES messages(message_id)
-                )
-            """)
-
-            # Memory index table (links to ChromaDB)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS memory_index (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT NOT NULL,
-                    message_id TEXT NOT NULL,
-                    chroma_id TEXT NOT NULL,
-                    content_hash TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id),
-                    FOREIGN KEY (message_id) REFERENCES messages(message_id)
-                )
-            """)
-
-            # Long-term facts/memory
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS facts (
-                    fact_id TEXT PRIMARY KEY,
-                    session_id TEXT,
-                    category TEXT NOT NULL,
-                    key TEXT NOT NULL,
-                    value TEXT NOT NULL,
-                    confidence REAL DEFAULT 1.0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    source_message_id TEXT,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """)
-
-            # Lessons table (metacognition — structured failure patterns)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS lessons (
-                    lesson_id TEXT PRIMARY KEY,
-                    trigger TEXT NOT NULL,
-                    mistake TEXT NOT NULL,
-                    fix TEXT NOT NULL,
-                    guardrail TEXT NOT NULL,
-                    score_before INTEGER,
-                    score_after INTEGER,
-                    task_type TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Models table (scanned from APIs)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS models (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    provider TEXT NOT NULL,
-                    context_window INTEGER,
-                    max_output INTEGER,
-                    pricing_input REAL,
-                    pricing_output REAL,
-                    capabilities TEXT,
-                    is_premium INTEGER DEFAULT 0,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # System logs table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS system_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    level TEXT NOT NULL,
-                    module TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    exception TEXT,
-                    metadata TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create indexes for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_level ON system_logs(level)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_created ON system_logs(created_at)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_parent ON messages(parent_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_facts_session ON facts(session_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_facts_category ON facts(category)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_lessons_type ON lessons(task_type)")
+        """Initialize database tables (WAL and connection PRAGMAs are set by the pool)."""
+        self._pool.write(self._create_schema, "init_schema")
+
+    @staticmethod
+    def _create_schema(conn):
+        # Sessions table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                channel TEXT NOT NULL,
+                chat_id TEXT NOT NULL,
+                user_id TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                metadata TEXT
+            )
+        """)
+
+        # Messages table with parent-child relationships
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                message_id TEXT PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                parent_id TEXT,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                message_type TEXT DEFAULT 'chat',
+                tool_calls TEXT,
+                tool_results TEXT,
+                metadata TEXT,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id),
+                FOREIGN KEY (parent_id) REFERENCES messages(message_id)
+            )
+        """)
+
+        # Memory index table (links to ChromaDB)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS memory_index (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                message_id TEXT NOT NULL,
+                chroma_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id),
+                FOREIGN KEY (message_id) REFERENCES messages(message_id)
+            )
+        """)
+
+        # Long-term facts/memory
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS facts (
+                fact_id TEXT PRIMARY KEY,
+                session_id TEXT,
+                category TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                confidence REAL DEFAULT 1.0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                source_message_id TEXT,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """)
+
+        # Lessons table (metacognition — structured failure patterns)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS lessons (
+                lesson_id TEXT PRIMARY KEY,
+                trigger TEXT NOT NULL,
+                mistake TEXT NOT NULL,
+                fix TEXT NOT NULL,
+                guardrail TEXT NOT NULL,
+                score_before INTEGER,
+                score_after INTEGER,
+                task_type TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Models table (scanned from APIs)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS models (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                context_window INTEGER,
+                max_output INTEGER,
+                pricing_input REAL,
+                pricing_output REAL,
+                capabilities TEXT,
+                is_premium INTEGER DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # System logs table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS system_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                level TEXT NOT NULL,
+                module TEXT NOT NULL,
+                message TEXT NOT NULL,
+                exception TEXT,
+                metadata TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
 
-            conn.commit()
+        # Create indexes for performance
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_level ON system_logs(level)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_created ON system_logs(created_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_parent ON messages(parent_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_facts_session ON facts(session_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_facts_category ON facts(category)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_lessons_type ON lessons(task_type)")
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection with proper cleanup."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        """This thread's pooled read connection; uncommitted changes are rolled back on exit."""
+        with self._pool.reader() as conn:
             yield conn
-        finally:
-            conn.close()
+
+    def close(self) -> None:
+        """Release this store's share of the pool; the last owner closes its connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pool.release()
 
     def create_session(self, session_id: str, channel: str, chat_id: str,
                       user_id: str | None = None, metadata: dict | None = None) -> bool:
         """Create a new session."""
         try:
-            with self._get_connection() as conn:
-                conn.execute(
+            params = (session_id, channel, chat_id, user_id,
+                      json.dumps(metadata) if metadata else None)
+            self._pool.write(
+                lambda conn: conn.execute(
                     """INSERT OR REPLACE INTO sessions
                        (session_id, channel, chat_id, user_id, metadata, updated_at)
                        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                    (session_id, channel, chat_id, user_id,
-                     json.dumps(metadata) if metadata else None)
-                )
-                conn.commit()
-                return True
+                    params,
+                ),
+                "create_session",
+            )
+            return True
         except Exception as e:
             logger.error(f"Error creating session: {e}")
             return False
@@ -204,17 +211,19 @@ class SQLiteMetadataStore:
                 tool_calls=tool_calls,
                 tool_results=tool_results,
             )
-            with self._get_connection() as conn:
+            params = (message_id, session_id, parent_id, role, safe_content,
+                      message_type,
+                      json.dumps(normalized_tool_calls) if normalized_tool_calls else None,
+                      json.dumps(normalized_tool_results) if normalized_tool_results else None,
+                      json.dumps(metadata) if metadata else None)
+
+            def insert(conn):
                 conn.execute(
                     """INSERT INTO messages
                        (message_id, session_id, parent_id, role, content,
                         message_type, tool_calls, tool_results, metadata)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (message_id, session_id, parent_id, role, safe_content,
-                     message_type,
-                     json.dumps(normalized_tool_calls) if normalized_tool_calls else None,
-                     json.dumps(normalized_tool_results) if normalized_tool_results else None,
-                     json.dumps(metadata) if metadata else None)
+                    params,
                 )
 
                 # Update session timestamp
@@ -223,12 +232,59 @@ class SQLiteMetadataStore:
                     (session_id,)
                 )
 
-                conn.commit()
-                return True
+            self._pool.write(insert, "add_message")
+            return True
         except Exception as e:
             logger.error(f"Error adding message: {e}")
             return False
 
+    def add_messages(self, messages: list[dict]) -> bool:
+        """
+        Add many messages in one transaction.
+
+        Each item takes the keyword arguments of ``add_message`` plus an
+        optional ``created_at`` (``YYYY-MM-DD HH:MM:SS`` UTC, defaults to now).
+        """
+        if not messages:
+            return True
+        try:
+            rows = []
+            for item in messages:
+                safe_content, normalized_tool_calls, normalized_tool_results = normalize_persisted_message(
+                    role=item["role"],
+                    content=item["content"],
+                    tool_calls=item.get("tool_calls"),
+                    tool_results=item.get("tool_results"),
+                )
+                rows.append((
+                    item["message_id"], item["session_id"], item.get("parent_id"), item["role"],
+                    safe_content, item.get("message_type") or "chat",
+                    json.dumps(normalized_tool_calls) if normalized_tool_calls else None,
+                    json.dumps(normalized_tool_results) if normalized_tool_results else None,
+                    json.dumps(item["metadata"]) if item.get("metadata") else None,
+                    item.get("created_at"),
+                ))
+            session_ids = sorted({item["session_id"] for item in messages})
+
+            def insert(conn):
+                conn.executemany(
+                    """INSERT INTO messages
+                       (message_id, session_id, parent_id, role, content,
+                        message_type, tool_calls, tool_results, metadata, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))""",
+                    rows,
+                )
+                conn.executemany(
+                    "UPDATE sessions SET updated_at = CURRENT_TIMESTAMP WHERE session_id = ?",
+                    [(session_id,) for session_id in session_ids],
+                )
+
+            self._pool.write(insert, "add_messages")
+            return True
+        except Exception as e:
+            logger.error(f"Error adding messages: {e}")
+            return False
+
     def get_message_chain(self, session_id: str, limit: int = 50) -> list[dict]:
         """
         Get conversation chain for a session.
@@ -236,11 +292,11 @@ class SQLiteMetadataStore:
         Returns messages in order with proper parent-child relationships.
         """
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_message_chain") as conn:
                 cursor = conn.execute(
                     """SELECT * FROM messages
                        WHERE session_id = ?
-                       ORDER BY created_at DESC
+                       ORDER BY created_at DESC, rowid DESC
                        LIMIT ?""",
                     (session_id, limit)
                 )
@@ -274,7 +330,7 @@ class SQLiteMetadataStore:
         This prevents amnesia by rebuilding full context.
         """
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_message_tree") as conn:
                 # Get all ancestors (parents)
                 ancestors = []
                 current_id = message_id
@@ -298,22 +354,71 @@ class SQLiteMetadataStore:
             logger.error(f"Error getting message tree: {e}")
             return []
 
+    def _get_rows_by_ids(self, op: str, table: str, key: str, ids) -> dict[str, dict]:
+        unique = list(dict.fromkeys(str(item) for item in ids if item))
+        if not unique:
+            return {}
+        rows: dict[str, dict] = {}
+        with self._pool.reader(op) as conn:
+            for start in range(0, len(unique), _MAX_IN_PARAMS):
+                chunk = unique[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor = conn.execute(
+                    f"SELECT * FROM {table} WHERE {key} IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor:
+                    rows[row[key]] = dict(row)
+        return rows
+
+    def get_messages_by_ids(self, message_ids) -> dict[str, dict]:
+        """
+        Get many messages in one query, keyed by message ID.
+
+        Unknown IDs are left out. Rows are returned as stored, like
+        ``get_message_tree``.
+        """
+        try:
+            return self._get_rows_by_ids("get_messages_by_ids", "messages", "message_id", message_ids)
+        except Exception as e:
+            logger.error(f"Error getting messages by id: {e}")
+            return {}
+
+    def search_messages(self, query: str, session_id: str | None = None,
+                        limit: int = 5) -> list[dict]:
+        """Newest messages whose content contains ``query`` (SQL LIKE), optionally in one session."""
+        try:
+            sql = "SELECT message_id, content, role, created_at FROM messages WHERE content LIKE ?"
+            params: list = [f"%{query}%"]
+            if session_id:
+                sql += " AND session_id = ?"
+                params.append(session_id)
+            sql += " ORDER BY created_at DESC LIMIT ?"
+            params.append(limit)
+            with self._pool.reader("search_messages") as conn:
+                return [dict(row) for row in conn.execute(sql, params)]
+        except Exception as e:
+            logger.error(f"Error searching messages: {e}")
+            return []
+
     def add_fact(self, fact_id: str, category: str, key: str, value: str,
                 session_id: str | None = None, confidence: float = 1.0,
                 source_message_id: str | None = None) -> bool:
         """Add a long-term fact/memory."""
         try:
-            with self._get_connection() as conn:
-                conn.execute(
+            params = (fact_id, session_id, category, key, value,
+                      confidence, source_message_id)
+            self._pool.write(
+                lambda conn: conn.execute(
                     """INSERT OR REPLACE INTO facts
                        (fact_id, session_id, category, key, value, confidence,
                         source_message_id, updated_at)
                        VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                    (fact_id, session_id, category, key, value,
-                     confidence, source_message_id)
-                )
-                conn.commit()
-                return True
+                    params,
+                ),
+                "add_fact",
+            )
+            return True
         except Exception as e:
             logger.error(f"Error adding fact: {e}")
             return False
@@ -321,7 +426,7 @@ class SQLiteMetadataStore:
     def get_fact(self, fact_id: str) -> dict | None:
         """Get a specific fact by ID."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_fact") as conn:
                 cursor = conn.execute(
                     "SELECT * FROM facts WHERE fact_id = ?",
                     (fact_id,)
@@ -334,11 +439,19 @@ class SQLiteMetadataStore:
             logger.error(f"Error getting fact: {e}")
             return None
 
+    def get_facts_by_ids(self, fact_ids) -> dict[str, dict]:
+        """Get many facts in one query, keyed by fact ID (unknown IDs are left out)."""
+        try:
+            return self._get_rows_by_ids("get_facts_by_ids", "facts", "fact_id", fact_ids)
+        except Exception as e:
+            logger.error(f"Error getting facts by id: {e}")
+            return {}
+
     def get_facts(self, session_id: str | None = None,
                  category: str | None = None) -> list[dict]:
         """Get facts with optional filtering."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_facts") as conn:
                 query = "SELECT * FROM facts WHERE 1=1"
                 params = []
 
@@ -368,17 +481,19 @@ class SQLiteMetadataStore:
                    score_after: int | None = None, task_type: str | None = None) -> bool:
         """Record a lesson from a failed/retried interaction."""
         try:
-            with self._get_connection() as conn:
-                conn.execute(
+            params = (lesson_id, trigger, mistake, fix, guardrail,
+                      score_before, score_after, task_type)
+            self._pool.write(
+                lambda conn: conn.execute(
                     """INSERT OR REPLACE INTO lessons
                        (lesson_id, trigger, mistake, fix, guardrail,
                         score_before, score_after, task_type)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (lesson_id, trigger, mistake, fix, guardrail,
-                     score_before, score_after, task_type)
-                )
-                conn.commit()
-                return True
+                    params,
+                ),
+                "add_lesson",
+            )
+            return True
         except Exception as e:
             logger.error(f"Error adding lesson: {e}")
             return False
@@ -387,7 +502,7 @@ class SQLiteMetadataStore:
                            task_type: str | None = None) -> list[dict]:
         """Get recent lessons, optionally filtered by task type."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_recent_lessons") as conn:
                 if task_type:
                     cursor = conn.execute(
                         """SELECT * FROM lessons
@@ -409,7 +524,7 @@ class SQLiteMetadataStore:
     def get_guardrails(self, limit: int = 5) -> list[str]:
         """Get unique guardrails for injection into system prompt."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_guardrails") as conn:
                 cursor = conn.execute(
                     """SELECT DISTINCT guardrail FROM lessons
                        ORDER BY created_at DESC LIMIT ?""",
@@ -424,23 +539,43 @@ class SQLiteMetadataStore:
                          chroma_id: str, content_hash: str) -> bool:
         """Save ChromaDB memory index reference."""
         try:
-            with self._get_connection() as conn:
-                conn.execute(
+            self._pool.write(
+                lambda conn: conn.execute(
                     """INSERT INTO memory_index
                        (session_id, message_id, chroma_id, content_hash)
                        VALUES (?, ?, ?, ?)""",
-                    (session_id, message_id, chroma_id, content_hash)
-                )
-                conn.commit()
-                return True
+                    (session_id, message_id, chroma_id, content_hash),
+                ),
+                "save_memory_index",
+            )
+            return True
         except Exception as e:
             logger.error(f"Error saving memory index: {e}")
             return False
 
+    def save_memory_indexes(self, rows: list[tuple[str, str, str, str]]) -> bool:
+        """Save many (session_id, message_id, chroma_id, content_hash) references in one transaction."""
+        if not rows:
+            return True
+        try:
+            self._pool.write(
+                lambda conn: conn.executemany(
+                    """INSERT INTO memory_index
+                       (session_id, message_id, chroma_id, content_hash)
+                       VALUES (?, ?, ?, ?)""",
+                    rows,
+                ),
+                "save_memory_indexes",
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error saving memory indexes: {e}")
+            return False
+
     def get_stats(self) -> dict:
         """Get database statistics."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_stats") as conn:
                 sessions = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
                 messages = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
                 facts = conn.execute("SELECT COUNT(*) FROM facts").fetchone()[0]
@@ -449,7 +584,8 @@ class SQLiteMetadataStore:
                     "sessions": sessions,
                     "messages": messages,
                     "facts": facts,
-                    "db_size_mb": self.db_path.stat().st_size / (1024 * 1024)
+                    "db_size_mb": self.db_path.stat().st_size / (1024 * 1024),
+                    "storage": self._pool.get_stats(),
                 }
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
@@ -458,26 +594,28 @@ class SQLiteMetadataStore:
     def save_model(self, model_data: dict) -> bool:
         """Save or update scanned model metadata."""
         try:
-            with self._get_connection() as conn:
-                conn.execute(
+            params = (
+                model_data["id"],
+                model_data["name"],
+                model_data["provider"],
+                model_data.get("context_window"),
+                model_data.get("max_output"),
+                model_data.get("pricing_input"),
+                model_data.get("pricing_output"),
+                json.dumps(model_data.get("capabilities", [])),
+                1 if model_data.get("is_premium") else 0
+            )
+            self._pool.write(
+                lambda conn: conn.execute(
                     """INSERT OR REPLACE INTO models
                        (id, name, provider, context_window, max_output,
                         pricing_input, pricing_output, capabilities, is_premium, updated_at)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                    (
-                        model_data["id"],
-                        model_data["name"],
-                        model_data["provider"],
-                        model_data.get("context_window"),
-                        model_data.get("max_output"),
-                        model_data.get("pricing_input"),
-                        model_data.get("pricing_output"),
-                        json.dumps(model_data.get("capabilities", [])),
-                        1 if model_data.get("is_premium") else 0
-                    )
-                )
-                conn.commit()
-                return True
+                    params,
+                ),
+                "save_model",
+            )
+            return True
         except Exception as e:
             logger.error(f"Error saving model: {e}")
             return False
@@ -485,7 +623,7 @@ class SQLiteMetadataStore:
     def get_scanned_models(self) -> list[dict]:
         """Get all scanned models from the database."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader("get_scanned_models") as conn:
                 cursor = conn.execute("SELECT * FROM models")
                 rows = cursor.fetchall()
                 models = []
@@ -505,17 +643,19 @@ class SQLiteMetadataStore:
                 metadata: dict | None = None, exception: str | None = None) -> bool:
         """Add a system log entry."""
         try:
-            with self._get_connection() as conn:
-                conn.execute(
+            params = (level, module, message,
+                      json.dumps(metadata) if metadata else None,
+                      exception)
+            self._pool.write(
+                lambda conn: conn.execute(
                     """INSERT INTO system_logs
                        (level, module, message, metadata, exception)
                        VALUES (?, ?, ?, ?, ?)""",
-                    (level, module, message,
-                     json.dumps(metadata) if metadata else None,
-                     exception)
-                )
-                conn.commit()
-                return True
+                    params,
+                ),
+                "add_log",
+            )
+            return True
         except Exception as e:
             # Don't log this error to avoid recursion if logger uses this DB
             print(f"Error adding log: {e}")
@@ -524,15 +664,14 @@ class SQLiteMetadataStore:
     def cleanup_logs(self, retention_days: int = 30) -> int:
         """Delete logs older than retention period."""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
+            return self._pool.write(
+                lambda conn: conn.execute(
                     """DELETE FROM system_logs
                        WHERE created_at < datetime('now', ?)""",
-                    (f"-{retention_days} days",)
-                )
-                deleted = cursor.rowcount
-                conn.commit()
-                return deleted
+                    (f"-{retention_days} days",),
+                ).rowcount,
+                "cleanup_logs",
+            )
         except Exception as e:
             print(f"Error cleaning logs: {e}")
             return 0
@@ -0,0 +1,203 @@
+"""
+Write-behind queue for memory ingestion.
+
+``HybridMemoryManager.add_message`` enqueues the message and returns; a
+flusher task hands queued messages (from every session) to the manager in
+batches, so one batch costs one SQLite transaction, one ``embed_batch`` call
+and one Chroma ``add`` instead of one of each per message.
+
+A batch is flushed when ``max_batch`` messages are waiting, when the oldest
+has waited ``max_delay_seconds``, or on :meth:`WriteBehindQueue.flush`
+(shutdown). Until its batch has been written, a message stays visible
+through :meth:`WriteBehindQueue.pending` so reads can overlay it.
+
+When a batch fails, its messages are retried one at a time so a single bad
+row cannot take the rest down with it. A message that still fails is
+requeued (behind a fresh ``max_delay_seconds`` wait) up to ``max_attempts``
+times before it is logged and dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+DEFAULT_MAX_BATCH = 32
+DEFAULT_MAX_DELAY_SECONDS = 0.5
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+@dataclass
+class PendingMessage:
+    """A message accepted by ``add_message`` but not written yet."""
+
+    message_id: str
+    session_id: str
+    role: str
+    content: str
+    created_at: str
+    parent_id: str | None = None
+    tool_calls: list | None = None
+    tool_results: list | None = None
+    metadata: dict | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+    def as_row(self) -> dict[str, Any]:
+        """Shaped like a ``messages`` row from SQLite."""
+        return {
+            "message_id": self.message_id,
+            "session_id": self.session_id,
+            "parent_id": self.parent_id,
+            "role": self.role,
+            "content": self.content,
+            "created_at": self.created_at,
+            "message_type": "chat",
+            "tool_calls": self.tool_calls,
+            "tool_results": self.tool_results,
+            "metadata": self.metadata,
+        }
+
+
+FlushBatch = Callable[[list[PendingMessage]], Awaitable[None]]
+
+
+class WriteBehindQueue:
+    """Coalesce pending messages and hand them to ``flush_batch`` in batches."""
+
+    def __init__(
+        self,
+        flush_batch: FlushBatch,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self._flush_batch = flush_batch
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay_seconds = max(0.0, float(max_delay_seconds))
+        self.max_attempts = max(1, int(max_attempts))
+        self._queued: list[PendingMessage] = []
+        self._inflight: list[PendingMessage] = []
+        self._flusher: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._flush_requested = False
+        self._batches = 0
+        self._flushed = 0
+        self._failed_batches = 0
+        self._retried = 0
+        self._dropped = 0
+        self._max_batch_seen = 0
+        self._reasons = {"size": 0, "age": 0, "flush": 0}
+
+    def submit(self, item: PendingMessage) -> None:
+        """Queue ``item``; must be called from the event loop that runs the flusher."""
+        self._queued.append(item)
+        if self._flusher is None or self._flusher.done():
+            self._wake = asyncio.Event()
+            self._flusher = asyncio.create_task(self._run())
+        elif len(self._queued) >= self.max_batch and self._wake is not None:
+            self._wake.set()
+
+    def pending(self, session_id: str | None = None) -> list[PendingMessage]:
+        """Messages not written yet (oldest first), optionally for one session."""
+        items = self._inflight + self._queued
+        if session_id is None:
+            return list(items)
+        return [item for item in items if item.session_id == session_id]
+
+    async def flush(self) -> None:
+        """Write everything queued so far and wait for it."""
+        while self._flusher is not None and not self._flusher.done():
+            self._flush_requested = True
+            if self._wake is not None:
+                self._wake.set()
+            await asyncio.shield(self._flusher)
+
+    async def _run(self) -> None:
+        while self._queued:
+            reason = await self._await_batch_ready()
+            batch = self._queued[: self.max_batch]
+            del self._queued[: len(batch)]
+            self._inflight = batch
+            try:
+                await self._write(batch)
+            finally:
+                self._inflight = []
+            self._batches += 1
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+            self._reasons[reason] += 1
+        self._flush_requested = False
+
+    async def _write(self, batch: list[PendingMessage]) -> None:
+        try:
+            await self._flush_batch(batch)
+            self._flushed += len(batch)
+            return
+        except Exception as exc:
+            self._failed_batches += 1
+            logger.warning(f"Memory write-behind batch of {len(batch)} failed: {exc}")
+
+        failed: list[PendingMessage] = []
+        for item in batch:
+            if len(batch) > 1:
+                try:
+                    await self._flush_batch([item])
+                    self._flushed += 1
+                    continue
+                except Exception as exc:
+                    logger.warning(f"Memory write-behind message {item.message_id} failed: {exc}")
+            failed.append(item)
+
+        retry: list[PendingMessage] = []
+        for item in failed:
+            item.attempts += 1
+            if item.attempts >= self.max_attempts:
+                self._dropped += 1
+                logger.error(
+                    f"Dropping memory message {item.message_id} for session {item.session_id} "
+                    f"after {item.attempts} failed writes"
+                )
+                continue
+            item.enqueued_at = time.monotonic()
+            retry.append(item)
+        if retry:
+            self._retried += len(retry)
+            self._queued[:0] = retry
+
+    async def _await_batch_ready(self) -> str:
+        while True:
+            if len(self._queued) >= self.max_batch:
+                return "size"
+            if self._flush_requested:
+                return "flush"
+            remaining = self._queued[0].enqueued_at + self.max_delay_seconds - time.monotonic()
+            if remaining <= 0:
+                return "age"
+            wake = self._wake
+            if wake is None:
+                wake = self._wake = asyncio.Event()
+            wake.clear()
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=remaining)
+            except TimeoutError:
+                pass
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._queued) + len(self._inflight),
+            "batches": self._batches,
+            "flushed": self._flushed,
+            "failed_batches": self._failed_batches,
+            "retried": self._retried,
+            "dropped": self._dropped,
+            "max_batch": self._max_batch_seen,
+            "flush_reasons": dict(self._reasons),
+        }
+
+
+__all__ = ["PendingMessage", "WriteBehindQueue"]
@@ -1,6 +1,6 @@
 """LLM provider abstraction module."""
 
-from kabot.providers.base import LLMProvider, LLMResponse
+from kabot.providers.base import LLMProvider, LLMResponse, LLMStreamChunk
 from kabot.providers.litellm_provider import LiteLLMProvider
 
-__all__ = ["LLMProvider", "LLMResponse", "LiteLLMProvider"]
+__all__ = ["LLMProvider", "LLMResponse", "LLMStreamChunk", "LiteLLMProvider"]
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterator
 
 
 @dataclass
@@ -28,6 +28,27 @@ class LLMResponse:
         return len(self.tool_calls) > 0
 
 
+@dataclass
+class ToolCallDelta:
+    """Incremental piece of a tool call while a response is streaming."""
+    index: int
+    id: str | None = None
+    name: str | None = None
+    arguments: str = ""
+
+
+@dataclass
+class LLMStreamChunk:
+    """One increment of a streamed response.
+
+    The last chunk of a stream carries the assembled ``response``; earlier
+    chunks only carry deltas.
+    """
+    content: str = ""
+    tool_call_deltas: list[ToolCallDelta] = field(default_factory=list)
+    response: LLMResponse | None = None
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -36,6 +57,10 @@ class LLMProvider(ABC):
     while maintaining a consistent interface.
     """
 
+    # True when stream_chat yields deltas as they arrive rather than the
+    # default single final chunk.
+    supports_streaming: bool = False
+
     def __init__(self, api_key: str | None = None, api_base: str | None = None):
         self.api_key = api_key
         self.api_base = api_base
@@ -64,6 +89,30 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def stream_chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a chat completion as content and tool-call deltas.
+
+        Takes the same arguments as :meth:`chat`. The final chunk carries the
+        complete LLMResponse. The default implementation does not stream: it
+        awaits :meth:`chat` and yields that response as a single chunk.
+        """
+        response = await self.chat(
+            messages=messages,
+            tools=tools,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        yield LLMStreamChunk(content=response.content or "", response=response)
+
     @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for this provider."""
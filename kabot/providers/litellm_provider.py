@@ -1,14 +1,13 @@
 """LiteLLM provider implementation for multi-provider support."""
 
-import asyncio
 import base64
 import json
 import logging
 import os
 import time
-from typing import Any
+from typing import Any, AsyncIterator
 
-import requests
+import httpx
 from tenacity import (
     before_sleep_log,
     retry,
@@ -18,7 +17,7 @@ from tenacity import (
 )
 
 from kabot.core.failover_error import resolve_failover_reason, should_fallback, should_retry
-from kabot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from kabot.providers.base import LLMProvider, LLMResponse, LLMStreamChunk, ToolCallRequest
 from kabot.providers.chatgpt_backend_client import (
     build_chatgpt_headers,
     build_chatgpt_request,
@@ -28,9 +27,18 @@ from kabot.providers.chatgpt_backend_client import (
     parse_sse_stream,
 )
 from kabot.providers.registry import find_by_model, find_by_name, find_gateway
+from kabot.providers.streaming import (
+    ChatCompletionStreamAccumulator,
+    aiter_sse_events,
+    chatgpt_event_increment,
+)
+from kabot.utils.http_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
+_OPENAI_CODEX_URL = "https://chatgpt.com/backend-api/codex/responses"
+_OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+
 # Lazy-loaded LiteLLM symbols.
 litellm = None
 acompletion = None
@@ -96,6 +104,8 @@ class LiteLLMProvider(LLMProvider):
     (see providers/registry.py) â€” no if-elif chains needed here.
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -333,6 +343,45 @@ class LiteLLMProvider(LLMProvider):
                     kwargs.update(overrides)
                     return
 
+    def _build_completion_kwargs(
+        self,
+        resolved_model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        max_tokens: int,
+        temperature: float,
+        *,
+        api_key: str | None,
+        api_base: str | None,
+        extra_headers: dict[str, str] | None,
+    ) -> dict[str, Any]:
+        """Build LiteLLM ``acompletion`` kwargs for one resolved model."""
+        kwargs: dict[str, Any] = {
+            "model": resolved_model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        # Apply model-specific overrides (e.g. kimi-k2.5 temperature)
+        self._apply_model_overrides(resolved_model, kwargs)
+
+        if api_key:
+            kwargs["api_key"] = api_key
+
+        # Pass api_base for custom endpoints
+        if api_base:
+            kwargs["api_base"] = api_base
+
+        # Pass extra headers
+        if extra_headers and "extra_headers" not in kwargs:
+            kwargs["extra_headers"] = extra_headers
+
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
+        return kwargs
+
     async def _execute_model_call(
         self,
         model: str,
@@ -376,30 +425,16 @@ class LiteLLMProvider(LLMProvider):
                 extra_headers=request_headers,
             )
 
-        kwargs: dict[str, Any] = {
-            "model": resolved_model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
-        # Apply model-specific overrides (e.g. kimi-k2.5 temperature)
-        self._apply_model_overrides(resolved_model, kwargs)
-
-        if request_api_key:
-            kwargs["api_key"] = request_api_key
-
-        # Pass api_base for custom endpoints
-        if request_api_base:
-            kwargs["api_base"] = request_api_base
-
-        # Pass extra headers
-        if request_headers and "extra_headers" not in kwargs:
-            kwargs["extra_headers"] = request_headers
-
-        if tools:
-            kwargs["tools"] = tools
-            kwargs["tool_choice"] = "auto"
+        kwargs = self._build_completion_kwargs(
+            resolved_model,
+            messages,
+            tools,
+            max_tokens,
+            temperature,
+            api_key=request_api_key,
+            api_base=request_api_base,
+            extra_headers=request_headers,
+        )
 
         # Dynamically create the retry wrapper for acompletion
         @retry(
@@ -421,45 +456,8 @@ class LiteLLMProvider(LLMProvider):
         response = await _do_call()
         return self._parse_response(response)
 
-    async def chat(
-        self,
-        messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-        model: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-    ) -> LLMResponse:
-        """
-        Send a chat completion request via LiteLLM with automatic retries and fallback.
-
-        Args:
-            messages: List of message dicts with 'role' and 'content'.
-            tools: Optional list of tool definitions in OpenAI format.
-            model: Model identifier (e.g., 'anthropic/claude-sonnet-4-5').
-            max_tokens: Maximum tokens in response.
-            temperature: Sampling temperature.
-
-        Returns:
-            LLMResponse with content and/or tool calls.
-        """
-        (
-            _runtime_acompletion,
-            runtime_api_connection_error,
-            runtime_rate_limit_error,
-            runtime_service_unavailable_error,
-            runtime_invalid_request_error,
-        ) = self._ensure_litellm_runtime()
-        transient_error_types = tuple(
-            exc
-            for exc in (
-                runtime_rate_limit_error,
-                runtime_api_connection_error,
-                runtime_service_unavailable_error,
-            )
-            if isinstance(exc, type) and issubclass(exc, BaseException)
-        )
-
-        # Sanitize messages to remove internal fields (like 'tool_results') that might cause API errors
+    def _sanitize_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Remove internal fields (like 'tool_results') that might cause API errors."""
         sanitized_messages = []
         for msg in messages:
             # Create a working copy
@@ -520,14 +518,10 @@ class LiteLLMProvider(LLMProvider):
 
             sanitized_messages.append(new_msg)
 
-        # Keep this in structured logs instead of polluting stdout for CLI/chat users.
-        if sanitized_messages:
-            logger.debug(
-                "Last message keys sent to LLM: %s",
-                list(sanitized_messages[-1].keys()),
-            )
+        return sanitized_messages
 
-        # Construct list of models to try: primary -> fallbacks
+    def _models_to_try(self, model: str | None) -> list[str]:
+        """Primary model followed by configured fallbacks, minus auth cooldowns."""
         primary_model = model or self.default_model
         models_to_try = [primary_model]
 
@@ -539,7 +533,56 @@ class LiteLLMProvider(LLMProvider):
             for fb in self.fallbacks:
                 if fb != primary_model:
                     models_to_try.append(fb)
-        models_to_try = self._apply_auth_cooldown_filter(models_to_try)
+        return self._apply_auth_cooldown_filter(models_to_try)
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        """
+        Send a chat completion request via LiteLLM with automatic retries and fallback.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            tools: Optional list of tool definitions in OpenAI format.
+            model: Model identifier (e.g., 'anthropic/claude-sonnet-4-5').
+            max_tokens: Maximum tokens in response.
+            temperature: Sampling temperature.
+
+        Returns:
+            LLMResponse with content and/or tool calls.
+        """
+        (
+            _runtime_acompletion,
+            runtime_api_connection_error,
+            runtime_rate_limit_error,
+            runtime_service_unavailable_error,
+            runtime_invalid_request_error,
+        ) = self._ensure_litellm_runtime()
+        transient_error_types = tuple(
+            exc
+            for exc in (
+                runtime_rate_limit_error,
+                runtime_api_connection_error,
+                runtime_service_unavailable_error,
+            )
+            if isinstance(exc, type) and issubclass(exc, BaseException)
+        )
+
+        sanitized_messages = self._sanitize_messages(messages)
+
+        # Keep this in structured logs instead of polluting stdout for CLI/chat users.
+        if sanitized_messages:
+            logger.debug(
+                "Last message keys sent to LLM: %s",
+                list(sanitized_messages[-1].keys()),
+            )
+
+        models_to_try = self._models_to_try(model)
 
         last_exception = None
 
@@ -607,6 +650,136 @@ class LiteLLMProvider(LLMProvider):
             finish_reason="error",
         )
 
+    async def stream_chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a chat completion, falling back across models until output starts.
+
+        Once a model has yielded a chunk its stream is committed: a later
+        failure is raised instead of restarting on a fallback model, which
+        would repeat text the caller has already rendered. When every model
+        fails before producing output, the final chunk carries the same
+        error response :meth:`chat` returns.
+        """
+        self._ensure_litellm_runtime()
+        sanitized_messages = self._sanitize_messages(messages)
+        last_exception = None
+
+        for attempt_model in self._models_to_try(model):
+            emitted = False
+            try:
+                async for chunk in self._stream_model_call(
+                    attempt_model,
+                    sanitized_messages,
+                    tools,
+                    max_tokens,
+                    temperature,
+                ):
+                    emitted = True
+                    yield chunk
+                return
+            except Exception as e:
+                if emitted:
+                    raise
+                reason = resolve_failover_reason(
+                    status=getattr(e, "status_code", None),
+                    message=str(e),
+                    error_code=getattr(e, "code", None),
+                )
+                if reason == "auth":
+                    self._mark_auth_failure_cooldown(attempt_model)
+                logger.warning(f"Streaming call for {attempt_model} failed: {e}. Trying next...")
+                last_exception = e
+
+        yield LLMStreamChunk(
+            response=LLMResponse(
+                content=f"All models failed. Last error: {last_exception}",
+                finish_reason="error",
+            )
+        )
+
+    async def _stream_model_call(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Dispatch one streaming attempt to the ChatGPT backend, OpenRouter or LiteLLM."""
+        resolved_model = self._resolve_model(model)
+        _, request_api_key, request_api_base, request_headers = self._resolve_runtime_options(model)
+
+        if self._is_openai_codex(resolved_model):
+            stream = self._stream_openai_codex(
+                messages,
+                tools,
+                resolved_model,
+                max_tokens,
+                temperature,
+                api_key=request_api_key,
+            )
+        elif self._is_openrouter(resolved_model):
+            stream = self._stream_openrouter(
+                messages,
+                tools,
+                resolved_model,
+                api_key=request_api_key,
+                extra_headers=request_headers,
+            )
+        else:
+            stream = self._stream_completion(
+                self._build_completion_kwargs(
+                    resolved_model,
+                    messages,
+                    tools,
+                    max_tokens,
+                    temperature,
+                    api_key=request_api_key,
+                    api_base=request_api_base,
+                    extra_headers=request_headers,
+                )
+            )
+        async for chunk in stream:
+            yield chunk
+
+    async def _stream_completion(self, kwargs: dict[str, Any]) -> AsyncIterator[LLMStreamChunk]:
+        """Stream through LiteLLM ``acompletion(stream=True)``."""
+        runtime_acompletion = self._ensure_litellm_runtime()[0]
+        accumulator = ChatCompletionStreamAccumulator()
+        response = await runtime_acompletion(**kwargs, stream=True)
+        async for part in response:
+            chunk = accumulator.add_chunk(part)
+            if chunk is not None:
+                yield chunk
+        yield LLMStreamChunk(response=accumulator.build_response())
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive client for the ChatGPT backend and OpenRouter paths."""
+        return get_http_client("llm")
+
+    @staticmethod
+    def _raise_for_http_status(status: int, body: str, provider_name: str, model: str) -> None:
+        """Map an HTTP error status to the matching LiteLLM exception."""
+        message = f"HTTP {status}: {body[:500]}" if body else f"HTTP {status}"
+        if status == 429:
+            raise RateLimitError(message=message, llm_provider=provider_name, model=model)
+        if status >= 500:
+            raise ServiceUnavailableError(message=message, llm_provider=provider_name, model=model)
+        if status in (401, 403):
+            raise InvalidRequestError(
+                message=f"Authentication failed: {message}",
+                llm_provider=provider_name,
+                model=model,
+            )
+        raise InvalidRequestError(message=message, llm_provider=provider_name, model=model)
+
     def _is_openrouter(self, model: str) -> bool:
         """Check if the request is destined for OpenRouter."""
         if self._gateway and self._gateway.name == "openrouter":
@@ -619,7 +792,7 @@ class LiteLLMProvider(LLMProvider):
         """Check if the model uses OpenAI Codex (ChatGPT backend API)."""
         return model.startswith("openai-codex/") or "openai-codex" in model
 
-    async def _chat_openai_codex(
+    def _build_openai_codex_request(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None,
@@ -627,157 +800,224 @@ class LiteLLMProvider(LLMProvider):
         max_tokens: int,
         temperature: float,
         api_key: str | None = None,
-    ) -> LLMResponse:
-        """Handle OpenAI Codex requests using ChatGPT backend API."""
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """Build ChatGPT backend headers and body (always a streaming request)."""
+        request_api_key = api_key or self.api_key
+        if not request_api_key:
+            raise ValueError("No API key for OpenAI Codex")
 
-        def _make_request():
-            request_api_key = api_key or self.api_key
-            if not request_api_key:
-                raise ValueError("No API key for OpenAI Codex")
+        # Verify it's a JWT token
+        if not request_api_key.startswith("eyJ"):
+            raise ValueError("OpenAI Codex requires OAuth JWT token, not API key")
 
-            # Verify it's a JWT token
-            if not request_api_key.startswith("eyJ"):
-                raise ValueError("OpenAI Codex requires OAuth JWT token, not API key")
+        try:
+            # Extract account ID from JWT token
+            account_id = extract_account_id(request_api_key)
+        except ValueError as e:
+            raise ValueError(f"Invalid OAuth token: {e}")
+
+        # Strip provider prefix from model name (openai-codex/gpt-5.3-codex -> gpt-5.3-codex)
+        api_model = model.split("/")[-1] if "/" in model else model
+
+        # Build request
+        body = build_chatgpt_request(
+            model=api_model,
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
 
-            try:
-                # Extract account ID from JWT token
-                account_id = extract_account_id(request_api_key)
-            except ValueError as e:
-                raise ValueError(f"Invalid OAuth token: {e}")
-
-            # Strip provider prefix from model name (openai-codex/gpt-5.3-codex -> gpt-5.3-codex)
-            api_model = model.split("/")[-1] if "/" in model else model
-
-            # Build request
-            body = build_chatgpt_request(
-                model=api_model,
-                messages=messages,
-                tools=tools,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=True,
-            )
+        headers = build_chatgpt_headers(request_api_key, account_id)
 
-            headers = build_chatgpt_headers(request_api_key, account_id)
+        # Debug logging
+        logger.info(f"ChatGPT Backend API Request - Model: {api_model}, Account: {account_id[:8]}...")
+        logger.debug(f"Request body: {json.dumps(body, indent=2)}")
+        return headers, body
 
-            # Debug logging
-            logger.info(f"ChatGPT Backend API Request - Model: {api_model}, Account: {account_id[:8]}...")
-            logger.debug(f"Request body: {json.dumps(body, indent=2)}")
+    def _codex_response_from_parsed(self, response_data: dict[str, Any]) -> LLMResponse:
+        """Convert parsed ChatGPT backend output into an LLMResponse."""
+        parsed_tool_calls: list[ToolCallRequest] = []
+        for tc in response_data.get("tool_calls", []):
+            if not isinstance(tc, dict):
+                continue
 
-            # Make request to ChatGPT backend API
-            url = "https://chatgpt.com/backend-api/codex/responses"
+            name = tc.get("name")
+            if not isinstance(name, str) or not name.strip():
+                continue
 
-            try:
-                response = requests.post(
-                    url=url,
-                    headers=headers,
-                    json=body,
-                    timeout=120,
+            tc_id = tc.get("id")
+            if not isinstance(tc_id, str) or not tc_id.strip():
+                tc_id = f"call_{len(parsed_tool_calls) + 1}"
+
+            arguments = tc.get("arguments")
+            if isinstance(arguments, dict):
+                parsed_args = arguments
+            elif isinstance(arguments, str):
+                try:
+                    loaded = json.loads(arguments) if arguments.strip() else {}
+                    # Guard: LLM sometimes sends [] for no-param tools instead of {}
+                    parsed_args = loaded if isinstance(loaded, dict) else {}
+                except json.JSONDecodeError:
+                    parsed_args = {"raw": arguments}
+            elif arguments is None:
+                parsed_args = {}
+            else:
+                parsed_args = {}
+
+            parsed_tool_calls.append(
+                ToolCallRequest(
+                    id=tc_id,
+                    name=name,
+                    arguments=parsed_args,
                 )
+            )
 
-                # Log response for debugging
-                logger.info(f"ChatGPT Backend API Response Status: {response.status_code}")
-
-                response.raise_for_status()
-
-                # Parse SSE stream from UTF-8 bytes first to avoid mojibake
-                # when requests guesses charset incorrectly.
-                sse_text = response.text
-                raw_payload = getattr(response, "content", None)
-                if isinstance(raw_payload, (bytes, bytearray)):
-                    try:
-                        sse_text = raw_payload.decode("utf-8")
-                    except UnicodeDecodeError:
-                        sse_text = raw_payload.decode("utf-8", errors="replace")
-
-                parsed_response = parse_chatgpt_stream_events(parse_sse_stream(sse_text))
-
-                # Fallback for non-streaming JSON payloads
-                if not parsed_response.get("content") and not parsed_response.get("tool_calls"):
-                    try:
-                        payload = response.json()
-                        parsed_response = parse_chatgpt_response_payload(payload)
-                    except ValueError:
-                        pass
-
-                return parsed_response
-
-            except requests.exceptions.HTTPError as e:
-                # Log error response body for debugging
-                error_body = ""
-                if e.response is not None:
-                    try:
-                        error_body = e.response.text
-                        logger.error(f"ChatGPT Backend API Error Response: {error_body}")
-                    except Exception:
-                        pass
-
-                    status = e.response.status_code
-                    if status == 429:
-                        raise RateLimitError(message=str(e), llm_provider="openai-codex", model=model)
-                    elif status >= 500:
-                        raise ServiceUnavailableError(message=str(e), llm_provider="openai-codex", model=model)
-                    elif status == 401 or status == 403:
-                        raise InvalidRequestError(message=f"Authentication failed: {e}", llm_provider="openai-codex", model=model)
-                    else:
-                        raise InvalidRequestError(message=str(e), llm_provider="openai-codex", model=model)
-                else:
-                    raise APIConnectionError(message=str(e), llm_provider="openai-codex", model=model)
-            except requests.exceptions.RequestException as e:
-                raise APIConnectionError(message=str(e), llm_provider="openai-codex", model=model)
+        content = response_data.get("content", "")
+        logger.debug(f"ChatGPT Backend API response: {len(content)} chars, {len(parsed_tool_calls)} tool calls")
+        return LLMResponse(
+            content=content,
+            tool_calls=parsed_tool_calls,
+            finish_reason="tool_calls" if parsed_tool_calls else "stop",
+            usage={},
+        )
 
+    async def _chat_openai_codex(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        api_key: str | None = None,
+    ) -> LLMResponse:
+        """Handle OpenAI Codex requests using ChatGPT backend API."""
+        headers, body = self._build_openai_codex_request(
+            messages, tools, model, max_tokens, temperature, api_key=api_key
+        )
         try:
-            loop = asyncio.get_running_loop()
-            response_data = await loop.run_in_executor(None, _make_request)
-
-            parsed_tool_calls: list[ToolCallRequest] = []
-            for tc in response_data.get("tool_calls", []):
-                if not isinstance(tc, dict):
-                    continue
+            response = await self._http_client().post(_OPENAI_CODEX_URL, headers=headers, json=body)
+        except httpx.TransportError as e:
+            raise APIConnectionError(message=str(e), llm_provider="openai-codex", model=model)
+
+        logger.info(f"ChatGPT Backend API Response Status: {response.status_code}")
+        if response.status_code >= 400:
+            logger.error(f"ChatGPT Backend API Error Response: {response.text}")
+            self._raise_for_http_status(response.status_code, response.text, "openai-codex", model)
+
+        # Decode the SSE body as UTF-8 ourselves: a missing or wrong charset
+        # header would otherwise turn emoji and accents into mojibake.
+        sse_text = response.content.decode("utf-8", errors="replace")
+        parsed_response = parse_chatgpt_stream_events(parse_sse_stream(sse_text))
+
+        # Fallback for non-streaming JSON payloads
+        if not parsed_response.get("content") and not parsed_response.get("tool_calls"):
+            try:
+                parsed_response = parse_chatgpt_response_payload(json.loads(sse_text))
+            except ValueError:
+                pass
+        return self._codex_response_from_parsed(parsed_response)
 
-                name = tc.get("name")
-                if not isinstance(name, str) or not name.strip():
-                    continue
+    async def _stream_openai_codex(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        api_key: str | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream ChatGPT backend SSE events as they arrive instead of buffering the body."""
+        headers, body = self._build_openai_codex_request(
+            messages, tools, model, max_tokens, temperature, api_key=api_key
+        )
+        events: list[dict[str, Any]] = []
+        call_indexes: dict[str, int] = {}
+        client = self._http_client()
+        try:
+            async with client.stream("POST", _OPENAI_CODEX_URL, headers=headers, json=body) as response:
+                logger.info(f"ChatGPT Backend API Response Status: {response.status_code}")
+                if response.status_code >= 400:
+                    error_body = (await response.aread()).decode("utf-8", errors="replace")
+                    logger.error(f"ChatGPT Backend API Error Response: {error_body}")
+                    self._raise_for_http_status(
+                        response.status_code, error_body, "openai-codex", model
+                    )
+                async for event in aiter_sse_events(response.aiter_lines()):
+                    events.append(event)
+                    chunk = chatgpt_event_increment(event, call_indexes)
+                    if chunk is not None:
+                        yield chunk
+        except httpx.TransportError as e:
+            raise APIConnectionError(message=str(e), llm_provider="openai-codex", model=model)
+
+        response_data = parse_chatgpt_stream_events(iter(events))
+        yield LLMStreamChunk(response=self._codex_response_from_parsed(response_data))
+
+    def _build_openrouter_request(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str,
+        api_key: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """Build OpenRouter headers and chat-completions payload."""
+        request_api_key = api_key or self.api_key or os.environ.get("OPENROUTER_API_KEY")
+        if not request_api_key:
+            raise ValueError("OPENROUTER_API_KEY not found")
+
+        # Prepare model name for OpenRouter API (strip gateway prefix)
+        api_model = model
+        if api_model.startswith("openrouter/"):
+            api_model = api_model.replace("openrouter/", "", 1)
+
+        headers = {
+            "Authorization": f"Bearer {request_api_key}",
+            "Content-Type": "application/json",
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+        elif self.extra_headers:
+            headers.update(self.extra_headers)
 
-                tc_id = tc.get("id")
-                if not isinstance(tc_id, str) or not tc_id.strip():
-                    tc_id = f"call_{len(parsed_tool_calls) + 1}"
+        # Prepare messages
+        api_messages = []
+        system_prompts = []
 
-                arguments = tc.get("arguments")
-                if isinstance(arguments, dict):
-                    parsed_args = arguments
-                elif isinstance(arguments, str):
-                    try:
-                        loaded = json.loads(arguments) if arguments.strip() else {}
-                        # Guard: LLM sometimes sends [] for no-param tools instead of {}
-                        parsed_args = loaded if isinstance(loaded, dict) else {}
-                    except json.JSONDecodeError:
-                        parsed_args = {"raw": arguments}
-                elif arguments is None:
-                    parsed_args = {}
-                else:
-                    parsed_args = {}
-
-                parsed_tool_calls.append(
-                    ToolCallRequest(
-                        id=tc_id,
-                        name=name,
-                        arguments=parsed_args,
-                    )
-                )
+        for msg in messages:
+            if msg["role"] == "system":
+                system_prompts.append(msg["content"])
+            else:
+                new_msg = msg.copy()
+                if "reasoning_content" in new_msg:
+                    new_msg["reasoning_details"] = new_msg.pop("reasoning_content")
+                api_messages.append(new_msg)
+
+        # Merge system prompts
+        if system_prompts and api_messages:
+            for i, m in enumerate(api_messages):
+                if m["role"] == "user":
+                    combined_system = "\n\n".join(system_prompts)
+                    if isinstance(m["content"], str):
+                        api_messages[i]["content"] = f"{combined_system}\n\n{m['content']}"
+                    elif isinstance(m["content"], list):
+                        api_messages[i]["content"].insert(0, {"type": "text", "text": combined_system + "\n\n"})
+                    break
+            else:
+                api_messages.insert(0, {"role": "user", "content": "\n\n".join(system_prompts)})
+
+        data = {
+            "model": api_model,
+            "messages": api_messages,
+            "reasoning": {"enabled": True}
+        }
 
-            content = response_data.get("content", "")
-            logger.debug(f"ChatGPT Backend API response: {len(content)} chars, {len(parsed_tool_calls)} tool calls")
-            return LLMResponse(
-                content=content,
-                tool_calls=parsed_tool_calls,
-                finish_reason="tool_calls" if parsed_tool_calls else "stop",
-                usage={},
-            )
-        except (RateLimitError, APIConnectionError, ServiceUnavailableError, InvalidRequestError):
-            raise
-        except Exception as e:
-            raise e
+        if tools:
+            data["tools"] = tools
+            data["tool_choice"] = "auto"
+        return headers, data
 
     async def _chat_openrouter(
         self,
@@ -789,119 +1029,81 @@ class LiteLLMProvider(LLMProvider):
         api_key: str | None = None,
         extra_headers: dict[str, str] | None = None,
     ) -> LLMResponse:
-        """Handle OpenRouter requests using raw requests lib."""
-
-        def _make_request():
-            request_api_key = api_key or self.api_key or os.environ.get("OPENROUTER_API_KEY")
-            if not request_api_key:
-                raise ValueError("OPENROUTER_API_KEY not found")
-
-            # Prepare model name for OpenRouter API (strip gateway prefix)
-            api_model = model
-            if api_model.startswith("openrouter/"):
-                api_model = api_model.replace("openrouter/", "", 1)
-
-            headers = {
-                "Authorization": f"Bearer {request_api_key}",
-                "Content-Type": "application/json",
-            }
-            if extra_headers:
-                headers.update(extra_headers)
-            elif self.extra_headers:
-                headers.update(self.extra_headers)
-
-            # Prepare messages
-            api_messages = []
-            system_prompts = []
-
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_prompts.append(msg["content"])
-                else:
-                    new_msg = msg.copy()
-                    if "reasoning_content" in new_msg:
-                        new_msg["reasoning_details"] = new_msg.pop("reasoning_content")
-                    api_messages.append(new_msg)
-
-            # Merge system prompts
-            if system_prompts and api_messages:
-                for i, m in enumerate(api_messages):
-                    if m["role"] == "user":
-                        combined_system = "\n\n".join(system_prompts)
-                        if isinstance(m["content"], str):
-                            api_messages[i]["content"] = f"{combined_system}\n\n{m['content']}"
-                        elif isinstance(m["content"], list):
-                            api_messages[i]["content"].insert(0, {"type": "text", "text": combined_system + "\n\n"})
-                        break
-                else:
-                    api_messages.insert(0, {"role": "user", "content": "\n\n".join(system_prompts)})
-
-            data = {
-                "model": api_model,
-                "messages": api_messages,
-                "reasoning": {"enabled": True}
-            }
-
-            if tools:
-                data["tools"] = tools
-                data["tool_choice"] = "auto"
+        """Handle OpenRouter requests over the pooled HTTP client."""
+        headers, data = self._build_openrouter_request(
+            messages, tools, model, api_key=api_key, extra_headers=extra_headers
+        )
+        client = self._http_client()
+        try:
+            response = await client.post(_OPENROUTER_CHAT_URL, headers=headers, json=data)
+            if response.status_code == 400:
+                # Smart fallback for tools: retry cleanly without tools/reasoning/extra params.
+                data.pop("tools", None)
+                data.pop("tool_choice", None)
+                data.pop("reasoning", None)
+                response = await client.post(_OPENROUTER_CHAT_URL, headers=headers, json=data)
+                if response.status_code >= 400:
+                    raise InvalidRequestError(
+                        message=f"OpenRouter 400 (retry failed): HTTP {response.status_code}: {response.text[:500]}",
+                        llm_provider="openrouter",
+                        model=model,
+                    )
+        except httpx.TransportError as e:
+            raise APIConnectionError(message=str(e), llm_provider="openrouter", model=model)
 
-            try:
-                response = requests.post(
-                    url="https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    data=json.dumps(data)
-                )
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.HTTPError as e:
-                # Handle specific HTTP errors to map to LiteLLM exceptions for retry logic
-                if e.response is not None:
-                    status = e.response.status_code
-                    if status == 429:
-                        raise RateLimitError(message=str(e), llm_provider="openrouter", model=model)
-                    elif status >= 500:
-                        raise ServiceUnavailableError(message=str(e), llm_provider="openrouter", model=model)
-                    elif status == 400:
-                        # Special handling for tools 400
-                        try:
-                            # Retry cleanly without tools/reasoning/extra params
-                            data.pop("tools", None)
-                            data.pop("tool_choice", None)
-                            data.pop("reasoning", None)
-
-                            # Note: This recursive-ish retry is synchronous and blocking,
-                            # but within run_in_executor. It handles the "Smart Fallback" for tools specifically.
-                            response = requests.post(
-                                url="https://openrouter.ai/api/v1/chat/completions",
-                                headers=headers,
-                                data=json.dumps(data)
-                            )
-                            response.raise_for_status()
-                            return response.json()
-                        except Exception as retry_e:
-                            raise InvalidRequestError(message=f"OpenRouter 400 (retry failed): {retry_e}", llm_provider="openrouter", model=model)
-
-                    # Other 4xx
-                    raise InvalidRequestError(message=str(e), llm_provider="openrouter", model=model)
-                else:
-                    raise APIConnectionError(message=str(e), llm_provider="openrouter", model=model)
-            except requests.exceptions.RequestException as e:
-                raise APIConnectionError(message=str(e), llm_provider="openrouter", model=model)
-            except Exception as e:
-                raise e
+        if response.status_code >= 400:
+            self._raise_for_http_status(response.status_code, response.text, "openrouter", model)
+        return self._parse_openrouter_response(response.json())
 
+    async def _stream_openrouter(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str,
+        api_key: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream OpenRouter ``chat.completion.chunk`` events."""
+        headers, data = self._build_openrouter_request(
+            messages, tools, model, api_key=api_key, extra_headers=extra_headers
+        )
+        data["stream"] = True
+        payloads = [data]
+        # Same smart fallback as the sync path: a 400 is retried once without
+        # tools/reasoning before it is treated as a bad request.
+        stripped = {k: v for k, v in data.items() if k not in ("tools", "tool_choice", "reasoning")}
+        if stripped != data:
+            payloads.append(stripped)
+
+        accumulator = ChatCompletionStreamAccumulator()
+        client = self._http_client()
         try:
-            loop = asyncio.get_running_loop()
-            response_data = await loop.run_in_executor(None, _make_request)
-            return self._parse_openrouter_response(response_data)
-        except (RateLimitError, APIConnectionError, ServiceUnavailableError, InvalidRequestError):
-            # Re-raise known exceptions for handling in caller
-            raise
-        except Exception as e:
-            # Map generic errors to APIConnectionError if safe, or bubble up?
-            # Safe to bubble up to be caught by catch-all in chat()
-            raise e
+            for attempt, payload in enumerate(payloads, start=1):
+                async with client.stream(
+                    "POST", _OPENROUTER_CHAT_URL, headers=headers, json=payload
+                ) as response:
+                    if response.status_code == 400 and attempt < len(payloads):
+                        continue
+                    if response.status_code >= 400:
+                        error_body = (await response.aread()).decode("utf-8", errors="replace")
+                        self._raise_for_http_status(
+                            response.status_code, error_body, "openrouter", model
+                        )
+                    async for event in aiter_sse_events(response.aiter_lines()):
+                        if "error" in event:
+                            error = event["error"]
+                            error_msg = (
+                                error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                            )
+                            raise Exception(f"API Error: {error_msg}")
+                        chunk = accumulator.add_chunk(event)
+                        if chunk is not None:
+                            yield chunk
+                break
+        except httpx.TransportError as e:
+            raise APIConnectionError(message=str(e), llm_provider="openrouter", model=model)
+
+        yield LLMStreamChunk(response=accumulator.build_response())
 
     def _parse_openrouter_response(self, response: dict) -> LLMResponse:
         """Parse OpenRouter raw response."""
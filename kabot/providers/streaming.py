@@ -0,0 +1,206 @@
+"""Helpers for streamed chat completions.
+
+Turns server-sent events and OpenAI-style ``chat.completion.chunk`` deltas
+into :class:`LLMStreamChunk` increments, and assembles the final
+:class:`LLMResponse` once the stream ends.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator
+
+from kabot.providers.base import LLMResponse, LLMStreamChunk, ToolCallDelta, ToolCallRequest
+from kabot.providers.chatgpt_backend_client import extract_content_from_event
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read ``name`` from a dict payload or an SDK object."""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _parse_arguments(raw: str) -> dict[str, Any]:
+    text = raw.strip()
+    if not text:
+        return {}
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        return {"raw": raw}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+async def aiter_sse_events(lines: AsyncIterator[str]) -> AsyncIterator[dict[str, Any]]:
+    """Parse an async iterator of SSE lines into JSON ``data:`` payloads."""
+    data_lines: list[str] = []
+
+    def _flush() -> dict[str, Any] | None:
+        data = "\n".join(data_lines).strip()
+        data_lines.clear()
+        if not data or data == "[DONE]":
+            return None
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError:
+            return None
+        return event if isinstance(event, dict) else None
+
+    async for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        if not line.strip():
+            event = _flush()
+            if event is not None:
+                yield event
+            continue
+        stripped = line.strip()
+        if stripped.startswith("data:"):
+            data_lines.append(stripped[5:].strip())
+        # Comments (": keep-alive") and event/id/retry fields carry no payload.
+
+    event = _flush()
+    if event is not None:
+        yield event
+
+
+def chatgpt_event_increment(
+    event: dict[str, Any], call_indexes: dict[str, int]
+) -> LLMStreamChunk | None:
+    """
+    Visible increment carried by one ChatGPT backend (responses API) event.
+
+    ``call_indexes`` maps output item ids to tool-call indexes and is shared
+    across the events of one stream. The final response is still assembled by
+    ``parse_chatgpt_stream_events`` over the same events, so streamed text and
+    final content agree.
+    """
+    text = extract_content_from_event(event) or ""
+    event_type = event.get("type")
+    deltas: list[ToolCallDelta] = []
+    if event_type == "response.output_item.added":
+        item = event.get("item")
+        if isinstance(item, dict) and item.get("type") == "function_call":
+            key = str(item.get("id") or item.get("call_id") or len(call_indexes))
+            index = call_indexes.setdefault(key, len(call_indexes))
+            arguments = item.get("arguments")
+            deltas.append(
+                ToolCallDelta(
+                    index=index,
+                    id=str(item.get("call_id") or item.get("id") or "") or None,
+                    name=str(item.get("name") or "") or None,
+                    arguments=arguments if isinstance(arguments, str) else "",
+                )
+            )
+    elif event_type == "response.function_call_arguments.delta":
+        key = str(event.get("item_id") or event.get("id") or event.get("call_id") or "")
+        delta = event.get("delta")
+        if key and isinstance(delta, str) and delta:
+            index = call_indexes.setdefault(key, len(call_indexes))
+            deltas.append(ToolCallDelta(index=index, arguments=delta))
+    if not text and not deltas:
+        return None
+    return LLMStreamChunk(content=text, tool_call_deltas=deltas)
+
+
+class ChatCompletionStreamAccumulator:
+    """Collect OpenAI-style streaming deltas into one LLMResponse."""
+
+    def __init__(self) -> None:
+        self._content: list[str] = []
+        self._reasoning: list[str] = []
+        self._tool_calls: dict[int, dict[str, Any]] = {}
+        self.finish_reason: str | None = None
+        self.usage: dict[str, int] = {}
+
+    def add_chunk(self, chunk: Any) -> LLMStreamChunk | None:
+        """
+        Fold one ``chat.completion.chunk`` (dict or SDK object) into the state.
+
+        Returns the visible increment, or None when the chunk only carried
+        bookkeeping (role, finish reason, usage).
+        """
+        usage = _field(chunk, "usage")
+        if usage:
+            self.usage = {
+                "prompt_tokens": int(_field(usage, "prompt_tokens") or 0),
+                "completion_tokens": int(_field(usage, "completion_tokens") or 0),
+                "total_tokens": int(_field(usage, "total_tokens") or 0),
+            }
+
+        choices = _field(chunk, "choices") or []
+        if not choices:
+            return None
+        choice = choices[0]
+        finish_reason = _field(choice, "finish_reason")
+        if finish_reason:
+            self.finish_reason = str(finish_reason)
+
+        delta = _field(choice, "delta")
+        if delta is None:
+            return None
+        content = _field(delta, "content")
+        content = content if isinstance(content, str) else ""
+        if content:
+            self._content.append(content)
+        reasoning = _field(delta, "reasoning_content") or _field(delta, "reasoning")
+        if isinstance(reasoning, str) and reasoning:
+            self._reasoning.append(reasoning)
+
+        tool_deltas: list[ToolCallDelta] = []
+        for position, raw_call in enumerate(_field(delta, "tool_calls") or []):
+            index = _field(raw_call, "index")
+            index = int(index) if isinstance(index, int) else position
+            function = _field(raw_call, "function")
+            call_id = _field(raw_call, "id")
+            name = _field(function, "name")
+            arguments = _field(function, "arguments")
+            arguments = arguments if isinstance(arguments, str) else ""
+
+            state = self._tool_calls.setdefault(index, {"id": None, "name": "", "arguments": []})
+            if call_id:
+                state["id"] = str(call_id)
+            if name:
+                state["name"] = str(name)
+            if arguments:
+                state["arguments"].append(arguments)
+            tool_deltas.append(
+                ToolCallDelta(
+                    index=index,
+                    id=str(call_id) if call_id else None,
+                    name=str(name) if name else None,
+                    arguments=arguments,
+                )
+            )
+
+        if not content and not tool_deltas:
+            return None
+        return LLMStreamChunk(content=content, tool_call_deltas=tool_deltas)
+
+    def build_response(self) -> LLMResponse:
+        tool_calls: list[ToolCallRequest] = []
+        for index in sorted(self._tool_calls):
+            state = self._tool_calls[index]
+            if not state["name"]:
+                continue
+            tool_calls.append(
+                ToolCallRequest(
+                    id=state["id"] or f"call_{index + 1}",
+                    name=state["name"],
+                    arguments=_parse_arguments("".join(state["arguments"])),
+                )
+            )
+        content = "".join(self._content)
+        reasoning = "".join(self._reasoning)
+        return LLMResponse(
+            content=content or None,
+            tool_calls=tool_calls,
+            finish_reason=self.finish_reason or ("tool_calls" if tool_calls else "stop"),
+            usage=dict(self.usage),
+            reasoning_content=reasoning or None,
+        )
+
+
+__all__ = ["ChatCompletionStreamAccumulator", "aiter_sse_events", "chatgpt_event_increment"]
@@ -5,9 +5,13 @@ Pattern from Kabot: infra/exec-approvals.ts
 Provides allowlist/deny/ask policies with tamper-proof configuration.
 """
 
+import atexit
 import hashlib
 import json
+import os
 import re
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -36,6 +40,15 @@ _PRESET_EXTRA_DENYLIST = {
     "compat": [],
 }
 
+# Audit lines are flushed this often while checks keep coming, and fsynced at
+# least this often (and whenever the writer goes idle).
+_AUDIT_FLUSH_INTERVAL_S = 0.25
+_AUDIT_FSYNC_INTERVAL_S = 5.0
+# Above this many pending lines the caller flushes synchronously.
+_AUDIT_MAX_PENDING = 5_000
+_RULE_CACHE_MAX = 256
+
+
 class ApprovalDecision(Enum):
     """Command approval decision."""
     ALLOW = "allow"
@@ -70,6 +83,149 @@ class CommandPattern:
         return bool(self.compiled_regex.match(command))
 
 
+class _CompiledPatternSet:
+    """
+    One list of patterns folded into a single anchored alternation.
+
+    Alternatives are tried in list order, so the attributed pattern is the
+    same one a sequential scan would have stopped at.
+    """
+
+    def __init__(self, patterns: List[CommandPattern]):
+        self.patterns = [pattern for pattern in patterns if pattern.compiled_regex is not None]
+        self._regex: Optional[re.Pattern] = None
+        if self.patterns:
+            self._regex = re.compile(
+                "|".join(
+                    f"(?P<p{index}>{pattern.compiled_regex.pattern})"
+                    for index, pattern in enumerate(self.patterns)
+                )
+            )
+
+    def first_match(self, command: str) -> Optional[CommandPattern]:
+        if self._regex is None:
+            return None
+        match = self._regex.match(command)
+        if match is None or not match.lastgroup:
+            return None
+        return self.patterns[int(match.lastgroup[1:])]
+
+
+@dataclass(frozen=True)
+class _EffectiveRules:
+    """Policy mode and compiled lists that apply to one execution context."""
+
+    policy_name: str
+    policy_mode: str
+    allow: _CompiledPatternSet
+    deny: _CompiledPatternSet
+
+
+class _BufferedAuditWriter:
+    """
+    Append-only JSONL writer shared by every firewall logging to one path.
+
+    ``write`` only queues the line; a daemon thread appends queued lines
+    through a persistent handle, flushes every ``_AUDIT_FLUSH_INTERVAL_S``,
+    fsyncs periodically and on idle, then exits until the next write.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._handle = None
+        self._thread: Optional[threading.Thread] = None
+        self._last_fsync = time.monotonic()
+
+    def _ensure_handle(self):
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "a", encoding="utf-8")
+        return self._handle
+
+    def write(self, line: str) -> None:
+        with self._io_lock:
+            # Open on the caller's thread so the log file exists as soon as
+            # the first decision is made; later writes only enqueue.
+            self._ensure_handle()
+        with self._lock:
+            self._pending.append(line)
+            overflow = len(self._pending) >= _AUDIT_MAX_PENDING
+            if not overflow and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="kabot-firewall-audit",
+                    daemon=True,
+                )
+                self._thread.start()
+        if overflow:
+            self.flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        with self._io_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+            if not lines and not fsync:
+                return
+            handle = self._ensure_handle()
+            if lines:
+                handle.write("".join(lines))
+            handle.flush()
+            if fsync or time.monotonic() - self._last_fsync >= _AUDIT_FSYNC_INTERVAL_S:
+                os.fsync(handle.fileno())
+                self._last_fsync = time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(_AUDIT_FLUSH_INTERVAL_S)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed writing approval audit log: {e}")
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    break
+        try:
+            self.flush(fsync=True)
+        except Exception as e:
+            logger.error(f"Failed syncing approval audit log: {e}")
+
+    def close(self) -> None:
+        """Flush pending lines and release the file handle."""
+        try:
+            self.flush(fsync=True)
+        except Exception as e:
+            logger.error(f"Failed writing approval audit log: {e}")
+        with self._io_lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+_audit_writers: Dict[Path, _BufferedAuditWriter] = {}
+_audit_writers_lock = threading.Lock()
+
+
+def _get_audit_writer(path: Path) -> _BufferedAuditWriter:
+    with _audit_writers_lock:
+        writer = _audit_writers.get(path)
+        if writer is None:
+            writer = _BufferedAuditWriter(path)
+            _audit_writers[path] = writer
+        return writer
+
+
+@atexit.register
+def _close_audit_writers() -> None:
+    with _audit_writers_lock:
+        writers = list(_audit_writers.values())
+    for writer in writers:
+        writer.close()
+
+
 @dataclass
 class ScopedPolicy:
     """Scoped policy entry for context-aware approval decisions."""
@@ -139,6 +295,11 @@ class CommandFirewall:
         self.scoped_policies: List[ScopedPolicy] = []
         self.config_hash: str = ""
         self._load_failed: bool = False
+        self._audit_writer = _get_audit_writer(self.audit_log_path)
+        # stat() signature of config + hash file at the last successful check.
+        self._verified_signature: Optional[tuple] = None
+        self._scope_keys: tuple[str, ...] = ()
+        self._rule_cache: Dict[Optional[tuple], _EffectiveRules] = {}
 
         # Load and verify configuration
         self._load_policy()
@@ -178,38 +339,26 @@ class CommandFirewall:
             )
             return ApprovalDecision.DENY
 
-        active_policy_name = "global"
-        policy_mode = self.policy.get('policy', 'ask')
-        allowlist = list(self.allowlist)
-        denylist = list(self.denylist)
-
-        scoped_policy = self._resolve_scoped_policy(context)
-        if scoped_policy:
-            active_policy_name = scoped_policy.name
-            policy_mode = scoped_policy.policy or policy_mode
-            if scoped_policy.inherit_global:
-                allowlist.extend(scoped_policy.allowlist)
-                denylist.extend(scoped_policy.denylist)
-            else:
-                allowlist = list(scoped_policy.allowlist)
-                denylist = list(scoped_policy.denylist)
+        rules = self._rules_for_context(context)
+        active_policy_name = rules.policy_name
+        policy_mode = rules.policy_mode
 
         # Check denylist first (highest priority)
-        for pattern in denylist:
-            if pattern.matches(command):
-                logger.warning(
-                    f"Command denied by denylist: {command} "
-                    f"(matched: {pattern.pattern})"
-                )
-                self._append_audit_entry(
-                    command=command,
-                    decision=ApprovalDecision.DENY,
-                    reason="matched_denylist",
-                    context=context,
-                    matched_pattern=pattern.pattern,
-                    policy_name=active_policy_name,
-                )
-                return ApprovalDecision.DENY
+        pattern = rules.deny.first_match(command)
+        if pattern is not None:
+            logger.warning(
+                f"Command denied by denylist: {command} "
+                f"(matched: {pattern.pattern})"
+            )
+            self._append_audit_entry(
+                command=command,
+                decision=ApprovalDecision.DENY,
+                reason="matched_denylist",
+                context=context,
+                matched_pattern=pattern.pattern,
+                policy_name=active_policy_name,
+            )
+            return ApprovalDecision.DENY
 
         if policy_mode == 'deny':
             # Deny all commands
@@ -224,21 +373,21 @@ class CommandFirewall:
 
         elif policy_mode == 'allowlist':
             # Check allowlist
-            for pattern in allowlist:
-                if pattern.matches(command):
-                    logger.info(
-                        f"Command allowed by allowlist: {command} "
-                        f"(matched: {pattern.pattern})"
-                    )
-                    self._append_audit_entry(
-                        command=command,
-                        decision=ApprovalDecision.ALLOW,
-                        reason="matched_allowlist",
-                        context=context,
-                        matched_pattern=pattern.pattern,
-                        policy_name=active_policy_name,
-                    )
-                    return ApprovalDecision.ALLOW
+            pattern = rules.allow.first_match(command)
+            if pattern is not None:
+                logger.info(
+                    f"Command allowed by allowlist: {command} "
+                    f"(matched: {pattern.pattern})"
+                )
+                self._append_audit_entry(
+                    command=command,
+                    decision=ApprovalDecision.ALLOW,
+                    reason="matched_allowlist",
+                    context=context,
+                    matched_pattern=pattern.pattern,
+                    policy_name=active_policy_name,
+                )
+                return ApprovalDecision.ALLOW
 
             # Not in allowlist - ask user
             self._append_audit_entry(
@@ -263,6 +412,7 @@ class CommandFirewall:
 
     def _load_policy(self) -> None:
         """Load policy from config file."""
+        self._verified_signature = None
         try:
             self._load_failed = False
             if not self.config_path.exists():
@@ -309,9 +459,12 @@ class CommandFirewall:
             self.allowlist = []
             self.denylist = []
             self.scoped_policies = []
+        finally:
+            self._invalidate_rules()
 
     def _apply_policy_preset(self) -> None:
         """Apply in-memory preset overlays without breaking explicit config policy."""
+        self._invalidate_rules()
         if self._load_failed:
             # Never relax fail-safe deny mode when config could not be loaded.
             self.policy["policy"] = "deny"
@@ -422,6 +575,53 @@ class CommandFirewall:
         matches.sort(key=lambda p: p.specificity(), reverse=True)
         return matches[0]
 
+    def _invalidate_rules(self) -> None:
+        self._rule_cache = {}
+        self._scope_keys = tuple(
+            sorted({key for policy in self.scoped_policies for key in policy.scope})
+        )
+
+    def _rules_for_context(self, context: Dict[str, Any]) -> _EffectiveRules:
+        """
+        Effective policy for ``context``, memoized on the context fields that
+        scoped policies actually look at.
+        """
+        cache_key = (
+            tuple(str(context.get(key, "")).strip() for key in self._scope_keys)
+            if context
+            else None
+        )
+        rules = self._rule_cache.get(cache_key)
+        if rules is not None:
+            return rules
+
+        active_policy_name = "global"
+        policy_mode = self.policy.get('policy', 'ask')
+        allowlist = list(self.allowlist)
+        denylist = list(self.denylist)
+
+        scoped_policy = self._resolve_scoped_policy(context)
+        if scoped_policy:
+            active_policy_name = scoped_policy.name
+            policy_mode = scoped_policy.policy or policy_mode
+            if scoped_policy.inherit_global:
+                allowlist.extend(scoped_policy.allowlist)
+                denylist.extend(scoped_policy.denylist)
+            else:
+                allowlist = list(scoped_policy.allowlist)
+                denylist = list(scoped_policy.denylist)
+
+        rules = _EffectiveRules(
+            policy_name=active_policy_name,
+            policy_mode=policy_mode,
+            allow=_CompiledPatternSet(allowlist),
+            deny=_CompiledPatternSet(denylist),
+        )
+        if len(self._rule_cache) >= _RULE_CACHE_MAX:
+            self._rule_cache.clear()
+        self._rule_cache[cache_key] = rules
+        return rules
+
     def _append_audit_entry(
         self,
         command: str,
@@ -445,9 +645,7 @@ class CommandFirewall:
             payload["matched_pattern"] = matched_pattern
 
         try:
-            self.audit_log_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.audit_log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+            self._audit_writer.write(json.dumps(payload, separators=(",", ":")) + "\n")
         except Exception as e:
             logger.error(f"Failed writing approval audit log: {e}")
 
@@ -474,13 +672,31 @@ class CommandFirewall:
         except Exception as e:
             logger.error(f"Error saving config hash: {e}")
 
+    def _integrity_signature(self) -> Optional[tuple]:
+        """stat() fingerprint of the config and hash files, or None if either is missing."""
+        try:
+            signature = []
+            for path in (self.config_path, self.hash_path):
+                st = path.stat()
+                signature.append((st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino))
+            return tuple(signature)
+        except OSError:
+            return None
+
     def _verify_integrity(self) -> bool:
         """
         Verify config file has not been tampered with.
 
+        The file is only re-hashed when the config or hash file's stat()
+        signature changed since the last successful check.
+
         Returns:
             True if config is valid and untampered
         """
+        signature = self._integrity_signature()
+        if signature is not None and signature == self._verified_signature:
+            return True
+        self._verified_signature = None
         try:
             # Compute current hash
             current_hash = self._compute_hash()
@@ -490,6 +706,7 @@ class CommandFirewall:
                 # First run - save hash
                 self.config_hash = current_hash
                 self._save_hash()
+                self._verified_signature = self._integrity_signature()
                 return True
 
             # Load stored hash
@@ -505,6 +722,7 @@ class CommandFirewall:
                 )
                 return False
 
+            self._verified_signature = signature
             return True
 
         except Exception as e:
@@ -651,6 +869,7 @@ class CommandFirewall:
         entries: List[Dict[str, Any]] = []
 
         try:
+            self._audit_writer.flush()
             with open(self.audit_log_path, "r", encoding="utf-8") as f:
                 lines = f.readlines()
         except Exception as e:
@@ -685,6 +904,7 @@ class CommandFirewall:
     def clear_audit(self) -> None:
         """Clear audit log file if present."""
         try:
+            self._audit_writer.close()
             if self.audit_log_path.exists():
                 self.audit_log_path.unlink()
         except Exception as e:
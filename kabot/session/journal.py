@@ -0,0 +1,477 @@
+"""Append-only session persistence with background compaction.
+
+Session files keep the historical layout: one ``metadata`` header line followed
+by one JSON line per message. Instead of rewriting the whole file on every
+save, the journal appends only messages that are new since the last write plus
+a ``metadata_delta`` record for changed metadata keys. Superseded deltas are
+garbage; once they outweigh the live content the file is compacted back to the
+plain layout on a worker thread.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from kabot.utils.pid_lock import PIDLock
+
+METADATA_RECORD = "metadata"
+METADATA_DELTA_RECORD = "metadata_delta"
+
+
+@dataclass
+class JournalCursor:
+    """What is already on disk for one cached session object."""
+
+    session: Any
+    path: Path
+    created_at: str
+    updated_at: str
+    message_count: int
+    last_message: Any
+    metadata_lines: dict[str, str]
+    message_bytes: int
+    file_bytes: int
+    resident_bytes: int
+    compacting: bool = False
+    pending_tail: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SessionScan:
+    """Metadata plus the recent message tail replayed from a journal file."""
+
+    metadata: dict[str, Any]
+    created_at: datetime | None
+    updated_at: datetime | None
+    tail: list[dict[str, Any]]
+    older_message_lines: int
+    tail_bytes: int
+    message_bytes: int
+    file_bytes: int
+    clean_end: bool
+
+
+def _encode_metadata(metadata: dict[str, Any]) -> dict[str, str]:
+    return {str(key): json.dumps(value) for key, value in metadata.items()}
+
+
+def _metadata_bytes(metadata_lines: dict[str, str]) -> int:
+    return sum(len(key) + len(value) + 6 for key, value in metadata_lines.items())
+
+
+def _prefix_intact(cursor: JournalCursor, messages: list[Any]) -> bool:
+    count = cursor.message_count
+    if len(messages) < count:
+        return False
+    return not count or messages[count - 1] is cursor.last_message
+
+
+def _header_line(created_at: str, updated_at: str, metadata_lines: dict[str, str]) -> str:
+    # Re-assemble the header from per-key encodings so compaction writes exactly
+    # the metadata state the journal has persisted, not the live (unsaved) one.
+    body = ", ".join(f"{json.dumps(key)}: {value}" for key, value in metadata_lines.items())
+    return (
+        f'{{"_type": "{METADATA_RECORD}", "created_at": {json.dumps(created_at)}, '
+        f'"updated_at": {json.dumps(updated_at)}, "metadata": {{{body}}}}}\n'
+    )
+
+
+def _replace_file(temp_path: Path, path: Path) -> None:
+    if os.name == "nt":  # Windows
+        if path.exists():
+            os.remove(path)
+        os.rename(temp_path, path)
+    else:  # Unix
+        os.replace(temp_path, path)
+
+
+def _metadata_record(line: str) -> dict[str, Any] | None:
+    """Decode ``line`` when it is a header/delta record; message lines return None."""
+    # Records are written by json.dumps, so message lines never start with the
+    # ``_type`` key and can be counted without being decoded.
+    if not line.startswith('{"_type"'):
+        return None
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if data.get("_type") in (METADATA_RECORD, METADATA_DELTA_RECORD):
+        return data
+    return None
+
+
+def _decode_messages(lines: Any, path: Path) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+    for line in lines:
+        try:
+            messages.append(json.loads(line))
+        except json.JSONDecodeError:
+            # A crash mid-append can leave one truncated trailing record.
+            logger.warning(f"Skipping unreadable session record in {path.name}")
+    return messages
+
+
+def scan_session_file(path: Path, *, tail_messages: int = 0) -> SessionScan:
+    """
+    Replay metadata from a session file (plain or journaled).
+
+    Only the last ``tail_messages`` message lines are decoded (all of them when
+    ``tail_messages`` is 0); older ones are counted and left on disk for
+    :func:`read_session_messages`.
+    """
+    metadata: dict[str, Any] = {}
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    tail: deque[str] = deque(maxlen=tail_messages if tail_messages > 0 else None)
+    message_lines = 0
+    message_bytes = 0
+    file_bytes = 0
+    clean_end = True
+
+    with open(path) as f:
+        for raw in f:
+            file_bytes += len(raw)
+            clean_end = raw.endswith("\n")
+            line = raw.strip()
+            if not line:
+                continue
+            data = _metadata_record(line)
+            if data is None:
+                message_lines += 1
+                message_bytes += len(line) + 1
+                tail.append(line)
+            elif data["_type"] == METADATA_RECORD:
+                metadata = data.get("metadata", {})
+                created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
+                updated_at = datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None
+            else:
+                changed = data.get("set")
+                if isinstance(changed, dict):
+                    metadata.update(changed)
+                for key in data.get("unset") or []:
+                    metadata.pop(key, None)
+                if data.get("updated_at"):
+                    updated_at = datetime.fromisoformat(data["updated_at"])
+
+    return SessionScan(
+        metadata=metadata,
+        created_at=created_at,
+        updated_at=updated_at,
+        tail=_decode_messages(tail, path),
+        older_message_lines=message_lines - len(tail),
+        tail_bytes=sum(len(line) + 1 for line in tail),
+        message_bytes=message_bytes,
+        file_bytes=file_bytes,
+        clean_end=clean_end,
+    )
+
+
+def read_session_messages(path: Path, *, limit: int) -> list[dict[str, Any]]:
+    """Decode the first ``limit`` message lines of a session file."""
+    lines: list[str] = []
+    if limit <= 0:
+        return []
+    with open(path) as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or _metadata_record(line) is not None:
+                continue
+            lines.append(line)
+            if len(lines) >= limit:
+                break
+    return _decode_messages(lines, path)
+
+
+class SessionJournal:
+    """
+    Incremental writer for session JSONL files.
+
+    ``save`` costs O(new messages + metadata size) instead of O(history). A
+    full rewrite still happens the first time a session object is saved, when
+    its message list was replaced or truncated (for example ``clear()``), and
+    after any write error, so on-disk state never diverges from memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        compact_min_bytes: int = 256 * 1024,
+        compact_ratio: float = 1.0,
+        background_compaction: bool = True,
+    ):
+        self.compact_min_bytes = max(0, int(compact_min_bytes))
+        self.compact_ratio = max(0.0, float(compact_ratio))
+        self.background_compaction = bool(background_compaction)
+        self._cursors: dict[str, JournalCursor] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._compactions: dict[str, Future] = {}
+        self.full_writes = 0
+        self.appends = 0
+        self.compactions = 0
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[key] = lock
+            return lock
+
+    def track_loaded(self, key: str, path: Path, session: Any, scan: SessionScan) -> None:
+        """Start journaling a session that was just replayed from ``path``."""
+        if not scan.clean_end:
+            # Truncated tail: appending would glue onto it, so the next save
+            # must rewrite the file instead.
+            return
+        messages = session.messages
+        with self._lock_for(key):
+            self._cursors[key] = JournalCursor(
+                session=session,
+                path=path,
+                created_at=session.created_at.isoformat(),
+                updated_at=session.updated_at.isoformat(),
+                message_count=len(messages),
+                last_message=messages[-1] if messages else None,
+                metadata_lines=_encode_metadata(session.metadata),
+                message_bytes=scan.message_bytes,
+                file_bytes=scan.file_bytes,
+                resident_bytes=scan.tail_bytes,
+            )
+
+    def forget(self, key: str) -> None:
+        """Drop journal state for ``key`` so the next save rewrites the file."""
+        with self._lock_for(key):
+            self._cursors.pop(key, None)
+
+    def can_append(self, key: str, path: Path, session: Any) -> bool:
+        """Return True when the next ``save`` of ``session`` will be an append."""
+        with self._lock_for(key):
+            cursor = self._cursors.get(key)
+            return cursor is not None and self._can_append(cursor, session, path)
+
+    def is_dirty(self, key: str, session: Any) -> bool:
+        """Return True when ``session`` holds state that ``save`` has not written yet."""
+        with self._lock_for(key):
+            cursor = self._cursors.get(key)
+            if cursor is None or cursor.session is not session:
+                return bool(session.messages or session.metadata)
+            messages = session.messages
+            return (
+                len(messages) != cursor.message_count
+                or not _prefix_intact(cursor, messages)
+                or session.updated_at.isoformat() != cursor.updated_at
+                or _encode_metadata(session.metadata) != cursor.metadata_lines
+            )
+
+    def resident_bytes(self, key: str) -> int:
+        """Approximate serialized size of what the tracked session keeps in memory."""
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            return 0
+        return cursor.resident_bytes + _metadata_bytes(cursor.metadata_lines)
+
+    def save(self, key: str, path: Path, session: Any) -> bool:
+        """Persist ``session``; return True when the file was fully rewritten."""
+        lock = self._lock_for(key)
+        with lock:
+            cursor = self._cursors.get(key)
+            if cursor is not None and self._can_append(cursor, session, path):
+                try:
+                    self._append(cursor, session)
+                except Exception:
+                    self._cursors.pop(key, None)
+                    raise
+                needs_compaction = self._needs_compaction(cursor)
+                rewritten = False
+            else:
+                self._cursors.pop(key, None)
+                self._write_full(key, path, session)
+                needs_compaction = False
+                rewritten = True
+        if needs_compaction:
+            self._schedule_compaction(key)
+        return rewritten
+
+    @staticmethod
+    def _can_append(cursor: JournalCursor, session: Any, path: Path) -> bool:
+        if cursor.session is not session or cursor.path != path:
+            return False
+        return _prefix_intact(cursor, session.messages) and path.exists()
+
+    def _append(self, cursor: JournalCursor, session: Any) -> None:
+        messages = session.messages
+        new_messages = messages[cursor.message_count:]
+        lines = [json.dumps(msg) + "\n" for msg in new_messages]
+        message_bytes = sum(len(line) for line in lines)
+
+        metadata_lines = _encode_metadata(session.metadata)
+        changed = {
+            key: value
+            for key, value in metadata_lines.items()
+            if cursor.metadata_lines.get(key) != value
+        }
+        removed = [key for key in cursor.metadata_lines if key not in metadata_lines]
+        updated_at = session.updated_at.isoformat()
+        if changed or removed or updated_at != cursor.updated_at:
+            body = ", ".join(f"{json.dumps(key)}: {value}" for key, value in changed.items())
+            lines.append(
+                f'{{"_type": "{METADATA_DELTA_RECORD}", "updated_at": {json.dumps(updated_at)}, '
+                f'"set": {{{body}}}, "unset": {json.dumps(removed)}}}\n'
+            )
+
+        if not lines:
+            return
+
+        payload = "".join(lines)
+        with PIDLock(cursor.path):
+            with open(cursor.path, "a") as f:
+                f.write(payload)
+        if cursor.compacting:
+            cursor.pending_tail.append(payload)
+
+        cursor.message_count = len(messages)
+        cursor.last_message = messages[-1] if messages else None
+        cursor.updated_at = updated_at
+        cursor.metadata_lines = metadata_lines
+        cursor.message_bytes += message_bytes
+        cursor.resident_bytes += message_bytes
+        cursor.file_bytes += len(payload)
+        self.appends += 1
+
+    def _write_full(self, key: str, path: Path, session: Any) -> None:
+        """Rewrite the whole file atomically and start a fresh cursor."""
+        metadata_lines = _encode_metadata(session.metadata)
+        created_at = session.created_at.isoformat()
+        updated_at = session.updated_at.isoformat()
+
+        # Use PIDLock for multi-process safety (Phase 13 fix)
+        with PIDLock(path):
+            # Write to temp file first for atomic replacement
+            temp_path = path.with_suffix(".tmp")
+            with open(temp_path, "w") as f:
+                header = _header_line(created_at, updated_at, metadata_lines)
+                f.write(header)
+                written = len(header)
+                for msg in session.messages:
+                    line = json.dumps(msg) + "\n"
+                    f.write(line)
+                    written += len(line)
+            _replace_file(temp_path, path)
+
+        messages = session.messages
+        self._cursors[key] = JournalCursor(
+            session=session,
+            path=path,
+            created_at=created_at,
+            updated_at=updated_at,
+            message_count=len(messages),
+            last_message=messages[-1] if messages else None,
+            metadata_lines=metadata_lines,
+            message_bytes=written - len(header),
+            file_bytes=written,
+            resident_bytes=written - len(header),
+        )
+        self.full_writes += 1
+
+    def _needs_compaction(self, cursor: JournalCursor) -> bool:
+        if cursor.compacting:
+            return False
+        live_bytes = cursor.message_bytes + _metadata_bytes(cursor.metadata_lines)
+        garbage_bytes = cursor.file_bytes - live_bytes
+        threshold = max(self.compact_min_bytes, int(live_bytes * self.compact_ratio))
+        return garbage_bytes > threshold
+
+    def _schedule_compaction(self, key: str) -> None:
+        if not self.background_compaction:
+            self.compact(key)
+            return
+        pending = self._compactions.get(key)
+        if pending is not None and not pending.done():
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kabot-session-compact")
+        self._compactions[key] = self._executor.submit(self.compact, key)
+
+    def compact(self, key: str) -> bool:
+        """Rewrite ``key``'s file without superseded deltas. Safe to run off-thread."""
+        lock = self._lock_for(key)
+        with lock:
+            cursor = self._cursors.get(key)
+            if cursor is None or cursor.compacting:
+                return False
+            cursor.compacting = True
+            cursor.pending_tail = []
+            header = _header_line(cursor.created_at, cursor.updated_at, cursor.metadata_lines)
+            persisted_bytes = cursor.file_bytes
+
+        temp_path = cursor.path.with_suffix(".compact.tmp")
+        try:
+            # The expensive part runs without the lock so saves keep appending;
+            # anything they append meanwhile is replayed from pending_tail.
+            # Message lines are copied from disk, so sessions hydrated with only
+            # their recent tail compact without loading older history.
+            with open(cursor.path) as src, open(temp_path, "w") as f:
+                f.write(header)
+                written = len(header)
+                remaining = persisted_bytes
+                for raw in src:
+                    if remaining <= 0:
+                        break
+                    remaining -= len(raw)
+                    line = raw.strip()
+                    if not line or _metadata_record(line) is not None:
+                        continue
+                    f.write(line + "\n")
+                    written += len(line) + 1
+
+            with lock:
+                if self._cursors.get(key) is not cursor:
+                    # A full rewrite superseded this compaction.
+                    temp_path.unlink(missing_ok=True)
+                    return False
+                tail = "".join(cursor.pending_tail)
+                with PIDLock(cursor.path):
+                    if tail:
+                        with open(temp_path, "a") as f:
+                            f.write(tail)
+                    _replace_file(temp_path, cursor.path)
+                cursor.file_bytes = written + len(tail)
+                self.compactions += 1
+                return True
+        except Exception as exc:
+            logger.warning(f"Session compaction failed for {key}: {exc}")
+            temp_path.unlink(missing_ok=True)
+            return False
+        finally:
+            with lock:
+                cursor.compacting = False
+                cursor.pending_tail = []
+
+    def wait_for_compactions(self, timeout: float | None = None) -> None:
+        """Block until scheduled compactions finish (used on shutdown and in tests)."""
+        for future in list(self._compactions.values()):
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+        self._compactions = {key: fut for key, fut in self._compactions.items() if not fut.done()}
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "tracked_sessions": len(self._cursors),
+            "full_writes": self.full_writes,
+            "appends": self.appends,
+            "compactions": self.compactions,
+        }
@@ -1,19 +1,25 @@
 """Session management for conversation history."""
 
 import json
-import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from loguru import logger
 
 from kabot.core.context_engine import LegacyContextEngine
 from kabot.core.queue import DormantQueue
-from kabot.session.transcript import resolve_transcript_path, write_session_transcript
+from kabot.session.journal import SessionJournal, read_session_messages, scan_session_file
+from kabot.session.transcript import (
+    append_session_transcript,
+    count_transcript_messages,
+    resolve_transcript_path,
+    transcript_header_signature,
+    write_session_transcript,
+)
 from kabot.utils.helpers import ensure_dir, safe_filename
-from kabot.utils.pid_lock import PIDLock
 
 _DURABLE_HISTORY_METADATA_KEY = "durable_history"
 
@@ -46,6 +52,33 @@ class Session:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Older messages still on disk when only the recent tail was hydrated.
+    history_offset: int = field(default=0, init=False, repr=False, compare=False)
+    _history_loader: Callable[[int], list[dict[str, Any]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def message_count(self) -> int:
+        """Total messages in the session, including ones not hydrated yet."""
+        return self.history_offset + len(self.messages)
+
+    def ensure_history(self, min_messages: int) -> list[dict[str, Any]]:
+        """Return ``messages`` with at least ``min_messages`` hydrated when available."""
+        if self.history_offset and len(self.messages) < min_messages:
+            self.load_full_history()
+        return self.messages
+
+    def load_full_history(self) -> list[dict[str, Any]]:
+        """Read the messages older than the hydrated tail back from disk."""
+        if self.history_offset and self._history_loader is not None:
+            older = self._history_loader(self.history_offset)
+            # A new list (not an in-place insert) so the journal sees replaced
+            # history and rewrites the file instead of appending.
+            self.messages = older + self.messages
+        self.history_offset = 0
+        self._history_loader = None
+        return self.messages
 
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the session."""
@@ -72,6 +105,7 @@ class Session:
 
     def compile_context(self, max_messages: int = 50) -> list[dict[str, Any]]:
         """Compile LLM-ready history through the legacy context engine."""
+        self.ensure_history(max_messages)
         if not self.messages:
             return self.get_durable_history_snapshot(max_messages=max_messages)
         engine = LegacyContextEngine(max_messages=max_messages)
@@ -101,6 +135,8 @@ class Session:
         """Clear conversation history and transient runtime metadata."""
         self.messages = []
         self.metadata = {}
+        self.history_offset = 0
+        self._history_loader = None
         self.updated_at = datetime.now()
 
     def enqueue_pending_work(self, payload: Any) -> None:
@@ -135,14 +171,41 @@ class SessionManager:
     """
     Manages conversation sessions.
 
-    Sessions are stored as JSONL files in the sessions directory.
+    Sessions are stored as JSONL files in the sessions directory. Saves are
+    journaled: only new messages and changed metadata keys are appended, and
+    files are compacted in the background once superseded deltas pile up.
+
+    Loaded sessions live in an LRU cache bounded by count and approximate
+    serialized size; evicted sessions are flushed first if they have unsaved
+    changes. A cache miss hydrates metadata (including the durable history
+    snapshot) and only the last ``hydrate_tail_messages`` messages; older ones
+    are read from disk when something asks for more history than that.
     """
 
-    def __init__(self, workspace: Path):
+    def __init__(
+        self,
+        workspace: Path,
+        *,
+        max_cached_sessions: int = 256,
+        max_cached_bytes: int = 64 * 1024 * 1024,
+        hydrate_tail_messages: int = 50,
+    ):
         self.workspace = workspace
         self.sessions_dir = ensure_dir(Path.home() / ".kabot" / "sessions")
         self.transcripts_dir = ensure_dir(self.sessions_dir / "transcripts")
-        self._cache: dict[str, Session] = {}
+        self.max_cached_sessions = max(1, int(max_cached_sessions or 1))
+        self.max_cached_bytes = max(0, int(max_cached_bytes or 0))
+        self.hydrate_tail_messages = max(0, int(hydrate_tail_messages or 0))
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        self._cache_sizes: dict[str, int] = {}
+        self._cached_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self._journal = SessionJournal()
+        # key -> (session, persisted message count, last persisted message, header signature)
+        self._transcript_cursors: dict[str, tuple[Session, int, Any, str]] = {}
+        self._save_listeners: list[Callable[[str], None]] = []
 
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
@@ -160,92 +223,172 @@ class SessionManager:
             The session.
         """
         # Check cache
-        if key in self._cache:
-            return self._cache[key]
+        session = self._cache.get(key)
+        if session is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return session
 
         # Try to load from disk
+        self.cache_misses += 1
         session = self._load(key)
         if session is None:
             session = Session(key=key)
 
-        self._cache[key] = session
+        self._remember(session)
         return session
 
     def _load(self, key: str) -> Session | None:
-        """Load a session from disk."""
+        """Load a session's metadata and recent message tail from disk."""
         path = self._get_session_path(key)
 
         if not path.exists():
             return None
 
         try:
-            messages = []
-            metadata = {}
-            created_at = None
-
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    data = json.loads(line)
-
-                    if data.get("_type") == "metadata":
-                        metadata = data.get("metadata", {})
-                        created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-                    else:
-                        messages.append(data)
-
-            return Session(
+            scan = scan_session_file(path, tail_messages=self.hydrate_tail_messages)
+            session = Session(
                 key=key,
-                messages=messages,
-                created_at=created_at or datetime.now(),
-                metadata=metadata
+                messages=scan.tail,
+                created_at=scan.created_at or datetime.now(),
+                updated_at=scan.updated_at or datetime.now(),
+                metadata=scan.metadata
             )
         except Exception as e:
             logger.warning(f"Failed to load session {key}: {e}")
             return None
 
+        if scan.older_message_lines:
+            session.history_offset = scan.older_message_lines
+            session._history_loader = lambda limit: read_session_messages(path, limit=limit)
+            self._seed_transcript_cursor(session)
+        self._journal.track_loaded(key, path, session, scan)
+        return session
+
+    def _seed_transcript_cursor(self, session: Session) -> None:
+        """Let the first save of a tail-hydrated session append to an up-to-date transcript."""
+        try:
+            on_disk = count_transcript_messages(self.transcripts_dir, session.key)
+        except OSError as e:
+            logger.warning(f"Failed to read session transcript for {session.key}: {e}")
+            return
+        if on_disk != session.message_count:
+            return
+        messages = session.messages
+        self._transcript_cursors[session.key] = (
+            session,
+            len(messages),
+            messages[-1] if messages else None,
+            transcript_header_signature(session),
+        )
+
     def save(self, session: Session) -> None:
-        """Save a session to disk with PID-based locking and atomic writes."""
+        """Persist a session: append new records, or rewrite atomically when history changed."""
+        self._persist(session)
+        self._remember(session)
+        self._notify_saved(session.key)
+
+    def add_save_listener(self, callback: Callable[[str], None]) -> None:
+        """Call ``callback(session_key)`` after every save or delete (e.g. to push live views)."""
+        self._save_listeners.append(callback)
+
+    def _notify_saved(self, key: str) -> None:
+        for callback in list(self._save_listeners):
+            try:
+                callback(key)
+            except Exception as e:
+                logger.warning(f"Session save listener failed for {key}: {e}")
+
+    def _persist(self, session: Session) -> None:
         path = self._get_session_path(session.key)
         transcript_path = resolve_transcript_path(self.transcripts_dir, session.key)
         session.metadata["transcript_path"] = str(transcript_path)
 
-        # Use PIDLock for multi-process safety (Phase 13 fix)
-        with PIDLock(path):
-            # Write to temp file first for atomic replacement
-            temp_path = path.with_suffix(".tmp")
-
-            with open(temp_path, "w") as f:
-                # Write metadata first
-                metadata_line = {
-                    "_type": "metadata",
-                    "created_at": session.created_at.isoformat(),
-                    "updated_at": session.updated_at.isoformat(),
-                    "metadata": session.metadata
-                }
-                f.write(json.dumps(metadata_line) + "\n")
-
-                # Write messages
-                for msg in session.messages:
-                    f.write(json.dumps(msg) + "\n")
-
-            # Atomic rename (replace existing if possible)
-            if os.name == 'nt':  # Windows
-                if path.exists():
-                    os.remove(path)
-                os.rename(temp_path, path)
-            else:  # Unix
-                os.replace(temp_path, path)
-
-        self._cache[session.key] = session
+        if session.history_offset and not self._journal.can_append(session.key, path, session):
+            # A full rewrite must include the history that was never hydrated.
+            session.load_full_history()
+        rewritten = self._journal.save(session.key, path, session)
+
         try:
-            write_session_transcript(self.transcripts_dir, session)
+            self._save_transcript(session, force_rewrite=rewritten)
         except Exception as e:
+            self._transcript_cursors.pop(session.key, None)
             logger.warning(f"Failed to update session transcript for {session.key}: {e}")
 
+    def _save_transcript(self, session: Session, *, force_rewrite: bool) -> None:
+        """Mirror new messages into the transcript, rewriting it only when needed."""
+        messages = session.messages
+        signature = transcript_header_signature(session)
+        cursor = self._transcript_cursors.get(session.key)
+        can_append = False
+        if cursor is not None and not force_rewrite:
+            cached_session, count, last_message, cached_signature = cursor
+            can_append = (
+                cached_session is session
+                and cached_signature == signature
+                and len(messages) >= count
+                and (not count or messages[count - 1] is last_message)
+            )
+        if can_append:
+            append_session_transcript(self.transcripts_dir, session, messages[cursor[1]:])
+        else:
+            if session.history_offset:
+                # Rewriting from the hydrated tail alone would drop older history.
+                messages = session.load_full_history()
+            write_session_transcript(self.transcripts_dir, session)
+        self._transcript_cursors[session.key] = (
+            session,
+            len(messages),
+            messages[-1] if messages else None,
+            signature,
+        )
+
+    def _remember(self, session: Session) -> None:
+        """Insert or refresh ``session`` as most recently used, then enforce bounds."""
+        key = session.key
+        self._cache[key] = session
+        self._cache.move_to_end(key)
+        size = self._journal.resident_bytes(key)
+        self._cached_bytes += size - self._cache_sizes.get(key, 0)
+        self._cache_sizes[key] = size
+        self._evict_over_budget()
+
+    def _evict_over_budget(self) -> None:
+        while len(self._cache) > 1 and (
+            len(self._cache) > self.max_cached_sessions
+            or (self.max_cached_bytes and self._cached_bytes > self.max_cached_bytes)
+        ):
+            key, session = next(iter(self._cache.items()))
+            if self._journal.is_dirty(key, session):
+                try:
+                    self._persist(session)
+                except Exception as e:
+                    # Keep unsaved state in memory rather than dropping it.
+                    logger.warning(f"Failed to flush session {key} before eviction: {e}")
+                    self._cache.move_to_end(key)
+                    return
+            self._cache.pop(key, None)
+            self._cached_bytes -= self._cache_sizes.pop(key, 0)
+            self._journal.forget(key)
+            self._transcript_cursors.pop(key, None)
+            self.cache_evictions += 1
+
+    def cache_stats(self) -> dict[str, int]:
+        """Session cache occupancy and hit/miss/eviction counters."""
+        return {
+            "cached_sessions": len(self._cache),
+            "max_cached_sessions": self.max_cached_sessions,
+            "cached_bytes": self._cached_bytes,
+            "max_cached_bytes": self.max_cached_bytes,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "evictions": self.cache_evictions,
+        }
+
+    def wait_for_compactions(self, timeout: float | None = None) -> None:
+        """Block until background session-file compactions finish."""
+        self._journal.wait_for_compactions(timeout=timeout)
+
     def delete(self, key: str) -> bool:
         """
         Delete a session.
@@ -258,11 +401,15 @@ class SessionManager:
         """
         # Remove from cache
         self._cache.pop(key, None)
+        self._cached_bytes -= self._cache_sizes.pop(key, 0)
+        self._journal.forget(key)
+        self._transcript_cursors.pop(key, None)
 
         # Remove file
         path = self._get_session_path(key)
         if path.exists():
             path.unlink()
+            self._notify_saved(key)
             return True
         return False
 
@@ -286,10 +433,25 @@ class SessionManager:
                             sessions.append({
                                 "key": path.stem.replace("_", ":"),
                                 "created_at": data.get("created_at"),
-                                "updated_at": data.get("updated_at"),
+                                "updated_at": self._effective_updated_at(path, data.get("updated_at")),
                                 "path": str(path)
                             })
             except Exception:
                 continue
 
         return sorted(sessions, key=lambda x: x.get("updated_at", ""), reverse=True)
+
+    @staticmethod
+    def _effective_updated_at(path: Path, header_updated_at: Any) -> Any:
+        """Header timestamps go stale once deltas are appended; prefer a newer file mtime."""
+        try:
+            modified = datetime.fromtimestamp(path.stat().st_mtime)
+        except OSError:
+            return header_updated_at
+        try:
+            header_dt = datetime.fromisoformat(str(header_updated_at)) if header_updated_at else None
+        except ValueError:
+            header_dt = None
+        if header_dt is not None and header_dt >= modified:
+            return header_updated_at
+        return modified.isoformat()
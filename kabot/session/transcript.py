@@ -15,11 +15,10 @@ def resolve_transcript_path(transcripts_dir: Path, session_key: str) -> Path:
     return ensure_dir(transcripts_dir) / f"{safe_key}.jsonl"
 
 
-def write_session_transcript(transcripts_dir: Path, session: Any) -> Path:
-    path = resolve_transcript_path(transcripts_dir, getattr(session, "key", "session"))
+def _transcript_header(session: Any) -> dict[str, Any]:
     metadata = getattr(session, "metadata", None)
     session_meta = metadata if isinstance(metadata, dict) else {}
-    header = {
+    return {
         "_type": "transcript",
         "session_key": getattr(session, "key", ""),
         "created_at": getattr(getattr(session, "created_at", None), "isoformat", lambda: "")(),
@@ -27,6 +26,17 @@ def write_session_transcript(transcripts_dir: Path, session: Any) -> Path:
         "cwd": str(session_meta.get("working_directory") or "").strip() or None,
         "delivery_route": normalize_delivery_route(session_meta.get("delivery_route")),
     }
+
+
+def transcript_header_signature(session: Any) -> str:
+    """Stable digest of header fields that force a transcript rewrite when they change."""
+    header = _transcript_header(session)
+    return json.dumps([header["cwd"], header["delivery_route"]], sort_keys=True)
+
+
+def write_session_transcript(transcripts_dir: Path, session: Any) -> Path:
+    path = resolve_transcript_path(transcripts_dir, getattr(session, "key", "session"))
+    header = _transcript_header(session)
     with open(path, "w", encoding="utf-8") as fh:
         fh.write(json.dumps(header, ensure_ascii=False) + "\n")
         for message in list(getattr(session, "messages", []) or []):
@@ -34,3 +44,30 @@ def write_session_transcript(transcripts_dir: Path, session: Any) -> Path:
                 continue
             fh.write(json.dumps(message, ensure_ascii=False) + "\n")
     return path
+
+
+def count_transcript_messages(transcripts_dir: Path, session_key: str) -> int | None:
+    """Number of message lines in a transcript mirror, or ``None`` when it does not exist."""
+    path = resolve_transcript_path(transcripts_dir, session_key)
+    if not path.exists():
+        return None
+    count = 0
+    with open(path, "rb") as fh:
+        for index, line in enumerate(fh):
+            if index and line.strip():
+                count += 1
+    return count
+
+
+def append_session_transcript(transcripts_dir: Path, session: Any, messages: list[Any]) -> Path:
+    """Append only ``messages`` to an existing transcript mirror."""
+    path = resolve_transcript_path(transcripts_dir, getattr(session, "key", "session"))
+    lines = [
+        json.dumps(message, ensure_ascii=False) + "\n"
+        for message in messages
+        if isinstance(message, dict)
+    ]
+    if lines:
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write("".join(lines))
+    return path
@@ -0,0 +1,175 @@
+"""
+Shared long-lived async HTTP clients.
+
+LLM provider calls and web tools borrow a named ``httpx.AsyncClient`` from
+this pool instead of opening a client per request, so keep-alive connections
+(and HTTP/2 when ``h2`` is installed) are reused across turns. Clients are
+bound to the event loop that created them; each running loop gets its own.
+
+Limits:
+1. ``max_connections`` / ``max_keepalive_connections`` per client (httpx).
+2. ``max_connections_per_host``: in-flight requests per host, held until the
+   response body is closed. On HTTP/1.1 this is the per-host connection cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class HttpPoolSettings:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    max_connections_per_host: int = 16
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 15.0
+    read_timeout_seconds: float = 120.0
+    http2: bool = True
+
+
+_settings = HttpPoolSettings()
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that releases its per-host slot once closed."""
+
+    def __init__(self, inner: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._inner = inner
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._inner:
+            yield part
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Cap concurrent requests per host in front of a pooled transport."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, max_per_host: int):
+        self._inner = inner
+        self._max_per_host = max(1, int(max_per_host))
+        self._slots: dict[tuple[str, str, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = (request.url.scheme, request.url.host, request.url.port)
+        slot = self._slots.setdefault(host, asyncio.Semaphore(self._max_per_host))
+        await slot.acquire()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if response.is_closed:
+            # Body already buffered (e.g. mock transports): nothing left to hold the slot for.
+            slot.release()
+            return response
+        response.stream = _ReleasingStream(response.stream, slot.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def configure_http_pool(settings: HttpPoolSettings) -> None:
+    """Apply new pool settings to clients created from now on."""
+    global _settings
+    _settings = settings
+
+
+def http_pool_settings_from_config(performance_cfg: Any) -> HttpPoolSettings:
+    """Build settings from ``runtime.performance`` (missing fields keep defaults)."""
+    defaults = HttpPoolSettings()
+    return HttpPoolSettings(
+        max_connections=int(getattr(performance_cfg, "http_max_connections", defaults.max_connections)),
+        max_keepalive_connections=int(
+            getattr(performance_cfg, "http_max_keepalive_connections", defaults.max_keepalive_connections)
+        ),
+        max_connections_per_host=int(
+            getattr(performance_cfg, "http_max_connections_per_host", defaults.max_connections_per_host)
+        ),
+        keepalive_expiry_seconds=float(
+            getattr(performance_cfg, "http_keepalive_expiry_seconds", defaults.keepalive_expiry_seconds)
+        ),
+        connect_timeout_seconds=float(
+            getattr(performance_cfg, "http_connect_timeout_seconds", defaults.connect_timeout_seconds)
+        ),
+        read_timeout_seconds=float(
+            getattr(performance_cfg, "http_read_timeout_seconds", defaults.read_timeout_seconds)
+        ),
+        http2=bool(getattr(performance_cfg, "http2", defaults.http2)),
+    )
+
+
+def _build_client(settings: HttpPoolSettings) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry_seconds,
+    )
+    http2 = settings.http2 and _http2_available()
+    transport = _PerHostLimitTransport(
+        httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+        settings.max_connections_per_host,
+    )
+    timeout = httpx.Timeout(settings.read_timeout_seconds, connect=settings.connect_timeout_seconds)
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+def get_http_client(name: str = "default") -> httpx.AsyncClient:
+    """
+    Shared client ``name`` for the running event loop.
+
+    Callers must not close it (no ``async with``); use :func:`aclose_http_pool`
+    at shutdown. Pass per-request ``timeout=`` / ``follow_redirects=`` when a
+    call needs different behaviour.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = _build_client(_settings)
+        clients[name] = client
+    return client
+
+
+async def aclose_http_pool() -> None:
+    """Close every pooled client owned by the running event loop."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for name, client in clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"Closing pooled HTTP client {name!r} failed: {e}")
+
+
+__all__ = [
+    "HttpPoolSettings",
+    "aclose_http_pool",
+    "configure_http_pool",
+    "get_http_client",
+    "http_pool_settings_from_config",
+]
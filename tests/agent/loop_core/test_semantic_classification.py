@@ -0,0 +1,118 @@
+import json
+from types import SimpleNamespace
+
+from kabot.agent.loop_core.message_runtime_parts import semantic_classification
+from kabot.agent.loop_core.message_runtime_parts.semantic_classification import (
+    SemanticTask,
+    classify_turn_semantics,
+)
+
+
+def _loop():
+    async def _chat(**_kwargs):
+        return None
+
+    return SimpleNamespace(provider=SimpleNamespace(chat=_chat), model="test-model")
+
+
+def _recording_classifier(label: str, calls: list[str], name: str):
+    async def _classify(_loop, _text, **_kwargs):
+        calls.append(name)
+        return label
+
+    return _classify
+
+
+def _patch_llm(monkeypatch, content: str | None):
+    prompts: list[str] = []
+
+    async def _fake_call(**kwargs):
+        prompts.append(kwargs["messages"][0]["content"])
+        return None if content is None else SimpleNamespace(content=content)
+
+    monkeypatch.setattr(semantic_classification, "call_semantic_llm_with_fallback", _fake_call)
+    return prompts
+
+
+def _tasks(calls: list[str]):
+    return [
+        SemanticTask("low_info", _recording_classifier("closing_ack", calls, "low_info")),
+        SemanticTask(
+            "memory",
+            _recording_classifier("memory_recall", calls, "memory"),
+            {"conversation_history": [{"role": "user", "content": "we picked postgres"}]},
+        ),
+    ]
+
+
+async def test_eligible_classifiers_share_one_llm_call(monkeypatch):
+    calls: list[str] = []
+    prompts = _patch_llm(
+        monkeypatch, '```json\n{"turn_intent":"none","memory_intent":"memory_recall"}\n```'
+    )
+
+    outcome = await classify_turn_semantics(
+        _loop(), "so what did we pick", route_profile="CHAT", turn_category="chat", tasks=_tasks(calls)
+    )
+
+    assert outcome.mode == "fused"
+    assert outcome.llm_calls == 1
+    assert outcome.get("low_info") == "none"
+    assert outcome.get("memory") == "memory_recall"
+    assert calls == []
+    assert len(prompts) == 1
+    assert '"turn_intent":"closing_ack|greeting_smalltalk|meta_feedback|none"' in prompts[0]
+    assert "we picked postgres" in prompts[0]
+
+
+async def test_incomplete_fused_answer_falls_back_to_individual_classifiers(monkeypatch):
+    calls: list[str] = []
+    _patch_llm(monkeypatch, json.dumps({"turn_intent": "closing_ack", "memory_intent": "maybe"}))
+
+    outcome = await classify_turn_semantics(
+        _loop(), "thanks, all good", route_profile="CHAT", turn_category="chat", tasks=_tasks(calls)
+    )
+
+    assert outcome.mode == "fallback"
+    assert outcome.llm_calls == 3
+    assert sorted(calls) == ["low_info", "memory"]
+    assert outcome.results == {"low_info": "closing_ack", "memory": "memory_recall"}
+
+
+async def test_single_eligible_classifier_is_left_to_the_call_site(monkeypatch):
+    calls: list[str] = []
+    prompts = _patch_llm(monkeypatch, "{}")
+    long_turn = "please walk me through how the nightly backup job decides which folders to skip " * 2
+
+    outcome = await classify_turn_semantics(
+        _loop(), long_turn, route_profile="GENERAL", turn_category="chat", tasks=_tasks(calls)
+    )
+
+    assert outcome.mode == "skipped"
+    assert outcome.get("low_info") is None
+    assert outcome.get("memory") is None
+    assert prompts == []
+    assert calls == []
+
+
+async def test_fallback_skips_gated_classifiers_the_call_site_would_not_run(monkeypatch):
+    calls: list[str] = []
+    _patch_llm(monkeypatch, None)
+    tasks = [
+        SemanticTask("low_info", _recording_classifier("greeting_smalltalk", calls, "low_info")),
+        SemanticTask(
+            "memory",
+            _recording_classifier("memory_recall", calls, "memory"),
+            {"conversation_history": [{"role": "user", "content": "we picked postgres"}]},
+            gate=lambda results: results.get("low_info") != "greeting_smalltalk",
+        ),
+    ]
+
+    outcome = await classify_turn_semantics(
+        _loop(), "hey there", route_profile="CHAT", turn_category="chat", tasks=tasks
+    )
+
+    assert outcome.mode == "fallback"
+    assert outcome.llm_calls == 2
+    assert calls == ["low_info"]
+    assert outcome.results == {"low_info": "greeting_smalltalk"}
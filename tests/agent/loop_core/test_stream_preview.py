@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from kabot.agent.loop_core.execution_runtime import call_llm_with_fallback
+from kabot.agent.loop_core.execution_runtime_parts.progress import StreamPreviewPublisher
+from kabot.bus.events import InboundMessage
+from kabot.providers.base import LLMResponse, LLMStreamChunk
+
+
+def _streaming_loop(deltas: list[str], *, metadata: dict | None = None):
+    published = []
+
+    async def _publish(message):
+        published.append(message)
+
+    async def _stream_chat(**_kwargs):
+        for delta in deltas:
+            yield LLMStreamChunk(content=delta)
+        yield LLMStreamChunk(response=LLMResponse(content="".join(deltas)))
+
+    provider = SimpleNamespace(
+        supports_streaming=True,
+        stream_chat=_stream_chat,
+        chat=AsyncMock(return_value=LLMResponse(content="buffered")),
+    )
+    loop = SimpleNamespace(
+        provider=provider,
+        bus=SimpleNamespace(publish_outbound=_publish),
+        tools=SimpleNamespace(get_definitions=lambda: []),
+        auth_rotation=None,
+        resilience=SimpleNamespace(handle_error=AsyncMock(), on_success=lambda: None),
+        runtime_resilience=SimpleNamespace(max_model_attempts_per_turn=4, strict_error_classification=True),
+        last_model_used=None,
+        last_fallback_used=False,
+        last_model_chain=[],
+        _active_message_metadata=metadata or {},
+    )
+    msg = InboundMessage(channel="telegram", chat_id="chat-1", sender_id="user-1", content="hi")
+    loop._active_stream_sink = StreamPreviewPublisher(loop=loop, msg=msg, min_interval_ms=0)
+    return loop, published
+
+
+async def test_streamed_text_is_published_as_partial_lane_drafts():
+    loop, published = _streaming_loop(["Hel", "lo ", "there"])
+
+    response, error = await call_llm_with_fallback(
+        loop, [{"role": "user", "content": "hi"}], ["openrouter/openai/gpt-4o-mini"]
+    )
+
+    assert error is None
+    assert response.content == "Hello there"
+    assert [message.content for message in published] == ["Hel", "Hello", "Hello there"]
+    assert {message.metadata["type"] for message in published} == {"draft_update"}
+    assert {message.metadata["lane"] for message in published} == {"partial"}
+    loop.provider.chat.assert_not_awaited()
+
+
+async def test_internal_calls_opt_out_of_streaming():
+    loop, published = _streaming_loop(["ignored"], metadata={"directive_no_stream": True})
+
+    response, error = await call_llm_with_fallback(
+        loop, [{"role": "user", "content": "classify"}], ["openrouter/openai/gpt-4o-mini"]
+    )
+
+    assert error is None
+    assert response.content == "buffered"
+    assert published == []
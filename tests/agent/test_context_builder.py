@@ -629,3 +629,93 @@ def test_context_builder_mcp_context_mode_skips_memory_context_for_explicit_mcp_
     )[0]["content"]
 
     assert "VERY LARGE MEMORY BLOCK" not in prompt
+
+
+def test_context_builder_reuses_stable_prefix_and_keeps_time_in_suffix(tmp_path: Path):
+    ensure_workspace_templates(tmp_path)
+    builder = ContextBuilder(tmp_path)
+    render_calls = {"count": 0}
+    render = builder._render_stable_prompt_prefix
+
+    def _counting_render(**kwargs):
+        render_calls["count"] += 1
+        return render(**kwargs)
+
+    builder._render_stable_prompt_prefix = _counting_render  # type: ignore[assignment]
+
+    first_prefix, first_suffix = builder.build_system_prompt_segments(
+        profile="GENERAL", tool_names=["read_file"], current_message="halo"
+    )
+    second_prefix, _ = builder.build_system_prompt_segments(
+        profile="GENERAL", tool_names=["read_file"], current_message="cek cuaca jakarta"
+    )
+    messages = builder.build_messages(
+        history=[],
+        current_message="apa kabar",
+        tool_names=["read_file"],
+        channel="cli",
+        chat_id="1",
+        max_context=128_000,
+    )
+
+    assert render_calls["count"] == 1
+    assert second_prefix is first_prefix
+    assert messages[0]["content"].startswith(first_prefix)
+    assert "## Current Time" not in first_prefix
+    assert first_suffix.startswith("## Current Time")
+
+
+def test_context_builder_rebuilds_prefix_and_memory_when_files_change(tmp_path: Path):
+    ensure_workspace_templates(tmp_path)
+    builder = ContextBuilder(tmp_path)
+    builder.build_system_prompt(profile="GENERAL", current_message="halo")
+
+    (tmp_path / "SOUL.md").write_text("# SOUL.md\n\nAlways answer like a pirate.\n", encoding="utf-8")
+    builder.memory.write_long_term("User prefers tea over coffee.")
+    prefix, suffix = builder.build_system_prompt_segments(profile="GENERAL", current_message="halo")
+
+    assert "Always answer like a pirate." in prefix
+    assert "User prefers tea over coffee." in suffix
+
+
+def test_context_builder_keeps_one_cached_prefix_per_profile(tmp_path: Path):
+    ensure_workspace_templates(tmp_path)
+    builder = ContextBuilder(tmp_path)
+    render_calls = {"count": 0}
+    render = builder._render_stable_prompt_prefix
+
+    def _counting_render(**kwargs):
+        render_calls["count"] += 1
+        return render(**kwargs)
+
+    builder._render_stable_prompt_prefix = _counting_render  # type: ignore[assignment]
+
+    prefixes = [
+        builder.build_system_prompt_segments(profile=profile, current_message="halo")[0]
+        for profile in ("GENERAL", "CODING", "GENERAL", "CODING")
+    ]
+
+    assert render_calls["count"] == 2
+    assert prefixes[2] is prefixes[0]
+    assert prefixes[3] is prefixes[1]
+
+
+def test_context_builder_reuses_one_guardrail_store_and_releases_it(tmp_path: Path):
+    from kabot.memory.sqlite_store import SQLiteMetadataStore
+
+    db_path = tmp_path / "chroma" / "metadata.db"
+    writer = SQLiteMetadataStore(db_path)
+    builder = ContextBuilder(tmp_path)
+
+    writer.add_lesson("l1", "t", "m", "f", "Check the file before editing it.")
+    assert "Check the file before editing it." in builder._build_guardrails_prompt()
+    store = builder._guardrail_store
+    writer.add_lesson("l2", "t", "m", "f", "Confirm the timezone first.")
+    assert "Confirm the timezone first." in builder._build_guardrails_prompt()
+    assert builder._guardrail_store is store
+
+    builder.close()
+    assert builder._guardrail_store is None
+    assert not writer._pool.closed
+    writer.close()
+    assert writer._pool.closed
@@ -76,6 +76,21 @@ async def test_close_runtime_resources_drains_pending_memory_tasks():
     assert not loop._pending_memory_tasks
 
 
+@pytest.mark.asyncio
+async def test_close_runtime_resources_flushes_memory_write_behind():
+    class _FakeLoop(AgentLoopDelegatesMixin):
+        pass
+
+    loop = _FakeLoop()
+    loop._pending_memory_tasks = set()
+    loop._mcp_session_runtimes = {}
+    loop.memory = SimpleNamespace(flush_writes=AsyncMock())
+
+    await loop.close_runtime_resources()
+
+    loop.memory.flush_writes.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_process_direct_persist_history_flushes_delayed_memory_writes_on_close(tmp_path):
     provider = MagicMock()
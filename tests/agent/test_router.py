@@ -1,5 +1,6 @@
 import pytest
 
+from kabot.agent.route_cache import RouteCache
 from kabot.agent.router import IntentRouter
 
 
@@ -232,3 +233,70 @@ async def test_route_skill_creation_spec_turn_uses_fallback_model_chain_when_pri
     assert decision.is_complex is True
     assert getattr(decision, "workflow_intent", None) == "skill_creator"
     assert provider.chat_calls[:2] == ["primary-model", "fallback-model"]
+
+
+@pytest.mark.asyncio
+async def test_route_cache_reuses_decision_for_normalized_repeat():
+    provider = _StructuredRouteProvider(
+        '{"profile":"CHAT","turn_category":"chat","is_complex":false}'
+    )
+    router = IntentRouter(provider, route_cache=RouteCache())
+
+    first = await router.route("Good morning!")
+    second = await router.route("  good   MORNING ")
+    second.is_complex = True  # callers mutate decisions; the cached copy must not change
+    third = await router.route("good morning")
+
+    assert provider.chat_calls == 1
+    assert first.profile == second.profile == third.profile == "CHAT"
+    assert third.is_complex is False
+    stats = router.route_cache.get_stats()["profiles"]["CHAT"]
+    assert stats["exact_hits"] == 2
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_route_cache_entries_expire_and_respect_lru_bound():
+    now = [0.0]
+    provider = _StructuredRouteProvider(
+        '{"profile":"GENERAL","turn_category":"action","is_complex":true}'
+    )
+    cache = RouteCache(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+    router = IntentRouter(provider, route_cache=cache)
+
+    await router.route("restart the gateway")
+    await router.route("check disk usage")
+    await router.route("restart the gateway")
+    await router.route("show the cron jobs")  # evicts "check disk usage"
+    await router.route("check disk usage")
+    assert provider.chat_calls == 4
+
+    now[0] = 61.0
+    await router.route("check disk usage")
+    assert provider.chat_calls == 5
+
+
+@pytest.mark.asyncio
+async def test_route_cache_semantic_tier_matches_near_duplicate():
+    vectors = {
+        "please restart the gateway": [1.0, 0.0, 0.1],
+        "restart the gateway please": [0.99, 0.0, 0.12],
+        "tell me a joke": [0.0, 1.0, 0.0],
+    }
+
+    async def _embed(text: str):
+        return vectors.get(text)
+
+    provider = _StructuredRouteProvider(
+        '{"profile":"GENERAL","turn_category":"action","is_complex":true}'
+    )
+    router = IntentRouter(provider, route_cache=RouteCache(embed=_embed, similarity_threshold=0.98))
+
+    await router.route("please restart the gateway")
+    decision = await router.route("restart the gateway please")
+    await router.route("tell me a joke")
+
+    assert decision.turn_category == "action"
+    assert provider.chat_calls == 2
+    assert router.route_cache.get_stats()["profiles"]["GENERAL"]["semantic_hits"] == 1
+
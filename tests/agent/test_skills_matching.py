@@ -1,8 +1,10 @@
 import os
 from pathlib import Path
 
+import kabot.agent.skills as skills_module
 from kabot.agent.skills import SkillsLoader, looks_like_skill_catalog_request
 from kabot.agent.skills_matching import looks_like_skill_install_request
+from kabot.agent.skills_parts.match_index import KeywordAutomaton, find_full_name_mentions
 
 _LEGACY_EXTERNAL_METADATA_KEY = "".join(
     chr(code) for code in (111, 112, 101, 110, 99, 108, 97, 119)
@@ -813,3 +815,80 @@ def test_builtin_config_manager_exposes_grounded_diagnostics_adaptation(tmp_path
     }
 
     assert details["config-manager"]["adapt_grounded_diagnostics"] is True
+
+
+def test_keyword_automaton_finds_overlapping_names_on_token_boundaries():
+    names = {"git": ["git"], "github": ["github"], "hub": ["hub"], "ล้างแคช": ["ล้างแคช"]}
+    automaton = KeywordAutomaton(names)
+    text = "use github or hub-cli then git; ช่วยล้างแคชดิสก์"
+
+    found = {pattern for _, pattern in automaton.find_all(text)}
+    mentioned = find_full_name_mentions(automaton.find_all(text), names, text)
+
+    assert found == {"git", "github", "hub", "ล้างแคช"}
+    assert mentioned == {"github", "git"}
+
+
+def test_match_skills_scores_only_indexed_candidates(tmp_path, monkeypatch):
+    fake_home = tmp_path / "home"
+    fake_home.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr("kabot.agent.skills.Path.home", lambda: fake_home)
+
+    workspace = tmp_path / "workspace"
+    builtin = tmp_path / "builtin"
+    builtin.mkdir(parents=True, exist_ok=True)
+    for index in range(30):
+        _write_skill(workspace / "skills", f"filler-{index}", f"unrelated{index}a unrelated{index}b")
+    _write_skill(workspace / "skills", "weather", "forecast temperature rain wind humidity")
+
+    loader = SkillsLoader(workspace=workspace, builtin_skills_dir=builtin)
+    scored: list[str] = []
+    original_alias_bonus = skills_module._intent_alias_bonus
+
+    def _alias_bonus(skill_name, message_lower):
+        scored.append(skill_name)
+        return original_alias_bonus(skill_name, message_lower)
+
+    monkeypatch.setattr("kabot.agent.skills._intent_alias_bonus", _alias_bonus)
+
+    matches = loader.match_skills("forecast temperature rain today", profile="GENERAL")
+
+    assert matches and matches[0].startswith("weather")
+    assert scored == ["weather"]
+
+
+def test_skill_roots_rescan_is_throttled_by_refresh_interval(tmp_path, monkeypatch):
+    fake_home = tmp_path / "home"
+    fake_home.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr("kabot.agent.skills.Path.home", lambda: fake_home)
+
+    workspace = tmp_path / "workspace"
+    builtin = tmp_path / "builtin"
+    builtin.mkdir(parents=True, exist_ok=True)
+    _write_skill(workspace / "skills", "weather", "forecast temperature rain wind humidity")
+
+    loader = SkillsLoader(
+        workspace=workspace,
+        builtin_skills_dir=builtin,
+        skills_config={"load": {"refreshIntervalSeconds": 30}},
+    )
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("kabot.agent.skills.time.monotonic", lambda: clock["now"])
+    scans = {"count": 0}
+    original_scan = loader._scan_skill_snapshot
+
+    def _scan():
+        scans["count"] += 1
+        return original_scan()
+
+    monkeypatch.setattr(loader, "_scan_skill_snapshot", _scan)
+
+    assert loader.match_skills("forecast temperature rain today", profile="GENERAL")
+    _write_skill(workspace / "skills", "tide-tables", "tidal surf harbor schedule")
+    assert not loader.match_skills("tidal surf harbor schedule", profile="GENERAL")
+    assert scans["count"] == 1
+
+    clock["now"] += 31
+    matches = loader.match_skills("tidal surf harbor schedule", profile="GENERAL")
+    assert scans["count"] == 2
+    assert matches and matches[0].startswith("tide-tables")
@@ -0,0 +1,97 @@
+"""Tests for the shared token counter."""
+
+from kabot.agent.context import TokenBudget
+from kabot.agent.context_guard import ContextGuard
+from kabot.agent.token_counter import MESSAGE_OVERHEAD_TOKENS, TokenCounter
+
+
+class _WordEncoder:
+    name = "words"
+
+    def __init__(self):
+        self.encoded: list[str] = []
+        self.batches = 0
+
+    def encode_ordinary(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_ordinary_batch(self, texts):
+        self.batches += 1
+        return [self.encode_ordinary(text) for text in texts]
+
+
+def _counter() -> tuple[TokenCounter, _WordEncoder]:
+    counter = TokenCounter()
+    encoder = _WordEncoder()
+    counter._encoders["fake-model"] = encoder
+    return counter, encoder
+
+
+def test_counts_are_memoized_per_content_and_provider_prefix_is_ignored():
+    counter, encoder = _counter()
+    text = "one two three four five six seven eight nine ten"
+
+    assert counter.count(text, "fake-model") == 10
+    assert counter.count(text, "openrouter/fake-model") == 10
+    assert encoder.encoded == [text]
+    assert counter.get_stats()["hits"] == 1
+
+
+def test_count_many_batches_misses_and_reuses_earlier_counts():
+    counter, encoder = _counter()
+    history = [f"history message number {i} with several words" for i in range(10)]
+
+    first = counter.count_many(history, "fake-model")
+    second = counter.count_many([*history, "a brand new user turn"], "fake-model")
+
+    assert first == [7] * 10
+    assert second == [7] * 10 + [5]
+    assert encoder.batches == 1
+    assert encoder.encoded[-1] == "a brand new user turn"
+    assert len(encoder.encoded) == 11
+
+
+def test_count_messages_includes_multimodal_text_tool_calls_and_overhead():
+    counter, _ = _counter()
+    messages = [
+        {"role": "user", "content": [{"type": "text", "text": "look at this"}]},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"function": {"name": "weather", "arguments": '{"city": "Oslo"}'}}],
+        },
+    ]
+
+    # "type"/"text" parts count too, as ContextGuard always did.
+    assert counter.count_messages(messages, "fake-model") == 1 + 3 + 1 + 2 + 2 * MESSAGE_OVERHEAD_TOKENS
+
+
+def test_budget_and_guard_share_the_process_counter(monkeypatch):
+    counter, encoder = _counter()
+    monkeypatch.setattr("kabot.agent.context.get_token_counter", lambda: counter)
+    monkeypatch.setattr("kabot.agent.context_guard.get_token_counter", lambda: counter)
+    history = [{"role": "system", "content": "sys"}] + [
+        {"role": "user", "content": f"turn {i} says hello to the assistant again"} for i in range(5)
+    ]
+
+    budget = TokenBudget(model="fake-model", max_context=8192)
+    kept = budget.truncate_history(history, budget=1000)
+    ContextGuard(max_tokens=8192).check_overflow(history, model="fake-model")
+
+    assert kept == history
+    assert len(encoder.encoded) == 6  # history once, plus the short system text
+
+
+def test_memo_is_keyed_by_content_digest_not_length(monkeypatch):
+    counter, encoder = _counter()
+    monkeypatch.setattr("kabot.agent.context.get_token_counter", lambda: counter)
+    same_length = ["alpha beta gamma delta epsilon zeta", "alphabeta gamma delta epsilon zeta!"]
+    assert len(same_length[0]) == len(same_length[1])
+
+    budget = TokenBudget(model="fake-model", max_context=8192)
+
+    assert budget.count_tokens_many(same_length) == [6, 5]
+    assert budget.count_tokens_many(same_length) == [6, 5]
+    assert encoder.encoded == same_length
+    assert all(isinstance(key[1], bytes) and len(key[1]) == 16 for key in counter._counts)
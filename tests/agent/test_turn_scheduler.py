@@ -0,0 +1,160 @@
+"""Tests for session-sharded concurrent turn execution."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from kabot.agent.loop_core.execution_runtime_parts.llm import _provider_fallbacks_suspended
+from kabot.agent.loop_parts.turn_scheduler import SessionTurnScheduler
+from kabot.agent.turn_context import TurnLocal
+from kabot.bus.events import InboundMessage
+
+
+def _msg(chat_id: str, content: str) -> InboundMessage:
+    return InboundMessage(channel="telegram", sender_id="u1", chat_id=chat_id, content=content)
+
+
+@pytest.mark.asyncio
+async def test_turns_for_same_session_stay_ordered():
+    seen: list[str] = []
+
+    async def _handler(msg: InboundMessage) -> None:
+        await asyncio.sleep(0.01 if msg.content == "first" else 0)
+        seen.append(msg.content)
+
+    scheduler = SessionTurnScheduler(_handler, max_concurrent_turns=4)
+    for content in ("first", "second", "third"):
+        await scheduler.submit(_msg("c1", content))
+    await scheduler.join()
+
+    assert seen == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_different_sessions_run_concurrently_up_to_cap():
+    active = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def _handler(_msg: InboundMessage) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await release.wait()
+        active -= 1
+
+    scheduler = SessionTurnScheduler(_handler, max_concurrent_turns=2, max_buffered_turns=8)
+    for chat_id in ("a", "b", "c"):
+        await scheduler.submit(_msg(chat_id, "hi"))
+    await asyncio.sleep(0.01)
+
+    assert peak == 2
+    assert scheduler.stats()["running_turns"] == 2
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert scheduler.stats()["completed_turns"] == 3
+
+
+@pytest.mark.asyncio
+async def test_submit_applies_backpressure_when_buffer_is_full():
+    release = asyncio.Event()
+
+    async def _handler(_msg: InboundMessage) -> None:
+        await release.wait()
+
+    scheduler = SessionTurnScheduler(_handler, max_concurrent_turns=1, max_buffered_turns=2)
+    await scheduler.submit(_msg("a", "1"))
+    await scheduler.submit(_msg("b", "2"))
+
+    blocked = asyncio.create_task(scheduler.submit(_msg("c", "3")))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=1.0)
+    await scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_take_pending_drains_unstarted_messages_for_session():
+    release = asyncio.Event()
+
+    async def _handler(_msg: InboundMessage) -> None:
+        await release.wait()
+
+    scheduler = SessionTurnScheduler(_handler, max_concurrent_turns=1)
+    await scheduler.submit(_msg("a", "running"))
+    await asyncio.sleep(0)
+    await scheduler.submit(_msg("a", "queued-1"))
+    await scheduler.submit(_msg("a", "queued-2"))
+
+    taken = scheduler.take_pending("telegram:a", limit=3)
+
+    assert [item.content for item in taken] == ["queued-1", "queued-2"]
+    release.set()
+    await scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_turn_local_values_do_not_leak_between_concurrent_turns():
+    class _Loop:
+        _active_turn_id = TurnLocal()
+
+    loop = _Loop()
+    observed: dict[str, str] = {}
+
+    async def _turn(turn_id: str) -> None:
+        loop._active_turn_id = turn_id
+        await asyncio.sleep(0.01)
+        observed[turn_id] = loop._active_turn_id
+
+    await asyncio.gather(_turn("turn-a"), _turn("turn-b"))
+
+    assert observed == {"turn-a": "turn-a", "turn-b": "turn-b"}
+    assert getattr(loop, "_active_turn_id", "turn-unknown") == "turn-unknown"
+
+
+@pytest.mark.asyncio
+async def test_overlapping_fallback_suspension_restores_original_chain():
+    provider = SimpleNamespace(fallbacks=["fb-1", "fb-2"])
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _first() -> None:
+        with _provider_fallbacks_suspended(provider):
+            entered.set()
+            await release.wait()
+
+    async def _second() -> None:
+        await entered.wait()
+        with _provider_fallbacks_suspended(provider):
+            assert provider.fallbacks == []
+        release.set()
+
+    await asyncio.gather(_first(), _second())
+
+    assert provider.fallbacks == ["fb-1", "fb-2"]
+
+
+@pytest.mark.asyncio
+async def test_last_model_used_is_reported_per_turn():
+    from kabot.agent.loop import AgentLoop
+
+    loop = object.__new__(AgentLoop)
+    observed: dict[str, tuple] = {}
+
+    async def _turn(model: str, fallback_used: bool) -> None:
+        loop.last_model_used = model
+        loop.last_fallback_used = fallback_used
+        loop.last_model_chain = [model]
+        await asyncio.sleep(0.01)
+        observed[model] = (loop.last_model_used, loop.last_fallback_used, loop.last_model_chain)
+
+    await asyncio.gather(_turn("openai/gpt-4o", False), _turn("groq/llama-3", True))
+
+    assert observed == {
+        "openai/gpt-4o": ("openai/gpt-4o", False, ["openai/gpt-4o"]),
+        "groq/llama-3": ("groq/llama-3", True, ["groq/llama-3"]),
+    }
@@ -0,0 +1,127 @@
+"""Tests for per-chat outbound send lanes."""
+
+import asyncio
+
+import pytest
+
+from kabot.bus.events import OutboundMessage
+from kabot.bus.outbound import OutboundScheduler
+from kabot.bus.queue import MessageBus
+
+
+def _out(chat_id: str, content: str, channel: str = "telegram") -> OutboundMessage:
+    return OutboundMessage(channel=channel, chat_id=chat_id, content=content)
+
+
+@pytest.mark.asyncio
+async def test_outbound_lane_keeps_fifo_order_within_chat():
+    delivered: list[str] = []
+
+    async def _send(msg: OutboundMessage) -> None:
+        await asyncio.sleep(0.01 if msg.content == "1" else 0)
+        delivered.append(msg.content)
+
+    scheduler = OutboundScheduler(max_inflight=4)
+    for content in ("1", "2", "3"):
+        scheduler.submit("telegram", _out("c1", content), _send)
+    await scheduler.join()
+
+    assert delivered == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_slow_chat_does_not_block_other_chats():
+    release_slow = asyncio.Event()
+    delivered: list[str] = []
+
+    async def _send(msg: OutboundMessage) -> None:
+        if msg.chat_id == "slow":
+            await release_slow.wait()
+        delivered.append(msg.chat_id)
+
+    scheduler = OutboundScheduler(max_inflight=2)
+    scheduler.submit("telegram", _out("slow", "x"), _send)
+    scheduler.submit("discord", _out("fast", "y", channel="discord"), _send)
+    await asyncio.sleep(0.01)
+
+    assert delivered == ["fast"]
+    stats = scheduler.stats()
+    assert stats["inflight"] == 1
+    lanes = {(lane["channel"], lane["chat_id"]): lane for lane in stats["lanes"]}
+    assert lanes[("discord", "fast")]["sent"] == 1
+    assert lanes[("telegram", "slow")]["sending"] is True
+
+    release_slow.set()
+    await scheduler.join()
+    assert delivered == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_inflight_sends_are_bounded():
+    active = 0
+    peak = 0
+
+    async def _send(_msg: OutboundMessage) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    scheduler = OutboundScheduler(max_inflight=2)
+    for idx in range(6):
+        scheduler.submit("telegram", _out(f"chat-{idx}", "hi"), _send)
+    await scheduler.join()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_send_is_counted_and_lane_continues():
+    delivered: list[str] = []
+
+    async def _send(msg: OutboundMessage) -> None:
+        if msg.content == "boom":
+            raise RuntimeError("rate limited")
+        delivered.append(msg.content)
+
+    scheduler = OutboundScheduler()
+    scheduler.submit("telegram", _out("c1", "boom"), _send)
+    scheduler.submit("telegram", _out("c1", "after"), _send)
+    await scheduler.join()
+
+    assert delivered == ["after"]
+    lane = scheduler.stats()["lanes"][0]
+    assert lane["failed"] == 1
+    assert lane["sent"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bus_dispatch_outbound_uses_per_chat_lanes():
+    bus = MessageBus()
+    release_slow = asyncio.Event()
+    delivered: list[str] = []
+
+    async def _callback(msg: OutboundMessage) -> None:
+        if msg.chat_id == "slow":
+            await release_slow.wait()
+        delivered.append(msg.chat_id)
+
+    bus.subscribe_outbound("telegram", _callback)
+    dispatch_task = asyncio.create_task(bus.dispatch_outbound())
+    await bus.publish_outbound(_out("slow", "x"))
+    await bus.publish_outbound(_out("fast", "y"))
+    await asyncio.sleep(0.05)
+
+    assert delivered == ["fast"]
+    assert bus.outbound_lane_stats()["queued"] == 0
+
+    release_slow.set()
+    await asyncio.sleep(0.01)
+    bus.stop()
+    dispatch_task.cancel()
+    try:
+        await dispatch_task
+    except asyncio.CancelledError:
+        pass
+    assert delivered == ["fast", "slow"]
@@ -250,3 +250,40 @@ async def test_channel_manager_suppresses_unknown_cli_channel_warning():
 
     warning_messages = [str(call.args[0]) for call in warn_mock.call_args_list if call.args]
     assert not any("Unknown channel: cli" in msg for msg in warning_messages)
+
+
+@pytest.mark.asyncio
+async def test_channel_manager_slow_send_does_not_block_other_chats():
+    config = Config()
+    bus = MessageBus()
+    manager = ChannelManager(config, bus)
+    release_slow = asyncio.Event()
+    delivered: list[str] = []
+
+    class _LaneChannel:
+        is_running = True
+
+        async def send(self, msg: OutboundMessage) -> None:
+            if msg.chat_id == "slow":
+                await release_slow.wait()
+            delivered.append(msg.chat_id)
+
+    manager.channels["telegram"] = _LaneChannel()
+    dispatch_task = asyncio.create_task(manager._dispatch_outbound())
+    await bus.publish_outbound(OutboundMessage(channel="telegram", chat_id="slow", content="a"))
+    await bus.publish_outbound(OutboundMessage(channel="telegram", chat_id="fast", content="b"))
+    await asyncio.sleep(0.05)
+
+    assert delivered == ["fast"]
+    lanes = {lane["chat_id"]: lane for lane in manager.get_outbound_stats()["lanes"]}
+    assert lanes["slow"]["sending"] is True
+    assert lanes["fast"]["sent"] == 1
+
+    release_slow.set()
+    dispatch_task.cancel()
+    try:
+        await dispatch_task
+    except asyncio.CancelledError:
+        pass
+    await manager._outbound.close()
+    assert delivered == ["fast", "slow"]
@@ -823,3 +823,45 @@ async def test_gateway_dashboard_control_action_skills_set_api_key_persists_conf
     assert result["skill_key"] == "demo-skill"
     assert entry["api_key"] == "secret-key"
     assert saved["called"] is True
+
+
+def test_build_dashboard_status_payload_includes_outbound_lane_stats(tmp_path):
+    from kabot.cli import commands
+    from kabot.config.schema import Config
+
+    payload = commands._build_dashboard_status_payload(
+        gateway_started_at=1709800000,
+        runtime_model="gpt-4o-mini",
+        runtime_fallbacks=[],
+        runtime_host="127.0.0.1",
+        runtime_port=18790,
+        tailscale_mode="off",
+        session_manager=SimpleNamespace(
+            sessions_dir=tmp_path,
+            list_sessions=lambda: [],
+        ),
+        channels=SimpleNamespace(
+            enabled_channels=["telegram"],
+            get_status=lambda: {"telegram": {"running": True}},
+            get_outbound_stats=lambda: {
+                "max_inflight": 8,
+                "inflight": 1,
+                "queued": 3,
+                "lanes": [
+                    {"channel": "telegram", "chat_id": "a", "queue_depth": 0, "avg_latency_ms": 12.0},
+                    {"channel": "telegram", "chat_id": "b", "queue_depth": 3, "avg_latency_ms": 850.0},
+                ],
+            },
+        ),
+        cron=SimpleNamespace(
+            status=lambda: {"enabled": True, "jobs": 0},
+            list_jobs=lambda include_disabled=False: [],
+            get_run_history=lambda job_id: [],
+        ),
+        config=Config(),
+        agent=SimpleNamespace(subagents=SimpleNamespace(registry=SimpleNamespace(list_all=lambda: []))),
+    )
+
+    assert payload["outbound"]["inflight"] == 1
+    assert payload["outbound"]["queued"] == 3
+    assert payload["outbound"]["lanes"][0]["chat_id"] == "b"
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from kabot.agent.loop_parts.delegates import AgentLoopDelegatesMixin
+from kabot.cli.commands_gateway import _shutdown_gateway_runtime
+from kabot.memory.chroma_memory import HybridMemoryManager
+from kabot.memory.sqlite_store import SQLiteMetadataStore
+
+
+class _FakeEmbeddings:
+    def __init__(self, model, auto_unload_seconds=300, cache=None):
+        self.model_name = model
+        self.dimensions = 2
+
+    async def embed(self, text):
+        return [0.1, 0.1]
+
+    async def embed_batch(self, texts):
+        return [[0.1, 0.1] for _ in texts]
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.ids: list[str] = []
+
+    def add(self, ids, embeddings, documents, metadatas):
+        self.ids.extend(ids)
+
+
+class _FakeAgent(AgentLoopDelegatesMixin):
+    def __init__(self, memory):
+        self.memory = memory
+        self._pending_memory_tasks = set()
+        self._mcp_session_runtimes = {}
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.mark.asyncio
+async def test_gateway_shutdown_drains_write_behind_before_teardown(tmp_path, monkeypatch):
+    monkeypatch.setattr("kabot.memory.chroma_memory.SentenceEmbeddingProvider", _FakeEmbeddings)
+    memory = HybridMemoryManager(
+        workspace=tmp_path,
+        embedding_provider="sentence",
+        enable_hybrid_memory=True,
+        write_behind_delay_ms=60_000,
+    )
+    memory._chroma_client = object()
+    memory._collection = _FakeCollection()
+    memory.create_session("s1", "telegram", "1")
+    for n in range(3):
+        assert await memory.add_message("s1", "user", f"queued note {n}")
+    assert memory.metadata.get_stats()["messages"] == 0
+
+    agent = _FakeAgent(memory)
+    channels = SimpleNamespace(stop_all=AsyncMock())
+    await _shutdown_gateway_runtime(
+        heartbeat=MagicMock(),
+        cron=MagicMock(),
+        agent=agent,
+        channels=channels,
+    )
+
+    assert memory.metadata._pool.closed
+    assert memory.graph._pool.closed
+    reopened = SQLiteMetadataStore(tmp_path / "metadata.db")
+    try:
+        assert [row["content"] for row in reopened.get_message_chain("s1")] == [
+            "queued note 0",
+            "queued note 1",
+            "queued note 2",
+        ]
+    finally:
+        reopened.close()
+    assert agent.stopped
+    channels.stop_all.assert_awaited_once()
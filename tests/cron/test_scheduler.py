@@ -0,0 +1,126 @@
+"""Tests for the cron wake heap, concurrent dispatch and misfire handling."""
+
+import asyncio
+
+import pytest
+
+from kabot.cron.core.scheduling import now_ms
+from kabot.cron.service import CronService
+from kabot.cron.types import CronSchedule
+
+
+def _add(service: CronService, name: str, *, to: str, every_ms: int = 60_000):
+    return service.add_job(
+        name=name,
+        schedule=CronSchedule(kind="every", every_ms=every_ms),
+        message=name,
+        deliver=True,
+        channel="cli",
+        to=to,
+    )
+
+
+async def _drain(service: CronService) -> None:
+    while service._running_jobs:
+        await asyncio.gather(*list(service._running_jobs.values()))
+
+
+@pytest.mark.asyncio
+async def test_due_jobs_run_in_parallel_but_serialize_per_destination(tmp_path):
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    overall = {"active": 0, "peak": 0}
+
+    async def on_job(job):
+        dest = job.payload.to
+        active[dest] = active.get(dest, 0) + 1
+        peak[dest] = max(peak.get(dest, 0), active[dest])
+        overall["active"] += 1
+        overall["peak"] = max(overall["peak"], overall["active"])
+        await asyncio.sleep(0.02)
+        active[dest] -= 1
+        overall["active"] -= 1
+
+    service = CronService(tmp_path / "jobs.json", on_job=on_job)
+    jobs = [_add(service, "a1", to="alice"), _add(service, "a2", to="alice"), _add(service, "b1", to="bob")]
+    past = now_ms() - 1_000
+    for job in jobs:
+        job.state.next_run_at_ms = past
+    service._indexed_jobs = None  # edited outside the public API: rebuild the heap
+
+    await service._on_timer()
+    assert set(service._running_jobs) == {job.id for job in jobs}
+    await service._on_timer()  # running jobs are not dispatched again
+    await _drain(service)
+
+    assert peak == {"alice": 1, "bob": 1}
+    assert overall["peak"] == 2
+    assert all(job.state.last_status == "ok" for job in jobs)
+    assert all(len(job.state.run_history) == 1 for job in jobs)
+    assert service._get_next_wake_ms() == min(job.state.next_run_at_ms for job in jobs)
+    service.stop()
+
+
+def test_next_wake_skips_disabled_and_rescheduled_jobs(tmp_path):
+    service = CronService(tmp_path / "jobs.json")
+    early = _add(service, "early", to="a", every_ms=10_000)
+    late = _add(service, "late", to="b", every_ms=50_000)
+
+    assert service._get_next_wake_ms() == early.state.next_run_at_ms
+
+    service.enable_job(early.id, enabled=False)
+    assert service._get_next_wake_ms() == late.state.next_run_at_ms
+
+    service.update_job(late.id, schedule=CronSchedule(kind="every", every_ms=90_000))
+    assert service._get_next_wake_ms() == late.state.next_run_at_ms
+
+    service.remove_job(late.id)
+    assert service._get_next_wake_ms() is None
+
+
+def test_unchanged_store_is_not_rewritten(tmp_path):
+    store_path = tmp_path / "jobs.json"
+    service = CronService(store_path)
+    _add(service, "ping", to="a")
+    mtime = store_path.stat().st_mtime_ns
+    store_path.write_text(store_path.read_text())  # bump mtime, same content
+    bumped = store_path.stat().st_mtime_ns
+
+    service._save_store()
+
+    assert store_path.stat().st_mtime_ns == bumped
+    assert bumped >= mtime
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("policy", "missed_by_ms", "expect_run"),
+    [("run_once", 60_000, True), ("run_once", 7_200_000, False), ("skip", 60_000, False)],
+)
+async def test_misfire_policy_on_start(tmp_path, policy, missed_by_ms, expect_run):
+    store_path = tmp_path / "jobs.json"
+    seed = CronService(store_path)
+    job = _add(seed, "reminder", to="a")
+    job.state.next_run_at_ms = now_ms() - missed_by_ms
+    seed._save_store()
+
+    ran: list[str] = []
+
+    async def on_job(cron_job):
+        ran.append(cron_job.id)
+
+    service = CronService(
+        store_path,
+        on_job=on_job,
+        misfire_policy=policy,
+        misfire_grace_ms=3_600_000,
+    )
+    await service.start()
+    await asyncio.sleep(0.05)
+    await _drain(service)
+    service.stop()
+
+    reloaded = CronService(store_path).list_jobs()[0]
+    assert ran == ([job.id] if expect_run else [])
+    assert reloaded.state.next_run_at_ms > now_ms()
+    assert reloaded.state.last_status == ("ok" if expect_run else "skipped")
@@ -0,0 +1,159 @@
+"""Tests for the dashboard chat stream fan-out hub."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from kabot.gateway.chat_stream import CLIENT_QUEUE_EVENTS, ChatStreamHub, appended_messages
+
+
+def _msg(n: int) -> dict:
+    return {"role": "user", "content": f"m{n}", "timestamp": f"2026-03-05T10:{n // 60:02d}:{n % 60:02d}", "metadata": {}}
+
+
+class _History:
+    def __init__(self, items):
+        self.items = list(items)
+        self.reads = 0
+
+    async def __call__(self, _session_key, limit):
+        self.reads += 1
+        return self.items[-limit:]
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_appended_messages_detects_tail_and_rewrites():
+    window = [_msg(1), _msg(2), _msg(3)]
+    assert appended_messages(window, window) == []
+    assert appended_messages([], window) == window
+    assert appended_messages(window, window + [_msg(4)]) == [_msg(4)]
+    # Sliding window: the oldest message fell out while two were added.
+    assert appended_messages(window, [_msg(3), _msg(4), _msg(5)]) == [_msg(4), _msg(5)]
+    assert appended_messages(window, [_msg(9)]) is None
+    assert appended_messages(window, []) is None
+
+
+@pytest.mark.asyncio
+async def test_clients_share_reads_and_receive_incremental_messages():
+    history = _History([_msg(1)])
+    hub = ChatStreamHub(history)
+
+    first, first_initial = await hub.subscribe("dashboard:web", 30, chat_id="dashboard")
+    second, second_initial = await hub.subscribe("dashboard:web", 30, chat_id="dashboard")
+    assert history.reads == 1
+    assert [event.event for event in first_initial + second_initial] == ["snapshot", "snapshot"]
+
+    history.items += [_msg(2), _msg(3)]
+    hub.notify("dashboard:web")
+    hub.notify("dashboard:web")
+    hub.notify("other:session")
+    await _settle()
+    assert history.reads == 2
+
+    for client in (first, second):
+        events = [client.queue.get_nowait() for _ in range(client.queue.qsize())]
+        assert [event.event for event in events] == ["message", "message"]
+        assert [json.loads(event.data)["message"]["content"] for event in events] == ["m2", "m3"]
+        assert events[0].id < events[1].id
+        assert events[0].id > first_initial[0].id
+
+    hub.unsubscribe(first)
+    hub.unsubscribe(second)
+    assert hub.client_count == 0
+    hub.notify("dashboard:web")
+    await _settle()
+    assert history.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_resumes_from_replay_buffer():
+    history = _History([_msg(1)])
+    hub = ChatStreamHub(history)
+    watcher, initial = await hub.subscribe("dashboard:web", 30, chat_id="dashboard")
+    snapshot_id = initial[0].id
+
+    history.items += [_msg(2), _msg(3)]
+    hub.notify()
+    await _settle()
+    delivered = [watcher.queue.get_nowait() for _ in range(watcher.queue.qsize())]
+
+    _, resumed = await hub.subscribe("dashboard:web", 30, chat_id="dashboard", last_event_id=snapshot_id)
+    assert [event.id for event in resumed] == [event.id for event in delivered]
+
+    _, caught_up = await hub.subscribe("dashboard:web", 30, chat_id="dashboard", last_event_id=delivered[-1].id)
+    assert caught_up == []
+
+    _, unknown = await hub.subscribe("dashboard:web", 30, chat_id="dashboard", last_event_id=1)
+    assert [event.event for event in unknown] == ["snapshot"]
+    assert history.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_client_is_resynced_instead_of_buffering():
+    history = _History([])
+    hub = ChatStreamHub(history)
+    client, _ = await hub.subscribe("dashboard:web", 500, chat_id="dashboard")
+
+    history.items = [_msg(n) for n in range(CLIENT_QUEUE_EVENTS + 10)]
+    hub.notify()
+    await _settle()
+
+    assert client.needs_snapshot is True
+    assert client.queue.qsize() == 1
+    assert client.queue.get_nowait().event == "resync"
+    snapshot = hub.snapshot_event(client)
+    assert len(json.loads(snapshot.data)["messages"]) == CLIENT_QUEUE_EVENTS + 10
+    assert client.needs_snapshot is False
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_endpoint_resumes_with_last_event_id(aiohttp_client):
+    from kabot.gateway.webhook_server import WebhookServer
+
+    mock_bus = MagicMock()
+    mock_bus.publish_inbound = AsyncMock()
+    history = _History([_msg(1)])
+    server = WebhookServer(bus=mock_bus, auth_token="test-token|operator.read", chat_history_provider=history)
+    client = await aiohttp_client(server.app)
+    headers = {"Authorization": "Bearer test-token"}
+
+    resp = await client.get("/dashboard/api/chat/stream?session_key=dashboard:web", headers=headers)
+    first = (await resp.content.readuntil(b"\n\n")).decode()
+    assert first.startswith("event: snapshot")
+    snapshot_id = int(first.split("id: ", 1)[1].split("\n", 1)[0])
+
+    history.items.append(_msg(2))
+    server.notify_chat_session_saved("dashboard:web")
+    pushed = (await asyncio.wait_for(resp.content.readuntil(b"\n\n"), timeout=2)).decode()
+    assert pushed.startswith("event: message")
+    assert "m2" in pushed
+
+    # Resume while the first tab keeps the feed alive.
+    resumed = await client.get(
+        "/dashboard/api/chat/stream?session_key=dashboard:web",
+        headers={**headers, "Last-Event-ID": str(snapshot_id)},
+    )
+    replayed = (await resumed.content.readuntil(b"\n\n")).decode()
+    assert replayed.startswith("event: message")
+    assert "m2" in replayed
+    resumed.close()
+    resp.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_initial_read_does_not_leak_the_client():
+    async def _broken_history(_session_key, _limit):
+        raise RuntimeError("history unavailable")
+
+    hub = ChatStreamHub(_broken_history)
+    with pytest.raises(RuntimeError):
+        await hub.subscribe("dashboard:web", 30, chat_id="dashboard")
+
+    assert hub.client_count == 0
+    assert not hub._feeds
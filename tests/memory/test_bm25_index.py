@@ -0,0 +1,74 @@
+"""Tests for the incremental BM25 index."""
+
+from kabot.memory.bm25_index import BM25Index
+from kabot.memory.memory_pruner import MemoryPruner
+from kabot.memory.sqlite_store import SQLiteMetadataStore
+
+
+def _store_and_index(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+    store.create_session("s1", "telegram", "1")
+    store.create_session("s2", "telegram", "2")
+    return store, BM25Index(store.db_path)
+
+
+def _add_message(store, index, message_id, session_id, content):
+    store.add_message(message_id, session_id, "user", content)
+    index.add_document("message", message_id, content, session_id=session_id)
+
+
+def test_search_ranks_documents_by_term_relevance(tmp_path):
+    store, index = _store_and_index(tmp_path)
+    _add_message(store, index, "m1", "s1", "python asyncio tutorial")
+    _add_message(store, index, "m2", "s1", "python python python generators")
+    _add_message(store, index, "m3", "s1", "weather in jakarta today")
+
+    hits = index.search("python", limit=5)
+
+    assert [doc_id for _, doc_id, _ in hits] == ["m2", "m1"]
+    assert all(score > 0 for _, _, score in hits)
+    assert index.get_stats()["documents"] == 3
+
+
+def test_search_filters_by_session_and_reindexes_replaced_facts(tmp_path):
+    store, index = _store_and_index(tmp_path)
+    _add_message(store, index, "m1", "s1", "deploy the staging server")
+    _add_message(store, index, "m2", "s2", "deploy the production server")
+    index.add_document("fact", "f1", "[ops] staging uses port 8080", session_id="s1")
+    index.add_document("fact", "f1", "[ops] staging uses port 9090", session_id="s1")
+
+    assert [doc_id for _, doc_id, _ in index.search("deploy", session_id="s2")] == ["m2"]
+    assert index.search("8080") == []
+    assert [doc_id for _, doc_id, _ in index.search("9090")] == ["f1"]
+
+
+def test_deleted_rows_drop_their_postings(tmp_path):
+    store, index = _store_and_index(tmp_path)
+    _add_message(store, index, "m1", "s1", "old note about invoices")
+    _add_message(store, index, "m2", "s1", "fresh note about invoices")
+    with store._get_connection() as conn:
+        conn.execute("UPDATE messages SET created_at = datetime('now', '-90 days') WHERE message_id = 'm1'")
+        conn.commit()
+
+    MemoryPruner(max_age_days=30).prune_old_messages(store)
+
+    assert [doc_id for _, doc_id, _ in index.search("invoices")] == ["m2"]
+    assert index.get_stats()["documents"] == 1
+
+
+def test_ensure_synced_indexes_rows_written_before_the_index(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+    store.create_session("s1", "telegram", "1")
+    store.add_message("m1", "s1", "user", "legacy row about kubernetes")
+    store.add_fact("f1", "infra", "k8s", "cluster runs kubernetes 1.29", session_id="s1")
+
+    index = BM25Index(store.db_path)
+    assert index.search("kubernetes") == []
+
+    assert index.ensure_synced() == 2
+    assert {doc_id for _, doc_id, _ in index.search("kubernetes")} == {"m1", "f1"}
+    assert index.ensure_synced() == 0
+
+    reopened = BM25Index(store.db_path)
+    assert reopened.ensure_synced() == 0
+    assert len(reopened.search("kubernetes")) == 2
@@ -0,0 +1,105 @@
+"""Tests for the persistent embedding cache."""
+
+import threading
+
+import pytest
+
+from kabot.memory.embedding_cache import EmbeddingCache
+from kabot.memory.sentence_embeddings import SentenceEmbeddingProvider
+
+
+def test_vectors_persist_across_instances_per_provider_and_model(tmp_path):
+    db_path = tmp_path / "embedding_cache.db"
+    cache = EmbeddingCache(db_path, provider="sentence", model="mini")
+    cache.put_many([("hello", [0.5, -1.0, 2.0]), ("world", [1.0, 0.0, 0.25])])
+
+    reopened = EmbeddingCache(db_path, provider="sentence", model="mini")
+    other_model = EmbeddingCache(db_path, provider="sentence", model="mpnet")
+
+    assert reopened.get_many(["hello", "missing", "world"]) == [[0.5, -1.0, 2.0], None, [1.0, 0.0, 0.25]]
+    assert other_model.get("hello") is None
+    assert reopened.get_stats()["hits"] == 2
+
+
+def test_byte_budget_evicts_least_recently_used_rows(tmp_path):
+    db_path = tmp_path / "embedding_cache.db"
+    # Each 4-dim vector is 16 bytes; the budget holds three.
+    cache = EmbeddingCache(db_path, provider="sentence", model="mini", max_bytes=48, memory_bytes=0)
+    for text in ("a", "b", "c"):
+        cache.put(text, [1.0, 2.0, 3.0, 4.0])
+    assert cache.get("a") is not None
+    cache.flush()
+
+    cache.put("d", [1.0, 2.0, 3.0, 4.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["disk_bytes"] <= 48
+    assert cache.get_stats()["evicted"] >= 1
+
+
+def test_warm_start_preloads_most_recent_vectors(tmp_path):
+    db_path = tmp_path / "embedding_cache.db"
+    writer = EmbeddingCache(db_path, provider="ollama", model="nomic")
+    writer.put_many([(f"text {i}", [float(i)] * 8) for i in range(5)])
+
+    # Room for two 32-byte vectors in memory.
+    cache = EmbeddingCache(db_path, provider="ollama", model="nomic", memory_bytes=64)
+
+    assert cache.warm() == 2
+    assert cache.get_stats()["memory_entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_serves_persistent_hits_without_starting_the_worker(tmp_path, monkeypatch):
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db", provider="sentence", model="all-MiniLM-L6-v2")
+    cache.put_many([("seen before", [0.25, 0.5]), ("also seen", [1.0, 2.0])])
+    provider = SentenceEmbeddingProvider(auto_unload_seconds=0, cache=cache)
+    requests = []
+
+    async def _request(req_type, data):
+        requests.append((req_type, data))
+        return [[9.0, 9.0] for _ in data]
+
+    monkeypatch.setattr(provider, "_request", _request)
+
+    assert await provider.embed("seen before") == [0.25, 0.5]
+    assert await provider.embed_batch(["also seen", "brand new"]) == [[1.0, 2.0], [9.0, 9.0]]
+
+    assert requests == [("embed_batch", ["brand new"])]
+    assert not provider._is_subprocess_alive()
+    assert cache.get("brand new") == [9.0, 9.0]
+
+
+@pytest.mark.asyncio
+async def test_provider_runs_disk_cache_io_off_the_event_loop(tmp_path, monkeypatch):
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db", provider="sentence", model="all-MiniLM-L6-v2")
+    cache.put_many([("on disk", [0.25, 0.5])])
+    cache._memory.clear()
+    provider = SentenceEmbeddingProvider(auto_unload_seconds=0, cache=cache)
+    loop_thread = threading.get_ident()
+    disk_threads: list[int] = []
+
+    async def _request(req_type, data):
+        return [[9.0, 9.0] for _ in data]
+
+    for name in ("get_many", "put_many"):
+        original = getattr(cache, name)
+
+        def _spy(*args, _original=original, **kwargs):
+            disk_threads.append(threading.get_ident())
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, _spy)
+    monkeypatch.setattr(provider, "_request", _request)
+
+    assert await provider.embed_batch(["on disk", "brand new"]) == [[0.25, 0.5], [9.0, 9.0]]
+    assert len(disk_threads) == 2
+    assert loop_thread not in disk_threads
+
+    # Hot in-process hits are answered inline.
+    disk_threads.clear()
+    provider._cache.clear()
+    assert await provider.embed("brand new") == [9.0, 9.0]
+    assert disk_threads == [loop_thread]
+    cache.close()
@@ -0,0 +1,73 @@
+"""Tests for the FTS5 lexical index and its use by SQLiteMemory."""
+
+from kabot.memory.fts_index import FTS5Index, build_match_query
+from kabot.memory.memory_pruner import MemoryPruner
+from kabot.memory.sqlite_memory import SQLiteMemory
+from kabot.memory.sqlite_store import SQLiteMetadataStore
+
+
+def test_build_match_query_quotes_terms_and_marks_prefixes():
+    assert build_match_query('deploy "prod" OR NEAR(x)') == '"deploy" OR "prod" OR "or" OR "near" OR "x"*'
+    assert build_match_query("conf* server", prefix_last_term=False) == '"conf"* OR "server"'
+    assert build_match_query("  ?! ") == ""
+
+
+def test_fts_index_tracks_inserts_replacements_and_deletes(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+    store.create_session("s1", "telegram", "1")
+    index = FTS5Index(store.db_path)
+
+    store.add_message("m1", "s1", "user", "remind me about the dentist appointment")
+    store.add_fact("f1", "health", "dentist", "dentist is Dr. Rina", session_id="s1")
+    store.add_fact("f1", "health", "dentist", "dentist is Dr. Sari", session_id="s1")
+
+    assert {doc_id for _, doc_id, _ in index.search("dentist")} == {"m1", "f1"}
+    assert index.search("rina") == []
+    assert [doc_id for _, doc_id, _ in index.search("sari")] == ["f1"]
+
+    with store._get_connection() as conn:
+        conn.execute("UPDATE messages SET created_at = datetime('now', '-90 days')")
+        conn.commit()
+    MemoryPruner(max_age_days=30).prune_old_messages(store)
+
+    assert [doc_id for _, doc_id, _ in index.search("dentist")] == ["f1"]
+    assert index.get_stats()["documents"] == 1
+
+
+def test_fts_index_backfills_existing_rows_on_first_open(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+    store.create_session("s1", "telegram", "1")
+    store.add_message("m1", "s1", "user", "legacy message about kubernetes")
+
+    index = FTS5Index(store.db_path)
+    assert [doc_id for _, doc_id, _ in index.search("kubernetes")] == ["m1"]
+
+    FTS5Index(store.db_path)
+    assert index.get_stats()["documents"] == 1
+
+
+def test_sqlite_memory_fts_search_ranks_prefix_matches_per_session(tmp_path):
+    mem = SQLiteMemory(workspace=tmp_path / "mem", enable_graph_memory=False)
+    mem.create_session("s1", "telegram", "1")
+    mem.create_session("s2", "telegram", "2")
+    mem.add_message("s1", "user", "Kubernetes cluster upgrade planned for Friday")
+    mem.add_message("s1", "user", "lunch at noon")
+    mem.add_message("s2", "user", "kubernetes kubernetes migration notes")
+    mem.remember_fact("cluster runs on kubernetes 1.29", category="infra", session_id="s1")
+
+    results = mem.search_memory("kuber", session_id="s1", limit=5)
+
+    assert mem.lexical_engine == "fts5"
+    assert len(results) == 2
+    assert all("kubernetes" in row["content"].lower() for row in results)
+    assert results[0]["score"] >= results[1]["score"] > 0
+    assert {row["role"] for row in results} == {"user", "system"}
+
+
+def test_sqlite_memory_like_engine_keeps_substring_search(tmp_path):
+    mem = SQLiteMemory(workspace=tmp_path / "mem", enable_graph_memory=False, lexical_engine="like")
+    mem.create_session("s1", "telegram", "1")
+    mem.add_message("s1", "user", "I love pizza")
+
+    assert mem.lexical_index is None
+    assert [row["content"] for row in mem.search_memory("izz")] == ["I love pizza"]
@@ -1,3 +1,4 @@
+import sqlite3
 from pathlib import Path
 
 from kabot.memory.graph_memory import GraphMemory
@@ -39,3 +40,69 @@ def test_sqlite_memory_exposes_graph_context(tmp_path: Path):
     summary = memory.get_graph_context(limit=5)
     assert "user prefers python" in summary.lower()
 
+
+
+def test_graph_memory_upserts_count_repeated_mentions(tmp_path: Path):
+    graph = GraphMemory(tmp_path / "graph.db")
+    for _ in range(2):
+        graph.ingest_text(session_id="s1", role="user", content="kabot uses chromadb")
+    graph.ingest_text(session_id="s1", role="user", content="chromadb uses sqlite3")
+
+    stats = graph.get_stats()
+    assert stats["entities"] == 3
+    assert stats["relations"] == 2
+    assert stats["storage"]["operations"]["graph_ingest"]["count"] == 3
+    rows = graph.query_related("kabot", limit=5, depth=1)
+    assert [(row["dst_name"], row["mentions"]) for row in rows] == [("chromadb", 2)]
+
+
+def test_graph_memory_expands_neighbourhood_within_depth_and_fanout(tmp_path: Path):
+    graph = GraphMemory(tmp_path / "graph.db", expand_depth=2, expand_fanout=1)
+    graph.ingest_text(session_id="s1", role="user", content="kabot uses chromadb")
+    graph.ingest_text(session_id="s1", role="user", content="chromadb uses sqlite3")
+    graph.ingest_text(session_id="s1", role="user", content="sqlite3 uses libc")
+    for _ in range(2):
+        graph.ingest_text(session_id="s1", role="user", content="chromadb uses numpy")
+
+    rows = graph.query_related("kabot", limit=10)
+
+    # chromadb's single strongest edge (numpy) is followed; libc is three hops away.
+    assert [(row["src_name"], row["dst_name"], row["depth"]) for row in rows] == [
+        ("kabot", "chromadb", 1),
+        ("chromadb", "numpy", 2),
+    ]
+    assert len(graph.query_related("kabot", limit=10, depth=3, fanout=4)) == 4
+
+
+def test_graph_memory_partial_name_lookup(tmp_path: Path):
+    for name_index in ("auto", "like"):
+        graph = GraphMemory(tmp_path / f"{name_index}.db", name_index=name_index)
+        graph.ingest_text(session_id="s1", role="assistant", content="api-gateway depends on redis")
+
+        rows = graph.query_related("gatew", limit=5)
+
+        assert [row["dst_name"] for row in rows] == ["redis"]
+    assert graph.name_index == "like"
+
+
+def test_graph_memory_folds_duplicate_relations_from_older_databases(tmp_path: Path):
+    db_path = tmp_path / "graph.db"
+    GraphMemory(db_path).ingest_text(session_id=None, role="user", content="kabot uses chromadb")
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP INDEX idx_rel_unique")
+    conn.execute(
+        """
+        INSERT INTO relations
+        SELECT 'dup', src_entity_id, dst_entity_id, relation, session_id, role, evidence, 0.95,
+               first_seen, last_seen, 2
+        FROM relations
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    graph = GraphMemory(db_path)
+
+    rows = graph.query_related("kabot", limit=5)
+    assert [(row["mentions"], row["confidence"]) for row in rows] == [(3, 0.95)]
+    assert graph.get_stats()["relations"] == 1
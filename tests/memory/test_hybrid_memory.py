@@ -1,7 +1,9 @@
 # tests/memory/test_hybrid_memory.py
 """Integration tests for HybridMemoryManager."""
 
+import asyncio
 import math
+import time
 
 import pytest
 
@@ -9,11 +11,21 @@ from kabot.memory.chroma_memory import HybridMemoryManager
 
 
 class _FakeEmbeddings:
-    def __init__(self, model, auto_unload_seconds=300):
+    def __init__(self, model, auto_unload_seconds=300, cache=None):
         self.model_name = model
         self.dimensions = 2
+        self.calls: list[str] = []
 
     async def embed(self, text):
+        self.calls.append("embed")
+        return self._vector(text)
+
+    async def embed_batch(self, texts):
+        self.calls.append(f"embed_batch:{len(texts)}")
+        return [self._vector(text) for text in texts]
+
+    @staticmethod
+    def _vector(text):
         text = (text or "").lower()
         if "maha raja" in text:
             return [1.0, 0.0]
@@ -60,23 +72,27 @@ class _FakeCollection:
             docs.append((distance, row))
         docs.sort(key=lambda item: item[0])
         docs = docs[:n_results]
-        return {
+        results = {
             "ids": [[row["id"] for _, row in docs]],
             "documents": [[row["document"] for _, row in docs]],
             "metadatas": [[row["metadata"] for _, row in docs]],
             "distances": [[distance for distance, _ in docs]],
         }
+        if include and "embeddings" in include:
+            results["embeddings"] = [[row["embedding"] for _, row in docs]]
+        return results
 
     def count(self):
         return len(self._docs)
 
 
-def _make_fake_manager(tmp_path, monkeypatch):
+def _make_fake_manager(tmp_path, monkeypatch, **kwargs):
     monkeypatch.setattr("kabot.memory.chroma_memory.SentenceEmbeddingProvider", _FakeEmbeddings)
     manager = HybridMemoryManager(
         workspace=tmp_path,
         embedding_provider="sentence",
         enable_hybrid_memory=True,
+        **kwargs,
     )
     manager._chroma_client = object()
     manager._collection = _FakeCollection()
@@ -148,6 +164,20 @@ class TestHybridMemoryManager:
 
         assert any("Maha Raja" in row["content"] for row in results)
 
+    @pytest.mark.asyncio
+    async def test_mmr_reuses_stored_vectors_and_batches_the_rest(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch)
+        manager.create_session("s1", "telegram", "123")
+        for text in ("Call me Maha Raja", "Dark mode everywhere, dark mode always", "Timezone is WIB"):
+            assert await manager.remember_fact(text, category="preference", session_id="s1")
+        manager.embeddings.calls.clear()
+
+        results = await manager.search_memory("Maha Raja dark mode", session_id="s1", limit=2)
+
+        assert results
+        # Only the query is embedded; the BM25-only hit is embedded in one batch.
+        assert manager.embeddings.calls == ["embed", "embed_batch:1"]
+
     @pytest.mark.asyncio
     async def test_hybrid_search_keeps_bm25_for_explanatory_queries(self, tmp_path, monkeypatch):
         manager = _make_fake_manager(tmp_path, monkeypatch)
@@ -173,6 +203,187 @@ class TestHybridMemoryManager:
         assert results
         assert calls == ["explain how DNS works"]
 
+    @pytest.mark.asyncio
+    async def test_hybrid_search_can_use_fts5_lexical_engine(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("kabot.memory.chroma_memory.SentenceEmbeddingProvider", _FakeEmbeddings)
+        manager = HybridMemoryManager(workspace=tmp_path, lexical_engine="fts5")
+        manager._chroma_client = object()
+        manager._collection = _FakeCollection()
+        manager.create_session("s1", "telegram", "123")
+        assert await manager.remember_fact("Explain how DNS works", category="knowledge", session_id="s1")
+
+        hits = manager._perform_bm25_search("dns resolvers", limit=5)
+
+        assert manager.get_stats()["lexical_engine"] == "fts5"
+        assert [row["fact_id"] for row in hits] == [manager.metadata.get_facts()[0]["fact_id"]]
+        assert hits[0]["bm25_score"] > 0
+
+    @pytest.mark.asyncio
+    async def test_search_hydrates_candidates_with_one_query_per_table(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch)
+        manager.create_session("s1", "telegram", "123")
+        for n in range(12):
+            await manager.add_message("s1", "user", f"timezone note {n}")
+            assert await manager.remember_fact(f"timezone fact {n}", category="profile", session_id="s1")
+        await manager.flush_writes()
+
+        before = manager.metadata.get_stats()["storage"]["operations"]
+        results = await manager.search_memory("timezone", session_id="s1", limit=10)
+        after = manager.metadata.get_stats()["storage"]["operations"]
+
+        def calls(op):
+            return after.get(op, {}).get("count", 0) - before.get(op, {}).get("count", 0)
+
+        assert results
+        # At most one messages query and one facts query per lane (vector + keyword).
+        assert 1 <= calls("get_messages_by_ids") <= 2
+        assert 1 <= calls("get_facts_by_ids") <= 2
+        assert calls("get_message_tree") == calls("get_fact") == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_vector_query_does_not_block_the_event_loop(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch)
+        manager.create_session("s1", "telegram", "123")
+        assert await manager.remember_fact("User prefers dark mode", category="preference", session_id="s1")
+        fast_query = manager._collection.query
+
+        def slow_query(*args, **kwargs):
+            time.sleep(0.3)
+            return fast_query(*args, **kwargs)
+
+        manager._collection.query = slow_query
+        lag = 0.0
+
+        async def ticker():
+            nonlocal lag
+            while True:
+                before = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lag = max(lag, time.perf_counter() - before - 0.01)
+
+        tick = asyncio.create_task(ticker())
+        results = await manager.search_memory("dark mode", session_id="s1", limit=3)
+        tick.cancel()
+
+        assert any("dark mode" in row["content"] for row in results)
+        assert lag < 0.1
+        assert manager.get_stats()["io_executor"]["operations"]["vector_search"]["max_ms"] >= 300
+
+    @pytest.mark.asyncio
+    async def test_write_behind_batches_messages_across_sessions(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch, write_behind_batch=4, write_behind_delay_ms=60_000)
+        manager.create_session("s1", "telegram", "1")
+        manager.create_session("s2", "telegram", "2")
+
+        for n in range(4):
+            assert await manager.add_message(f"s{n % 2 + 1}", "user", f"timezone note {n}")
+        await manager.flush_writes()
+
+        assert manager.embeddings.calls == ["embed_batch:4"]
+        assert manager._collection.count() == 4
+        assert manager.metadata.get_stats()["messages"] == 4
+        assert [row["content"] for row in manager.get_conversation_context("s2")] == [
+            "timezone note 1",
+            "timezone note 3",
+        ]
+        stats = manager.get_stats()["write_behind"]
+        assert stats["batches"] == 1
+        assert stats["flush_reasons"]["size"] == 1
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unflushed_messages_are_visible_to_reads(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch, write_behind_delay_ms=60_000)
+        manager.create_session("s1", "telegram", "1")
+        await manager.add_message("s1", "user", "I switched to dark mode yesterday")
+        await manager.add_message("s1", "assistant", "Noted.")
+
+        assert manager.metadata.get_stats()["messages"] == 0
+        results = await manager.search_memory("dark mode", session_id="s1", limit=3)
+        assert results[0]["content"] == "I switched to dark mode yesterday"
+        assert results[0]["pending_rank"] == 1
+        assert [row["content"] for row in manager.get_conversation_context("s1")] == [
+            "I switched to dark mode yesterday",
+            "Noted.",
+        ]
+
+        await manager.flush_writes()
+        assert manager.metadata.get_stats()["messages"] == 2
+        assert manager.get_stats()["write_behind"]["flush_reasons"]["flush"] == 1
+        assert len(manager.get_conversation_context("s1")) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_when_oldest_message_ages_out(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch, write_behind_delay_ms=20)
+        manager.create_session("s1", "telegram", "1")
+        await manager.add_message("s1", "user", "timezone is UTC+7")
+
+        for _ in range(100):
+            if manager.metadata.get_stats()["messages"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert manager.metadata.get_stats()["messages"] == 1
+        await manager.flush_writes()
+        assert manager.get_stats()["write_behind"]["flush_reasons"]["age"] == 1
+
+    @pytest.mark.asyncio
+    async def test_poisoned_message_does_not_drop_the_rest_of_its_batch(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch, write_behind_batch=4, write_behind_delay_ms=60_000)
+        manager.create_session("s1", "telegram", "1")
+        manager.create_session("s2", "telegram", "2")
+
+        assert await manager.add_message("s1", "user", "timezone note 0")
+        assert await manager.add_message("s2", "user", "poisoned", metadata={"handle": object()})
+        assert await manager.add_message("s2", "user", "timezone note 1")
+        assert await manager.add_message("s1", "user", "timezone note 2")
+        await manager.flush_writes()
+
+        assert manager.metadata.get_stats()["messages"] == 3
+        assert [row["content"] for row in manager.get_conversation_context("s2")] == ["timezone note 1"]
+        assert manager._collection.count() == 3
+        stats = manager.get_stats()["write_behind"]
+        assert stats["failed_batches"] >= 1
+        assert stats["flushed"] == 3
+        assert stats["dropped"] == 1
+        assert stats["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_transient_batch_failure_is_retried(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch, write_behind_batch=2, write_behind_delay_ms=60_000)
+        manager.create_session("s1", "telegram", "1")
+        real_add_messages = manager.metadata.add_messages
+        failures = {"left": 3}
+
+        def _locked_then_ok(rows):
+            if failures["left"]:
+                failures["left"] -= 1
+                return False
+            return real_add_messages(rows)
+
+        monkeypatch.setattr(manager.metadata, "add_messages", _locked_then_ok)
+        assert await manager.add_message("s1", "user", "timezone note 0")
+        assert await manager.add_message("s1", "user", "timezone note 1")
+        await manager.flush_writes()
+
+        assert manager.metadata.get_stats()["messages"] == 2
+        stats = manager.get_stats()["write_behind"]
+        assert stats["retried"] == 2
+        assert stats["dropped"] == 0
+
+    def test_bulk_lookups_skip_unknown_ids(self, tmp_path, monkeypatch):
+        manager = _make_fake_manager(tmp_path, monkeypatch)
+        manager.create_session("s1", "telegram", "123")
+        manager.metadata.add_message("m1", "s1", "user", "hello")
+        manager.metadata.add_fact("f1", "profile", "name", "Maha Raja", session_id="s1")
+
+        messages, facts = manager._hydrate_candidates(["m1", "missing", "f1"], ["m1", "missing", "f1"])
+
+        assert list(messages) == ["m1"]
+        assert list(facts) == ["f1"]
+        assert facts["f1"]["role"] == "system"
+        assert facts["f1"]["content"] == "[profile] Maha Raja"
+
     def test_get_stats_surfaces_backend_and_retrieval_mode(self, tmp_path, monkeypatch):
         manager = _make_fake_manager(tmp_path, monkeypatch)
 
@@ -57,3 +57,46 @@ def test_mmr_select_candidates_promotes_diversity():
 
     assert selected_ids[0] == "a"
     assert selected_ids[1] == "c"
+
+
+def test_mmr_numpy_and_pure_python_paths_pick_the_same_order(monkeypatch):
+    import random
+
+    from kabot.memory import chroma_memory
+
+    manager = _manager_without_init()
+    rng = random.Random(7)
+    query_embedding = [rng.uniform(-1, 1) for _ in range(16)]
+
+    def _pool():
+        pool = [
+            {
+                "item": {"message_id": f"m{idx}"},
+                "score": rng.random(),
+                "embedding": [rng.uniform(-1, 1) for _ in range(16)],
+            }
+            for idx in range(20)
+        ]
+        pool[3]["embedding"] = None
+        pool[5]["embedding"] = [0.0] * 16
+        return pool
+
+    candidates = _pool()
+    vectorized = manager._mmr_select_candidates(
+        candidates=[dict(c) for c in candidates], query_embedding=query_embedding, limit=8
+    )
+    monkeypatch.setattr(chroma_memory, "np", None)
+    fallback = manager._mmr_select_candidates(
+        candidates=[dict(c) for c in candidates], query_embedding=query_embedding, limit=8
+    )
+
+    assert [c["item"]["message_id"] for c in vectorized] == [c["item"]["message_id"] for c in fallback]
+
+
+def test_batched_temporal_decay_matches_scalar_multiplier():
+    ages = [0.0, 1.5, 24.0 * 7, 24.0 * 90, -3.0]
+
+    batched = ChromaMemoryManager._temporal_decay_multipliers(ages)
+
+    for age, value in zip(ages, batched):
+        assert abs(value - ChromaMemoryManager._temporal_decay_multiplier(age)) < 1e-12
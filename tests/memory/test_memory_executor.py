@@ -0,0 +1,71 @@
+"""Tests for the bounded executor behind the async memory API."""
+
+import asyncio
+import threading
+
+import pytest
+
+from kabot.memory.memory_executor import MemoryExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_uses_worker_thread_and_records_stats():
+    executor = MemoryExecutor(max_workers=2)
+
+    name = await executor.run(lambda: threading.current_thread().name, op="probe")
+
+    assert name.startswith("kabot-memory")
+    stats = executor.get_stats()
+    assert stats["completed"] == 1
+    assert stats["queued"] == stats["running"] == 0
+    assert stats["operations"]["probe"]["count"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_cancellation_drop_queued_calls():
+    executor = MemoryExecutor(max_workers=1, max_pending=4)
+    release = threading.Event()
+    ran: list[str] = []
+
+    busy = asyncio.create_task(executor.run(release.wait, 5, op="busy", timeout=None))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(TimeoutError):
+        await executor.run(ran.append, "timed-out", timeout=0.05)
+    cancelled = asyncio.create_task(executor.run(ran.append, "cancelled"))
+    await asyncio.sleep(0.05)
+    assert executor.get_stats()["queued"] == 1
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    release.set()
+    assert await busy is True
+    await executor.run(ran.append, "ok")
+
+    assert ran == ["ok"]
+    stats = executor.get_stats()
+    assert stats["timed_out"] == 1
+    assert stats["cancelled"] == 1
+    assert stats["queued"] == 0
+    assert stats["max_queue_depth"] >= 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_callers_wait_for_a_slot_beyond_max_pending():
+    executor = MemoryExecutor(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    first = asyncio.create_task(executor.run(release.wait, 5, timeout=None))
+    second = asyncio.create_task(executor.run(lambda: "second"))
+    await asyncio.sleep(0.05)
+
+    stats = executor.get_stats()
+    assert stats["waiting"] == 1
+    assert stats["queued"] == 0
+    release.set()
+    assert await first is True
+    assert await second == "second"
+    executor.shutdown()
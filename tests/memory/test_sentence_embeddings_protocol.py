@@ -1,28 +1,116 @@
-from io import StringIO
+import asyncio
+import json
+import os
+import queue
+import struct
+from io import BytesIO, StringIO
 from types import SimpleNamespace
 
+import pytest
+
+from kabot.memory import _embedding_worker
 from kabot.memory.sentence_embeddings import SentenceEmbeddingProvider
 
 
-def test_send_request_ignores_non_json_stdout_lines(monkeypatch):
-    provider = SentenceEmbeddingProvider(model="all-MiniLM-L6-v2", auto_unload_seconds=0)
-    provider._req_counter = 0
+def _frame(req_id, vectors):
+    payload = b"".join(struct.pack("<%df" % len(row), *row) for row in vectors)
+    header = {"id": req_id, "status": "ok", "shape": [len(vectors), len(vectors[0])], "nbytes": len(payload)}
+    return json.dumps(header).encode() + b"\n" + payload
 
-    fake_stdout = StringIO(
-        "Warning: noisy line from dependency\n"
-        "{\"id\": \"req_1\", \"status\": \"ok\", \"result\": [0.1, 0.2, 0.3]}\n"
-    )
-    fake_stdin = StringIO()
+
+class _PipeStdin:
+    """Fake worker stdin; ``respond`` maps each request to the bytes the worker writes back."""
+
+    def __init__(self, write_fd, respond):
+        self.write_fd = write_fd
+        self.respond = respond
+        self.requests = []
+
+    def write(self, data):
+        self.requests.append(json.loads(data))
+        reply = self.respond(self.requests)
+        if reply:
+            os.write(self.write_fd, reply)
+
+    def flush(self):
+        pass
+
+
+def _attach_fake_worker(provider, monkeypatch, respond):
+    read_fd, write_fd = os.pipe()
+    stdin = _PipeStdin(write_fd, respond)
     provider._process = SimpleNamespace(
-        stdin=fake_stdin,
-        stdout=fake_stdout,
-        poll=lambda: None,
+        stdin=stdin, stdout=os.fdopen(read_fd, "rb"), poll=lambda: None, pid=4321
     )
-
     monkeypatch.setattr(provider, "_start_subprocess", lambda: None)
+    provider._start_reader()
+    return stdin
+
+
+def test_send_request_ignores_non_json_stdout_lines(monkeypatch):
+    provider = SentenceEmbeddingProvider(model="all-MiniLM-L6-v2", auto_unload_seconds=0)
+    _attach_fake_worker(
+        provider,
+        monkeypatch,
+        lambda requests: b"Warning: noisy line from dependency\n" + _frame(requests[-1]["id"], [[0.5, 0.25, 2.0]]),
+    )
 
     result = provider._send_request("embed", "hello")
-    assert result == [0.1, 0.2, 0.3]
+    assert result == [[0.5, 0.25, 2.0]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_matched_by_id_out_of_order(monkeypatch):
+    provider = SentenceEmbeddingProvider(model="all-MiniLM-L6-v2", auto_unload_seconds=0)
+
+    def _respond(requests):
+        # Hold the first request back and answer both once the second arrives.
+        if len(requests) < 2:
+            return b""
+        return _frame(requests[1]["id"], [[2.0, 2.0]]) + _frame(requests[0]["id"], [[1.0, 1.0]])
+
+    stdin = _attach_fake_worker(provider, monkeypatch, _respond)
+
+    first, second = await asyncio.gather(provider.embed("first"), provider.embed("second"))
+
+    assert first == [1.0, 1.0]
+    assert second == [2.0, 2.0]
+    assert [request["type"] for request in stdin.requests] == ["embed", "embed"]
+    assert provider.get_memory_stats()["in_flight"] == 0
+
+
+def test_worker_coalesces_queued_requests_into_one_encode_call():
+    np = pytest.importorskip("numpy")
+
+    class _Model:
+        def __init__(self):
+            self.calls = []
+
+        def encode(self, texts, convert_to_numpy=True):
+            self.calls.append(list(texts))
+            return np.array([[float(len(text)), 1.0] for text in texts])
+
+    requests = queue.Queue()
+    requests.put({"id": 1, "type": "embed", "data": "a"})
+    requests.put({"id": 2, "type": "embed_batch", "data": ["bb", "ccc"]})
+    requests.put({"id": 3, "type": "ping"})
+    model, out = _Model(), BytesIO()
+
+    batch = _embedding_worker._collect_batch(requests, window=0.01)
+    assert _embedding_worker._serve_batch(model, out, batch) is True
+
+    assert model.calls == [["a", "bb", "ccc"]]
+    out.seek(0)
+    frames = {}
+    while line := out.readline():
+        header = json.loads(line)
+        payload = out.read(header.get("nbytes", 0))
+        frames[header["id"]] = (header, payload)
+    assert frames[1][0]["shape"] == [1, 2]
+    assert struct.unpack("<2f", frames[1][1]) == (1.0, 1.0)
+    assert frames[2][0]["shape"] == [2, 2]
+    assert struct.unpack("<4f", frames[2][1]) == (2.0, 1.0, 3.0, 1.0)
+    assert frames[3][0]["result"] is True
 
 
 def test_start_subprocess_uses_quiet_env_and_devnull_stderr(monkeypatch):
@@ -64,3 +64,44 @@ def test_health_check(mem):
     status = mem.health_check()
     assert status["status"] == "ok"
     assert status["backend"] == "sqlite_only"
+
+
+def test_like_search_filters_by_session(tmp_path):
+    mem = SQLiteMemory(workspace=tmp_path / "like_mem", lexical_engine="like")
+    mem.create_session("s1", "telegram", "chat1")
+    mem.create_session("s2", "telegram", "chat2")
+    mem.add_message("s1", "user", "pizza on friday")
+    mem.add_message("s2", "user", "pizza on sunday")
+
+    results = mem.search_memory("pizza", session_id="s2")
+
+    assert [r["content"] for r in results] == ["pizza on sunday"]
+    assert results[0]["score"] == 1.0
+
+
+def test_index_search_returns_messages_and_facts(mem):
+    mem.create_session("s1", "telegram", "chat1")
+    mem.add_message("s1", "user", "the deploy uses postgres")
+    mem.remember_fact("production database is postgres", category="infra")
+
+    results = mem.search_memory("postgres", limit=5)
+
+    roles = sorted(r["role"] for r in results)
+    assert roles == ["system", "user"]
+
+
+def test_close_releases_store_index_and_graph_pools(tmp_path):
+    mem = SQLiteMemory(workspace=tmp_path / "closing_mem")
+    mem.create_session("s1", "telegram", "chat1")
+    mem.add_message("s1", "user", "the deploy uses postgres")
+
+    mem.close()
+    mem.close()
+
+    assert mem.metadata._pool.closed
+    assert mem.graph._pool.closed
+    reopened = SQLiteMemory(workspace=tmp_path / "closing_mem")
+    try:
+        assert reopened.search_memory("postgres")[0]["content"] == "the deploy uses postgres"
+    finally:
+        reopened.close()
@@ -0,0 +1,129 @@
+"""Tests for the pooled SQLite reader connections and group-committing writer."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from kabot.memory.sqlite_pool import SQLitePool, get_sqlite_pool
+from kabot.memory.sqlite_store import SQLiteMetadataStore
+
+
+def _pool(tmp_path) -> SQLitePool:
+    pool = SQLitePool(tmp_path / "pool.db")
+    pool.write(lambda conn: conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT UNIQUE)"))
+    return pool
+
+
+def test_concurrent_writes_are_group_committed(tmp_path):
+    pool = _pool(tmp_path)
+    holding, gate = threading.Event(), threading.Event()
+
+    def hold_writer(conn):
+        holding.set()
+        gate.wait(timeout=5)
+
+    blocker = threading.Thread(target=pool.write, args=(hold_writer, "hold"))
+    blocker.start()
+    assert holding.wait(timeout=5)
+    writers = [
+        threading.Thread(
+            target=pool.write,
+            args=(lambda conn, n=n: conn.execute("INSERT INTO items (value) VALUES (?)", (f"v{n}",)), "insert"),
+        )
+        for n in range(20)
+    ]
+    for thread in writers:
+        thread.start()
+    while pool._queue.qsize() < 20:
+        threading.Event().wait(0.005)
+    gate.set()
+    for thread in [blocker, *writers]:
+        thread.join(timeout=5)
+
+    with pool.reader() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 20
+    stats = pool.get_stats()
+    assert stats["writes"] == 22
+    assert stats["max_batch"] == 20
+    assert stats["write_batches"] == 3
+    assert stats["operations"]["insert"]["count"] == 20
+    pool.close()
+
+
+def test_failed_write_does_not_roll_back_its_batch(tmp_path):
+    pool = _pool(tmp_path)
+    pool.write(lambda conn: conn.execute("INSERT INTO items (value) VALUES ('dup')"))
+
+    def insert_then_fail(conn):
+        conn.execute("INSERT INTO items (value) VALUES ('partial')")
+        conn.execute("INSERT INTO items (value) VALUES ('dup')")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        pool.write(insert_then_fail)
+    assert pool.write(lambda conn: conn.execute("INSERT INTO items (value) VALUES ('ok')").lastrowid)
+
+    with pool.reader() as conn:
+        values = {row["value"] for row in conn.execute("SELECT value FROM items")}
+    assert values == {"dup", "ok"}
+    pool.close()
+
+
+def test_reader_connection_is_reused_per_thread(tmp_path):
+    pool = _pool(tmp_path)
+    with pool.reader("a") as first:
+        pass
+    with pool.reader("b") as second:
+        assert second is first
+
+    other: list[sqlite3.Connection] = []
+
+    def read():
+        with pool.reader("a") as conn:
+            other.append(conn)
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+    stats = pool.get_stats()
+    assert stats["reader_connections"] == 2
+    assert stats["operations"]["a"]["count"] == 2
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool.write(lambda conn: None)
+
+
+def test_metadata_store_shares_pool_and_reports_storage_stats(tmp_path):
+    store = SQLiteMetadataStore(tmp_path / "metadata.db")
+    again = SQLiteMetadataStore(tmp_path / "metadata.db")
+    assert again._pool is store._pool is get_sqlite_pool(tmp_path / "metadata.db")
+
+    store.create_session("s1", "telegram", "1")
+    assert store.add_message("m1", "s1", "user", "hello")
+    assert again.get_message_chain("s1")[0]["content"] == "hello"
+
+    storage = store.get_stats()["storage"]
+    assert storage["operations"]["add_message"]["count"] == 1
+    assert storage["operations"]["get_message_chain"]["count"] == 1
+    assert storage["lock_wait_ms_total"] >= 0
+    store.close()
+
+
+def test_closing_one_store_keeps_the_shared_pool_open_for_others(tmp_path):
+    a = SQLiteMetadataStore(tmp_path / "metadata.db")
+    b = SQLiteMetadataStore(tmp_path / "metadata.db")
+    assert a._pool is b._pool
+
+    a.close()
+    a.close()
+    assert not b._pool.closed
+    assert b.create_session("s1", "telegram", "1")
+    assert b.get_stats()["sessions"] == 1
+
+    b.close()
+    assert b._pool.closed
+    c = SQLiteMetadataStore(tmp_path / "metadata.db")
+    assert c._pool is not b._pool
+    assert c.get_stats()["sessions"] == 1
+    c.close()
@@ -1,6 +1,7 @@
 import base64
 import json
 
+import httpx
 import pytest
 from litellm.exceptions import InvalidRequestError
 
@@ -324,25 +325,23 @@ async def test_openrouter_auto_model_is_stripped_before_request(monkeypatch):
 
     captured: dict[str, object] = {}
 
-    class _FakeResponse:
-        status_code = 200
-
-        def raise_for_status(self):
-            return None
-
-        def json(self):
-            return {
+    def _fake_post(request: httpx.Request) -> httpx.Response:
+        captured["url"] = str(request.url)
+        captured["headers"] = request.headers
+        captured["data"] = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
                 "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
                 "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
-            }
-
-    def _fake_post(*, url, headers, data):
-        captured["url"] = url
-        captured["headers"] = headers
-        captured["data"] = json.loads(data)
-        return _FakeResponse()
+            },
+        )
 
-    monkeypatch.setattr(litellm_provider_mod.requests, "post", _fake_post)
+    monkeypatch.setattr(
+        provider,
+        "_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_fake_post)),
+    )
 
     result = await provider._chat_openrouter(
         messages=[{"role": "user", "content": "hello"}],
@@ -366,25 +365,23 @@ async def test_openrouter_vendor_model_prefix_is_stripped_before_request(monkeyp
 
     captured: dict[str, object] = {}
 
-    class _FakeResponse:
-        status_code = 200
-
-        def raise_for_status(self):
-            return None
-
-        def json(self):
-            return {
+    def _fake_post(request: httpx.Request) -> httpx.Response:
+        captured["url"] = str(request.url)
+        captured["headers"] = request.headers
+        captured["data"] = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
                 "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
                 "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
-            }
-
-    def _fake_post(*, url, headers, data):
-        captured["url"] = url
-        captured["headers"] = headers
-        captured["data"] = json.loads(data)
-        return _FakeResponse()
+            },
+        )
 
-    monkeypatch.setattr(litellm_provider_mod.requests, "post", _fake_post)
+    monkeypatch.setattr(
+        provider,
+        "_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(_fake_post)),
+    )
 
     result = await provider._chat_openrouter(
         messages=[{"role": "user", "content": "hello"}],
@@ -1,9 +1,9 @@
 import base64
 import json
 
+import httpx
 import pytest
 
-import kabot.providers.litellm_provider as litellm_provider_module
 from kabot.providers.chatgpt_backend_client import (
     build_chatgpt_request,
     extract_content_from_event,
@@ -23,6 +23,14 @@ def _fake_jwt(account_id: str = "acc_test") -> str:
     return f"{header}.{payload}.sig"
 
 
+def _mock_http(monkeypatch, provider, handler):
+    monkeypatch.setattr(
+        provider,
+        "_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
 def test_extract_content_from_event_supports_output_text_delta():
     event = {"type": "response.output_text.delta", "delta": "Hello"}
     assert extract_content_from_event(event) == "Hello"
@@ -46,24 +54,15 @@ async def test_chat_openai_codex_uses_streaming_payload_and_parses_output_text(m
         ]
     ) + "\n\n"
 
-    class DummyResponse:
-        def __init__(self, text: str):
-            self.status_code = 200
-            self.text = text
-
-        def raise_for_status(self):
-            return None
-
-    def fake_post(**kwargs):
-        captured.update(kwargs)
-        return DummyResponse(sse)
-
-    monkeypatch.setattr(litellm_provider_module.requests, "post", fake_post)
+    def fake_post(request: httpx.Request) -> httpx.Response:
+        captured["json"] = json.loads(request.content)
+        return httpx.Response(200, text=sse)
 
     provider = LiteLLMProvider(
         api_key=_fake_jwt(),
         default_model="openai-codex/gpt-5.3-codex",
     )
+    _mock_http(monkeypatch, provider, fake_post)
     response = await provider._chat_openai_codex(
         messages=[{"role": "user", "content": "Say hello"}],
         tools=None,
@@ -72,9 +71,7 @@ async def test_chat_openai_codex_uses_streaming_payload_and_parses_output_text(m
         temperature=0.2,
     )
 
-    body = captured.get("json")
-    if body is None:
-        body = json.loads(captured["data"])  # type: ignore[index]
+    body = captured["json"]
 
     assert isinstance(body, dict)
     assert body.get("stream") is True
@@ -88,26 +85,20 @@ async def test_chat_openai_codex_decodes_sse_utf8_from_raw_bytes(monkeypatch):
     sse_utf8 = 'data: {"type":"response.output_text.delta","delta":"Halo! 👋 \\"2 menit lagi makan\\"."}\n\n'
     sse_bytes = sse_utf8.encode("utf-8")
 
-    class DummyResponse:
-        def __init__(self):
-            self.status_code = 200
-            self.content = sse_bytes
-            # Simulate requests wrong charset decode (mojibake source).
-            self.text = sse_bytes.decode("latin-1")
-
-        def raise_for_status(self):
-            return None
-
-    monkeypatch.setattr(
-        litellm_provider_module.requests,
-        "post",
-        lambda **kwargs: DummyResponse(),
-    )
-
     provider = LiteLLMProvider(
         api_key=_fake_jwt(),
         default_model="openai-codex/gpt-5.3-codex",
     )
+    # A wrong charset header would make response.text decode to mojibake.
+    _mock_http(
+        monkeypatch,
+        provider,
+        lambda _request: httpx.Response(
+            200,
+            content=sse_bytes,
+            headers={"content-type": "text/event-stream; charset=latin-1"},
+        ),
+    )
     response = await provider._chat_openai_codex(
         messages=[{"role": "user", "content": "Say hello"}],
         tools=None,
@@ -127,24 +118,15 @@ async def test_chat_openai_codex_sends_tools_and_parses_function_call(monkeypatc
         '"call_id":"call_123","name":"weather","arguments":"{\\"location\\":\\"Cilacap\\"}"}}\n\n'
     )
 
-    class DummyResponse:
-        def __init__(self, text: str):
-            self.status_code = 200
-            self.text = text
-
-        def raise_for_status(self):
-            return None
-
-    def fake_post(**kwargs):
-        captured.update(kwargs)
-        return DummyResponse(sse)
-
-    monkeypatch.setattr(litellm_provider_module.requests, "post", fake_post)
+    def fake_post(request: httpx.Request) -> httpx.Response:
+        captured["json"] = json.loads(request.content)
+        return httpx.Response(200, text=sse)
 
     provider = LiteLLMProvider(
         api_key=_fake_jwt(),
         default_model="openai-codex/gpt-5.3-codex",
     )
+    _mock_http(monkeypatch, provider, fake_post)
     response = await provider._chat_openai_codex(
         messages=[{"role": "user", "content": "cek suhu Cilacap"}],
         tools=[
@@ -168,9 +150,7 @@ async def test_chat_openai_codex_sends_tools_and_parses_function_call(monkeypatc
         temperature=0.2,
     )
 
-    body = captured.get("json")
-    if body is None:
-        body = json.loads(captured["data"])  # type: ignore[index]
+    body = captured["json"]
 
     assert isinstance(body, dict)
     assert "tools" in body
@@ -0,0 +1,137 @@
+import base64
+import json
+
+import httpx
+
+from kabot.providers.litellm_provider import LiteLLMProvider
+from kabot.providers.streaming import ChatCompletionStreamAccumulator
+
+
+def _fake_jwt(account_id: str = "acc_test") -> str:
+    header = base64.urlsafe_b64encode(
+        json.dumps({"alg": "HS256", "typ": "JWT"}).encode("utf-8")
+    ).decode("utf-8").rstrip("=")
+    payload = base64.urlsafe_b64encode(
+        json.dumps(
+            {"https://api.openai.com/auth": {"chatgpt_account_id": account_id}}
+        ).encode("utf-8")
+    ).decode("utf-8").rstrip("=")
+    return f"{header}.{payload}.sig"
+
+
+def _mock_http(monkeypatch, provider, handler):
+    monkeypatch.setattr(
+        provider,
+        "_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_accumulator_assembles_interleaved_tool_call_deltas():
+    accumulator = ChatCompletionStreamAccumulator()
+    chunks = [
+        {"choices": [{"delta": {"role": "assistant", "content": "Checking "}}]},
+        {"choices": [{"delta": {"tool_calls": [
+            {"index": 0, "id": "call_a", "function": {"name": "weather", "arguments": '{"ci'}},
+        ]}}]},
+        {"choices": [{"delta": {"tool_calls": [
+            {"index": 1, "id": "call_b", "function": {"name": "clock", "arguments": "{}"}},
+            {"index": 0, "function": {"arguments": 'ty": "Oslo"}'}},
+        ]}}]},
+        {"choices": [{"delta": {}, "finish_reason": "tool_calls"}],
+         "usage": {"prompt_tokens": 10, "completion_tokens": 4, "total_tokens": 14}},
+    ]
+
+    increments = [accumulator.add_chunk(chunk) for chunk in chunks]
+    response = accumulator.build_response()
+
+    assert increments[0].content == "Checking "
+    assert [delta.arguments for delta in increments[2].tool_call_deltas] == ["{}", 'ty": "Oslo"}']
+    assert increments[3] is None
+    assert response.content == "Checking "
+    assert [(call.id, call.name, call.arguments) for call in response.tool_calls] == [
+        ("call_a", "weather", {"city": "Oslo"}),
+        ("call_b", "clock", {}),
+    ]
+    assert response.finish_reason == "tool_calls"
+    assert response.usage["total_tokens"] == 14
+
+
+async def test_openrouter_stream_yields_deltas_then_final_response(monkeypatch):
+    captured: dict[str, object] = {}
+    sse = "".join(
+        f"data: {json.dumps(event)}\n\n"
+        for event in [
+            {"choices": [{"delta": {"content": "Hel"}}]},
+            {"choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}]},
+        ]
+    ) + ": OPENROUTER PROCESSING\n\ndata: [DONE]\n\n"
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        captured["body"] = json.loads(request.content)
+        return httpx.Response(200, text=sse, headers={"content-type": "text/event-stream"})
+
+    provider = LiteLLMProvider(api_key="sk-or-test", default_model="openrouter/openai/gpt-4o-mini")
+    _mock_http(monkeypatch, provider, _handler)
+
+    chunks = await _collect(
+        provider.stream_chat(messages=[{"role": "user", "content": "hi"}])
+    )
+
+    assert [chunk.content for chunk in chunks if chunk.content] == ["Hel", "lo"]
+    assert chunks[-1].response.content == "Hello"
+    assert captured["body"]["stream"] is True
+    assert captured["body"]["model"] == "openai/gpt-4o-mini"
+
+
+async def test_openai_codex_stream_matches_buffered_parse(monkeypatch):
+    events = [
+        {"type": "response.output_text.delta", "delta": "On it"},
+        {"type": "response.output_item.added",
+         "item": {"type": "function_call", "id": "fc_1", "call_id": "call_1", "name": "weather"}},
+        {"type": "response.function_call_arguments.delta", "item_id": "fc_1", "delta": '{"city":'},
+        {"type": "response.function_call_arguments.delta", "item_id": "fc_1", "delta": '"Oslo"}'},
+    ]
+    sse = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+    provider = LiteLLMProvider(api_key=_fake_jwt(), default_model="openai-codex/gpt-5.3-codex")
+    _mock_http(monkeypatch, provider, lambda _request: httpx.Response(200, text=sse))
+
+    chunks = await _collect(
+        provider.stream_chat(messages=[{"role": "user", "content": "weather in oslo"}])
+    )
+
+    deltas = [delta for chunk in chunks for delta in chunk.tool_call_deltas]
+    assert chunks[0].content == "On it"
+    assert {delta.index for delta in deltas} == {0}
+    response = chunks[-1].response
+    assert response.content == "On it"
+    assert [(call.id, call.name, call.arguments) for call in response.tool_calls] == [
+        ("call_1", "weather", {"city": "Oslo"})
+    ]
+
+
+async def test_stream_falls_back_to_next_model_before_first_chunk(monkeypatch):
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        calls.append(model)
+        if model == "openai/broken":
+            return httpx.Response(503, text="upstream down")
+        return httpx.Response(200, text='data: {"choices":[{"delta":{"content":"ok"}}]}\n\n')
+
+    provider = LiteLLMProvider(
+        api_key="sk-or-test",
+        default_model="openrouter/openai/broken",
+        fallbacks=["openrouter/openai/working"],
+    )
+    _mock_http(monkeypatch, provider, _handler)
+
+    chunks = await _collect(provider.stream_chat(messages=[{"role": "user", "content": "hi"}]))
+
+    assert calls == ["openai/broken", "openai/working"]
+    assert chunks[-1].response.content == "ok"
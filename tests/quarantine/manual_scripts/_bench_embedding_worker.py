@@ -0,0 +1,40 @@
+"""Throughput benchmark for the embedding worker at 1, 8 and 64 concurrent callers.
+
+Needs sentence-transformers and the model weights. Run manually:
+    python tests/quarantine/manual_scripts/_bench_embedding_worker.py [model] [requests_per_caller]
+"""
+
+import asyncio
+import sys
+import time
+
+from kabot.memory.sentence_embeddings import SentenceEmbeddingProvider
+
+
+async def _run(provider: SentenceEmbeddingProvider, callers: int, per_caller: int) -> float:
+    async def _caller(caller_id: int) -> None:
+        for n in range(per_caller):
+            # Unique text per call so the in-process cache never answers.
+            await provider.embed(f"benchmark sentence {callers}-{caller_id}-{n} about memory retrieval")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_caller(i) for i in range(callers)))
+    return (callers * per_caller) / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    model = sys.argv[1] if len(sys.argv) > 1 else "all-MiniLM-L6-v2"
+    per_caller = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    provider = SentenceEmbeddingProvider(model=model, auto_unload_seconds=0)
+    await provider.warmup()
+    await provider.embed("warmup")
+
+    print(f"model={model} requests_per_caller={per_caller}")
+    for callers in (1, 8, 64):
+        throughput = await _run(provider, callers, per_caller)
+        print(f"{callers:>3} concurrent callers: {throughput:8.1f} embeddings/s")
+    provider.unload_model()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
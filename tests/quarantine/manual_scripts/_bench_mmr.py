@@ -0,0 +1,109 @@
+"""Micro-benchmark: hybrid memory MMR + temporal decay, legacy vs vectorized.
+
+Run manually:
+    python tests/quarantine/manual_scripts/_bench_mmr.py
+"""
+
+import math
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from kabot.memory import chroma_memory
+from kabot.memory.chroma_memory import HybridMemoryManager
+
+
+def _legacy_cosine(vec_a, vec_b):
+    if not vec_a or not vec_b or len(vec_a) != len(vec_b):
+        return 0.0
+    dot = sum(a * b for a, b in zip(vec_a, vec_b))
+    norm_a = math.sqrt(sum(a * a for a in vec_a))
+    norm_b = math.sqrt(sum(b * b for b in vec_b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _legacy_mmr(candidates, query_embedding, limit, lambda_mult=0.75):
+    """The pre-vectorization implementation, kept here as the baseline."""
+    norm_scores = HybridMemoryManager._normalize_scores([c["score"] for c in candidates])
+    norm_query = HybridMemoryManager._normalize_scores(
+        [_legacy_cosine(query_embedding, c["embedding"]) for c in candidates]
+    )
+    for idx, candidate in enumerate(candidates):
+        candidate["_mmr_relevance"] = (0.5 * norm_scores[idx]) + (0.5 * norm_query[idx])
+
+    selected = []
+    remaining = list(range(len(candidates)))
+    while remaining and len(selected) < limit:
+        if not selected:
+            pick_idx = max(remaining, key=lambda i: candidates[i]["_mmr_relevance"])
+        else:
+            def _mmr_value(i):
+                max_sim = 0.0
+                for chosen in selected:
+                    max_sim = max(max_sim, _legacy_cosine(candidates[i]["embedding"], chosen["embedding"]))
+                return (lambda_mult * candidates[i]["_mmr_relevance"]) - ((1.0 - lambda_mult) * max_sim)
+
+            pick_idx = max(remaining, key=_mmr_value)
+        selected.append(candidates[pick_idx])
+        remaining.remove(pick_idx)
+    return selected
+
+
+def _legacy_decay(ages_hours):
+    return [HybridMemoryManager._temporal_decay_multiplier(age) for age in ages_hours]
+
+
+def _time_ms(fn, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def main():
+    rng = random.Random(42)
+    manager = HybridMemoryManager.__new__(HybridMemoryManager)
+    numpy_module = chroma_memory.np
+
+    print(f"{'dims':>5} {'pool':>5} {'limit':>5} | {'legacy ms':>10} {'python ms':>10} {'numpy ms':>10}")
+    for dims in (384, 768):
+        for limit in (5, 10):
+            pool_size = limit * 4
+            query = [rng.uniform(-1, 1) for _ in range(dims)]
+            pool = [
+                {"item": {"message_id": str(i)}, "score": rng.random(),
+                 "embedding": [rng.uniform(-1, 1) for _ in range(dims)]}
+                for i in range(pool_size)
+            ]
+
+            legacy = _time_ms(lambda: _legacy_mmr([dict(c) for c in pool], query, limit))
+            chroma_memory.np = None
+            python = _time_ms(lambda: manager._mmr_select_candidates([dict(c) for c in pool], query, limit))
+            chroma_memory.np = numpy_module
+            vectorized = (
+                _time_ms(lambda: manager._mmr_select_candidates([dict(c) for c in pool], query, limit))
+                if numpy_module is not None else float("nan")
+            )
+            print(f"{dims:>5} {pool_size:>5} {limit:>5} | {legacy:>10.2f} {python:>10.2f} {vectorized:>10.2f}")
+
+    now = datetime.now()
+    candidates = [
+        {"item": {"created_at": (now - timedelta(hours=rng.uniform(0, 24 * 120))).isoformat()},
+         "score": rng.random()}
+        for _ in range(200)
+    ]
+    ages = [rng.uniform(0, 24 * 120) for _ in range(200)]
+    print()
+    print(f"temporal decay x200: legacy {_time_ms(lambda: _legacy_decay(ages)):.3f} ms, "
+          f"batched {_time_ms(lambda: HybridMemoryManager._temporal_decay_multipliers(ages)):.3f} ms")
+    print(f"decay + resort x200 (incl. timestamp parsing): "
+          f"{_time_ms(lambda: manager._apply_temporal_decay_to_candidates(candidates)):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
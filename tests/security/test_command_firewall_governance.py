@@ -177,3 +177,71 @@ def test_scoped_policy_supports_identity_scope_fields_with_wildcards(tmp_path):
         )
         == ApprovalDecision.ASK
     )
+
+
+def test_compiled_matcher_attributes_first_matching_pattern_in_list_order(tmp_path):
+    config_path = tmp_path / "command_approvals.yaml"
+    _write_config(
+        config_path,
+        {
+            "policy": "allowlist",
+            "allowlist": [
+                {"pattern": "git *", "description": "any git"},
+                {"pattern": "git status", "description": "exact"},
+            ],
+            "denylist": [
+                {"pattern": "rm *", "description": "rm"},
+                {"pattern": "rm -rf *", "description": "rm -rf"},
+            ],
+        },
+    )
+    firewall = CommandFirewall(config_path)
+
+    assert firewall.check_command("rm -rf /tmp/x") == ApprovalDecision.DENY
+    assert firewall.check_command("git status") == ApprovalDecision.ALLOW
+    assert firewall.check_command("gitk") == ApprovalDecision.ASK
+
+    entries = firewall.get_recent_audit(limit=10)
+    matched = {e["command"]: e.get("matched_pattern") for e in entries}
+    assert matched == {"rm -rf /tmp/x": "rm *", "git status": "git *", "gitk": None}
+
+
+def test_integrity_and_scoped_rules_are_reused_until_config_changes(tmp_path, monkeypatch):
+    config_path = tmp_path / "command_approvals.yaml"
+    _write_config(
+        config_path,
+        {
+            "policy": "ask",
+            "scoped_policies": [
+                {"name": "cli-deny", "scope": {"channel": "cli"}, "policy": "deny"},
+            ],
+        },
+    )
+    firewall = CommandFirewall(config_path)
+    calls = {"hash": 0, "resolve": 0}
+    compute_hash = firewall._compute_hash
+    resolve = firewall._resolve_scoped_policy
+
+    def _counting_hash():
+        calls["hash"] += 1
+        return compute_hash()
+
+    def _counting_resolve(context):
+        calls["resolve"] += 1
+        return resolve(context)
+
+    monkeypatch.setattr(firewall, "_compute_hash", _counting_hash)
+    monkeypatch.setattr(firewall, "_resolve_scoped_policy", _counting_resolve)
+
+    for _ in range(3):
+        assert firewall.check_command("ls", context={"channel": "cli", "sender": "a"}) == ApprovalDecision.DENY
+        assert firewall.check_command("ls", context={"channel": "cli", "sender": "b"}) == ApprovalDecision.DENY
+
+    assert calls == {"hash": 0, "resolve": 1}
+
+    with open(config_path, "a") as f:
+        f.write("\n# tampered\n")
+
+    assert firewall.check_command("ls", context={"channel": "discord"}) == ApprovalDecision.DENY
+    assert calls["hash"] == 1
+    assert firewall.get_recent_audit(limit=1)[0]["reason"] == "integrity_check_failed"
@@ -15,3 +15,276 @@ def test_session_clear_resets_messages_and_metadata():
 
     assert session.messages == []
     assert session.metadata == {}
+
+
+def _journaled_manager(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return SessionManager(tmp_path / "workspace")
+
+
+def _record_types(path):
+    import json
+
+    return [json.loads(line).get("_type") for line in path.read_text().splitlines() if line.strip()]
+
+
+def test_session_save_appends_only_new_messages_and_metadata_deltas(tmp_path, monkeypatch):
+    from kabot.session.manager import SessionManager
+
+    manager = _journaled_manager(tmp_path, monkeypatch)
+    session = manager.get_or_create("telegram:42")
+    session.add_message("user", "hello")
+    manager.save(session)
+    path = manager._get_session_path("telegram:42")
+    size_after_first = path.stat().st_size
+
+    session.add_message("assistant", "hi there")
+    session.metadata["runtime_locale"] = "en"
+    manager.save(session)
+
+    assert _record_types(path) == ["metadata", None, None, "metadata_delta"]
+    assert path.stat().st_size > size_after_first
+    assert manager._journal.full_writes == 1
+    assert manager._journal.appends == 1
+
+    restored = SessionManager(tmp_path / "workspace").get_or_create("telegram:42")
+    assert [m["content"] for m in restored.messages] == ["hello", "hi there"]
+    assert restored.metadata["runtime_locale"] == "en"
+
+
+def test_session_save_rewrites_after_clear(tmp_path, monkeypatch):
+    from kabot.session.manager import SessionManager
+
+    manager = _journaled_manager(tmp_path, monkeypatch)
+    session = manager.get_or_create("telegram:7")
+    session.add_message("user", "one")
+    session.metadata["pending_followup_tool"] = {"tool": "stock"}
+    manager.save(session)
+
+    session.clear()
+    manager.save(session)
+
+    restored = SessionManager(tmp_path / "workspace").get_or_create("telegram:7")
+    assert restored.messages == []
+    assert "pending_followup_tool" not in restored.metadata
+    assert manager._journal.full_writes == 2
+
+
+def test_session_journal_skips_truncated_tail_and_rewrites_next_save(tmp_path, monkeypatch):
+    from kabot.session.manager import SessionManager
+
+    manager = _journaled_manager(tmp_path, monkeypatch)
+    session = manager.get_or_create("telegram:9")
+    session.add_message("user", "kept")
+    manager.save(session)
+    path = manager._get_session_path("telegram:9")
+    with open(path, "a") as fh:
+        fh.write('{"role": "assistant", "content": "half')
+
+    reopened = SessionManager(tmp_path / "workspace")
+    restored = reopened.get_or_create("telegram:9")
+    assert [m["content"] for m in restored.messages] == ["kept"]
+
+    restored.add_message("assistant", "after crash")
+    reopened.save(restored)
+    assert reopened._journal.full_writes == 1
+    again = SessionManager(tmp_path / "workspace").get_or_create("telegram:9")
+    assert [m["content"] for m in again.messages] == ["kept", "after crash"]
+
+
+def test_session_journal_compacts_superseded_metadata_deltas(tmp_path, monkeypatch):
+    from kabot.session.manager import SessionManager
+
+    manager = _journaled_manager(tmp_path, monkeypatch)
+    manager._journal.compact_min_bytes = 0
+    manager._journal.background_compaction = False
+    session = manager.get_or_create("telegram:5")
+    session.add_message("user", "hello")
+    manager.save(session)
+
+    for idx in range(5):
+        session.metadata["durable_history"] = [{"role": "user", "content": f"turn {idx} " * 20}]
+        manager.save(session)
+
+    path = manager._get_session_path("telegram:5")
+    assert manager._journal.compactions >= 1
+    assert "metadata_delta" not in _record_types(path)[:1]
+
+    restored = SessionManager(tmp_path / "workspace").get_or_create("telegram:5")
+    assert restored.metadata["durable_history"][0]["content"].startswith("turn 4")
+    assert [m["content"] for m in restored.messages] == ["hello"]
+
+
+def test_session_transcript_mirror_appends_new_messages(tmp_path, monkeypatch):
+    manager = _journaled_manager(tmp_path, monkeypatch)
+    session = manager.get_or_create("telegram:3")
+    session.add_message("user", "first")
+    manager.save(session)
+    session.add_message("assistant", "second")
+    manager.save(session)
+
+    transcript = manager.transcripts_dir / "telegram_3.jsonl"
+    lines = transcript.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert '"second"' in lines[-1]
+
+
+def test_session_cache_evicts_least_recently_used_and_flushes_dirty(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = SessionManager(tmp_path / "workspace", max_cached_sessions=2)
+    first = manager.get_or_create("telegram:1")
+    first.add_message("user", "unsaved")
+    manager.get_or_create("telegram:2")
+    manager.get_or_create("telegram:1")
+    manager.get_or_create("telegram:3")
+
+    assert list(manager._cache) == ["telegram:1", "telegram:3"]
+    first_reloaded = manager.get_or_create("telegram:1")
+    assert first_reloaded is first
+
+    manager.get_or_create("telegram:2")
+    manager.get_or_create("telegram:3")
+    assert "telegram:1" not in manager._cache
+    restored = manager.get_or_create("telegram:1")
+    assert restored is not first
+    assert [m["content"] for m in restored.messages] == ["unsaved"]
+
+    stats = manager.cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 6
+    assert stats["evictions"] == 4
+
+
+def test_session_cache_respects_byte_budget(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = SessionManager(tmp_path / "workspace", max_cached_bytes=600)
+    for idx in range(3):
+        session = manager.get_or_create(f"telegram:{idx}")
+        session.add_message("user", "x" * 200)
+        manager.save(session)
+
+    assert len(manager._cache) < 3
+    assert manager.cache_stats()["cached_bytes"] <= 600
+    assert manager.cache_stats()["evictions"] >= 1
+
+
+def test_session_hydrates_recent_tail_and_loads_older_history_on_demand(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    writer = SessionManager(tmp_path / "workspace")
+    session = writer.get_or_create("telegram:8")
+    for idx in range(10):
+        session.add_message("user", f"m{idx}")
+    session.refresh_durable_history_snapshot(max_messages=3)
+    writer.save(session)
+
+    manager = SessionManager(tmp_path / "workspace", hydrate_tail_messages=4)
+    lazy = manager.get_or_create("telegram:8")
+    assert [m["content"] for m in lazy.messages] == ["m6", "m7", "m8", "m9"]
+    assert lazy.message_count == 10
+    assert [m["content"] for m in lazy.get_durable_history_snapshot()] == ["m7", "m8", "m9"]
+    assert [m["content"] for m in lazy.get_history(max_messages=3)] == ["m7", "m8", "m9"]
+
+    lazy.add_message("assistant", "m10")
+    manager.save(lazy)
+    assert manager._journal.appends == 1
+    assert lazy.history_offset == 6
+
+    history = lazy.get_history(max_messages=20)
+    assert [m["content"] for m in history] == [f"m{idx}" for idx in range(11)]
+    manager.save(lazy)
+
+    reread = SessionManager(tmp_path / "workspace", hydrate_tail_messages=0).get_or_create("telegram:8")
+    assert [m["content"] for m in reread.messages] == [f"m{idx}" for idx in range(11)]
+
+
+def test_compaction_keeps_history_that_was_never_hydrated(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    writer = SessionManager(tmp_path / "workspace")
+    session = writer.get_or_create("telegram:4")
+    for idx in range(6):
+        session.add_message("user", f"m{idx}")
+    writer.save(session)
+
+    manager = SessionManager(tmp_path / "workspace", hydrate_tail_messages=2)
+    manager._journal.compact_min_bytes = 0
+    manager._journal.background_compaction = False
+    lazy = manager.get_or_create("telegram:4")
+    for idx in range(3):
+        lazy.metadata["note"] = "n" * 400 + str(idx)
+        manager.save(lazy)
+
+    assert manager._journal.compactions >= 1
+    reread = SessionManager(tmp_path / "workspace", hydrate_tail_messages=0).get_or_create("telegram:4")
+    assert [m["content"] for m in reread.messages] == [f"m{idx}" for idx in range(6)]
+    assert reread.metadata["note"].endswith("2")
+
+
+def test_tail_hydrated_save_keeps_every_transcript_line(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    writer = SessionManager(tmp_path / "workspace")
+    session = writer.get_or_create("telegram:9")
+    for idx in range(120):
+        session.add_message("user", f"m{idx}")
+    writer.save(session)
+    transcript = writer.transcripts_dir / "telegram_9.jsonl"
+    assert len(transcript.read_text(encoding="utf-8").splitlines()) == 121
+
+    manager = SessionManager(tmp_path / "workspace", hydrate_tail_messages=50)
+    lazy = manager.get_or_create("telegram:9")
+    assert lazy.history_offset == 70
+    lazy.add_message("assistant", "m120")
+    manager.save(lazy)
+
+    lines = transcript.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 122
+    assert '"m0"' in lines[1]
+    assert '"m120"' in lines[-1]
+    assert lazy.history_offset == 70
+
+
+def test_tail_hydrated_transcript_rewrite_includes_older_history(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from kabot.session.manager import SessionManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    writer = SessionManager(tmp_path / "workspace")
+    session = writer.get_or_create("telegram:10")
+    for idx in range(10):
+        session.add_message("user", f"m{idx}")
+    writer.save(session)
+    transcript = writer.transcripts_dir / "telegram_10.jsonl"
+    transcript.unlink()
+
+    manager = SessionManager(tmp_path / "workspace", hydrate_tail_messages=3)
+    lazy = manager.get_or_create("telegram:10")
+    lazy.add_message("assistant", "m10")
+    manager.save(lazy)
+
+    lines = transcript.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 12
+    assert '"m0"' in lines[1]
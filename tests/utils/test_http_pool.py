@@ -0,0 +1,68 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from kabot.utils import http_pool
+from kabot.utils.http_pool import (
+    HttpPoolSettings,
+    _PerHostLimitTransport,
+    aclose_http_pool,
+    configure_http_pool,
+    get_http_client,
+    http_pool_settings_from_config,
+)
+
+
+async def test_named_clients_are_shared_within_a_loop_until_closed(monkeypatch):
+    monkeypatch.setattr(http_pool, "_settings", HttpPoolSettings(read_timeout_seconds=42.0, http2=False))
+
+    llm = get_http_client("llm")
+
+    assert get_http_client("llm") is llm
+    assert get_http_client("web") is not llm
+    assert llm.timeout.read == 42.0
+
+    await aclose_http_pool()
+
+    assert llm.is_closed
+    assert get_http_client("llm") is not llm
+    await aclose_http_pool()
+
+
+class _Body(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b"ok"
+
+
+async def test_per_host_limit_holds_slot_until_body_is_closed():
+    started: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        started.append(request.url.host)
+        return httpx.Response(200, stream=_Body())
+
+    transport = _PerHostLimitTransport(httpx.MockTransport(_handler), max_per_host=1)
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://a.example/one"):
+            second = asyncio.create_task(client.get("https://a.example/two"))
+            await client.get("https://b.example/")
+            await asyncio.sleep(0)
+            assert started == ["a.example", "b.example"]
+            assert not second.done()
+        assert (await second).text == "ok"
+
+    assert started == ["a.example", "b.example", "a.example"]
+
+
+def test_settings_follow_runtime_performance_config():
+    settings = http_pool_settings_from_config(
+        SimpleNamespace(http_max_connections_per_host=4, http2=False, http_read_timeout_seconds=30)
+    )
+
+    assert settings.max_connections_per_host == 4
+    assert settings.http2 is False
+    assert settings.read_timeout_seconds == 30.0
+    assert settings.max_connections == HttpPoolSettings().max_connections
+
+    configure_http_pool(HttpPoolSettings())